@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single pass lexer for the parts of a statement that the DB-API inspects."""
+
+from dataclasses import dataclass
+import re
+from typing import List
+
+# The tokens that matter for classifying and rewriting a statement. All other
+# text is skipped by the regular expression engine, and only these tokens
+# are handled in Python. Literals and quoted identifiers are matched as a
+# whole so that nothing inside them is taken for a comment or a placeholder.
+_TOKENS = re.compile(
+    r"""
+    (?P<hint>/\*\+.*?(?:\*/|\Z))
+    | (?P<block_comment>/\*.*?(?:\*/|\Z))
+    | (?P<line_comment>(?:--|\#)[^\r\n]*)
+    | '''(?:[^\\]|\\.)*?(?:'''|\Z)
+    | \"\"\"(?:[^\\]|\\.)*?(?:\"\"\"|\Z)
+    | '(?:[^'\\]|\\.|'')*(?:'|\Z)
+    | "(?:[^"\\]|\\.|"")*(?:"|\Z)
+    | `(?:[^`\\]|\\.)*(?:`|\Z)
+    | \$(?P<tag>[A-Za-z_]\w*)?\$.*?(?:\$(?P=tag)\$|\Z)
+    | %%
+    | (?P<placeholder>%(?:\([^()]+\))?s)
+    | (?P<open>\()
+    | (?P<close>\))
+    | (?P<where>(?<!\w)WHERE(?!\w))
+    """,
+    re.DOTALL | re.IGNORECASE | re.VERBOSE,
+)
+
+
+@dataclass
+class ScannedSql:
+    """A statement without comments, split around its pyformat placeholders.
+
+    ``parts`` holds the text around the placeholders, so it has one more
+    element than ``placeholders``.
+    """
+
+    parts: List[str]
+    placeholders: List[str]
+    has_where: bool
+
+    @property
+    def sql(self):
+        """The statement without comments."""
+        return self.rewrite(self.placeholders)
+
+    def rewrite(self, replacements):
+        """Return the statement with each placeholder replaced.
+
+        :type replacements: list of str
+        :param replacements: the text to replace each placeholder with.
+
+        :rtype: str
+        :returns: the rewritten statement.
+        """
+        parts = self.parts
+        if not replacements:
+            return parts[0]
+        pieces = [parts[0]]
+        for replacement, part in zip(replacements, parts[1:]):
+            pieces.append(replacement)
+            pieces.append(part)
+        return "".join(pieces)
+
+
+def scan_sql(sql):
+    """Strip the comments of a statement and find its placeholders.
+
+    Comments are removed, except for ``/*+ ... */`` hints. Pyformat
+    placeholders (``%s`` and ``%(name)s``) are only recognized outside of
+    string literals, quoted identifiers and comments, and ``%%`` is an
+    escaped percent sign. ``has_where`` is set if the statement has a
+    ``WHERE`` clause outside of parentheses.
+
+    :type sql: str
+    :param sql: A SQL statement.
+
+    :rtype: :class:`ScannedSql`
+    :returns: the scanned statement, stripped of surrounding whitespace.
+    """
+    parts = []
+    placeholders = []
+    pieces = []
+    depth = 0
+    has_where = False
+    last = 0
+    for match in _TOKENS.finditer(sql):
+        kind = match.lastgroup
+        if kind is None or kind == "hint" or kind == "tag":
+            continue
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            if depth:
+                depth -= 1
+        elif kind == "where":
+            if not depth:
+                has_where = True
+        elif kind == "placeholder":
+            pieces.append(sql[last : match.start()])
+            parts.append("".join(pieces))
+            pieces = []
+            placeholders.append(match.group())
+            last = match.end()
+        elif kind == "line_comment":
+            # Keep the line break, but not the blanks before the comment.
+            pieces.append(sql[last : match.start()].rstrip(" \t"))
+            last = match.end()
+        else:
+            pieces.append(sql[last : match.start()])
+            pieces.append(" ")
+            last = match.end()
+    pieces.append(sql[last:])
+    parts.append("".join(pieces))
+    parts[0] = parts[0].lstrip()
+    parts[-1] = parts[-1].rstrip()
+    return ScannedSql(parts, placeholders, has_where)
@@ -0,0 +1,38 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous connection-based DB API for Cloud Spanner.
+
+Connections and cursors behave like those of
+:mod:`google.cloud.spanner_dbapi`, with coroutines for the methods that
+send requests to Spanner::
+
+    connection = await connect("my-instance", "my-database")
+    async with connection:
+        cursor = connection.cursor()
+        await cursor.execute("SELECT * FROM Singers WHERE id > %s", (10,))
+        rows = await cursor.fetchmany(100)
+
+The exceptions and types of :mod:`google.cloud.spanner_dbapi` are used for
+both.
+"""
+
+from google.cloud.spanner_dbapi.aio.connection import Connection, connect
+from google.cloud.spanner_dbapi.aio.cursor import Cursor
+
+__all__ = [
+    "Connection",
+    "connect",
+    "Cursor",
+]
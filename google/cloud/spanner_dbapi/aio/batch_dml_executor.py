@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from google.api_core.exceptions import Aborted
+
+from google.cloud.spanner_dbapi import batch_dml_executor
+from google.cloud.spanner_dbapi.aio.utils import StreamedManyResultSets
+from google.cloud.spanner_dbapi.batch_dml_executor import (
+    _must_begin_transaction,
+    _raise_for_status,
+    _set_row_counts,
+)
+from google.cloud.spanner_dbapi.parsed_statement import Statement
+
+if TYPE_CHECKING:
+    from google.cloud.spanner_dbapi.aio.cursor import Cursor
+
+
+class BatchDmlExecutor(batch_dml_executor.BatchDmlExecutor):
+    """Executor that is used when a DML batch is started on an asynchronous
+    connection. The DML statements are buffered locally and sent to Spanner
+    when the batch is run.
+
+    :type "Cursor": :class:`~google.cloud.spanner_dbapi.aio.cursor.Cursor`
+    :param cursor:
+    """
+
+    async def run_batch_dml(self):
+        """Executes all the buffered statements on the active dml batch by
+        making a call to Spanner.
+        """
+        return await run_batch_dml(self._cursor, self._statements)
+
+
+async def run_batch_dml(cursor: "Cursor", statements: List[Statement]):
+    """Executes all the dml statements by making a batch call to Spanner.
+
+    :type cursor: Cursor
+    :param cursor: Asynchronous database Cursor object
+
+    :type statements: List[Statement]
+    :param statements: list of statements to execute in batch
+    """
+    many_result_set = StreamedManyResultSets()
+    if not statements:
+        return many_result_set
+    connection = cursor.connection
+    statements_tuple = []
+    for statement in statements:
+        statements_tuple.append(statement.get_tuple())
+    if not connection._client_transaction_started:
+        res = await connection.database.run_in_transaction(
+            _do_batch_update_autocommit, statements_tuple
+        )
+        _set_row_counts(cursor, many_result_set, res, in_transaction=False)
+    else:
+        retry_count = 0
+        while True:
+            try:
+                transaction = await connection.transaction_checkout()
+                status, res = await transaction.batch_update_many(statements_tuple)
+                if _must_begin_transaction(
+                    connection, transaction, status, retry_count
+                ):
+                    retry_count += 1
+                    await transaction._reset_and_begin()
+                    continue
+
+                _set_row_counts(cursor, many_result_set, res, in_transaction=True)
+                return many_result_set
+            except Aborted:
+                # We are raising it so it could be handled in transaction_helper.py and is retried
+                if cursor._in_retry_mode:
+                    raise
+                else:
+                    await connection._transaction_helper.retry_transaction()
+            except Exception as ex:
+                if not transaction._transaction_id:
+                    await transaction._reset_and_begin()
+                    continue
+                raise ex
+    return many_result_set
+
+
+async def _do_batch_update_autocommit(transaction, statements):
+    status, res = await transaction.batch_update_many(statements, last_statement=True)
+    _raise_for_status(status)
+    return res
+
+
+class AutocommitDmlBatch(batch_dml_executor.AutocommitDmlBatch):
+    """Buffer for the DML statements that an asynchronous connection executes
+    in autocommit mode when its autocommit DML mode is ``BATCHED``.
+
+    The statements are buffered and sent like for
+    :class:`~google.cloud.spanner_dbapi.batch_dml_executor.AutocommitDmlBatch`,
+    except that beginning a transaction, or setting the ``autocommit``
+    property or the autocommit DML mode, does not send the batch right away.
+    It is sent by the next statement, fetch, commit, rollback or close
+    instead.
+
+    :type connection: :class:`~google.cloud.spanner_dbapi.aio.connection.Connection`
+    :param connection: The connection that executes the statements.
+    """
+
+    async def add(self, cursor: "Cursor", statement: Statement):
+        """Buffers a DML statement, and sends the batch if it is due.
+
+        See :meth:`~google.cloud.spanner_dbapi.batch_dml_executor.AutocommitDmlBatch.add`.
+        """
+        if self._buffer(cursor, statement):
+            await self.flush()
+
+    async def flush(self):
+        """Sends the buffered statements to Spanner, if there are any.
+
+        See :meth:`~google.cloud.spanner_dbapi.batch_dml_executor.AutocommitDmlBatch.flush`.
+        """
+        if not self._statements:
+            return
+        statements, cursors = self._take()
+        res = await self._connection.database.run_in_transaction(
+            _do_batch_update_autocommit,
+            [statement.get_tuple() for statement in statements],
+        )
+        self._set_row_counts(statements, cursors, res)
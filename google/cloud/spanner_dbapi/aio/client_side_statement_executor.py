@@ -0,0 +1,101 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING
+
+from google.cloud.spanner_dbapi.client_side_statement_executor import (
+    CONNECTION_CLOSED_ERROR,
+    _get_isolation_level,
+    _get_streamed_result_set,
+)
+from google.cloud.spanner_dbapi.exceptions import NotSupportedError, ProgrammingError
+from google.cloud.spanner_dbapi.parsed_statement import (
+    ClientSideStatementType,
+    ParsedStatement,
+)
+from google.cloud.spanner_v1 import TypeCode
+
+if TYPE_CHECKING:
+    from google.cloud.spanner_dbapi.aio.cursor import Cursor
+
+# Partitioned queries are run with a batch snapshot, which asynchronous
+# connections do not support.
+_PARTITION_STATEMENTS = (
+    ClientSideStatementType.PARTITION_QUERY,
+    ClientSideStatementType.RUN_PARTITION,
+    ClientSideStatementType.RUN_PARTITIONED_QUERY,
+)
+
+
+async def execute(cursor: "Cursor", parsed_statement: ParsedStatement):
+    """Executes the client side statements by calling the relevant method of
+    an asynchronous connection.
+
+    It is an internal method that can make backwards-incompatible changes.
+
+    :type cursor: Cursor
+    :param cursor: Asynchronous cursor object of the dbApi
+
+    :type parsed_statement: ParsedStatement
+    :param parsed_statement: parsed_statement based on the sql query
+    """
+    connection = cursor.connection
+    column_values = []
+    if connection.is_closed:
+        raise ProgrammingError(CONNECTION_CLOSED_ERROR)
+    statement_type = parsed_statement.client_side_statement_type
+    if statement_type == ClientSideStatementType.COMMIT:
+        await connection.commit()
+        return None
+    if statement_type == ClientSideStatementType.BEGIN:
+        connection.begin(isolation_level=_get_isolation_level(parsed_statement))
+        return None
+    if statement_type == ClientSideStatementType.ROLLBACK:
+        await connection.rollback()
+        return None
+    if statement_type == ClientSideStatementType.SHOW_COMMIT_TIMESTAMP:
+        if (
+            connection._transaction is not None
+            and connection._transaction.committed is not None
+        ):
+            column_values.append(connection._transaction.committed)
+        return _get_streamed_result_set(
+            ClientSideStatementType.SHOW_COMMIT_TIMESTAMP.name,
+            TypeCode.TIMESTAMP,
+            column_values,
+        )
+    if statement_type == ClientSideStatementType.SHOW_READ_TIMESTAMP:
+        if (
+            connection._snapshot is not None
+            and connection._snapshot._transaction_read_timestamp is not None
+        ):
+            column_values.append(connection._snapshot._transaction_read_timestamp)
+        return _get_streamed_result_set(
+            ClientSideStatementType.SHOW_READ_TIMESTAMP.name,
+            TypeCode.TIMESTAMP,
+            column_values,
+        )
+    if statement_type == ClientSideStatementType.START_BATCH_DML:
+        connection.start_batch_dml(cursor)
+        return None
+    if statement_type == ClientSideStatementType.RUN_BATCH:
+        return await connection.run_batch()
+    if statement_type == ClientSideStatementType.ABORT_BATCH:
+        return connection.abort_batch()
+    if statement_type in _PARTITION_STATEMENTS:
+        raise NotSupportedError(
+            "Partitioned queries are not supported by asynchronous connections."
+        )
+    if statement_type == ClientSideStatementType.SET_AUTOCOMMIT_DML_MODE:
+        return connection._set_autocommit_dml_mode(parsed_statement)
@@ -0,0 +1,417 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous DB-API Connection for the Google Cloud Spanner."""
+
+import inspect
+import warnings
+
+from google.api_core.exceptions import Aborted
+
+from google.cloud import spanner_v1 as spanner
+from google.cloud.spanner_dbapi import connection
+from google.cloud.spanner_dbapi.aio.batch_dml_executor import (
+    AutocommitDmlBatch,
+    BatchDmlExecutor,
+)
+from google.cloud.spanner_dbapi.aio.cursor import Cursor
+from google.cloud.spanner_dbapi.aio.transaction_helper import TransactionRetryHelper
+from google.cloud.spanner_dbapi.batch_dml_executor import BatchMode
+from google.cloud.spanner_dbapi.connection import (
+    CLIENT_TRANSACTION_NOT_STARTED_WARNING,
+    _get_client,
+    check_not_closed,
+)
+from google.cloud.spanner_dbapi.exceptions import (
+    NotSupportedError,
+    OperationalError,
+    ProgrammingError,
+)
+from google.cloud.spanner_dbapi.parsed_statement import Statement
+from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1._async.database_sessions_manager import TransactionType
+from google.cloud.spanner_v1._async.snapshot import Snapshot
+
+
+class Connection(connection.Connection):
+    """Representation of an asynchronous DB-API connection to a Cloud Spanner
+    database.
+
+    The connection has the options and connection variables of
+    :class:`~google.cloud.spanner_dbapi.connection.Connection`, and the
+    methods that send requests to Spanner are coroutines. Use the
+    :func:`connect` coroutine to create connections.
+
+    :type instance: :class:`~google.cloud.spanner_v1._async.instance.Instance`
+    :param instance: Cloud Spanner instance to connect to.
+
+    :type database: :class:`~google.cloud.spanner_v1._async.database.Database`
+    :param database: The database to which the connection is linked.
+
+    :type read_only: bool
+    :param read_only:
+        Flag to indicate that the connection may only execute queries and no
+        update or DDL statements, see
+        :class:`~google.cloud.spanner_dbapi.connection.Connection`.
+
+    **kwargs: Initial value for connection variables.
+    """
+
+    def __init__(self, instance, database=None, read_only=False, **kwargs):
+        super().__init__(instance, database, read_only=read_only, **kwargs)
+        self._transaction_helper = TransactionRetryHelper(self)
+        self._autocommit_dml_batch = AutocommitDmlBatch(self)
+
+    @property
+    def autocommit(self):
+        """Autocommit mode flag for this connection.
+
+        :rtype: bool
+        :returns: Autocommit mode flag value.
+        """
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        """Change this connection autocommit mode. A transaction that is
+        active has to be committed first, e.g. with :meth:`set_autocommit`.
+
+        :type value: bool
+        :param value: New autocommit mode state.
+
+        :raises: :class:`ProgrammingError`: if autocommit mode is turned on
+            while a transaction is active.
+        """
+        if value and not self._autocommit and self._spanner_transaction_started:
+            raise ProgrammingError(
+                "Cannot turn on autocommit mode while a transaction is active. "
+                "Use set_autocommit() to commit the transaction first."
+            )
+        self._autocommit = value
+
+    async def set_autocommit(self, value):
+        """Change this connection autocommit mode. Setting this value to True
+        while a transaction is active will commit the current transaction.
+
+        :type value: bool
+        :param value: New autocommit mode state.
+        """
+        if not value:
+            await self._autocommit_dml_batch.flush()
+        if value and not self._autocommit and self._spanner_transaction_started:
+            await self.commit()
+
+        self._autocommit = value
+
+    async def _session_checkout(self):
+        """Get a Cloud Spanner session from the pool.
+
+        If there is already a session associated with
+        this connection, it'll be used instead.
+
+        :rtype: :class:`google.cloud.spanner_v1._async.session.Session`
+        :returns: Cloud Spanner session object ready to use.
+        """
+        if self.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+
+        if not self._session:
+            transaction_type = (
+                TransactionType.READ_ONLY
+                if self.read_only
+                else TransactionType.READ_WRITE
+            )
+            self._session = await self.database._sessions_manager.get_session(
+                transaction_type
+            )
+
+        return self._session
+
+    async def _release_session(self):
+        """Release the currently used Spanner session.
+
+        The session will be returned into the sessions pool.
+        """
+        if self._session is None:
+            return
+
+        if self.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+
+        await self.database._sessions_manager.put_session(self._session)
+        self._session = None
+
+    async def transaction_checkout(self):
+        """Get a Cloud Spanner transaction.
+
+        See :meth:`~google.cloud.spanner_dbapi.connection.Connection.transaction_checkout`.
+
+        :rtype: :class:`google.cloud.spanner_v1._async.transaction.Transaction`
+        :returns: A Cloud Spanner transaction object, ready to use.
+        """
+        if not self.read_only and self._client_transaction_started:
+            if not self._spanner_transaction_started:
+                self._start_spanner_transaction(await self._session_checkout())
+
+            return self._transaction
+
+    async def snapshot_checkout(self):
+        """Get a Cloud Spanner snapshot.
+
+        Initiate a new multi-use snapshot, if there is no snapshot in
+        this connection yet. Return the existing one otherwise.
+
+        :rtype: :class:`google.cloud.spanner_v1._async.snapshot.Snapshot`
+        :returns: A Cloud Spanner snapshot object, ready to use.
+        """
+        if self.read_only and self._client_transaction_started:
+            if not self._spanner_transaction_started:
+                self._snapshot = Snapshot(
+                    await self._session_checkout(), multi_use=True, **self.staleness
+                )
+                self._transaction = None
+                await self._snapshot.begin()
+                self._spanner_transaction_started = True
+
+            return self._snapshot
+
+    async def close(self):
+        """Closes this connection.
+
+        The connection will be unusable from this point forward. If the
+        connection has an active transaction, it will be rolled back.
+        """
+        try:
+            await self._autocommit_dml_batch.flush()
+        finally:
+            if self._spanner_transaction_started and not self._read_only:
+                await self._transaction.rollback()
+
+            if self._own_pool and self.database:
+                res = self.database._sessions_manager._pool.clear()
+                if inspect.isawaitable(res):
+                    await res
+
+            self.is_closed = True
+
+    async def commit(self):
+        """Commits any pending transaction to the database.
+        This is a no-op if there is no active client transaction.
+        """
+        if self.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+        await self._autocommit_dml_batch.flush()
+        if not self._client_transaction_started:
+            if not self._ignore_transaction_warnings:
+                warnings.warn(
+                    CLIENT_TRANSACTION_NOT_STARTED_WARNING, UserWarning, stacklevel=2
+                )
+            return
+
+        await self.run_prior_DDL_statements()
+        try:
+            if self._spanner_transaction_started and not self._read_only:
+                await self._transaction.commit()
+        except Aborted:
+            await self._transaction_helper.retry_transaction()
+            await self.commit()
+        finally:
+            await self._reset_post_commit_or_rollback()
+
+    async def rollback(self):
+        """Rolls back any pending transaction.
+        This is a no-op if there is no active client transaction.
+        """
+        await self._autocommit_dml_batch.flush()
+        if not self._client_transaction_started:
+            if not self._ignore_transaction_warnings:
+                warnings.warn(
+                    CLIENT_TRANSACTION_NOT_STARTED_WARNING, UserWarning, stacklevel=2
+                )
+            return
+        try:
+            if self._spanner_transaction_started and not self._read_only:
+                await self._transaction.rollback()
+        finally:
+            await self._reset_post_commit_or_rollback()
+
+    def _flush_autocommit_dml_batch(self):
+        """The autocommit DML batch cannot be sent by the methods that are not
+        coroutines. It is sent by the next statement, fetch, commit, rollback
+        or close instead.
+        """
+
+    async def _reset_post_commit_or_rollback(self):
+        await self._release_session()
+        self._reset_transaction_state()
+
+    @check_not_closed
+    def cursor(self):
+        """Factory to create an asynchronous DB API Cursor."""
+        return Cursor(self)
+
+    @check_not_closed
+    async def run_prior_DDL_statements(self):
+        if self.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+        if self._ddl_statements:
+            ddl_statements = self._ddl_statements
+            self._ddl_statements = []
+
+            operation = await self.database.update_ddl(ddl_statements)
+            return await operation.result()
+
+    async def run_statement(
+        self, statement: Statement, request_options: RequestOptions = None
+    ):
+        """Run single SQL statement in begun transaction.
+
+        :type statement: :class:`Statement`
+        :param statement: SQL statement to execute.
+
+        :type request_options: :class:`RequestOptions`
+        :param request_options: Request options to use for this statement.
+
+        :rtype: :class:`google.cloud.spanner_v1._async.streamed.StreamedResultSet`
+        :returns: Streamed result set of the statement.
+        """
+        transaction = await self.transaction_checkout()
+        return await transaction.execute_sql(
+            statement.sql,
+            statement.params,
+            param_types=statement.param_types,
+            request_options=request_options or self.request_options,
+        )
+
+    @check_not_closed
+    async def validate(self):
+        """
+        Execute a minimal request to check if the connection
+        is valid and the related database is reachable.
+
+        :raises: :class:`InterfaceError`: if this connection is closed.
+        :raises: :class:`OperationalError`: if the request result is incorrect.
+        :raises: :class:`google.cloud.exceptions.NotFound`: if the linked instance
+                  or database doesn't exist.
+        """
+        if self.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+        await self._autocommit_dml_batch.flush()
+        async with self.database.snapshot() as snapshot:
+            result_set = await snapshot.execute_sql("SELECT 1")
+            result = await result_set.fetch_rows()
+            if result != [[1]]:
+                raise OperationalError(
+                    "The checking query (SELECT 1) returned an unexpected result: %s. "
+                    "Expected: [[1]]" % result
+                )
+
+    def start_batch_dml(self, cursor):
+        super().start_batch_dml(cursor)
+        self._batch_dml_executor = BatchDmlExecutor(cursor)
+
+    @check_not_closed
+    async def run_batch(self):
+        if self._batch_mode is BatchMode.NONE:
+            raise ProgrammingError("Cannot run a batch when the BatchMode is not set")
+        try:
+            if self._batch_mode is BatchMode.DML:
+                many_result_set = await self._batch_dml_executor.run_batch_dml()
+        finally:
+            self._batch_mode = BatchMode.NONE
+            self._batch_dml_executor = None
+        return many_result_set
+
+    def partition_query(self, parsed_statement, query_options=None):
+        raise NotSupportedError(
+            "Partitioned queries are not supported by asynchronous connections."
+        )
+
+    def run_partition(self, encoded_partition_id):
+        raise NotSupportedError(
+            "Partitioned queries are not supported by asynchronous connections."
+        )
+
+    def run_partitioned_query(self, parsed_statement):
+        raise NotSupportedError(
+            "Partitioned queries are not supported by asynchronous connections."
+        )
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with asynchronous connections.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, etype, value, traceback):
+        await self.commit()
+        await self.close()
+
+
+async def connect(
+    instance_id,
+    database_id=None,
+    project=None,
+    credentials=None,
+    pool=None,
+    user_agent=None,
+    client=None,
+    route_to_leader_enabled=True,
+    database_role=None,
+    experimental_host=None,
+    use_plain_text=False,
+    ca_certificate=None,
+    client_certificate=None,
+    client_key=None,
+    **kwargs,
+):
+    """Creates an asynchronous connection to a Google Cloud Spanner database.
+
+    The parameters are the same as for
+    :func:`google.cloud.spanner_dbapi.connect`, except that ``client`` is an
+    :class:`~google.cloud.spanner_v1.AsyncClient`, and ``pool`` an
+    asynchronous session pool, e.g.
+    :class:`~google.cloud.spanner_v1.AsyncFixedSizePool`.
+
+    :rtype: :class:`google.cloud.spanner_dbapi.aio.connection.Connection`
+    :returns: Asynchronous connection object associated with the given
+              Google Cloud Spanner resource.
+    """
+    client = _get_client(
+        spanner.AsyncClient,
+        client,
+        project,
+        credentials,
+        user_agent,
+        route_to_leader_enabled,
+        experimental_host,
+        use_plain_text,
+        ca_certificate,
+        client_certificate,
+        client_key,
+        kwargs.get("client_options"),
+    )
+
+    instance = client.instance(instance_id)
+    database = None
+    if database_id:
+        logger = kwargs.get("logger")
+        database = await instance.database(
+            database_id, pool=pool, database_role=database_role, logger=logger
+        )
+    conn = Connection(instance, database, **kwargs)
+    if pool is not None:
+        conn._own_pool = False
+
+    return conn
@@ -0,0 +1,419 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous database cursor for Google Cloud Spanner DB API."""
+
+import asyncio
+import inspect
+
+from google.api_core.exceptions import Aborted
+
+from google.cloud import spanner_v1 as spanner
+from google.cloud.spanner_dbapi import _helpers, cursor, parse_utils
+from google.cloud.spanner_dbapi.aio import (
+    batch_dml_executor,
+    client_side_statement_executor,
+)
+from google.cloud.spanner_dbapi.aio.utils import PeekIterator, StreamedManyResultSets
+from google.cloud.spanner_dbapi.cursor import (
+    _column_details,
+    _committed_rows,
+    _set_read_timestamp,
+    check_not_closed,
+)
+from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+from google.cloud.spanner_dbapi.parse_utils import get_param_types
+from google.cloud.spanner_dbapi.transaction_helper import CursorStatementType
+from google.cloud.spanner_v1._async.bulk_writer import BulkWriter
+
+
+async def _peek(result_set):
+    """Wrap the rows of a result set and read the first row ahead."""
+    if isinstance(result_set, StreamedManyResultSets):
+        return result_set
+    iterator = PeekIterator(result_set)
+    await iterator.peek()
+    return iterator
+
+
+class Cursor(cursor.Cursor):
+    """Asynchronous database cursor to manage the context of a fetch operation.
+
+    The cursor has the attributes of
+    :class:`~google.cloud.spanner_dbapi.cursor.Cursor`, and the methods that
+    execute statements and fetch rows are coroutines. Rows can also be
+    iterated with ``async for``.
+
+    The control flow, e.g. how a statement is executed and how its errors
+    are raised, is shared with the synchronous cursor. This class only
+    overrides the methods that send requests to Spanner.
+
+    :type connection: :class:`~google.cloud.spanner_dbapi.aio.connection.Connection`
+    :param connection: An asynchronous DB-API connection to Google Cloud Spanner.
+    """
+
+    async def close(self):
+        """Closes this cursor.
+
+        See :meth:`~google.cloud.spanner_dbapi.cursor.Cursor.close`.
+        """
+        try:
+            if self._buffered_statement is not None:
+                await self.connection._autocommit_dml_batch.flush()
+        finally:
+            self._is_closed = True
+
+    async def _do_execute_update_in_autocommit(self, transaction, sql, params):
+        """This function should only be used in autocommit mode."""
+        self.connection._transaction = transaction
+        self.connection._snapshot = None
+        self._result_set = await transaction.execute_sql(
+            sql,
+            params=params,
+            param_types=get_param_types(params),
+            last_statement=True,
+        )
+        self._itr = await _peek(self._result_set)
+        self._row_count = None
+
+    @check_not_closed
+    async def execute(self, sql, args=None):
+        await self._execute(sql, args, False)
+
+    async def _execute(self, sql, args=None, call_from_execute_many=False):
+        """Prepares and executes a Spanner database operation.
+
+        :type sql: str
+        :param sql: A SQL query statement.
+
+        :type args: list
+        :param args: Additional parameters to supplement the SQL query.
+        """
+        self._reset()
+        with self._executing(sql, args, record=not call_from_execute_many):
+            batched = self._classify_statement(sql, args)
+            if not batched:
+                await self.connection._autocommit_dml_batch.flush()
+            res = self._statement_executor(sql, args, batched)()
+            if inspect.isawaitable(res):
+                await res
+
+    async def _execute_client_side_statement(self):
+        self._result_set = await client_side_statement_executor.execute(
+            self, self._parsed_statement
+        )
+        if self._result_set is not None:
+            self._itr = await _peek(self._result_set)
+
+    async def _execute_DDL(self, sql):
+        self._batch_DDLs(sql)
+        if not self.connection._client_transaction_started:
+            await self.connection.run_prior_DDL_statements()
+
+    async def _execute_partitioned_DML(self, sql, args):
+        self._row_count = await self.connection.database.execute_partitioned_dml(
+            sql,
+            params=args,
+            param_types=self._parsed_statement.statement.param_types,
+            request_options=self.request_options,
+        )
+        self._result_set = None
+
+    async def _execute_in_rw_transaction(self):
+        # For every other operation, we've got to ensure that
+        # any prior DDL statements were run.
+        await self.connection.run_prior_DDL_statements()
+        statement = self._parsed_statement.statement
+        if self.connection._client_transaction_started:
+            while True:
+                try:
+                    self._result_set = await self.connection.run_statement(
+                        statement, self.request_options
+                    )
+                    self._itr = await _peek(self._result_set)
+                    return
+                except Aborted:
+                    # We are raising it so it could be handled in transaction_helper.py and is retried
+                    if self._in_retry_mode:
+                        raise
+                    else:
+                        await self.transaction_helper.retry_transaction()
+                except Exception as ex:
+                    # In case of inline-begin failure, the transaction isn't started.
+                    # We immediately retry with an explicit BeginTransaction.
+                    transaction = getattr(self.connection, "_transaction", None)
+                    if transaction and not transaction._transaction_id:
+                        await transaction._reset_and_begin()
+
+                        # Let the existing retry loop handle the retry of the statement
+                        continue
+                    raise ex
+        else:
+            await self.connection.database.run_in_transaction(
+                self._do_execute_update_in_autocommit,
+                statement.sql,
+                statement.params or None,
+            )
+
+    @check_not_closed
+    async def executemany(self, operation, seq_of_params):
+        """Execute the given SQL with every parameters set
+        from the given sequence of parameters.
+
+        :type operation: str
+        :param operation: SQL code to execute.
+
+        :type seq_of_params: list
+        :param seq_of_params: Sequence of additional parameters to run
+                              the query with.
+        """
+        self._reset()
+        with self._executing(operation, seq_of_params, is_execute_many=True):
+            await self.connection._autocommit_dml_batch.flush()
+            self._classify_executemany(operation)
+            # For every operation, we've got to ensure that any prior DDL
+            # statements were run.
+            await self.connection.run_prior_DDL_statements()
+            many_result_set = await self._executemany_executor(
+                operation, seq_of_params
+            )()
+            self._result_set = many_result_set
+            self._itr = many_result_set
+
+    async def _run_batch_dml(self, statements):
+        return await batch_dml_executor.run_batch_dml(self, statements)
+
+    async def _execute_serially(self, operation, seq_of_params):
+        """Execute a statement once for each set of parameters, one after
+        the other.
+        """
+        many_result_set = StreamedManyResultSets()
+        for params in seq_of_params:
+            await self._execute(operation, params, True)
+            many_result_set.add_iter(self._itr)
+        return many_result_set
+
+    async def _execute_queries_concurrently(self, statements):
+        """Run a query once for each set of parameters, running up to
+        ``max_concurrent_queries`` queries at the same time.
+
+        See :meth:`~google.cloud.spanner_dbapi.cursor.Cursor._execute_queries_concurrently`.
+        """
+        connection = self.connection
+        request_options = self.request_options
+        semaphore = asyncio.Semaphore(connection.max_concurrent_queries)
+        if connection._client_transaction_started:
+            # All queries use the multi-use snapshot of the transaction.
+            multi_use_snapshot = await connection.snapshot_checkout()
+
+            async def run_query(statement):
+                async with semaphore:
+                    return multi_use_snapshot, await _execute_query(
+                        multi_use_snapshot, *statement, request_options
+                    )
+
+        else:
+
+            async def run_query(statement):
+                async with semaphore:
+                    async with connection.database.snapshot(
+                        **connection.staleness
+                    ) as snapshot:
+                        return snapshot, await _execute_query(
+                            snapshot, *statement, request_options
+                        )
+
+        results = await asyncio.gather(*map(run_query, statements))
+        many_result_set = StreamedManyResultSets()
+        for itr in self._concurrent_query_iterators(results):
+            many_result_set.add_iter(itr)
+        return many_result_set
+
+    async def _insert_mutations(self, insert, seq_of_params):
+        """Insert the rows of an ``executemany`` call as mutations.
+
+        See :meth:`~google.cloud.spanner_dbapi.cursor.Cursor._insert_mutations`.
+        """
+        rows = [insert.bind(params) for params in seq_of_params]
+        if self.connection._client_transaction_started:
+            self._insert_in_transaction(
+                await self.connection.transaction_checkout(), insert, rows
+            )
+        else:
+            writer = self._bulk_writer(BulkWriter)
+            try:
+                async with writer:
+                    await writer.insert(insert.table, insert.columns, rows)
+            finally:
+                self._row_count = _committed_rows(writer)
+        many_result_set = StreamedManyResultSets()
+        many_result_set.add_iter([1] * len(rows))
+        return many_result_set
+
+    @check_not_closed
+    async def fetchone(self):
+        """Fetch the next row of a query result set, returning a single
+        sequence, or None when no more data is available."""
+        rows = await self._fetch(CursorStatementType.FETCH_ONE)
+        if not rows:
+            return
+        return rows[0]
+
+    @check_not_closed
+    async def fetchall(self):
+        """Fetch all (remaining) rows of a query result, returning them as
+        a sequence of sequences.
+        """
+        return await self._fetch(CursorStatementType.FETCH_ALL)
+
+    @check_not_closed
+    async def fetchmany(self, size=None):
+        """Fetch the next set of rows of a query result, returning a sequence
+        of sequences. An empty sequence is returned when no more rows are available.
+
+        :type size: int
+        :param size: (Optional) The maximum number of results to fetch.
+
+        :raises InterfaceError:
+            if the previous call to .execute*() did not produce any result set
+            or if no call was issued yet.
+        """
+        if size is None:
+            size = self.arraysize
+        return await self._fetch(CursorStatementType.FETCH_MANY, size)
+
+    async def _fetch(self, cursor_statement_type, size=None):
+        await self.connection._autocommit_dml_batch.flush()
+        with self._fetching(cursor_statement_type) as rows:
+            while True:
+                try:
+                    rows[:] = await self._fetch_rows(cursor_statement_type, size)
+                    break
+                except Aborted:
+                    if not self.connection.read_only:
+                        if self._in_retry_mode:
+                            raise
+                        else:
+                            await self.transaction_helper.retry_transaction()
+        return rows
+
+    async def _fetch_rows(self, cursor_statement_type, size=None):
+        if self._itr is None:
+            raise ProgrammingError("no results to return")
+        if cursor_statement_type == CursorStatementType.FETCH_ALL:
+            return await self._itr.fetch()
+        if cursor_statement_type == CursorStatementType.FETCH_MANY:
+            return await self._itr.fetch(size)
+        return await self._itr.fetch(1)
+
+    async def _handle_DQL_with_snapshot(self, snapshot, sql, params):
+        self._result_set, self._itr = await _execute_query(
+            snapshot, sql, params, self.request_options
+        )
+        # Unfortunately, Spanner doesn't seem to send back
+        # information about the number of rows available.
+        self._row_count = None
+
+    async def _handle_DQL(self, sql, params):
+        if self.connection.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+        sql, params = parse_utils.sql_pyformat_args_to_spanner(sql, params)
+        if self.connection.read_only and self.connection._client_transaction_started:
+            # initiate or use the existing multi-use snapshot
+            await self._handle_DQL_with_snapshot(
+                await self.connection.snapshot_checkout(), sql, params
+            )
+        else:
+            # execute with single-use snapshot
+            async with self.connection.database.snapshot(
+                **self.connection.staleness
+            ) as snapshot:
+                self.connection._snapshot = snapshot
+                self.connection._transaction = None
+                await self._handle_DQL_with_snapshot(snapshot, sql, params)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, etype, value, traceback):
+        await self.close()
+
+    def __aiter__(self):
+        if self._itr is None:
+            raise ProgrammingError("no results to return")
+        return self._itr
+
+    async def __anext__(self):
+        if self._itr is None:
+            raise ProgrammingError("no results to return")
+        return await self._itr.__anext__()
+
+    async def list_tables(self, schema_name="", include_views=True):
+        """List the tables of the linked Database.
+
+        :rtype: list
+        :returns: The list of tables within the Database.
+        """
+        return await self.run_sql_in_snapshot(
+            sql=(
+                _helpers.SQL_LIST_TABLES_AND_VIEWS
+                if include_views
+                else _helpers.SQL_LIST_TABLES
+            ),
+            params={"table_schema": schema_name},
+            param_types={"table_schema": spanner.param_types.STRING},
+        )
+
+    async def run_sql_in_snapshot(self, sql, params=None, param_types=None):
+        # Some SQL e.g. for INFORMATION_SCHEMA cannot be run in read-write transactions
+        # hence this method exists to circumvent that limit.
+        if self.connection.database is None:
+            raise ValueError("Database needs to be passed for this operation")
+        await self.connection.run_prior_DDL_statements()
+        await self.connection._autocommit_dml_batch.flush()
+
+        async with self.connection.database.snapshot() as snapshot:
+            result_set = await snapshot.execute_sql(sql, params, param_types)
+            return await result_set.fetch_rows()
+
+    async def get_table_column_schema(self, table_name, schema_name=""):
+        rows = await self.run_sql_in_snapshot(
+            sql=_helpers.SQL_GET_TABLE_COLUMN_SCHEMA,
+            params={"schema_name": schema_name, "table_name": table_name},
+            param_types={
+                "schema_name": spanner.param_types.STRING,
+                "table_name": spanner.param_types.STRING,
+            },
+        )
+        return _column_details(rows)
+
+
+async def _execute_query(snapshot, sql, params, request_options):
+    """Run a query in a snapshot.
+
+    :rtype: tuple
+    :returns: the result set of the query, and an iterator over its rows
+        that has read the first row.
+    """
+    result_set = await snapshot.execute_sql(
+        sql,
+        params,
+        get_param_types(params),
+        request_options=request_options,
+    )
+    # Read the first element so that the StreamedResultSet can
+    # return the metadata after a DQL statement.
+    itr = await _peek(result_set)
+    _set_read_timestamp(snapshot, result_set)
+    return result_set, itr
@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.api_core.exceptions import Aborted
+
+from google.cloud.spanner_dbapi import transaction_helper
+from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+from google.cloud.spanner_dbapi.exceptions import RetryAborted
+from google.cloud.spanner_dbapi.transaction_helper import (
+    MAX_INTERNAL_RETRIES,
+    CursorStatementType,
+    _check_exception,
+    _check_execute_result,
+    _check_fetch_result,
+    _is_execute_type_statement,
+)
+from google.cloud.spanner_v1._helpers import _get_retry_delay
+
+
+class TransactionRetryHelper(transaction_helper.TransactionRetryHelper):
+    """Helper class used in retrying the aborted transactions of an
+    asynchronous connection.
+
+    The statements are recorded like for
+    :class:`~google.cloud.spanner_dbapi.transaction_helper.TransactionRetryHelper`,
+    and replayed with the asynchronous cursors of the connection.
+
+    :type connection: :class:`~google.cloud.spanner_dbapi.aio.connection.Connection`
+    :param connection: An asynchronous DB-API connection to Google Cloud Spanner.
+    """
+
+    async def retry_transaction(self, default_retry_delay=None):
+        """Retry the aborted transaction.
+
+        See :meth:`~google.cloud.spanner_dbapi.transaction_helper.TransactionRetryHelper.retry_transaction`.
+        """
+        self._check_retry_allowed()
+        attempt = 0
+        while True:
+            attempt += 1
+            if attempt > MAX_INTERNAL_RETRIES:
+                raise
+            self._set_connection_for_retry()
+            try:
+                for statement_result_details in self._statement_result_details_list:
+                    cursor = self._get_retry_cursor(statement_result_details)
+                    try:
+                        await _handle_statement(
+                            statement_result_details, cursor, self._checksum_class
+                        )
+                    except Aborted:
+                        raise
+                    except RetryAborted:
+                        raise
+                    except Exception as ex:
+                        _check_exception(statement_result_details, ex)
+                return
+            except Aborted as ex:
+                delay = _get_retry_delay(
+                    ex.errors[0], attempt, default_retry_delay=default_retry_delay
+                )
+                if delay:
+                    await asyncio.sleep(delay)
+
+
+async def _handle_statement(
+    statement_result_details, cursor, checksum_class=ResultsChecksum
+):
+    statement_type = statement_result_details.statement_type
+    if _is_execute_type_statement(statement_type):
+        if statement_type == CursorStatementType.EXECUTE:
+            await cursor.execute(
+                statement_result_details.sql, statement_result_details.args
+            )
+        else:
+            await cursor.executemany(
+                statement_result_details.sql, statement_result_details.args
+            )
+        _check_execute_result(statement_result_details, cursor)
+    else:
+        if statement_type == CursorStatementType.FETCH_ALL:
+            res = await cursor.fetchall()
+        else:
+            res = await cursor.fetchmany(statement_result_details.size)
+        _check_fetch_result(statement_result_details, res, checksum_class)
@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from itertools import islice
+
+from google.cloud.spanner_dbapi.utils import _as_tuple
+from google.cloud.spanner_v1._async.streamed import StreamedResultSet
+
+
+class PeekIterator:
+    """Asynchronous iterator over the rows of a result set.
+
+    The rows of a
+    :class:`~google.cloud.spanner_v1._async.streamed.StreamedResultSet` are
+    fetched in slices as they are streamed. Any other iterable, such as the
+    row counts of a batch DML statement, is read directly. Rows of type list
+    are returned as tuples.
+
+    :type source: :class:`~google.cloud.spanner_v1._async.streamed.StreamedResultSet`
+        or iterable
+    :param source: The rows.
+    """
+
+    def __init__(self, source):
+        if isinstance(source, StreamedResultSet):
+            self._fetch_rows = source.fetch_rows
+        else:
+            self._fetch_rows = _IterableRows(source).fetch_rows
+        # Rows that were read ahead.
+        self._head = []
+
+    async def peek(self):
+        """Read the first row ahead, so that the metadata of a result set is
+        available before its rows are fetched.
+        """
+        if not self._head:
+            self._head = await self._fetch_rows(1)
+
+    async def fetch(self, size=None):
+        """Return the next rows.
+
+        :type size: int
+        :param size: (Optional) maximum number of rows to return. All
+            remaining rows are returned if not set.
+
+        :rtype: list
+        :returns: the next rows.
+        """
+        rows = self._head
+        if size is None:
+            self._head = []
+            rows.extend(await self._fetch_rows())
+        elif size <= len(rows):
+            self._head = rows[size:]
+            rows = rows[:size]
+        else:
+            self._head = []
+            rows.extend(await self._fetch_rows(size - len(rows)))
+        return list(map(_as_tuple, rows))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        rows = await self.fetch(1)
+        if not rows:
+            raise StopAsyncIteration
+        return rows[0]
+
+
+class _IterableRows:
+    """Fetch the rows of an iterable in slices."""
+
+    def __init__(self, source):
+        self._iterator = iter(source)
+
+    async def fetch_rows(self, max_rows=None):
+        return list(islice(self._iterator, max_rows))
+
+
+class StreamedManyResultSets:
+    """Asynchronous iterator over the rows of several result sets, e.g. the
+    result sets of :meth:`~google.cloud.spanner_dbapi.aio.cursor.Cursor.executemany`.
+    """
+
+    def __init__(self):
+        self._iterators = []
+        self._index = 0
+
+    def add_iter(self, iterator):
+        """Add the rows of a result set.
+
+        :type iterator: :class:`PeekIterator` or iterable
+        :param iterator: The rows.
+        """
+        if not isinstance(iterator, PeekIterator):
+            iterator = PeekIterator(iterator)
+        self._iterators.append(iterator)
+
+    async def fetch(self, size=None):
+        """Return the next rows, see :meth:`PeekIterator.fetch`."""
+        rows = []
+        while self._index < len(self._iterators):
+            remaining = None if size is None else size - len(rows)
+            if remaining == 0:
+                break
+            chunk = await self._iterators[self._index].fetch(remaining)
+            rows.extend(chunk)
+            if remaining is None or len(chunk) < remaining:
+                self._index += 1
+        return rows
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        rows = await self.fetch(1)
+        if not rows:
+            raise StopAsyncIteration
+        return rows[0]
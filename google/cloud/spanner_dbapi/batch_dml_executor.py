@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from enum import Enum
+import time
 from typing import TYPE_CHECKING, List
 
 from google.api_core.exceptions import Aborted
@@ -81,8 +82,6 @@ def run_batch_dml(cursor: "Cursor", statements: List[Statement]):
     :type statements: List[Statement]
     :param statements: list of statements to execute in batch
     """
-    from google.cloud.spanner_dbapi import OperationalError
-
     many_result_set = StreamedManyResultSets()
     if not statements:
         return many_result_set
@@ -94,31 +93,21 @@ def run_batch_dml(cursor: "Cursor", statements: List[Statement]):
         res = connection.database.run_in_transaction(
             _do_batch_update_autocommit, statements_tuple
         )
-        many_result_set.add_iter(res)
-        cursor._row_count = sum([max(val, 0) for val in res])
+        _set_row_counts(cursor, many_result_set, res, in_transaction=False)
     else:
         retry_count = 0
         while True:
             try:
                 transaction = connection.transaction_checkout()
-                status, res = transaction.batch_update(statements_tuple)
-                if status.code == ABORTED:
-                    connection._transaction = None
-                    raise Aborted(status.message)
-                elif status.code != OK:
-                    if not transaction._transaction_id:
-                        # This should normally not happen,
-                        # but we safeguard against it just to be sure.
-                        if retry_count > 0:
-                            raise OperationalError(status.message)
-                        retry_count += 1
-                        transaction._reset_and_begin()
-                        continue
-                    raise OperationalError(status.message)
-
-                cursor._batch_dml_rows_count = res
-                many_result_set.add_iter(res)
-                cursor._row_count = sum([max(val, 0) for val in res])
+                status, res = transaction.batch_update_many(statements_tuple)
+                if _must_begin_transaction(
+                    connection, transaction, status, retry_count
+                ):
+                    retry_count += 1
+                    transaction._reset_and_begin()
+                    continue
+
+                _set_row_counts(cursor, many_result_set, res, in_transaction=True)
                 return many_result_set
             except Aborted:
                 # We are raising it so it could be handled in transaction_helper.py and is retried
@@ -134,14 +123,139 @@ def run_batch_dml(cursor: "Cursor", statements: List[Statement]):
 
 
 def _do_batch_update_autocommit(transaction, statements):
+    status, res = transaction.batch_update_many(statements, last_statement=True)
+    _raise_for_status(status)
+    return res
+
+
+def _raise_for_status(status):
+    """Raise the error of a batch DML request that failed."""
     from google.cloud.spanner_dbapi import OperationalError
 
-    status, res = transaction.batch_update(statements, last_statement=True)
     if status.code == ABORTED:
         raise Aborted(status.message)
     elif status.code != OK:
         raise OperationalError(status.message)
-    return res
+
+
+def _must_begin_transaction(connection, transaction, status, retry_count):
+    """Check the status of a batch DML request in a transaction.
+
+    :rtype: bool
+    :returns: True if the request failed before the transaction was begun,
+        so the request has to be retried with an explicit BeginTransaction.
+
+    :raises: the error of the request, if it failed otherwise.
+    """
+    if status.code == ABORTED:
+        connection._transaction = None
+    elif status.code != OK and not transaction._transaction_id:
+        # This should normally not happen,
+        # but we safeguard against it just to be sure.
+        if retry_count == 0:
+            return True
+    _raise_for_status(status)
+    return False
+
+
+def _set_row_counts(cursor, many_result_set, res, in_transaction):
+    """Set the row counts of a batch DML request on its cursor."""
+    if in_transaction:
+        cursor._batch_dml_rows_count = res
+    many_result_set.add_iter(res)
+    cursor._row_count = sum([max(val, 0) for val in res])
+
+
+class AutocommitDmlBatch:
+    """Buffer for the DML statements that are executed in autocommit mode when
+    the autocommit DML mode of the connection is ``BATCHED``.
+
+    Consecutive DML statements are buffered locally and sent to Spanner as one
+    batch DML request in a single transaction. The batch is sent when it is
+    full, when a statement is added after its first statement was buffered
+    longer ago than the batch timeout, and before any other statement is
+    executed, rows are fetched, a cursor with a buffered statement is closed,
+    or the connection is committed, rolled back or closed. There is no
+    background timer: an expired batch waits for one of these events.
+
+    :type connection: :class:`~google.cloud.spanner_dbapi.connection.Connection`
+    :param connection: The connection that executes the statements.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._statements: List[Statement] = []
+        self._cursors: List["Cursor"] = []
+        self._started = None
+
+    def __len__(self):
+        return len(self._statements)
+
+    def add(self, cursor: "Cursor", statement: Statement):
+        """Buffers a DML statement, and sends the batch if it is due.
+
+        The row count of the cursor is -1 until the batch is sent.
+
+        :type cursor: Cursor
+        :param cursor: The cursor that executes the statement.
+
+        :type statement: Statement
+        :param statement: The statement to buffer.
+        """
+        if self._buffer(cursor, statement):
+            self.flush()
+
+    def _buffer(self, cursor, statement):
+        """Buffers a DML statement.
+
+        :rtype: bool
+        :returns: whether the batch is due to be sent.
+        """
+        if not self._statements:
+            self._started = time.monotonic()
+        self._statements.append(statement)
+        self._cursors.append(cursor)
+        cursor._row_count = -1
+        cursor._buffered_statement = statement
+        return self._is_due()
+
+    def _is_due(self):
+        connection = self._connection
+        if len(self._statements) >= connection.autocommit_dml_batch_size:
+            return True
+        timeout = connection.autocommit_dml_batch_timeout
+        return (
+            timeout is not None and (time.monotonic() - self._started) * 1000 >= timeout
+        )
+
+    def flush(self):
+        """Sends the buffered statements to Spanner, if there are any.
+
+        The statements are executed atomically: if one of them fails, none
+        of them is applied. Each cursor gets the row count of its statement,
+        unless it has executed another statement since.
+        """
+        if not self._statements:
+            return
+        statements, cursors = self._take()
+        res = self._connection.database.run_in_transaction(
+            _do_batch_update_autocommit,
+            [statement.get_tuple() for statement in statements],
+        )
+        self._set_row_counts(statements, cursors, res)
+
+    def _take(self):
+        """Removes the buffered statements and their cursors from the batch."""
+        statements, cursors = self._statements, self._cursors
+        self._statements, self._cursors, self._started = [], [], None
+        return statements, cursors
+
+    @staticmethod
+    def _set_row_counts(statements, cursors, res):
+        for cursor, statement, row_count in zip(cursors, statements, res):
+            if cursor._buffered_statement is statement:
+                cursor._buffered_statement = None
+                cursor._row_count = row_count
 
 
 class BatchMode(Enum):
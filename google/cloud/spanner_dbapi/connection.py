@@ -13,6 +13,7 @@
 # limitations under the License.
 
 """DB-API Connection for the Google Cloud Spanner."""
+
 import warnings
 
 from google.api_core.client_options import ClientOptions
@@ -22,7 +23,11 @@ from google.auth.credentials import AnonymousCredentials
 
 from google.cloud import spanner_v1 as spanner
 from google.cloud.spanner_dbapi import partition_helper
-from google.cloud.spanner_dbapi.batch_dml_executor import BatchDmlExecutor, BatchMode
+from google.cloud.spanner_dbapi.batch_dml_executor import (
+    AutocommitDmlBatch,
+    BatchDmlExecutor,
+    BatchMode,
+)
 from google.cloud.spanner_dbapi.cursor import Cursor
 from google.cloud.spanner_dbapi.exceptions import (
     InterfaceError,
@@ -44,6 +49,8 @@ from google.cloud.spanner_v1.snapshot import Snapshot
 CLIENT_TRANSACTION_NOT_STARTED_WARNING = (
     "This method is non-operational as a transaction has not been started."
 )
+DEFAULT_AUTOCOMMIT_DML_BATCH_SIZE = 100
+DEFAULT_AUTOCOMMIT_DML_BATCH_TIMEOUT = 100
 
 
 def check_not_closed(function):
@@ -120,6 +127,7 @@ class Connection:
         self._batch_dml_executor: BatchDmlExecutor = None
         self._transaction_helper = TransactionRetryHelper(self)
         self._autocommit_dml_mode: AutocommitDmlMode = AutocommitDmlMode.TRANSACTIONAL
+        self._autocommit_dml_batch = AutocommitDmlBatch(self)
         self._connection_variables = kwargs
 
     @property
@@ -158,6 +166,8 @@ class Connection:
         :type value: bool
         :param value: New autocommit mode state.
         """
+        if not value:
+            self._flush_autocommit_dml_batch()
         if value and not self._autocommit and self._spanner_transaction_started:
             self.commit()
 
@@ -185,6 +195,21 @@ class Connection:
         If an error occurs during the execution of the DML statement, it is possible that the
         statement has been applied to some but not all of the rows specified in the statement.
 
+        3) BATCHED - consecutive DML statements are buffered, and executed as
+        one batch DML request in a single read-write transaction. The batch is
+        executed when it contains `autocommit_dml_batch_size` statements, when
+        its first statement is older than `autocommit_dml_batch_timeout` at
+        the time that a statement is added, and before any other statement is
+        executed, rows are fetched, a cursor with a buffered statement is
+        closed, or the connection is committed, rolled back or closed. Errors
+        of the statements are raised at that time, and if one of the
+        statements fails, none of them is applied.
+
+        Note that in the BATCHED mode, ``cursor.rowcount`` is -1 after a DML
+        statement is executed, until the batch is flushed. Do not use this
+        mode with code that reads the update count of each statement right
+        after executing it, e.g. ORMs that check for concurrent updates.
+
         :rtype: :class:`~google.cloud.spanner_dbapi.parsed_statement.AutocommitDmlMode`
         """
         return self._autocommit_dml_mode
@@ -311,6 +336,198 @@ class Connection:
         """
         self._connection_variables["isolation_level"] = value
 
+    @property
+    def insert_as_mutations(self):
+        """Flag: ``executemany`` writes simple INSERT statements as mutations.
+
+        A simple INSERT inserts a single row of parameters, e.g.
+        ``INSERT INTO t (a, b) VALUES (%s, %s)``. Executing it with
+        ``executemany`` inserts all rows as mutations instead of running one
+        DML statement per row. In autocommit mode, the rows are committed
+        right away, in commits that are split by size, so the rows are only
+        inserted atomically if they fit into one commit. The commits run one
+        after the other and stop at the first one that fails: its error is
+        raised, the rows of the commits before it stay inserted, and
+        :attr:`~google.cloud.spanner_dbapi.cursor.Cursor.rowcount` is the
+        number of these rows. Inside a
+        transaction, the rows are buffered in the transaction and written
+        when it is committed, so they are not visible to the statements of
+        the transaction, and errors such as duplicate keys are raised by
+        :meth:`commit`.
+
+        Returns:
+            bool: True if simple INSERT statements are written as mutations.
+        """
+        return self._connection_variables.get("insert_as_mutations", False)
+
+    @insert_as_mutations.setter
+    def insert_as_mutations(self, value):
+        """Sets whether ``executemany`` writes simple INSERT statements as
+        mutations.
+
+        Args:
+            value (bool): True to write simple INSERT statements as mutations.
+        """
+        self._connection_variables["insert_as_mutations"] = value
+
+    @property
+    def max_concurrent_queries(self):
+        """Maximum number of queries that ``executemany`` runs at the same time.
+
+        A query that is executed with ``executemany`` in autocommit mode, or
+        in a read-only transaction, runs once for each set of parameters.
+        When this is greater than 1, these queries run concurrently, each in
+        a single-use read-only transaction in autocommit mode, or in the
+        read-only transaction of the connection. The rows of the queries are
+        returned in the order of the parameters.
+
+        Returns:
+            int: The maximum number of concurrent queries.
+        """
+        return self._connection_variables.get("max_concurrent_queries", 1)
+
+    @max_concurrent_queries.setter
+    def max_concurrent_queries(self, value):
+        """Sets the maximum number of queries that ``executemany`` runs at
+        the same time.
+
+        Args:
+            value (int): The maximum number of concurrent queries.
+        """
+        if value < 1:
+            raise ValueError("max_concurrent_queries must be at least 1")
+        self._connection_variables["max_concurrent_queries"] = value
+
+    @property
+    def autocommit_dml_batch_size(self):
+        """Maximum number of DML statements of a batch in the ``BATCHED``
+        autocommit DML mode.
+
+        Returns:
+            int: The maximum number of statements of a batch.
+        """
+        return self._connection_variables.get(
+            "autocommit_dml_batch_size", DEFAULT_AUTOCOMMIT_DML_BATCH_SIZE
+        )
+
+    @autocommit_dml_batch_size.setter
+    def autocommit_dml_batch_size(self, value):
+        """Sets the maximum number of DML statements of a batch in the
+        ``BATCHED`` autocommit DML mode.
+
+        Args:
+            value (int): The maximum number of statements of a batch.
+        """
+        self._connection_variables["autocommit_dml_batch_size"] = value
+
+    @property
+    def autocommit_dml_batch_timeout(self):
+        """Maximum age in milliseconds of a batch in the ``BATCHED``
+        autocommit DML mode.
+
+        The age is only checked when the next statement is added to the
+        batch: a batch is not executed in the background when it expires,
+        and the last statements of a burst of DML stay buffered until one of
+        the other events that execute the batch, such as executing a query,
+        closing the cursor or committing the connection.
+
+        Returns:
+            float: The maximum age in milliseconds, or None for no limit.
+        """
+        return self._connection_variables.get(
+            "autocommit_dml_batch_timeout", DEFAULT_AUTOCOMMIT_DML_BATCH_TIMEOUT
+        )
+
+    @autocommit_dml_batch_timeout.setter
+    def autocommit_dml_batch_timeout(self, value):
+        """Sets the maximum age in milliseconds of a batch in the ``BATCHED``
+        autocommit DML mode.
+
+        Args:
+            value (float): The maximum age in milliseconds, or None for no limit.
+        """
+        self._connection_variables["autocommit_dml_batch_timeout"] = value
+
+    @property
+    def retry_aborts_internally(self):
+        """Flag: aborted read/write transactions are retried by this `Connection`.
+
+        The statements of a read/write transaction, and checksums of the
+        rows that they return, are recorded, so that an aborted transaction
+        can be retried by replaying them. When this is False, nothing is
+        recorded, and an aborted transaction raises
+        :class:`~google.cloud.spanner_dbapi.exceptions.RetryAborted` right
+        away, so that the application can retry it, e.g. for idempotent
+        workloads with their own retry loop.
+
+        Returns:
+            bool: True if aborted transactions are retried internally.
+        """
+        return self._transaction_helper.retry_aborts_internally
+
+    @retry_aborts_internally.setter
+    def retry_aborts_internally(self, value):
+        """Sets whether aborted read/write transactions are retried internally.
+
+        Args:
+            value (bool): True to retry aborted transactions internally.
+        """
+        if self._spanner_transaction_started:
+            raise ProgrammingError(
+                "Cannot change retry_aborts_internally while a transaction is active."
+            )
+        self._transaction_helper.retry_aborts_internally = value
+
+    @property
+    def max_recorded_statements(self):
+        """Maximum number of statements that are recorded to retry a transaction.
+
+        Each execute and each sequence of fetch calls of a cursor counts as
+        one statement. A transaction that exceeds the limit is no longer
+        recorded, and raises
+        :class:`~google.cloud.spanner_dbapi.exceptions.RetryAborted` if it is
+        aborted.
+
+        Returns:
+            int: The maximum number of statements, or None for no limit.
+        """
+        return self._transaction_helper.max_recorded_statements
+
+    @max_recorded_statements.setter
+    def max_recorded_statements(self, value):
+        """Sets the maximum number of statements that are recorded to retry a
+        transaction.
+
+        Args:
+            value (int): The maximum number of statements, or None for no limit.
+        """
+        self._transaction_helper.max_recorded_statements = value
+
+    @property
+    def max_recorded_bytes(self):
+        """Maximum size of the results that are recorded to retry a transaction.
+
+        This is the encoded size of the rows that the transaction fetched,
+        which all need to be fetched again to retry it. A transaction that
+        exceeds the limit is no longer recorded, and raises
+        :class:`~google.cloud.spanner_dbapi.exceptions.RetryAborted` if it is
+        aborted.
+
+        Returns:
+            int: The maximum size in bytes, or None for no limit.
+        """
+        return self._transaction_helper.max_recorded_bytes
+
+    @max_recorded_bytes.setter
+    def max_recorded_bytes(self, value):
+        """Sets the maximum size of the results that are recorded to retry a
+        transaction.
+
+        Args:
+            value (int): The maximum size in bytes, or None for no limit.
+        """
+        self._transaction_helper.max_recorded_bytes = value
+
     @property
     def staleness(self):
         """Current read staleness option value of this `Connection`.
@@ -406,20 +623,26 @@ class Connection:
         """
         if not self.read_only and self._client_transaction_started:
             if not self._spanner_transaction_started:
-                self._transaction = self._session_checkout().transaction()
-                self._transaction.transaction_tag = self.transaction_tag
-                if self._transaction_isolation_level:
-                    self._transaction.isolation_level = (
-                        self._transaction_isolation_level
-                    )
-                else:
-                    self._transaction.isolation_level = self.isolation_level
-                self.transaction_tag = None
-                self._snapshot = None
-                self._spanner_transaction_started = True
+                self._start_spanner_transaction(self._session_checkout())
 
             return self._transaction
 
+    def _start_spanner_transaction(self, session):
+        """Create the Cloud Spanner transaction of the client transaction.
+
+        :type session: :class:`google.cloud.spanner_v1.session.Session`
+        :param session: The session of the transaction.
+        """
+        self._transaction = session.transaction()
+        self._transaction.transaction_tag = self.transaction_tag
+        if self._transaction_isolation_level:
+            self._transaction.isolation_level = self._transaction_isolation_level
+        else:
+            self._transaction.isolation_level = self.isolation_level
+        self.transaction_tag = None
+        self._snapshot = None
+        self._spanner_transaction_started = True
+
     def snapshot_checkout(self):
         """Get a Cloud Spanner snapshot.
 
@@ -446,13 +669,16 @@ class Connection:
         The connection will be unusable from this point forward. If the
         connection has an active transaction, it will be rolled back.
         """
-        if self._spanner_transaction_started and not self._read_only:
-            self._transaction.rollback()
+        try:
+            self._autocommit_dml_batch.flush()
+        finally:
+            if self._spanner_transaction_started and not self._read_only:
+                self._transaction.rollback()
 
-        if self._own_pool and self.database:
-            self.database._sessions_manager._pool.clear()
+            if self._own_pool and self.database:
+                self.database._sessions_manager._pool.clear()
 
-        self.is_closed = True
+            self.is_closed = True
 
     @check_not_closed
     def begin(self, isolation_level=None):
@@ -463,6 +689,7 @@ class Connection:
         :raises: :class:`OperationalError`: if there is an existing transaction
         that has been started
         """
+        self._flush_autocommit_dml_batch()
         if self._transaction_begin_marked:
             raise OperationalError("A transaction has already started")
         if self._spanner_transaction_started:
@@ -479,6 +706,7 @@ class Connection:
         """
         if self.database is None:
             raise ValueError("Database needs to be passed for this operation")
+        self._autocommit_dml_batch.flush()
         if not self._client_transaction_started:
             if not self._ignore_transaction_warnings:
                 warnings.warn(
@@ -500,6 +728,7 @@ class Connection:
         """Rolls back any pending transaction.
         This is a no-op if there is no active client transaction.
         """
+        self._autocommit_dml_batch.flush()
         if not self._client_transaction_started:
             if not self._ignore_transaction_warnings:
                 warnings.warn(
@@ -512,8 +741,17 @@ class Connection:
         finally:
             self._reset_post_commit_or_rollback()
 
+    def _flush_autocommit_dml_batch(self):
+        """Sends the autocommit DML batch before a transaction is begun, or
+        the autocommit mode or autocommit DML mode is changed.
+        """
+        self._autocommit_dml_batch.flush()
+
     def _reset_post_commit_or_rollback(self):
         self._release_session()
+        self._reset_transaction_state()
+
+    def _reset_transaction_state(self):
         self._transaction_helper.reset()
         self._transaction_begin_marked = False
         self._transaction_isolation_level = None
@@ -583,6 +821,7 @@ class Connection:
         """
         if self.database is None:
             raise ValueError("Database needs to be passed for this operation")
+        self._autocommit_dml_batch.flush()
         with self.database.snapshot() as snapshot:
             result = list(snapshot.execute_sql("SELECT 1"))
             if result != [[1]]:
@@ -643,7 +882,6 @@ class Connection:
         self._partitioned_query_validation(partitioned_query, statement)
 
         batch_snapshot = self._database.batch_snapshot()
-        partition_ids = []
         partitions = list(
             batch_snapshot.generate_query_batches(
                 partitioned_query,
@@ -654,11 +892,9 @@ class Connection:
         )
 
         batch_transaction_id = batch_snapshot.get_batch_transaction_id()
-        for partition in partitions:
-            partition_ids.append(
-                partition_helper.encode_to_string(batch_transaction_id, partition)
-            )
-        return partition_ids
+        return partition_helper.encode_partitions_to_strings(
+            batch_transaction_id, partitions
+        )
 
     @check_not_closed
     def run_partition(self, encoded_partition_id):
@@ -715,6 +951,7 @@ class Connection:
             )
         if self._batch_mode is not BatchMode.NONE:
             raise ProgrammingError("Cannot set autocommit DML mode while in a batch.")
+        self._flush_autocommit_dml_batch()
         self._autocommit_dml_mode = autocommit_dml_mode
 
     def _partitioned_query_validation(self, partitioned_query, statement):
@@ -822,41 +1059,20 @@ def connect(
         This is intended only for experimental host spanner endpoints.
         This is mandatory if the experimental_host requires an mTLS connection.
     """
-    if client is None:
-        client_info = ClientInfo(
-            user_agent=user_agent or DEFAULT_USER_AGENT,
-            python_version=PY_VERSION,
-            client_library_version=spanner.__version__,
-        )
-        if isinstance(credentials, str):
-            client = spanner.Client.from_service_account_json(
-                credentials,
-                project=project,
-                client_info=client_info,
-                route_to_leader_enabled=route_to_leader_enabled,
-            )
-        else:
-            client_options = None
-            if isinstance(credentials, AnonymousCredentials):
-                client_options = kwargs.get("client_options")
-            if experimental_host is not None:
-                project = "default"
-                credentials = AnonymousCredentials()
-                client_options = ClientOptions(api_endpoint=experimental_host)
-            client = spanner.Client(
-                project=project,
-                credentials=credentials,
-                client_info=client_info,
-                route_to_leader_enabled=route_to_leader_enabled,
-                client_options=client_options,
-                use_plain_text=use_plain_text,
-                ca_certificate=ca_certificate,
-                client_certificate=client_certificate,
-                client_key=client_key,
-            )
-    else:
-        if project is not None and client.project != project:
-            raise ValueError("project in url does not match client object project")
+    client = _get_client(
+        spanner.Client,
+        client,
+        project,
+        credentials,
+        user_agent,
+        route_to_leader_enabled,
+        experimental_host,
+        use_plain_text,
+        ca_certificate,
+        client_certificate,
+        client_key,
+        kwargs.get("client_options"),
+    )
 
     instance = client.instance(instance_id)
     database = None
@@ -870,3 +1086,58 @@ def connect(
         conn._own_pool = False
 
     return conn
+
+
+def _get_client(
+    client_class,
+    client,
+    project,
+    credentials,
+    user_agent,
+    route_to_leader_enabled,
+    experimental_host,
+    use_plain_text,
+    ca_certificate,
+    client_certificate,
+    client_key,
+    client_options,
+):
+    """Create the client of a connection, unless one is given.
+
+    See :func:`connect` for the parameters.
+    """
+    if client is not None:
+        if project is not None and client.project != project:
+            raise ValueError("project in url does not match client object project")
+        return client
+
+    client_info = ClientInfo(
+        user_agent=user_agent or DEFAULT_USER_AGENT,
+        python_version=PY_VERSION,
+        client_library_version=spanner.__version__,
+    )
+    if isinstance(credentials, str):
+        return client_class.from_service_account_json(
+            credentials,
+            project=project,
+            client_info=client_info,
+            route_to_leader_enabled=route_to_leader_enabled,
+        )
+
+    if not isinstance(credentials, AnonymousCredentials):
+        client_options = None
+    if experimental_host is not None:
+        project = "default"
+        credentials = AnonymousCredentials()
+        client_options = ClientOptions(api_endpoint=experimental_host)
+    return client_class(
+        project=project,
+        credentials=credentials,
+        client_info=client_info,
+        route_to_leader_enabled=route_to_leader_enabled,
+        client_options=client_options,
+        use_plain_text=use_plain_text,
+        ca_certificate=ca_certificate,
+        client_certificate=client_certificate,
+        client_key=client_key,
+    )
@@ -13,7 +13,11 @@
 # limitations under the License.
 
 """Database cursor for Google Cloud Spanner DB API."""
+
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import functools
 
 from google.api_core.exceptions import (
     Aborted,
@@ -50,6 +54,7 @@ from google.cloud.spanner_dbapi.parsed_statement import (
 from google.cloud.spanner_dbapi.transaction_helper import CursorStatementType
 from google.cloud.spanner_dbapi.utils import PeekIterator, StreamedManyResultSets
 from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1.bulk_writer import BulkWriter
 from google.cloud.spanner_v1.merged_result_set import MergedResultSet
 
 ColumnDetails = namedtuple("column_details", ["null_ok", "spanner_type"])
@@ -97,6 +102,7 @@ class Cursor(object):
         self._parsed_statement: ParsedStatement = None
         self._in_retry_mode = False
         self._batch_dml_rows_count = None
+        self._buffered_statement = None
         self._request_tag = None
 
     @property
@@ -220,8 +226,17 @@ class Cursor(object):
         pass
 
     def close(self):
-        """Closes this cursor."""
-        self._is_closed = True
+        """Closes this cursor.
+
+        A DML statement of the cursor that is buffered in the ``BATCHED``
+        autocommit DML mode is executed first, together with the rest of its
+        batch.
+        """
+        try:
+            if self._buffered_statement is not None:
+                self.connection._autocommit_dml_batch.flush()
+        finally:
+            self._is_closed = True
 
     def _do_execute_update_in_autocommit(self, transaction, sql, params):
         """This function should only be used in autocommit mode."""
@@ -269,6 +284,24 @@ class Cursor(object):
         self._result_set = None
         self._row_count = None
         self._batch_dml_rows_count = None
+        self._buffered_statement = None
+
+    def _is_autocommit_dml_batched(self):
+        """Whether the parsed statement is buffered in the autocommit DML batch
+        of the connection.
+        """
+        connection = self.connection
+        return (
+            connection.autocommit_dml_mode is AutocommitDmlMode.BATCHED
+            and not connection._client_transaction_started
+            and not connection.read_only
+            and connection._batch_mode is BatchMode.NONE
+            and self._parsed_statement.statement_type
+            in (StatementType.INSERT, StatementType.UPDATE)
+            and not parse_utils.RE_RETURNING.search(
+                self._parsed_statement.statement.sql
+            )
+        )
 
     @check_not_closed
     def execute(self, sql, args=None):
@@ -284,72 +317,104 @@ class Cursor(object):
         :param args: Additional parameters to supplement the SQL query.
         """
         self._reset()
+        with self._executing(sql, args, record=not call_from_execute_many):
+            batched = self._classify_statement(sql, args)
+            if not batched:
+                self.connection._autocommit_dml_batch.flush()
+            self._statement_executor(sql, args, batched)()
+
+    @contextmanager
+    def _executing(self, sql, args, is_execute_many=False, record=True):
+        """Context of the execution of a statement.
+
+        Errors of Spanner are raised as the matching DB-API errors, and the
+        statement is recorded for a retry of the transaction.
+        """
         exception = None
         try:
-            self._parsed_statement = parse_utils.classify_statement(sql, args)
-            if self._parsed_statement is None:
-                raise ProgrammingError("Invalid Statement.")
-
-            if self._parsed_statement.statement_type == StatementType.CLIENT_SIDE:
-                self._result_set = client_side_statement_executor.execute(
-                    self, self._parsed_statement
-                )
-                if self._result_set is not None:
-                    if isinstance(
-                        self._result_set, StreamedManyResultSets
-                    ) or isinstance(self._result_set, MergedResultSet):
-                        self._itr = self._result_set
-                    else:
-                        self._itr = PeekIterator(self._result_set)
-            elif self.connection._batch_mode == BatchMode.DML:
-                self.connection.execute_batch_dml_statement(self._parsed_statement)
-            elif self.connection.read_only or (
-                not self.connection._client_transaction_started
-                and self._parsed_statement.statement_type == StatementType.QUERY
-            ):
-                self._handle_DQL(sql, args or None)
-            elif self._parsed_statement.statement_type == StatementType.DDL:
-                self._batch_DDLs(sql)
-                if not self.connection._client_transaction_started:
-                    self.connection.run_prior_DDL_statements()
-            elif (
-                self.connection.autocommit_dml_mode
-                is AutocommitDmlMode.PARTITIONED_NON_ATOMIC
-            ):
-                self._row_count = self.connection.database.execute_partitioned_dml(
-                    sql,
-                    params=args,
-                    param_types=self._parsed_statement.statement.param_types,
-                    request_options=self.request_options,
-                )
-                self._result_set = None
-            else:
-                self._execute_in_rw_transaction()
-
-        except (AlreadyExists, FailedPrecondition, OutOfRange) as e:
-            exception = IntegrityError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
-        except InvalidArgument as e:
-            exception = ProgrammingError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
-        except InternalServerError as e:
-            exception = OperationalError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
+            yield
         except Exception as e:
-            exception = e
-            raise
-
+            exception = _to_dbapi_error(e)
+            if exception is e:
+                raise
+            raise exception from e
         finally:
-            if not self._in_retry_mode and not call_from_execute_many:
+            if record and not self._in_retry_mode:
                 self.transaction_helper.add_execute_statement_for_retry(
-                    self, sql, args, exception, False
+                    self, sql, args, exception, is_execute_many
                 )
             if self.connection._client_transaction_started is False:
                 self.connection._spanner_transaction_started = False
 
+    def _classify_statement(self, sql, args):
+        """Parse the statement that is executed.
+
+        :rtype: bool
+        :returns: whether the statement is buffered in the autocommit DML
+            batch of the connection.
+        """
+        self._parsed_statement = parse_utils.classify_statement(sql, args)
+        if self._parsed_statement is None:
+            raise ProgrammingError("Invalid Statement.")
+        return self._is_autocommit_dml_batched()
+
+    def _statement_executor(self, sql, args, batched):
+        """Choose how the parsed statement is executed.
+
+        :rtype: callable
+        :returns: a function without arguments that executes the statement.
+        """
+        connection = self.connection
+        statement_type = self._parsed_statement.statement_type
+        if statement_type == StatementType.CLIENT_SIDE:
+            return self._execute_client_side_statement
+        if connection._batch_mode == BatchMode.DML:
+            return functools.partial(
+                connection.execute_batch_dml_statement, self._parsed_statement
+            )
+        if connection.read_only or (
+            not connection._client_transaction_started
+            and statement_type == StatementType.QUERY
+        ):
+            return functools.partial(self._handle_DQL, sql, args or None)
+        if statement_type == StatementType.DDL:
+            return functools.partial(self._execute_DDL, sql)
+        if batched:
+            return functools.partial(
+                connection._autocommit_dml_batch.add,
+                self,
+                self._parsed_statement.statement,
+            )
+        if connection.autocommit_dml_mode is AutocommitDmlMode.PARTITIONED_NON_ATOMIC:
+            return functools.partial(self._execute_partitioned_DML, sql, args)
+        return self._execute_in_rw_transaction
+
+    def _execute_client_side_statement(self):
+        self._result_set = client_side_statement_executor.execute(
+            self, self._parsed_statement
+        )
+        if self._result_set is not None:
+            if isinstance(self._result_set, StreamedManyResultSets) or isinstance(
+                self._result_set, MergedResultSet
+            ):
+                self._itr = self._result_set
+            else:
+                self._itr = PeekIterator(self._result_set)
+
+    def _execute_DDL(self, sql):
+        self._batch_DDLs(sql)
+        if not self.connection._client_transaction_started:
+            self.connection.run_prior_DDL_statements()
+
+    def _execute_partitioned_DML(self, sql, args):
+        self._row_count = self.connection.database.execute_partitioned_dml(
+            sql,
+            params=args,
+            param_types=self._parsed_statement.statement.param_types,
+            request_options=self.request_options,
+        )
+        self._result_set = None
+
     def _execute_in_rw_transaction(self):
         # For every other operation, we've got to ensure that
         # any prior DDL statements were run.
@@ -399,72 +464,208 @@ class Cursor(object):
                               the query with.
         """
         self._reset()
-        exception = None
-        try:
-            self._parsed_statement = parse_utils.classify_statement(operation)
-            if self._parsed_statement.statement_type == StatementType.DDL:
-                raise ProgrammingError(
-                    "Executing DDL statements with executemany() method is not allowed."
-                )
-
-            if self._parsed_statement.statement_type == StatementType.CLIENT_SIDE:
-                raise ProgrammingError(
-                    "Executing the following operation: "
-                    + operation
-                    + ", with executemany() method is not allowed."
-                )
-
+        with self._executing(operation, seq_of_params, is_execute_many=True):
+            self.connection._autocommit_dml_batch.flush()
+            self._classify_executemany(operation)
             # For every operation, we've got to ensure that any prior DDL
             # statements were run.
             self.connection.run_prior_DDL_statements()
-            # Treat UNKNOWN statements as if they are DML and let the server
-            # determine what is wrong with it.
-            if self._parsed_statement.statement_type in (
-                StatementType.INSERT,
-                StatementType.UPDATE,
-                StatementType.UNKNOWN,
-            ):
-                statements = []
-                for params in seq_of_params:
-                    sql, params = parse_utils.sql_pyformat_args_to_spanner(
-                        operation, params
-                    )
-                    statements.append(Statement(sql, params, get_param_types(params)))
-                many_result_set = batch_dml_executor.run_batch_dml(self, statements)
-            else:
-                many_result_set = StreamedManyResultSets()
-                for params in seq_of_params:
-                    self._execute(operation, params, True)
-                    many_result_set.add_iter(self._itr)
-
+            many_result_set = self._executemany_executor(operation, seq_of_params)()
             self._result_set = many_result_set
             self._itr = many_result_set
-        except (AlreadyExists, FailedPrecondition, OutOfRange) as e:
-            exception = IntegrityError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
-        except InvalidArgument as e:
-            exception = ProgrammingError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
-        except InternalServerError as e:
-            exception = OperationalError(getattr(e, "details", e))
-            exception.__cause__ = e
-            raise exception
-        except Exception as e:
-            exception = e
-            raise
-        finally:
-            if not self._in_retry_mode:
-                self.transaction_helper.add_execute_statement_for_retry(
-                    self,
-                    operation,
-                    seq_of_params,
-                    exception,
-                    True,
+
+    def _classify_executemany(self, operation):
+        """Parse the statement of an ``executemany`` call.
+
+        :raises: :class:`ProgrammingError` if the statement cannot be executed
+            with ``executemany``.
+        """
+        self._parsed_statement = parse_utils.classify_statement(operation)
+        if self._parsed_statement.statement_type == StatementType.DDL:
+            raise ProgrammingError(
+                "Executing DDL statements with executemany() method is not allowed."
+            )
+
+        if self._parsed_statement.statement_type == StatementType.CLIENT_SIDE:
+            raise ProgrammingError(
+                "Executing the following operation: "
+                + operation
+                + ", with executemany() method is not allowed."
+            )
+
+    def _executemany_executor(self, operation, seq_of_params):
+        """Choose how the statement of an ``executemany`` call is executed.
+
+        :rtype: callable
+        :returns: a function without arguments that executes the statement,
+            and returns the results of all sets of parameters.
+        """
+        statement_type = self._parsed_statement.statement_type
+        # Treat UNKNOWN statements as if they are DML and let the server
+        # determine what is wrong with it.
+        insert = None
+        if (
+            statement_type == StatementType.INSERT
+            and self.connection.insert_as_mutations
+            and not self.connection.read_only
+        ):
+            insert = parse_utils.get_insert_template(operation)
+        if insert is not None:
+            return functools.partial(self._insert_mutations, insert, seq_of_params)
+        if statement_type in (
+            StatementType.INSERT,
+            StatementType.UPDATE,
+            StatementType.UNKNOWN,
+        ):
+            statements = []
+            for params in seq_of_params:
+                sql, params = parse_utils.sql_pyformat_args_to_spanner(
+                    operation, params
                 )
-            if self.connection._client_transaction_started is False:
-                self.connection._spanner_transaction_started = False
+                statements.append(Statement(sql, params, get_param_types(params)))
+            return functools.partial(self._run_batch_dml, statements)
+        seq_of_params = list(seq_of_params)
+        if seq_of_params and self._executes_queries_concurrently():
+            statements = [
+                parse_utils.sql_pyformat_args_to_spanner(operation, params)
+                for params in seq_of_params
+            ]
+            return functools.partial(self._execute_queries_concurrently, statements)
+        return functools.partial(self._execute_serially, operation, seq_of_params)
+
+    def _run_batch_dml(self, statements):
+        return batch_dml_executor.run_batch_dml(self, statements)
+
+    def _execute_serially(self, operation, seq_of_params):
+        """Execute a statement once for each set of parameters, one after
+        the other.
+        """
+        many_result_set = StreamedManyResultSets()
+        for params in seq_of_params:
+            self._execute(operation, params, True)
+            many_result_set.add_iter(self._itr)
+        return many_result_set
+
+    def _executes_queries_concurrently(self):
+        """Whether ``executemany`` runs the parsed query concurrently for its
+        sets of parameters.
+        """
+        connection = self.connection
+        return (
+            connection.max_concurrent_queries > 1
+            and self._parsed_statement.statement_type == StatementType.QUERY
+            and connection._batch_mode is BatchMode.NONE
+            and (connection.read_only or not connection._client_transaction_started)
+        )
+
+    def _execute_queries_concurrently(self, statements):
+        """Run a query once for each set of parameters, running up to
+        ``max_concurrent_queries`` queries at the same time.
+
+        :type statements: list
+        :param statements: the SQL and the parameters of each query.
+
+        :rtype: :class:`~google.cloud.spanner_dbapi.utils.StreamedManyResultSets`
+        :returns: the rows of each query, in the order of the parameters.
+        """
+        connection = self.connection
+        request_options = self.request_options
+        if connection._client_transaction_started:
+            # All queries use the multi-use snapshot of the transaction.
+            multi_use_snapshot = connection.snapshot_checkout()
+
+            def run_query(statement):
+                return multi_use_snapshot, _execute_query(
+                    multi_use_snapshot, *statement, request_options
+                )
+
+        else:
+
+            def run_query(statement):
+                with connection.database.snapshot(**connection.staleness) as snapshot:
+                    return snapshot, _execute_query(
+                        snapshot, *statement, request_options
+                    )
+
+        max_workers = min(connection.max_concurrent_queries, len(statements))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_query, statements))
+        many_result_set = StreamedManyResultSets()
+        for itr in self._concurrent_query_iterators(results):
+            many_result_set.add_iter(itr)
+        return many_result_set
+
+    def _concurrent_query_iterators(self, results):
+        """Return the row iterators of queries that were run concurrently.
+
+        :type results: list
+        :param results: the snapshot, the result set and the row iterator of
+            each query.
+        """
+        connection = self.connection
+        if not connection._client_transaction_started:
+            connection._snapshot = results[-1][0]
+            connection._transaction = None
+        return [itr for _, (_, itr) in results]
+
+    def _insert_mutations(self, insert, seq_of_params):
+        """Insert the rows of an ``executemany`` call as mutations.
+
+        :type insert: :class:`~google.cloud.spanner_dbapi.parse_utils.InsertTemplate`
+        :param insert: the simple INSERT statement.
+
+        :type seq_of_params: list
+        :param seq_of_params: the parameters of each row.
+
+        :rtype: :class:`~google.cloud.spanner_dbapi.utils.StreamedManyResultSets`
+        :returns: the row count of each statement.
+        """
+        rows = [insert.bind(params) for params in seq_of_params]
+        if self.connection._client_transaction_started:
+            self._insert_in_transaction(
+                self.connection.transaction_checkout(), insert, rows
+            )
+        else:
+            writer = self._bulk_writer(BulkWriter)
+            try:
+                with writer:
+                    writer.insert(insert.table, insert.columns, rows)
+            finally:
+                self._row_count = _committed_rows(writer)
+        many_result_set = StreamedManyResultSets()
+        many_result_set.add_iter([1] * len(rows))
+        return many_result_set
+
+    def _insert_in_transaction(self, transaction, insert, rows):
+        """Buffer the rows of an ``executemany`` call in the transaction.
+
+        :raises: :class:`ProgrammingError` if the rows exceed the mutation
+            limits of the transaction.
+        """
+        try:
+            transaction.insert(insert.table, insert.columns, rows, validate=True)
+        except ValueError as e:
+            raise ProgrammingError(str(e))
+        self._row_count = len(rows)
+        self._batch_dml_rows_count = [1] * len(rows)
+
+    def _bulk_writer(self, writer_class):
+        """Create the writer that commits the rows of an ``executemany`` call
+        in autocommit mode.
+
+        The writer commits one batch of rows at a time, and stops at the first
+        batch that fails.
+        """
+        commit_kw = {}
+        request_options = self.request_options
+        if request_options is not None:
+            commit_kw["request_options"] = request_options
+        return writer_class(
+            self.connection.database,
+            max_concurrent_commits=1,
+            stop_on_error=True,
+            **commit_kw,
+        )
 
     @check_not_closed
     def fetchone(self):
@@ -499,30 +700,11 @@ class Cursor(object):
         return self._fetch(CursorStatementType.FETCH_MANY, size)
 
     def _fetch(self, cursor_statement_type, size=None):
-        exception = None
-        rows = []
-        is_fetch_all = False
-        try:
+        self.connection._autocommit_dml_batch.flush()
+        with self._fetching(cursor_statement_type) as rows:
             while True:
-                rows = []
                 try:
-                    if cursor_statement_type == CursorStatementType.FETCH_ALL:
-                        is_fetch_all = True
-                        for row in self:
-                            rows.append(row)
-                    elif cursor_statement_type == CursorStatementType.FETCH_MANY:
-                        for _ in range(size):
-                            try:
-                                row = next(self)
-                                rows.append(row)
-                            except StopIteration:
-                                break
-                    elif cursor_statement_type == CursorStatementType.FETCH_ONE:
-                        try:
-                            row = next(self)
-                            rows.append(row)
-                        except StopIteration:
-                            return
+                    rows[:] = self._fetch_rows(cursor_statement_type, size)
                     break
                 except Aborted:
                     if not self.connection.read_only:
@@ -530,33 +712,57 @@ class Cursor(object):
                             raise
                         else:
                             self.transaction_helper.retry_transaction()
+        return rows
+
+    @contextmanager
+    def _fetching(self, cursor_statement_type):
+        """Context of a fetch call, which yields the list of fetched rows.
+
+        The rows are recorded for a retry of the transaction. An error of the
+        fetch call is recorded as well, and is not raised.
+        """
+        exception = None
+        rows = []
+        try:
+            yield rows
         except Exception as e:
             exception = e
-
         finally:
             if not self._in_retry_mode:
                 self.transaction_helper.add_fetch_statement_for_retry(
-                    self, rows, exception, is_fetch_all
+                    self,
+                    rows,
+                    exception,
+                    cursor_statement_type == CursorStatementType.FETCH_ALL,
                 )
-        return rows
+
+    def _fetch_rows(self, cursor_statement_type, size=None):
+        if cursor_statement_type == CursorStatementType.FETCH_ALL:
+            if isinstance(self._itr, PeekIterator):
+                return self._itr.fetch()
+            return list(self)
+        if cursor_statement_type == CursorStatementType.FETCH_MANY:
+            if isinstance(self._itr, PeekIterator):
+                return self._itr.fetch(size)
+            rows = []
+            for _ in range(size):
+                try:
+                    rows.append(next(self))
+                except StopIteration:
+                    break
+            return rows
+        try:
+            return [next(self)]
+        except StopIteration:
+            return []
 
     def _handle_DQL_with_snapshot(self, snapshot, sql, params):
-        self._result_set = snapshot.execute_sql(
-            sql,
-            params,
-            get_param_types(params),
-            request_options=self.request_options,
+        self._result_set, self._itr = _execute_query(
+            snapshot, sql, params, self.request_options
         )
-        # Read the first element so that the StreamedResultSet can
-        # return the metadata after a DQL statement.
-        self._itr = PeekIterator(self._result_set)
         # Unfortunately, Spanner doesn't seem to send back
         # information about the number of rows available.
         self._row_count = None
-        if self._result_set.metadata.transaction.read_timestamp is not None:
-            snapshot._transaction_read_timestamp = (
-                self._result_set.metadata.transaction.read_timestamp
-            )
 
     def _handle_DQL(self, sql, params):
         if self.connection.database is None:
@@ -612,6 +818,7 @@ class Cursor(object):
         if self.connection.database is None:
             raise ValueError("Database needs to be passed for this operation")
         self.connection.run_prior_DDL_statements()
+        self.connection._autocommit_dml_batch.flush()
 
         with self.connection.database.snapshot() as snapshot:
             return list(snapshot.execute_sql(sql, params, param_types))
@@ -625,10 +832,62 @@ class Cursor(object):
                 "table_name": spanner.param_types.STRING,
             },
         )
+        return _column_details(rows)
 
-        column_details = {}
-        for column_name, is_nullable, spanner_type in rows:
-            column_details[column_name] = ColumnDetails(
-                null_ok=is_nullable == "YES", spanner_type=spanner_type
-            )
-        return column_details
+
+def _column_details(rows):
+    """Map the rows of the column schema query to the details of each column."""
+    column_details = {}
+    for column_name, is_nullable, spanner_type in rows:
+        column_details[column_name] = ColumnDetails(
+            null_ok=is_nullable == "YES", spanner_type=spanner_type
+        )
+    return column_details
+
+
+def _execute_query(snapshot, sql, params, request_options):
+    """Run a query in a snapshot.
+
+    :rtype: tuple
+    :returns: the result set of the query, and an iterator over its rows
+        that has read the first row.
+    """
+    result_set = snapshot.execute_sql(
+        sql,
+        params,
+        get_param_types(params),
+        request_options=request_options,
+    )
+    # Read the first element so that the StreamedResultSet can
+    # return the metadata after a DQL statement.
+    itr = PeekIterator(result_set)
+    _set_read_timestamp(snapshot, result_set)
+    return result_set, itr
+
+
+def _set_read_timestamp(snapshot, result_set):
+    """Keep the read timestamp that a query returned on its snapshot."""
+    if result_set.metadata.transaction.read_timestamp is not None:
+        snapshot._transaction_read_timestamp = (
+            result_set.metadata.transaction.read_timestamp
+        )
+
+
+def _committed_rows(writer):
+    """The number of rows that a bulk writer committed successfully."""
+    return sum(result.rows for result in writer.results if result.succeeded)
+
+
+def _to_dbapi_error(error):
+    """Convert an error of Spanner to the matching DB-API error.
+
+    :rtype: Exception
+    :returns: the DB-API error, or ``error`` if there is no matching one.
+    """
+    if isinstance(error, (AlreadyExists, FailedPrecondition, OutOfRange)):
+        return IntegrityError(getattr(error, "details", error))
+    if isinstance(error, InvalidArgument):
+        return ProgrammingError(getattr(error, "details", error))
+    if isinstance(error, InternalServerError):
+        return OperationalError(getattr(error, "details", error))
+    return error
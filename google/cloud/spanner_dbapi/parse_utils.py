@@ -14,17 +14,19 @@
 
 "SQL parsing and classification utils."
 
+from dataclasses import dataclass
 import datetime
 import decimal
+import functools
 import re
+from typing import Optional, Tuple
 import warnings
 
-import sqlparse
-
 from google.cloud import spanner_v1 as spanner
 from google.cloud.spanner_v1 import JsonObject
 
 from . import client_side_statement_parser
+from ._sql_lexer import scan_sql
 from .exceptions import Error
 from .parsed_statement import ParsedStatement, Statement, StatementType
 from .types import DateStr, TimestampStr
@@ -171,6 +173,9 @@ RE_DDL = re.compile(
 RE_IS_INSERT = re.compile(r"^\s*(INSERT\s+)", re.IGNORECASE | re.DOTALL)
 RE_IS_UPDATE = re.compile(r"^\s*(UPDATE\s+)", re.IGNORECASE | re.DOTALL)
 RE_IS_DELETE = re.compile(r"^\s*(DELETE\s+)", re.IGNORECASE | re.DOTALL)
+# DML statements with a THEN RETURN (GoogleSQL) or RETURNING (PostgreSQL)
+# clause return rows.
+RE_RETURNING = re.compile(r"\b(THEN\s+RETURN|RETURNING)\b", re.IGNORECASE)
 
 RE_INSERT = re.compile(
     # Only match the `INSERT INTO <table_name> (columns...)
@@ -181,6 +186,15 @@ RE_INSERT = re.compile(
 )
 """Deprecated: Use the RE_IS_INSERT, RE_IS_UPDATE, and RE_IS_DELETE regexes"""
 
+# An INSERT of a single row whose values are all placeholders, that can be
+# written as a mutation instead.
+RE_SIMPLE_INSERT = re.compile(
+    r"^INSERT\s+(?:INTO\s+)?(?P<table_name>`[^`]+`|[^\s\(\)`]+)\s*"
+    r"\((?P<columns>[^\(\)]+)\)\s*VALUES\s*"
+    r"\((?P<values>(?:[^\(\)]|%\([^\(\)]+\)s)+)\)\s*;?$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 RE_VALUES_TILL_END = re.compile(r"VALUES\s*\(.+$", re.IGNORECASE | re.DOTALL)
 
 RE_VALUES_PYFORMAT = re.compile(
@@ -191,6 +205,9 @@ RE_VALUES_PYFORMAT = re.compile(
 
 RE_PYFORMAT = re.compile(r"(%s|%\([^\(\)]+\)s)+", re.DOTALL)
 
+# Number of distinct statements whose classification is cached.
+_STATEMENT_CACHE_SIZE = 1000
+
 
 def classify_stmt(query):
     """Determine SQL query type.
@@ -203,11 +220,7 @@ def classify_stmt(query):
         "This method is deprecated. Use _classify_stmt method", DeprecationWarning
     )
 
-    # sqlparse will strip Cloud Spanner comments,
-    # still, special commenting styles, like
-    # PostgreSQL dollar quoted comments are not
-    # supported and will not be stripped.
-    query = sqlparse.format(query, strip_comments=True).strip()
+    query = scan_sql(query).sql
 
     if RE_DDL.match(query):
         return STMT_DDL
@@ -234,32 +247,76 @@ def classify_statement(query, args=None):
     :rtype: ParsedStatement
     :returns: parsed statement attributes.
     """
-    # Check for RUN PARTITION command to avoid sqlparse processing it.
-    # sqlparse fails with "Maximum grouping depth exceeded" on long partition IDs.
+    # RUN PARTITION commands carry a unique partition ID, so they are parsed
+    # directly instead of filling the statement cache.
     if re.match(r"^\s*RUN\s+PARTITION\s+.+", query, re.IGNORECASE):
         return client_side_statement_parser.parse_stmt(query.strip())
 
-    # sqlparse will strip Cloud Spanner comments,
-    # still, special commenting styles, like
-    # PostgreSQL dollar quoted comments are not
-    # supported and will not be stripped.
-    query = sqlparse.format(query, strip_comments=True).strip()
+    if not args:
+        params_kind = None
+    elif isinstance(args, dict):
+        params_kind = dict
+    else:
+        params_kind = list
+    template = _get_statement_template(query, params_kind)
+    if template is None:
+        return None
+    if template.statement_type is None:
+        return client_side_statement_parser.parse_stmt(template.sql)
+    if params_kind is None:
+        return ParsedStatement(template.statement_type, Statement(template.sql))
+    params = _bind_pyformat_params(template.placeholders, args)
+    statement = Statement(template.sql, params, get_param_types(params or None))
+    return ParsedStatement(template.statement_type, statement)
+
+
+@dataclass(frozen=True)
+class _StatementTemplate:
+    """The classification of a statement, without its parameter values."""
+
+    # None for client side statements.
+    statement_type: Optional[StatementType]
+    sql: str
+    # The pyformat placeholders that were replaced by @a0, @a1, ... in order.
+    placeholders: Optional[Tuple[str, ...]] = None
+
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _get_statement_template(query, params_kind):
+    """Classify a statement, and rewrite it for the given kind of parameters.
+
+    Applications run the same statements over and over, so the result is
+    cached by the text of the statement, and only the parameters are bound
+    for each execution.
+
+    :type query: str
+    :param query: A SQL query.
+
+    :type params_kind: type
+    :param params_kind: ``dict`` or ``list`` for named or positional
+        parameters, or None if the statement is executed without parameters.
+
+    :rtype: :class:`_StatementTemplate`
+    :returns: the classified statement, or None if it is empty.
+    """
+    # Comments, placeholders and the WHERE clause are found in a single
+    # pass, which skips string literals and quoted identifiers.
+    scanned = scan_sql(query)
+    query = scanned.sql
     if query == "":
         return None
-    parsed_statement: ParsedStatement = client_side_statement_parser.parse_stmt(query)
-    if parsed_statement is not None:
-        return parsed_statement
-    query, args = sql_pyformat_args_to_spanner(query, args or None)
-    statement = Statement(
-        query,
-        args,
-        get_param_types(args or None),
-    )
-    statement_type = _get_statement_type(statement)
-    return ParsedStatement(statement_type, statement)
+    if client_side_statement_parser.parse_stmt(query) is not None:
+        return _StatementTemplate(None, query)
+    if params_kind is None:
+        sql, placeholders = sanitize_literals_for_upload(query), None
+    else:
+        sql, placeholders = _pyformat_template(scanned, params_kind is dict)
+    statement = Statement(sql)
+    statement_type = _get_statement_type(statement, scanned.has_where)
+    return _StatementTemplate(statement_type, statement.sql, placeholders)
 
 
-def _get_statement_type(statement):
+def _get_statement_type(statement, has_where=None):
     query = statement.sql
     if RE_DDL.match(query):
         return StatementType.DDL
@@ -273,7 +330,10 @@ def _get_statement_type(statement):
     if RE_IS_UPDATE.match(query) or RE_IS_DELETE.match(query):
         # TODO: Remove this? It makes more sense to have this in SQLAlchemy and
         #       Django than here.
-        statement.sql = ensure_where_clause(query)
+        if has_where is None:
+            statement.sql = ensure_where_clause(query)
+        elif not has_where:
+            statement.sql = query + " WHERE 1=1"
         return StatementType.UPDATE
 
     return StatementType.UNKNOWN
@@ -311,39 +371,158 @@ def sql_pyformat_args_to_spanner(sql, params):
     if not params:
         return sanitize_literals_for_upload(sql), None
 
-    found_pyformat_placeholders = RE_PYFORMAT.findall(sql)
-    params_is_dict = isinstance(params, dict)
+    sql, placeholders = _compile_pyformat(sql, isinstance(params, dict))
+    return sql, _bind_pyformat_params(placeholders, params)
 
-    if params_is_dict:
-        if not found_pyformat_placeholders:
-            return sanitize_literals_for_upload(sql), params
-    else:
-        n_params = len(params) if params else 0
-        n_matches = len(found_pyformat_placeholders)
-        if n_matches != n_params:
-            raise Error(
-                "pyformat_args mismatch\ngot %d args from %s\n"
-                "want %d args in %s"
-                % (n_matches, found_pyformat_placeholders, n_params, params)
-            )
-
-    named_args = {}
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _compile_pyformat(sql, params_is_dict):
+    """Rewrite the pyformat placeholders of a statement once per statement.
+
+    The same statement is usually executed many times with different
+    parameters, e.g. by ``executemany``, so the rewritten statement is
+    cached by its text and only the parameters are bound for each call.
+
+    :type sql: str
+    :param sql: A SQL request.
+
+    :type params_is_dict: bool
+    :param params_is_dict: whether the parameters are named.
+
+    :rtype: tuple(str, tuple)
+    :returns: The result of :func:`_pyformat_template`.
+    """
+    return _pyformat_template(scan_sql(sql), params_is_dict)
+
+
+def _pyformat_template(scanned, params_is_dict):
+    """Replace the pyformat placeholders of a statement by @a0, @a1, ...
+
+    :type scanned: :class:`~google.cloud.spanner_dbapi._sql_lexer.ScannedSql`
+    :param scanned: A scanned SQL request.
+
+    :type params_is_dict: bool
+    :param params_is_dict: whether the parameters are named.
+
+    :rtype: tuple(str, tuple)
+    :returns: The sanitized SQL, and the replaced placeholders, or None if
+              the statement has no placeholders for named parameters.
+    """
+    placeholders = scanned.placeholders
+    if params_is_dict and not placeholders:
+        return sanitize_literals_for_upload(scanned.sql), None
+
+    sql = scanned.rewrite(["@" + name for name in _param_names(len(placeholders))])
+    return sanitize_literals_for_upload(sql), tuple(placeholders)
+
+
+@functools.lru_cache(maxsize=64)
+def _param_names(count):
+    """The names a0, a1, ... of the parameters of a statement."""
+    return tuple("a%d" % i for i in range(count))
+
+
+def _bind_pyformat_params(placeholders, params):
+    """Name the parameters after the placeholders they replace.
+
+    :type placeholders: tuple
+    :param placeholders: The placeholders returned by
+                         :func:`_pyformat_template`.
+
+    :type params: list or dict
+    :param params: The parameters of the statement.
+
+    :rtype: dict
+    :returns: The named arguments.
+    """
+    if placeholders is None:
+        return params
     # We've now got for example:
     # Case a) Params is a non-dict
     #   SQL:      'SELECT * from t where f1=%s, f2=%s, f3=%s'
     #   Params:   ('a', 23, '888***')
     # Case b) Params is a dict and the matches are %(value)s'
-    for i, pyfmt in enumerate(found_pyformat_placeholders):
-        key = "a%d" % i
-        sql = sql.replace(pyfmt, "@" + key, 1)
-        if params_is_dict:
-            # The '%(key)s' case, so interpolate it.
-            resolved_value = pyfmt % params
-            named_args[key] = resolved_value
-        else:
-            named_args[key] = params[i]
+    if isinstance(params, dict):
+        # The '%(key)s' case, so interpolate it.
+        return {
+            name: pyfmt % params
+            for name, pyfmt in zip(_param_names(len(placeholders)), placeholders)
+        }
+
+    n_params = len(params) if params else 0
+    n_matches = len(placeholders)
+    if n_matches != n_params:
+        raise Error(
+            "pyformat_args mismatch\ngot %d args from %s\n"
+            "want %d args in %s" % (n_matches, list(placeholders), n_params, params)
+        )
+    return dict(zip(_param_names(n_matches), params))
+
+
+@dataclass(frozen=True)
+class InsertTemplate:
+    """A simple INSERT statement, that inserts one row of parameters."""
+
+    table: str
+    columns: Tuple[str, ...]
+    # The pyformat placeholders of the values, in the order of the columns.
+    placeholders: Tuple[str, ...]
+
+    def bind(self, params):
+        """Return the values of the inserted row.
+
+        :type params: list or dict
+        :param params: The parameters of the statement.
+
+        :rtype: list
+        :returns: The value of each column.
+        """
+        if isinstance(params, dict):
+            try:
+                return [params[pyfmt[2:-2]] for pyfmt in self.placeholders]
+            except KeyError as e:
+                raise Error("pyformat_args mismatch: missing %s" % e)
+        return list(_bind_pyformat_params(self.placeholders, params).values())
+
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def get_insert_template(sql):
+    """Recognize an INSERT of a single row of parameters.
+
+    Such statements can be executed as insert mutations, e.g.
+    ``INSERT INTO t (a, b) VALUES (%s, %s)``. Statements with literal
+    values, multiple rows, hints, a ``THEN RETURN`` clause or other
+    clauses are not recognized.
+
+    :type sql: str
+    :param sql: A SQL statement.
+
+    :rtype: :class:`InsertTemplate`
+    :returns: the table, columns and placeholders of the statement, or None
+        if the statement is not a simple INSERT.
+    """
+    scanned = scan_sql(sql)
+    match = RE_SIMPLE_INSERT.match(scanned.sql)
+    if match is None:
+        return None
+    values = [value.strip() for value in match.group("values").split(",")]
+    columns = [column.strip() for column in match.group("columns").split(",")]
+    if values != scanned.placeholders or len(columns) != len(values):
+        return None
+    named = [pyfmt != "%s" for pyfmt in values]
+    if any(named) and not all(named):
+        return None
+    return InsertTemplate(
+        _unquote_identifier(match.group("table_name")),
+        tuple(_unquote_identifier(column) for column in columns),
+        tuple(values),
+    )
+
 
-    return sanitize_literals_for_upload(sql), named_args
+def _unquote_identifier(name):
+    if len(name) > 1 and name[0] == name[-1] and name[0] in '`"':
+        return name[1:-1]
+    return name
 
 
 def get_param_types(params):
@@ -376,7 +555,7 @@ def ensure_where_clause(sql):
     :type sql: str
     :param sql: SQL code to check.
     """
-    if any(isinstance(token, sqlparse.sql.Where) for token in sqlparse.parse(sql)[0]):
+    if scan_sql(sql).has_where:
         return sql
 
     return sql + " WHERE 1=1"
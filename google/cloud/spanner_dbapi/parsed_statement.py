@@ -43,6 +43,7 @@ class ClientSideStatementType(Enum):
 class AutocommitDmlMode(Enum):
     TRANSACTIONAL = 1
     PARTITIONED_NON_ATOMIC = 2
+    BATCHED = 3
 
 
 @dataclass
@@ -14,24 +14,146 @@
 
 import base64
 from dataclasses import dataclass
+import functools
 import gzip
 import pickle
+import struct
 from typing import Any
 
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.cloud._helpers import _datetime_to_pb_timestamp
+from google.protobuf.timestamp_pb2 import Timestamp
+
 from google.cloud.spanner_v1 import BatchTransactionId
 
+# Partition ids are encoded as a version byte followed by length-prefixed
+# fields: session id, transaction id, read timestamp, partition token and the
+# request template. The template (everything in the partition result except
+# the partition token) is serialized once and shared by all partitions of a
+# query. Partition ids created by older versions are gzipped pickles.
+_FORMAT_VERSION = 1
+_GZIP_MAGIC = b"\x1f\x8b"
+_LENGTH = struct.Struct(">I")
+_TEMPLATE_CACHE_SIZE = 64
+
 
 def decode_from_string(encoded_partition_id):
-    gzip_bytes = base64.b64decode(bytes(encoded_partition_id, "utf-8"))
-    partition_id_bytes = gzip.decompress(gzip_bytes)
-    return pickle.loads(partition_id_bytes)
+    partition_id_bytes = base64.b64decode(bytes(encoded_partition_id, "utf-8"))
+    if partition_id_bytes[:2] == _GZIP_MAGIC:
+        return pickle.loads(gzip.decompress(partition_id_bytes))
+    return _decode_partition_id(partition_id_bytes)
 
 
 def encode_to_string(batch_transaction_id, partition_result):
-    partition_id = PartitionId(batch_transaction_id, partition_result)
-    partition_id_bytes = pickle.dumps(partition_id)
-    gzip_bytes = gzip.compress(partition_id_bytes)
-    return str(base64.b64encode(gzip_bytes), "utf-8")
+    template = {k: v for k, v in partition_result.items() if k != "partition"}
+    return _encode_partition_id(
+        _encode_transaction_id(batch_transaction_id),
+        partition_result["partition"],
+        pickle.dumps(template),
+    )
+
+
+def encode_partitions_to_strings(batch_transaction_id, partition_results):
+    """Encodes the partitions of a single partitioned query or read.
+
+    The transaction id and the request template are only serialized once,
+    which is considerably cheaper than calling :func:`encode_to_string` for
+    each partition.
+
+    :rtype: list of str
+    :returns: the encoded partition ids, in the order of the partitions
+    """
+    transaction_id_bytes = _encode_transaction_id(batch_transaction_id)
+    template = template_bytes = None
+    encoded_partition_ids = []
+    for partition_result in partition_results:
+        partition_template = {
+            k: v for k, v in partition_result.items() if k != "partition"
+        }
+        if partition_template != template:
+            template = partition_template
+            template_bytes = pickle.dumps(template)
+        encoded_partition_ids.append(
+            _encode_partition_id(
+                transaction_id_bytes, partition_result["partition"], template_bytes
+            )
+        )
+    return encoded_partition_ids
+
+
+def _encode_transaction_id(batch_transaction_id):
+    read_timestamp = batch_transaction_id.read_timestamp
+    if read_timestamp is None:
+        read_timestamp_bytes = b""
+    elif isinstance(read_timestamp, DatetimeWithNanoseconds):
+        read_timestamp_bytes = read_timestamp.timestamp_pb().SerializeToString()
+    else:
+        read_timestamp_bytes = _datetime_to_pb_timestamp(
+            read_timestamp
+        ).SerializeToString()
+    return _pack_fields(
+        bytes(batch_transaction_id.session_id, "utf-8"),
+        batch_transaction_id.transaction_id,
+        read_timestamp_bytes,
+    )
+
+
+def _encode_partition_id(transaction_id_bytes, partition_token, template_bytes):
+    partition_id_bytes = b"".join(
+        (
+            bytes((_FORMAT_VERSION,)),
+            transaction_id_bytes,
+            _pack_fields(partition_token, template_bytes),
+        )
+    )
+    return str(base64.b64encode(partition_id_bytes), "utf-8")
+
+
+def _decode_partition_id(partition_id_bytes):
+    version = partition_id_bytes[0]
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported partition id version: {version}")
+    (
+        session_id,
+        transaction_id,
+        read_timestamp_bytes,
+        partition_token,
+        template_bytes,
+    ) = _unpack_fields(partition_id_bytes, 1, 5)
+    read_timestamp = None
+    if read_timestamp_bytes:
+        read_timestamp = DatetimeWithNanoseconds.from_timestamp_pb(
+            Timestamp.FromString(read_timestamp_bytes)
+        )
+    partition_result = dict(_decode_template(template_bytes))
+    partition_result["partition"] = partition_token
+    return PartitionId(
+        BatchTransactionId(transaction_id, str(session_id, "utf-8"), read_timestamp),
+        partition_result,
+    )
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _decode_template(template_bytes):
+    # The decoded template is shared by all partitions of the same query, and
+    # must therefore not be modified.
+    return pickle.loads(template_bytes)
+
+
+def _pack_fields(*fields):
+    return b"".join(_LENGTH.pack(len(field)) + field for field in fields)
+
+
+def _unpack_fields(data, offset, count):
+    fields = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        fields.append(data[offset : offset + length])
+        offset += length
+    if offset != len(data):
+        raise ValueError("Invalid partition id")
+    return fields
 
 
 @dataclass
@@ -29,19 +29,37 @@ from google.cloud.spanner_dbapi.checksum import ResultsChecksum, _compare_checks
 
 MAX_INTERNAL_RETRIES = 50
 RETRY_ABORTED_ERROR = "The transaction was aborted and could not be retried due to a concurrent modification."
+RETRY_DISABLED_ERROR = "The transaction was aborted and was not retried, because internal retries are disabled."
+RETRY_LIMIT_EXCEEDED_ERROR = "The transaction was aborted and was not retried, because it exceeded the limits for replaying its statements."
 
 
 class TransactionRetryHelper:
-    def __init__(self, connection: "Connection"):
+    def __init__(self, connection: "Connection", checksum_class=ResultsChecksum):
         """Helper class used in retrying the transaction when aborted This will
         maintain all the statements executed on original transaction and replay
         them again in the retried transaction.
 
         :type connection: :class:`~google.cloud.spanner_dbapi.connection.Connection`
         :param connection: A DB-API connection to Google Cloud Spanner.
+
+        :type checksum_class: type
+        :param checksum_class: (Optional) The class of the checksums of the
+            fetched rows, with the interface of
+            :class:`~google.cloud.spanner_dbapi.checksum.ResultsChecksum`.
         """
 
         self._connection = connection
+        self._checksum_class = checksum_class
+        # Whether aborted transactions are retried by replaying their
+        # statements, and the limits of the statements that are recorded for
+        # a replay. None means no limit.
+        self.retry_aborts_internally = True
+        self.max_recorded_statements = None
+        self.max_recorded_bytes = None
+        # Encoded size of the results that were recorded for a replay
+        self._recorded_bytes = 0
+        # Whether the transaction exceeded the limits, so it is not replayed
+        self._limit_exceeded = False
         # list of all statements in the same order as executed in original
         # transaction along with their results
         self._statement_result_details_list: List[StatementDetails] = []
@@ -64,6 +82,34 @@ class TransactionRetryHelper:
         self._statement_result_details_list = []
         self._last_statement_details_per_cursor = {}
         self._cursor_map = {}
+        self._recorded_bytes = 0
+        self._limit_exceeded = False
+
+    @property
+    def _recording(self):
+        """Whether the statements are recorded for a replay."""
+        return (
+            self._connection._client_transaction_started
+            and self.retry_aborts_internally
+            and not self._limit_exceeded
+        )
+
+    def _check_limits(self):
+        """Stop recording the transaction if it exceeds the limits.
+
+        The recorded statements are dropped to free their memory, and the
+        transaction fails with :class:`RetryAborted` if it is aborted.
+        """
+        if (
+            self.max_recorded_statements is not None
+            and len(self._statement_result_details_list) > self.max_recorded_statements
+        ) or (
+            self.max_recorded_bytes is not None
+            and self._recorded_bytes > self.max_recorded_bytes
+        ):
+            self._statement_result_details_list = []
+            self._last_statement_details_per_cursor = {}
+            self._limit_exceeded = True
 
     def add_fetch_statement_for_retry(
         self, cursor, result_rows, exception, is_fetch_all
@@ -81,7 +127,7 @@ class TransactionRetryHelper:
         statement execution
         :param is_fetch_all: True in case of fetchall statement execution
         """
-        if not self._connection._client_transaction_started:
+        if not self._recording:
             return
 
         last_statement_result_details = self._last_statement_details_per_cursor.get(
@@ -96,11 +142,16 @@ class TransactionRetryHelper:
                 last_statement_result_details.result_type = ResultType.EXCEPTION
                 last_statement_result_details.result_details = exception
             else:
-                for row in result_rows:
-                    last_statement_result_details.result_details.consume_result(row)
+                checksum = last_statement_result_details.result_details
+                size = getattr(checksum, "size", 0)
+                checksum.consume_results(result_rows)
+                self._recorded_bytes += getattr(checksum, "size", 0) - size
                 last_statement_result_details.size += len(result_rows)
         else:
-            result_details = _get_statement_result_checksum(result_rows)
+            result_details = _get_statement_result_checksum(
+                result_rows, self._checksum_class
+            )
+            self._recorded_bytes += getattr(result_details, "size", 0)
             if is_fetch_all:
                 statement_type = CursorStatementType.FETCH_ALL
                 size = None
@@ -119,6 +170,7 @@ class TransactionRetryHelper:
                 cursor
             ] = last_statement_result_details
             self._statement_result_details_list.append(last_statement_result_details)
+        self._check_limits()
 
     def add_execute_statement_for_retry(
         self, cursor, sql, args, exception, is_execute_many
@@ -134,7 +186,7 @@ class TransactionRetryHelper:
         statement execution
         :param is_execute_many: True in case of executemany statement execution
         """
-        if not self._connection._client_transaction_started:
+        if not self._recording:
             return
         statement_type = CursorStatementType.EXECUTE
         if is_execute_many:
@@ -162,6 +214,22 @@ class TransactionRetryHelper:
         )
         self._last_statement_details_per_cursor[cursor] = last_statement_result_details
         self._statement_result_details_list.append(last_statement_result_details)
+        self._check_limits()
+
+    def _check_retry_allowed(self):
+        if not self.retry_aborts_internally:
+            raise RetryAborted(RETRY_DISABLED_ERROR)
+        if self._limit_exceeded:
+            raise RetryAborted(RETRY_LIMIT_EXCEEDED_ERROR)
+
+    def _get_retry_cursor(self, statement_result_details):
+        """Get the cursor that replays the statements of an original cursor."""
+        cursor = self._cursor_map.get(statement_result_details.cursor)
+        if cursor is None:
+            cursor = self._connection.cursor()
+            cursor._in_retry_mode = True
+            self._cursor_map[statement_result_details.cursor] = cursor
+        return cursor
 
     def retry_transaction(self, default_retry_delay=None):
         """Retry the aborted transaction.
@@ -172,8 +240,11 @@ class TransactionRetryHelper:
 
         :raises: :class:`google.cloud.spanner_dbapi.exceptions.RetryAborted`
             If results checksum of the retried statement is
-            not equal to the checksum of the original one.
+            not equal to the checksum of the original one, or if
+            the transaction is not replayed, because internal
+            retries are disabled or it exceeded the replay limits.
         """
+        self._check_retry_allowed()
         attempt = 0
         while True:
             attempt += 1
@@ -182,25 +253,17 @@ class TransactionRetryHelper:
             self._set_connection_for_retry()
             try:
                 for statement_result_details in self._statement_result_details_list:
-                    if statement_result_details.cursor in self._cursor_map:
-                        cursor = self._cursor_map.get(statement_result_details.cursor)
-                    else:
-                        cursor = self._connection.cursor()
-                        cursor._in_retry_mode = True
-                        self._cursor_map[statement_result_details.cursor] = cursor
+                    cursor = self._get_retry_cursor(statement_result_details)
                     try:
-                        _handle_statement(statement_result_details, cursor)
+                        _handle_statement(
+                            statement_result_details, cursor, self._checksum_class
+                        )
                     except Aborted:
                         raise
                     except RetryAborted:
                         raise
                     except Exception as ex:
-                        if (
-                            type(statement_result_details.result_details)
-                            is not type(ex)
-                            or ex.args != statement_result_details.result_details.args
-                        ):
-                            raise RetryAborted(RETRY_ABORTED_ERROR, ex)
+                        _check_exception(statement_result_details, ex)
                 return
             except Aborted as ex:
                 delay = _get_retry_delay(
@@ -210,36 +273,58 @@ class TransactionRetryHelper:
                     time.sleep(delay)
 
 
-def _handle_statement(statement_result_details, cursor):
+def _handle_statement(statement_result_details, cursor, checksum_class=ResultsChecksum):
     statement_type = statement_result_details.statement_type
     if _is_execute_type_statement(statement_type):
         if statement_type == CursorStatementType.EXECUTE:
             cursor.execute(statement_result_details.sql, statement_result_details.args)
-            if (
-                statement_result_details.result_type == ResultType.ROW_COUNT
-                and statement_result_details.result_details != cursor.rowcount
-            ):
-                raise RetryAborted(RETRY_ABORTED_ERROR)
         else:
             cursor.executemany(
                 statement_result_details.sql, statement_result_details.args
             )
-        if (
-            statement_result_details.result_type == ResultType.BATCH_DML_ROWS_COUNT
-            and statement_result_details.result_details != cursor._batch_dml_rows_count
-        ):
-            raise RetryAborted(RETRY_ABORTED_ERROR)
+        _check_execute_result(statement_result_details, cursor)
     else:
         if statement_type == CursorStatementType.FETCH_ALL:
             res = cursor.fetchall()
         else:
             res = cursor.fetchmany(statement_result_details.size)
-        checksum = _get_statement_result_checksum(res)
-        _compare_checksums(checksum, statement_result_details.result_details)
+        _check_fetch_result(statement_result_details, res, checksum_class)
+
+
+def _check_execute_result(statement_result_details, cursor):
+    """Compare the result of a replayed execute call with the original one."""
+    if (
+        statement_result_details.statement_type == CursorStatementType.EXECUTE
+        and statement_result_details.result_type == ResultType.ROW_COUNT
+        and statement_result_details.result_details != cursor.rowcount
+    ):
+        raise RetryAborted(RETRY_ABORTED_ERROR)
+    if (
+        statement_result_details.result_type == ResultType.BATCH_DML_ROWS_COUNT
+        and statement_result_details.result_details != cursor._batch_dml_rows_count
+    ):
+        raise RetryAborted(RETRY_ABORTED_ERROR)
     if statement_result_details.result_type == ResultType.EXCEPTION:
         raise RetryAborted(RETRY_ABORTED_ERROR)
 
 
+def _check_fetch_result(statement_result_details, rows, checksum_class):
+    """Compare the rows of a replayed fetch call with the original ones."""
+    checksum = _get_statement_result_checksum(rows, checksum_class)
+    _compare_checksums(checksum, statement_result_details.result_details)
+    if statement_result_details.result_type == ResultType.EXCEPTION:
+        raise RetryAborted(RETRY_ABORTED_ERROR)
+
+
+def _check_exception(statement_result_details, ex):
+    """Compare an exception of a replayed statement with the original one."""
+    if (
+        type(statement_result_details.result_details) is not type(ex)
+        or ex.args != statement_result_details.result_details.args
+    ):
+        raise RetryAborted(RETRY_ABORTED_ERROR, ex)
+
+
 def _is_execute_type_statement(statement_type):
     return statement_type in (
         CursorStatementType.EXECUTE,
@@ -247,10 +332,9 @@ def _is_execute_type_statement(statement_type):
     )
 
 
-def _get_statement_result_checksum(res_iter):
-    retried_checksum = ResultsChecksum()
-    for res in res_iter:
-        retried_checksum.consume_result(res)
+def _get_statement_result_checksum(res_iter, checksum_class=ResultsChecksum):
+    retried_checksum = checksum_class()
+    retried_checksum.consume_results(list(res_iter))
     return retried_checksum
 
 
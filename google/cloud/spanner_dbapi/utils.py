@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from itertools import islice
 import re
 
 re_UNICODE_POINTS = re.compile(r"([^\s]*[\u0080-\uFFFF]+[^\s]*)")
@@ -30,6 +31,8 @@ class PeekIterator:
 
     def __init__(self, source):
         itr_src = iter(source)
+        # Result sets can return their rows in slices rather than one by one.
+        self.__fetch_rows = getattr(source, "fetch_rows", None)
 
         self.__iters = []
         self.__index = 0
@@ -58,6 +61,39 @@ class PeekIterator:
     def __iter__(self):
         return self
 
+    def fetch(self, size=None):
+        """Return the next rows as tuples.
+
+        :type size: int
+        :param size: (Optional) maximum number of rows to return. All
+            remaining rows are returned if not set.
+
+        :rtype: list
+        :returns: the next rows.
+        """
+        rows = []
+        if size == 0:
+            return rows
+        if self.__index == 0 and self.__iters:
+            # The row that was read ahead.
+            rows.extend(map(_as_tuple, self.__iters[0]))
+            self.__index = 1
+        if self.__index >= len(self.__iters):
+            return rows
+
+        if size is not None:
+            size -= len(rows)
+        if self.__fetch_rows is not None:
+            # Result set rows are lists, which are all converted at once.
+            rows.extend(map(tuple, self.__fetch_rows(size)))
+        else:
+            rows.extend(map(_as_tuple, islice(self.__iters[self.__index], size)))
+        return rows
+
+
+def _as_tuple(row):
+    return tuple(row) if isinstance(row, list) else row
+
 
 class StreamedManyResultSets:
     """Iterator to walk through several `StreamedResultsSet` iterators.
@@ -30,14 +30,20 @@ from google.cloud.spanner_v1._helpers import (
     _merge_request_options,
     _validate_client_context,
     _check_rst_stream_error,
-    _make_list_value_pbs,
+    _RowEncoder,
+    _resolve_column_types,
     _merge_Transaction_Options,
     _metadata_with_leader_aware_routing,
     _metadata_with_prefix,
     _SessionWrapper,
 )
+from google.cloud.spanner_v1._keyed_writes import _KeyedWriteBuffer
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.mutation_size import (
+    MutationSize,
+    _index_mutations_per_row,
+)
 from google.cloud.spanner_v1.types.commit_response import CommitResponse
 from google.cloud.spanner_v1.types.mutation import Mutation
 from google.cloud.spanner_v1.types.spanner import (
@@ -76,6 +82,12 @@ class _BatchBase(_SessionWrapper):
         self.commit_stats: Optional[CommitResponse.CommitStats] = None
         self._client_context = _validate_client_context(client_context)
 
+        self._mutation_size = MutationSize()
+        self._unsized_mutations = []
+        self._secondary_indexes = {}
+        self._index_mutations = {}
+        self._keyed_writes = {}
+
     @property
     def _resource_info(self):
         """Resource information for metrics labels."""
@@ -86,7 +98,7 @@ class _BatchBase(_SessionWrapper):
             "database": database.database_id,
         }
 
-    def insert(self, table, columns, values):
+    def insert(self, table, columns, values, column_types=None, *, validate=False):
         """Insert one or more new table rows.
 
         :type table: str
@@ -97,12 +109,33 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types: list or dict
+        :param column_types:
+            (Optional) Spanner type of each column, either as a list of
+            :class:`~google.cloud.spanner_v1.types.Type` or
+            :class:`~google.cloud.spanner_v1.types.TypeCode` in the order of
+            ``columns``, a dict keyed by column name, or the
+            :attr:`~google.cloud.spanner_v1.table.Table.schema` of the table.
+            Used to bind the encoder of each column once, instead of
+            inspecting the type of each value.
+
+        :type validate: bool
+        :param validate:
+            (Optional) check that the mutations of the batch stay within the
+            commit limits with the new rows, counting them as if none of them
+            were merged into earlier writes. If they do not, the rows are not
+            added.
+
+        :raises ValueError: if ``validate`` is set and a limit is exceeded.
         """
-        self._mutations.append(Mutation(insert=_make_write_pb(table, columns, values)))
+        self._append_write(
+            "insert", table, columns, values, column_types, validate=validate
+        )
         # TODO: Decide if we should add a span event per mutation:
         # https://github.com/googleapis/python-spanner/issues/1269
 
-    def update(self, table, columns, values):
+    def update(self, table, columns, values, column_types=None, *, validate=False):
         """Update one or more existing table rows.
 
         :type table: str
@@ -113,12 +146,35 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types: list or dict
+        :param column_types:
+            (Optional) Spanner type of each column, either as a list of
+            :class:`~google.cloud.spanner_v1.types.Type` or
+            :class:`~google.cloud.spanner_v1.types.TypeCode` in the order of
+            ``columns``, a dict keyed by column name, or the
+            :attr:`~google.cloud.spanner_v1.table.Table.schema` of the table.
+            Used to bind the encoder of each column once, instead of
+            inspecting the type of each value.
+
+        :type validate: bool
+        :param validate:
+            (Optional) check that the mutations of the batch stay within the
+            commit limits with the new rows, counting them as if none of them
+            were merged into earlier writes. If they do not, the rows are not
+            added.
+
+        :raises ValueError: if ``validate`` is set and a limit is exceeded.
         """
-        self._mutations.append(Mutation(update=_make_write_pb(table, columns, values)))
+        self._append_write(
+            "update", table, columns, values, column_types, validate=validate
+        )
         # TODO: Decide if we should add a span event per mutation:
         # https://github.com/googleapis/python-spanner/issues/1269
 
-    def insert_or_update(self, table, columns, values):
+    def insert_or_update(
+        self, table, columns, values, column_types=None, *, validate=False
+    ):
         """Insert/update one or more table rows.
 
         :type table: str
@@ -129,14 +185,33 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types: list or dict
+        :param column_types:
+            (Optional) Spanner type of each column, either as a list of
+            :class:`~google.cloud.spanner_v1.types.Type` or
+            :class:`~google.cloud.spanner_v1.types.TypeCode` in the order of
+            ``columns``, a dict keyed by column name, or the
+            :attr:`~google.cloud.spanner_v1.table.Table.schema` of the table.
+            Used to bind the encoder of each column once, instead of
+            inspecting the type of each value.
+
+        :type validate: bool
+        :param validate:
+            (Optional) check that the mutations of the batch stay within the
+            commit limits with the new rows, counting them as if none of them
+            were merged into earlier writes. If they do not, the rows are not
+            added.
+
+        :raises ValueError: if ``validate`` is set and a limit is exceeded.
         """
-        self._mutations.append(
-            Mutation(insert_or_update=_make_write_pb(table, columns, values))
+        self._append_write(
+            "insert_or_update", table, columns, values, column_types, validate=validate
         )
         # TODO: Decide if we should add a span event per mutation:
         # https://github.com/googleapis/python-spanner/issues/1269
 
-    def replace(self, table, columns, values):
+    def replace(self, table, columns, values, column_types=None, *, validate=False):
         """Replace one or more table rows.
 
         :type table: str
@@ -147,8 +222,29 @@ class _BatchBase(_SessionWrapper):
 
         :type values: list of lists
         :param values: Values to be modified.
+
+        :type column_types: list or dict
+        :param column_types:
+            (Optional) Spanner type of each column, either as a list of
+            :class:`~google.cloud.spanner_v1.types.Type` or
+            :class:`~google.cloud.spanner_v1.types.TypeCode` in the order of
+            ``columns``, a dict keyed by column name, or the
+            :attr:`~google.cloud.spanner_v1.table.Table.schema` of the table.
+            Used to bind the encoder of each column once, instead of
+            inspecting the type of each value.
+
+        :type validate: bool
+        :param validate:
+            (Optional) check that the mutations of the batch stay within the
+            commit limits with the new rows, counting them as if none of them
+            were merged into earlier writes. If they do not, the rows are not
+            added.
+
+        :raises ValueError: if ``validate`` is set and a limit is exceeded.
         """
-        self._mutations.append(Mutation(replace=_make_write_pb(table, columns, values)))
+        self._append_write(
+            "replace", table, columns, values, column_types, validate=validate
+        )
         # TODO: Decide if we should add a span event per mutation:
         # https://github.com/googleapis/python-spanner/issues/1269
 
@@ -162,10 +258,158 @@ class _BatchBase(_SessionWrapper):
         :param keyset: Keys/ranges identifying rows to delete.
         """
         delete = Mutation.Delete(table=table, key_set=keyset._to_pb())
-        self._mutations.append(Mutation(delete=delete))
+        keyed_writes = self._keyed_writes.get(table)
+        if keyed_writes is not None:
+            keyed_writes.clear()
+        mutation = Mutation(delete=delete)
+        self._mutations.append(mutation)
+        self._unsized_mutations.append((table, "delete", mutation))
         # TODO: Decide if we should add a span event per mutation:
         # https://github.com/googleapis/python-spanner/issues/1269
 
+    def _append_write(
+        self, operation, table, columns, values, column_types, validate=False
+    ):
+        """Add a write mutation and account for its size."""
+        mutation = _make_write_mutation(operation, table, columns, values, column_types)
+        self._add_write_mutation(operation, table, mutation, validate=validate)
+
+    def _add_write_mutation(self, operation, table, mutation, validate=False):
+        """Add a write mutation that is already built, like the write
+        methods do."""
+        keyed_writes = self._keyed_writes.get(table)
+        if validate or keyed_writes is not None:
+            # Merging a write changes the size of an earlier write, so the
+            # earlier writes must be sized before.
+            self._add_unsized_mutations()
+        if validate:
+            self._mutation_size.validate_add(
+                table, *self._size_of(table, operation, mutation)
+            )
+        if keyed_writes is not None:
+            mutation = keyed_writes.add(operation, mutation)
+            if mutation is None:
+                return
+        self._mutations.append(mutation)
+        self._account_write(table, operation, mutation)
+
+    def _account_write(self, table, operation, mutation):
+        """Add a write mutation to :attr:`mutation_size` when it is next
+        read."""
+        self._unsized_mutations.append((table, operation, mutation))
+
+    def _add_unsized_mutations(self):
+        """Add the mutations that were not sized yet to the size."""
+        for table, operation, mutation in self._unsized_mutations:
+            self._mutation_size.add(table, *self._size_of(table, operation, mutation))
+        self._unsized_mutations.clear()
+
+    def _size_of(self, table, operation, mutation):
+        """Count the rows, mutations and encoded size of a mutation."""
+        mutation_pb = Mutation.pb(mutation)
+        if operation == "delete":
+            # Rows deleted by a key range are unknown, so count each range once.
+            key_set_pb = mutation_pb.delete.key_set
+            rows = (
+                1 if key_set_pb.all_ else len(key_set_pb.keys) + len(key_set_pb.ranges)
+            )
+            cells = 1 + len(self._secondary_indexes.get(table, ()))
+        else:
+            write_pb = getattr(mutation_pb, operation)
+            rows = len(write_pb.values)
+            cells = self._write_cells(table, write_pb.columns)
+        return rows, rows * cells, mutation_pb.ByteSize()
+
+    def _write_cells(self, table, columns):
+        """Count the mutations of writing the given columns of a row."""
+        indexes = self._secondary_indexes.get(table)
+        if not indexes:
+            return len(columns)
+        key = (table, tuple(columns))
+        cells = self._index_mutations.get(key)
+        if cells is None:
+            cells = len(columns) + _index_mutations_per_row(columns, indexes)
+            self._index_mutations[key] = cells
+        return cells
+
+    @property
+    def mutation_size(self):
+        """Size of the mutations added so far.
+
+        The size of the mutations is computed when it is read, rather than
+        as each mutation is added, so that adding mutations stays cheap
+        when the size is not checked. Use
+        :meth:`~google.cloud.spanner_v1.mutation_size.MutationSize.validate`
+        to check it against the commit limits before committing.
+
+        :rtype: :class:`~google.cloud.spanner_v1.mutation_size.MutationSize`
+        :returns: the mutation count and encoded size, in total and by table
+        """
+        self._add_unsized_mutations()
+        return self._mutation_size
+
+    def set_secondary_indexes(self, table, indexes=None):
+        """Declare the secondary indexes of a table.
+
+        Writes that are added afterwards also count the index entries that
+        they touch in :attr:`mutation_size`, as Spanner does for the
+        mutation limit of a commit.
+
+        :type table: str or :class:`~google.cloud.spanner_v1.table.Table`
+        :param table: the table, or its name
+
+        :type indexes: dict or list
+        :param indexes:
+            (Optional) the columns of each secondary index of the table,
+            including its stored columns, either as a list of column lists or
+            as a dict keyed by index name. Defaults to
+            :attr:`~google.cloud.spanner_v1.table.Table.indexes` if ``table``
+            is a :class:`~google.cloud.spanner_v1.table.Table`.
+        """
+        if not isinstance(table, str):
+            if indexes is None:
+                indexes = table.indexes
+            table = table.table_id
+        self._add_unsized_mutations()
+        if isinstance(indexes, dict):
+            indexes = indexes.values()
+        self._secondary_indexes[table] = [frozenset(columns) for columns in indexes]
+        self._index_mutations = {
+            key: count
+            for key, count in self._index_mutations.items()
+            if key[0] != table
+        }
+
+    def deduplicate_writes(self, table, key_columns=None):
+        """Merge the writes to the same row of a table.
+
+        Writes that are added afterwards to a row that was already written
+        in the batch are merged into the earlier write of the row, so that
+        each row is sent once, with the last value written to each column.
+        For example, an insert followed by an update of the row is sent as a
+        single insert with the columns of both. Writes are only merged where
+        the merged write has the same outcome as the separate writes; other
+        writes, such as an insert of a row that was written before, are kept
+        as they are. Deleting rows of the table ends the merging of the
+        earlier writes.
+
+        :type table: str or :class:`~google.cloud.spanner_v1.table.Table`
+        :param table: the table, or its name
+
+        :type key_columns: list of str
+        :param key_columns:
+            (Optional) the primary key columns of the table. Defaults to
+            :attr:`~google.cloud.spanner_v1.table.Table.primary_key` if
+            ``table`` is a :class:`~google.cloud.spanner_v1.table.Table`.
+        """
+        if not isinstance(table, str):
+            if key_columns is None:
+                key_columns = table.primary_key
+            table = table.table_id
+        if not key_columns:
+            raise ValueError("key_columns must not be empty")
+        self._keyed_writes[table] = _KeyedWriteBuffer(self, table, key_columns)
+
 
 class Batch(_BatchBase):
     """Accumulate mutations for transmission during :meth:`commit`."""
@@ -460,7 +704,7 @@ class MutationGroups(_SessionWrapper):
         return response
 
 
-def _make_write_pb(table, columns, values):
+def _make_write_pb(table, columns, values, column_types=None):
     """Helper for :meth:`Batch.insert` et al.
 
     :type table: str
@@ -472,9 +716,58 @@ def _make_write_pb(table, columns, values):
     :type values: list of lists
     :param values: Values to be modified.
 
+    :type column_types: list or dict
+    :param column_types: (Optional) Spanner type of each column, see
+        :meth:`Batch.insert`.
+
     :rtype: :class:`google.cloud.spanner_v1.types.Mutation.Write`
     :returns: Write protobuf
     """
-    return Mutation.Write(
-        table=table, columns=columns, values=_make_list_value_pbs(values)
+    write_pb = Mutation.Write.pb()()
+    _fill_write_pb(write_pb, table, columns, values, column_types)
+    return Mutation.Write.wrap(write_pb)
+
+
+def _make_write_mutation(operation, table, columns, values, column_types=None):
+    """Helper for :meth:`Batch.insert` et al.
+
+    Builds the mutation protobuf in place, so the encoded rows are not
+    copied into the mutation.
+
+    :type operation: str
+    :param operation: One of ``insert``, ``update``, ``insert_or_update``
+        or ``replace``.
+
+    :type table: str
+    :param table: Name of the table to be modified.
+
+    :type columns: list of str
+    :param columns: Name of the table columns to be modified.
+
+    :type values: list of lists
+    :param values: Values to be modified.
+
+    :type column_types: list or dict
+    :param column_types: (Optional) Spanner type of each column, see
+        :meth:`Batch.insert`.
+
+    :rtype: :class:`google.cloud.spanner_v1.types.Mutation`
+    :returns: Mutation protobuf
+    """
+    mutation_pb = Mutation.pb()()
+    write_pb = getattr(mutation_pb, operation)
+    write_pb.SetInParent()
+    _fill_write_pb(write_pb, table, columns, values, column_types)
+    return Mutation.wrap(mutation_pb)
+
+
+def _fill_write_pb(write_pb, table, columns, values, column_types):
+    write_pb.table = table
+    write_pb.columns.extend(columns)
+    encoder = _RowEncoder(
+        len(write_pb.columns),
+        _resolve_column_types(write_pb.columns, column_types),
     )
+    add = write_pb.values.add
+    for row in values:
+        encoder.encode_into(add(), row)
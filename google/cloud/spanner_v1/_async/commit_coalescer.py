@@ -0,0 +1,310 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalesces many small blind writes into shared BatchWrite requests."""
+
+__CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.commit_coalescer"
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from google.api_core.exceptions import Unknown, from_grpc_status
+from google.rpc import code_pb2
+
+from google.cloud.aio._cross_sync import CrossSync
+
+from google.cloud.spanner_v1._async.batch import MutationGroup
+from google.cloud.spanner_v1.types.spanner import BatchWriteRequest
+
+DEFAULT_MAX_DELAY = 0.005
+DEFAULT_MAX_MUTATIONS = 1000
+DEFAULT_MAX_GROUPS = 500
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+
+@CrossSync.convert_class(
+    docstring_format_vars={
+        "experimental_api": (
+            "\n\n    .. warning::\n        The Spanner AsyncIO API is experimental and may be subject to breaking changes.\n",
+            "",
+        )
+    }
+)
+class CommitCoalescer:
+    """{experimental_api}Group commit for many small, independent blind writes.
+
+    Instead of sending one ``Commit`` request for each small batch of
+    mutations, the coalescer collects the batches that are submitted within
+    ``max_delay`` seconds, or until ``max_mutations`` mutations or
+    ``max_groups`` batches are pending, and applies them with a single
+    ``BatchWrite`` request in which each batch is a separate mutation group.
+    Each batch is still applied atomically, and each caller gets the outcome
+    of its own batch.
+
+    Unlike a commit, a mutation group is not retried when it fails, and it
+    may be applied more than once if the request is interrupted, so the
+    mutations should be idempotent. The coalescer trades up to ``max_delay``
+    seconds of latency for throughput, like ``max_commit_delay`` does on the
+    server.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type max_delay: float
+    :param max_delay: (Optional) maximum seconds a batch waits for other
+        batches before it is sent.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) number of pending mutations after which
+        the pending batches are sent immediately.
+
+    :type max_groups: int
+    :param max_groups: (Optional) number of pending batches after which the
+        pending batches are sent immediately.
+
+    :type max_concurrent_requests: int
+    :param max_concurrent_requests: (Optional) maximum number of
+        ``BatchWrite`` requests in flight.
+
+    :type request_options:
+        :class:`google.cloud.spanner_v1.types.RequestOptions`
+    :param request_options: (Optional) Common options for the requests.
+
+    :type exclude_txn_from_change_streams: bool
+    :param exclude_txn_from_change_streams: (Optional) If true, the
+        transactions are excluded from change streams with the DDL option
+        ``allow_txn_exclusion=true``.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_delay=DEFAULT_MAX_DELAY,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_groups=DEFAULT_MAX_GROUPS,
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        request_options=None,
+        exclude_txn_from_change_streams=False,
+    ):
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if max_mutations < 1:
+            raise ValueError("max_mutations must be at least 1")
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        self._database = database
+        self._max_delay = max_delay
+        self._max_mutations = max_mutations
+        self._max_groups = max_groups
+        self._batch_write_kw = {
+            "request_options": request_options,
+            "exclude_txn_from_change_streams": exclude_txn_from_change_streams,
+        }
+        self._semaphore = CrossSync.Semaphore(max_concurrent_requests)
+        self._lock = threading.Lock()
+        self._wakeup = CrossSync.Event()
+        if CrossSync.is_async:
+            self._executor = None
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests + 1)
+        self._pending = []
+        self._pending_mutations = 0
+        self._flusher = None
+        self._tasks = []
+        self._closed = False
+
+    @CrossSync.convert
+    async def submit(self, mutations):
+        """Submits a batch of mutations to be applied atomically.
+
+        :type mutations: list of :class:`~google.cloud.spanner_v1.types.Mutation`
+        :param mutations: the mutations of the batch
+
+        :rtype: :class:`~concurrent.futures.Future` or :class:`asyncio.Future`
+        :returns: a future that resolves to the commit timestamp of the
+            batch, or to the error with which the batch failed
+        """
+        future = CrossSync.Future()
+        mutation_group = BatchWriteRequest.MutationGroup(mutations=list(mutations))
+        with self._lock:
+            if self._closed:
+                raise ValueError("CommitCoalescer is closed")
+            if self._flusher is None:
+                self._flusher = CrossSync.create_task(
+                    self._run_flusher, sync_executor=self._executor
+                )
+            self._pending.append((mutation_group, future, time.monotonic()))
+            self._pending_mutations += len(mutation_group.mutations)
+            if len(self._pending) == 1 or self._is_full():
+                self._wakeup.set()
+        return future
+
+    @CrossSync.convert
+    async def write(self, mutations):
+        """Applies a batch of mutations and waits for the outcome.
+
+        :type mutations: list of :class:`~google.cloud.spanner_v1.types.Mutation`
+        :param mutations: the mutations of the batch
+
+        :rtype: :class:`datetime.datetime`
+        :returns: the commit timestamp of the batch
+        :raises: :class:`~google.api_core.exceptions.GoogleAPICallError` if
+            the batch could not be applied
+        """
+        future = await self.submit(mutations)
+        if CrossSync.is_async:
+            return await future
+        else:
+            return future.result()
+
+    def batch(self):
+        """Return a context manager for a batch that is applied through the
+        coalescer when the ``with`` block ends.
+
+        :rtype: :class:`CoalescedBatchCheckout`
+        :returns: new wrapper
+        """
+        return CoalescedBatchCheckout(self)
+
+    def _is_full(self):
+        return (
+            len(self._pending) >= self._max_groups
+            or self._pending_mutations >= self._max_mutations
+        )
+
+    def _take_pending(self):
+        """Removes the oldest pending batches that fit in one request."""
+        count = 0
+        mutations = 0
+        for mutation_group, _, _ in self._pending:
+            group_mutations = len(mutation_group.mutations)
+            if count and (
+                count >= self._max_groups
+                or mutations + group_mutations > self._max_mutations
+            ):
+                break
+            count += 1
+            mutations += group_mutations
+        pending = self._pending[:count]
+        del self._pending[:count]
+        self._pending_mutations -= mutations
+        return pending
+
+    @CrossSync.convert
+    async def _run_flusher(self):
+        while True:
+            pending = None
+            timeout = None
+            with self._lock:
+                if self._pending:
+                    timeout = self._pending[0][2] + self._max_delay
+                    timeout -= time.monotonic()
+                    if self._closed or self._is_full() or timeout <= 0:
+                        pending = self._take_pending()
+                elif self._closed:
+                    return
+            if pending is None:
+                await CrossSync.event_wait(self._wakeup, timeout)
+                self._wakeup.clear()
+                continue
+            await self._semaphore.acquire()
+            self._tasks = [task for task in self._tasks if not task.done()]
+            self._tasks.append(
+                CrossSync.create_task(self._send, pending, sync_executor=self._executor)
+            )
+
+    @CrossSync.convert
+    async def _send(self, pending):
+        try:
+            statuses = {}
+            exception = None
+            try:
+                async with self._database.mutation_groups() as groups:
+                    groups._mutation_groups = [group for group, _, _ in pending]
+                    responses = await groups.batch_write(**self._batch_write_kw)
+                    async for response in responses:
+                        for position in response.indexes:
+                            statuses[position] = response
+            except Exception as exc:
+                exception = exc
+            for position, (_, future, _) in enumerate(pending):
+                response = statuses.get(position)
+                if response is None:
+                    future.set_exception(
+                        exception
+                        or Unknown("No status was received for the mutation group")
+                    )
+                elif response.status.code == code_pb2.OK:
+                    future.set_result(response.commit_timestamp)
+                else:
+                    future.set_exception(
+                        from_grpc_status(response.status.code, response.status.message)
+                    )
+        finally:
+            self._semaphore.release()
+
+    @CrossSync.convert
+    async def close(self):
+        """Sends the pending batches and waits for all requests to finish."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.set()
+            flusher = self._flusher
+        if flusher is not None:
+            await CrossSync.wait([flusher])
+        await CrossSync.wait(self._tasks)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    @CrossSync.convert(sync_name="__enter__")
+    async def __aenter__(self):
+        return self
+
+    @CrossSync.convert(sync_name="__exit__")
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class CoalescedBatchCheckout(object):
+    """Context manager for a batch that is applied through a
+    :class:`CommitCoalescer`.
+
+    Inside the context manager, mutations are added to the batch, which is
+    submitted to the coalescer when the ``with`` block ends without an
+    error. Leaving the block waits until the batch has been applied, after
+    which the commit timestamp is available as ``committed``.
+
+    :type coalescer: :class:`CommitCoalescer`
+    :param coalescer: coalescer to apply the batch with
+    """
+
+    def __init__(self, coalescer):
+        self._coalescer = coalescer
+        self._batch = None
+
+    @CrossSync.convert(sync_name="__enter__")
+    async def __aenter__(self):
+        """Begin ``with`` block."""
+        self._batch = MutationGroup(None, [])
+        return self._batch
+
+    @CrossSync.convert(sync_name="__exit__")
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block."""
+        if exc_type is None:
+            self._batch.committed = await self._coalescer.write(self._batch._mutations)
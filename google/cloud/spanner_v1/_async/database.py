@@ -15,7 +15,6 @@
 """User-friendly container for Cloud Spanner Database."""
 
 __CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.database"
-import copy
 import functools
 import logging
 import re
@@ -44,6 +43,15 @@ from google.cloud.spanner_admin_database_v1 import (
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 
 from google.cloud.spanner_v1._async.batch import Batch, MutationGroups
+from google.cloud.spanner_v1._async.commit_coalescer import CommitCoalescer
+from google.cloud.spanner_v1._async.bulk_writer import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_CONCURRENT_COMMITS,
+    DEFAULT_MAX_MUTATIONS,
+    BulkWriter,
+)
+from google.cloud.spanner_v1._async.mutation_group_writer import MutationGroupWriter
+from google.cloud.spanner_v1._async.table_loader import TableLoader
 from google.cloud.spanner_v1._async.database_sessions_manager import (
     DatabaseSessionsManager,
     TransactionType,
@@ -61,7 +69,7 @@ from google.cloud.spanner_v1._helpers import (
     _metadata_with_request_id_and_req_id,
 )
 from google.cloud.spanner_v1.keyset import KeySet
-from google.cloud.spanner_v1.merged_result_set import MergedResultSet
+from google.cloud.spanner_v1.partition_scheduler import shard_batches
 from google.cloud.spanner_v1.services.spanner.async_client import (
     SpannerAsyncClient as SpannerClient,
 )
@@ -77,10 +85,12 @@ from google.cloud.spanner_v1.types.transaction import (
 from google.cloud.spanner_v1.types.type import Type, TypeCode
 
 if CrossSync.is_async:
+    from google.cloud.spanner_v1._async.merged_result_set import MergedResultSet
     from google.cloud.spanner_v1.services.spanner.transports.grpc_asyncio import (
         SpannerGrpcAsyncIOTransport as SpannerGrpcTransport,
     )
 else:
+    from google.cloud.spanner_v1.merged_result_set import MergedResultSet
     from google.cloud.spanner_v1.services.spanner.transports.grpc import (
         SpannerGrpcTransport,
     )
@@ -1098,6 +1108,122 @@ class Database(object):
         """
         return MutationGroupsCheckout(self, client_context=client_context)
 
+    def bulk_writer(
+        self,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_concurrent_commits=DEFAULT_MAX_CONCURRENT_COMMITS,
+        on_batch_complete=None,
+        **kw,
+    ):
+        """Return a writer that commits a stream of rows in multiple batches.
+
+        The writer should be used as a context manager. Rows that are written
+        to it are split into commits of at most ``max_mutations`` mutations
+        and ``max_bytes`` bytes, of which up to ``max_concurrent_commits`` are
+        executed concurrently. Leaving the context manager waits for all
+        commits to finish.
+
+        :type max_mutations: int
+        :param max_mutations: (Optional) maximum number of mutations per commit.
+
+        :type max_bytes: int
+        :param max_bytes: (Optional) maximum encoded size of the rows per commit.
+
+        :type max_concurrent_commits: int
+        :param max_concurrent_commits: (Optional) maximum number of commits in flight.
+
+        :type on_batch_complete: callable
+        :param on_batch_complete: (Optional) called with the result of each commit.
+
+        :type kw: dict
+        :param kw: (Optional) arguments for :meth:`batch`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`
+        :returns: new writer
+        """
+        return BulkWriter(
+            self,
+            max_mutations=max_mutations,
+            max_bytes=max_bytes,
+            max_concurrent_commits=max_concurrent_commits,
+            on_batch_complete=on_batch_complete,
+            **kw,
+        )
+
+    def mutation_group_writer(self, **kw):
+        """Return a writer that applies mutation groups with pipelined
+        BatchWrite requests.
+
+        The writer should be used as a context manager. Mutation groups that
+        are written to it are packed into size-bounded BatchWrite requests,
+        of which several are executed concurrently, and groups that fail
+        with a retryable error are sent again. Leaving the context manager
+        waits for all requests to finish.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`
+        :returns: new writer
+        """
+        return MutationGroupWriter(self, **kw)
+
+    def commit_coalescer(self, **kw):
+        """Return a coalescer that applies many small blind writes with
+        shared BatchWrite requests.
+
+        The coalescer is opt-in and should be shared by the callers whose
+        writes are to be combined. It must be closed, for example by using it
+        as a context manager, to send the last pending batches.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.commit_coalescer.CommitCoalescer`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.commit_coalescer.CommitCoalescer`
+        :returns: new coalescer
+        """
+        return CommitCoalescer(self, **kw)
+
+    @CrossSync.convert
+    async def load_table(self, table, source, format=None, **kw):
+        """Load the rows of a CSV, JSON lines, Arrow IPC or Parquet file
+        into a table.
+
+        The file is streamed in blocks that are written with concurrent
+        commits, or with ``BatchWrite`` requests when ``use_batch_write`` is
+        set. A load that failed or was interrupted can be continued by
+        passing the ``resume_offset`` of its result, or of the last progress
+        report, as ``start_offset``.
+
+        .. code-block:: python
+
+           result = database.load_table("Singers", "singers.csv")
+           print(result.rows_loaded, result.rows_per_second)
+
+        :type table: str or :class:`~google.cloud.spanner_v1.table.Table`
+        :param table: the table to load
+
+        :type source: str, path-like or binary file object
+        :param source: the file to load
+
+        :type format: str
+        :param format: (Optional) one of ``csv``, ``jsonl``, ``arrow`` or
+            ``parquet``. Inferred from the file extension if not set.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.table_loader.TableLoader`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.table_loader.TableLoadResult`
+        :returns: the number of rows loaded, the throughput and the offset
+            from which to resume.
+        """
+        loader = TableLoader(self, table, source, format=format, **kw)
+        return await loader.load()
+
     def batch_snapshot(
         self,
         read_timestamp=None,
@@ -1817,6 +1943,17 @@ class BatchSnapshot(object):
             snapshot._read_timestamp,
         )
 
+    def shard_batches(self, batches, num_shards, weights=None):
+        """Split partitions into shards of roughly equal weight, one for each
+        worker that processes the partitions.
+
+        Use a :class:`~google.cloud.spanner_v1.partition_scheduler.PartitionLeaseCoordinator`
+        instead to let workers steal partitions from each other.
+
+        See :func:`~google.cloud.spanner_v1.partition_scheduler.shard_batches`.
+        """
+        return shard_batches(batches, num_shards, weights)
+
     @CrossSync.convert
     async def read(self, *args, **kw):
         """Convenience method:  perform read operation via snapshot.
@@ -1894,9 +2031,11 @@ class BatchSnapshot(object):
             f"CloudSpanner.{type(self).__name__}.process_read_batch",
             observability_options=observability_options,
         ), MetricsCapture(self._resource_info):
-            kwargs = copy.deepcopy(batch["read"])
-            keyset_dict = kwargs.pop("keyset")
-            kwargs["keyset"] = KeySet._from_dict(keyset_dict)
+            # The read request template may be shared by many partitions, so
+            # it is copied instead of being modified in place. The request
+            # itself does not modify any of the (nested) values.
+            kwargs = dict(batch["read"])
+            kwargs["keyset"] = KeySet._from_dict(kwargs["keyset"])
             snapshot = await self._get_snapshot()
             return await CrossSync.run_if_async(
                 snapshot.read,
@@ -1992,9 +2131,14 @@ class BatchSnapshot(object):
         query_options=None,
         data_boost_enabled=False,
         lazy_decode=False,
+        adaptive_parallelism=False,
     ):
         """Start a partitioned query operation to get list of partitions and
         then executes each partition on a separate thread
+
+        If ``adaptive_parallelism`` is set, the number of partitions that are
+        executed concurrently is scaled at runtime depending on how fast the
+        returned rows are consumed.
         """
         with trace_call(
             f"CloudSpanner.${type(self).__name__}.run_partitioned_query",
@@ -2012,7 +2156,13 @@ class BatchSnapshot(object):
                 data_boost_enabled,
             ):
                 partitions.append(partition)
-            return MergedResultSet(self, partitions, 0, lazy_decode=lazy_decode)
+            return MergedResultSet(
+                self,
+                partitions,
+                0,
+                lazy_decode=lazy_decode,
+                adaptive_parallelism=adaptive_parallelism,
+            )
 
     @CrossSync.convert
     async def process(self, batch):
@@ -0,0 +1,321 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Merged result set of a partitioned query for the AsyncIO API."""
+
+import asyncio
+from collections import deque
+import contextlib
+import time
+
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.merged_result_set import (
+    ADAPTIVE_ADJUST_INTERVAL_SECONDS,
+    MAX_PARALLELISM,
+    QUEUE_SIZE_PER_WORKER,
+    MergedResultSetStats,
+    PartitionExecutorResult,
+    AdaptiveParallelismController,
+    PartitionStats,
+    _END_OF_PARTITION,
+)
+from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.types.result_set import PartialResultSet
+
+
+class _TimedResponseIterator:
+    """
+    Wraps the PartialResultSet stream of a single partition and records the
+    time spent waiting for responses and the number of bytes received.
+    """
+
+    def __init__(self, response_iterator, partition_stats):
+        self._response_iterator = response_iterator
+        self._stats = partition_stats
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        start = time.perf_counter()
+        try:
+            response = await self._response_iterator.__anext__()
+        finally:
+            self._stats.network_wait_time += time.perf_counter() - start
+        self._stats.bytes_received += PartialResultSet.pb(response).ByteSize()
+        return response
+
+
+class _AsyncAdaptiveParallelismController(AdaptiveParallelismController):
+    """
+    :class:`~google.cloud.spanner_v1.merged_result_set.AdaptiveParallelismController`
+    for the asyncio tasks of a MergedResultSet.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = asyncio.Condition()
+
+    async def next_partition(self):
+        """Waits until a new partition may be started.
+
+        :rtype: tuple
+        :returns: the next partition id and its stats, or ``None`` if there
+            are no more partitions
+        """
+        async with self._condition:
+            while True:
+                if not self._pending:
+                    return None
+                self._maybe_adjust()
+                if self._active < self.target_parallelism:
+                    self._active += 1
+                    return self._pending.popleft()
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait(), self._adjust_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def partition_done(self):
+        """Marks a partition that was returned by next_partition as done."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    async def maybe_adjust(self):
+        """Re-evaluates the target parallelism if the adjust interval passed."""
+        async with self._condition:
+            self._maybe_adjust()
+
+
+class MergedResultSet:
+    """
+    Executes multiple partitions as asyncio tasks and then combines the
+    results from multiple queries using an :class:`asyncio.Queue`. The order
+    of the records in the MergedResultSet is not guaranteed.
+
+    At most ``max_parallelism`` partitions are executed concurrently, and the
+    producers are suspended while the queue is full, so rows do not pile up
+    in memory when the consumer is slower than Spanner.
+
+    If ``adaptive_parallelism`` is set, the number of partitions that are
+    executed concurrently starts at one and is scaled between one and the
+    maximum parallelism, depending on how fast the rows are consumed.
+
+    .. warning::
+        The Spanner AsyncIO API is experimental and may be subject to breaking changes.
+    """
+
+    def __init__(
+        self,
+        batch_snapshot,
+        partition_ids,
+        max_parallelism,
+        lazy_decode=False,
+        adaptive_parallelism=False,
+    ):
+        self._batch_snapshot = batch_snapshot
+        self._lazy_decode = lazy_decode
+        self._result_set = None
+        self._exception = None
+        self._metadata = None
+
+        partition_ids_count = len(partition_ids)
+        self._finished_count_down_latch = partition_ids_count
+        parallelism = min(MAX_PARALLELISM, partition_ids_count)
+        if max_parallelism != 0:
+            parallelism = min(partition_ids_count, max_parallelism)
+        self._queue = asyncio.Queue(maxsize=QUEUE_SIZE_PER_WORKER * parallelism)
+
+        self._partition_stats = []
+        self._pending = deque()
+        for index, partition_id in enumerate(partition_ids):
+            partition_stats = PartitionStats(partition_index=index)
+            self._partition_stats.append(partition_stats)
+            self._pending.append((partition_id, partition_stats))
+        self._controller = None
+        worker = self._run_worker
+        if adaptive_parallelism:
+            self._controller = _AsyncAdaptiveParallelismController(
+                self, self._pending, 1, parallelism
+            )
+            worker = self._run_adaptive_worker
+        self._tasks = [asyncio.create_task(worker()) for _ in range(parallelism)]
+
+    async def _run_worker(self):
+        while self._pending:
+            await self._run_traced_partition(*self._pending.popleft())
+
+    async def _run_adaptive_worker(self):
+        while True:
+            partition = await self._controller.next_partition()
+            if partition is None:
+                return
+            try:
+                await self._run_traced_partition(*partition)
+            finally:
+                await self._controller.partition_done()
+
+    async def _run_traced_partition(self, partition_id, partition_stats):
+        with trace_call(
+            "CloudSpanner.PartitionExecutor.run",
+            observability_options=getattr(
+                self._batch_snapshot, "observability_options", {}
+            ),
+        ), MetricsCapture():
+            await self._run_partition(partition_id, partition_stats)
+
+    async def _run_partition(self, partition_id, stats):
+        start_time = time.perf_counter()
+        cancelled = False
+        try:
+            results = await self._batch_snapshot.process_query_batch(
+                partition_id, lazy_decode=self._lazy_decode
+            )
+            results._response_iterator = _TimedResponseIterator(
+                results._response_iterator, stats
+            )
+            rows = results.__aiter__()
+            while True:
+                step_start = time.perf_counter()
+                network_wait_time = stats.network_wait_time
+                try:
+                    row = await rows.__anext__()
+                except StopAsyncIteration:
+                    row = _END_OF_PARTITION
+                stats.decode_time += (
+                    time.perf_counter()
+                    - step_start
+                    - (stats.network_wait_time - network_wait_time)
+                )
+                if row is _END_OF_PARTITION:
+                    break
+                stats.rows += 1
+                self._set_metadata(results)
+                put_start = time.perf_counter()
+                await self._queue.put(PartitionExecutorResult(data=row))
+                stats.queue_wait_time += time.perf_counter() - put_start
+            stats.result_set_stats = results.stats
+            # Special case: The result set did not return any rows.
+            self._set_metadata(results)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as ex:
+            try:
+                await self._queue.put(PartitionExecutorResult(exception=ex))
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+        finally:
+            stats.elapsed_time = time.perf_counter() - start_time
+            stats.done = True
+            # Emit a special 'is_last' result to ensure that the MergedResultSet
+            # is not blocked on a queue that never receives any more results.
+            last = PartitionExecutorResult(is_last=True)
+            if cancelled:
+                # The result set is closed, so the queue is no longer read,
+                # and waiting for room in it would block close() forever.
+                with contextlib.suppress(asyncio.QueueFull):
+                    self._queue.put_nowait(last)
+            else:
+                await self._queue.put(last)
+
+    def _set_metadata(self, results):
+        if self._metadata is None:
+            self._metadata = results.metadata
+            self._result_set = results
+
+    async def _get_partition_result(self):
+        if self._controller is None:
+            return await self._queue.get()
+        # Wake up regularly while waiting for rows, so the controller can add
+        # workers when the consumer is faster than the producers.
+        while True:
+            try:
+                return await asyncio.wait_for(
+                    self._queue.get(), ADAPTIVE_ADJUST_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                await self._controller.maybe_adjust()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._exception is not None:
+            raise self._exception
+        while True:
+            if self._finished_count_down_latch == 0:
+                raise StopAsyncIteration
+            partition_result = await self._get_partition_result()
+            if partition_result.is_last:
+                self._finished_count_down_latch -= 1
+            elif partition_result.exception is not None:
+                self._exception = partition_result.exception
+                raise self._exception
+            else:
+                return partition_result.data
+
+    async def close(self):
+        """Cancels the partitions that are still running."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def metadata(self):
+        """Result set metadata.
+
+        The metadata is available once the first row has been returned, or
+        once a partition has finished without returning any rows.
+        """
+        return self._metadata
+
+    @property
+    def stats(self) -> MergedResultSetStats:
+        """Statistics of the partitions that have been executed so far.
+
+        :rtype: :class:`~google.cloud.spanner_v1.merged_result_set.MergedResultSetStats`
+        :returns: combined and per-partition statistics
+        """
+        return MergedResultSetStats(partitions=list(self._partition_stats))
+
+    def decode_row(self, row: []) -> []:
+        """Decodes a row from protobuf values to Python objects. This function
+           should only be called for result sets that use ``lazy_decoding=True``.
+
+        :returns: an array containing the decoded values of all the columns in the given row
+        """
+        if self._result_set is None:
+            raise ValueError("iterator not started")
+        return self._result_set.decode_row(row)
+
+    def decode_column(self, row: [], column_index: int):
+        """Decodes a column from a protobuf value to a Python object. This function
+           should only be called for result sets that use ``lazy_decoding=True``.
+
+        :returns: the decoded column value
+        """
+        if self._result_set is None:
+            raise ValueError("iterator not started")
+        return self._result_set.decode_column(row, column_index)
@@ -0,0 +1,364 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming bulk loader from CSV, JSON lines, Arrow and Parquet files."""
+
+__CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.table_loader"
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import List
+
+from google.api_core.exceptions import from_grpc_status
+
+from google.cloud.aio._cross_sync import CrossSync
+
+from google.cloud.spanner_v1._helpers import _RowEncoder, _resolve_column_types
+from google.cloud.spanner_v1._load_sources import _make_source
+from google.cloud.spanner_v1._async.bulk_writer import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_CONCURRENT_COMMITS,
+    DEFAULT_MAX_MUTATIONS,
+    BulkWriter,
+)
+from google.cloud.spanner_v1._async.mutation_group_writer import MutationGroupWriter
+from google.cloud.spanner_v1.types.mutation import Mutation
+
+_OPERATIONS = ("insert", "update", "insert_or_update", "replace")
+
+
+@dataclass
+class TableLoadResult:
+    """Progress and outcome of :meth:`TableLoader.load`.
+
+    ``resume_offset`` is the offset up to which all rows have been written:
+    a byte offset for CSV and JSON lines files, and a row number for Arrow
+    and Parquet files. Pass it as ``start_offset`` to continue an interrupted
+    or failed load.
+    """
+
+    table: str
+    start_offset: int = 0
+    resume_offset: int = 0
+    rows_loaded: int = 0
+    rows_failed: int = 0
+    bytes_loaded: int = 0
+    elapsed_time: float = 0.0
+    exceptions: List[Exception] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.elapsed_time:
+            return 0.0
+        return self.rows_loaded / self.elapsed_time
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.rows_failed and not self.exceptions
+
+
+@CrossSync.convert_class(
+    docstring_format_vars={
+        "experimental_api": (
+            "\n\n    .. warning::\n        The Spanner AsyncIO API is experimental and may be subject to breaking changes.\n",
+            "",
+        )
+    }
+)
+class TableLoader:
+    """{experimental_api}Streams the rows of a file into a table.
+
+    The file is read in blocks of ``block_rows`` rows, which keeps memory use
+    bounded for files of any size. CSV and JSON lines files are memory-mapped
+    when they are regular files, and Arrow IPC and Parquet files are always
+    read through a memory map. The values of a block are converted one
+    column at a time, and the blocks are written by a
+    :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`, which commits
+    several blocks concurrently, or, with ``use_batch_write``, by a
+    :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`,
+    which applies each block as a separate mutation group.
+
+    Blocks are committed independently, so a load that fails or is
+    interrupted can have written some blocks but not others. The
+    ``resume_offset`` of the result is the offset up to which all blocks have
+    been written, and is reported after each commit to ``on_progress``.
+
+    CSV values are loaded as strings, except for BOOL and FLOAT columns,
+    whose values are parsed, and fields equal to ``null_value``, which are
+    loaded as NULL. BYTES values must be base64-encoded, as in Spanner's wire
+    format. Arrow and Parquet files require the ``pyarrow`` package.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type table: str or :class:`~google.cloud.spanner_v1.table.Table`
+    :param table: the table to load. The schema of a
+        :class:`~google.cloud.spanner_v1.table.Table` is used for the
+        column types, unless ``column_types`` is given.
+
+    :type source: str, path-like or binary file object
+    :param source: the file to load
+
+    :type format: str
+    :param format: (Optional) one of ``csv``, ``jsonl``, ``arrow`` or
+        ``parquet``. Inferred from the file extension if not set.
+
+    :type columns: list of str
+    :param columns: (Optional) the columns to load. Defaults to the columns
+        in the header of a CSV file, the keys of the first JSON object, or the
+        columns of an Arrow or Parquet file.
+
+    :type column_types: list or dict
+    :param column_types: (Optional) Spanner type of each column, see
+        :meth:`~google.cloud.spanner_v1.batch.Batch.insert`.
+
+    :type operation: str
+    :param operation: (Optional) one of ``insert``, ``update``,
+        ``insert_or_update`` or ``replace``.
+
+    :type start_offset: int
+    :param start_offset: (Optional) offset at which to start reading, as
+        reported by ``resume_offset``.
+
+    :type block_rows: int
+    :param block_rows: (Optional) number of rows per block. Defaults to the
+        number of rows that fit in ``max_mutations``.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum encoded size of the rows per commit.
+
+    :type max_concurrent_requests: int
+    :param max_concurrent_requests: (Optional) maximum number of commits or
+        ``BatchWrite`` requests in flight.
+
+    :type use_batch_write: bool
+    :param use_batch_write: (Optional) write the blocks with ``BatchWrite``
+        instead of commits. The ``resume_offset`` is then only known when the
+        load has finished.
+
+    :type on_progress: callable
+    :param on_progress: (Optional) called with the :class:`TableLoadResult`
+        after each commit.
+
+    :type reader_options: dict
+    :param reader_options: (Optional) options for reading the file, such as
+        ``header``, ``null_value``, ``encoding`` or the ``csv`` module's
+        ``delimiter`` for CSV files.
+
+    :param write_kw: (Optional) arguments for
+        :meth:`~google.cloud.spanner_v1.database.Database.batch`, or for
+        :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`
+        with ``use_batch_write``.
+    """
+
+    def __init__(
+        self,
+        database,
+        table,
+        source,
+        format=None,
+        columns=None,
+        column_types=None,
+        operation="insert_or_update",
+        start_offset=0,
+        block_rows=None,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_COMMITS,
+        use_batch_write=False,
+        on_progress=None,
+        reader_options=None,
+        **write_kw,
+    ):
+        if operation not in _OPERATIONS:
+            raise ValueError(f"Unsupported operation: {operation}")
+        if start_offset < 0:
+            raise ValueError("start_offset must not be negative")
+        if block_rows is not None and block_rows < 1:
+            raise ValueError("block_rows must be at least 1")
+        table_id = getattr(table, "table_id", table)
+        if column_types is None and table_id is not table:
+            column_types = table.schema
+        self._database = database
+        self._table = table_id
+        self._source = source
+        self._format = format
+        self._columns = columns
+        self._column_types = column_types
+        self._operation = operation
+        self._start_offset = start_offset
+        self._block_rows = block_rows
+        self._max_mutations = max_mutations
+        self._max_bytes = max_bytes
+        self._max_concurrent_requests = max_concurrent_requests
+        self._use_batch_write = use_batch_write
+        self._on_progress = on_progress
+        self._reader_options = reader_options or {}
+        self._write_kw = write_kw
+        self._lock = threading.Lock()
+        self._result = None
+        self._checkpoints = []
+        self._succeeded_batches = set()
+        self._next_batch = 0
+        self._start_time = None
+
+    @CrossSync.convert
+    async def load(self):
+        """Reads the file and writes its rows to the table.
+
+        Errors while reading the file stop the load, and are reported in the
+        result together with the commits that failed.
+
+        :rtype: :class:`TableLoadResult`
+        :returns: the number of rows loaded, the throughput and the offset
+            from which to resume.
+        """
+        self._result = result = TableLoadResult(
+            table=self._table,
+            start_offset=self._start_offset,
+            resume_offset=self._start_offset,
+        )
+        self._start_time = time.perf_counter()
+        source = _make_source(
+            self._source,
+            self._format,
+            self._columns,
+            self._column_types,
+            **self._reader_options,
+        )
+        source.open()
+        try:
+            columns = source.columns
+            if not columns:
+                raise ValueError("No columns to load")
+            column_type_codes = _resolve_column_types(columns, self._column_types)
+            block_rows = self._block_rows
+            if block_rows is None:
+                block_rows = max(self._max_mutations // len(columns), 1)
+            blocks = source.blocks(self._start_offset, block_rows)
+            if self._use_batch_write:
+                await self._load_batch_write(blocks, columns, column_type_codes)
+            else:
+                await self._load_commits(blocks, columns, column_type_codes)
+        finally:
+            source.close()
+        result.elapsed_time = time.perf_counter() - self._start_time
+        return result
+
+    @CrossSync.convert
+    async def _load_commits(self, blocks, columns, column_type_codes):
+        writer = BulkWriter(
+            self._database,
+            max_mutations=self._max_mutations,
+            max_bytes=self._max_bytes,
+            max_concurrent_commits=self._max_concurrent_requests,
+            on_batch_complete=self._on_batch_complete,
+            **self._write_kw,
+        )
+        try:
+            for rows, end_offset in blocks:
+                await writer.write(
+                    self._table,
+                    columns,
+                    rows,
+                    operation=self._operation,
+                    column_types=column_type_codes,
+                )
+                # Each block ends a commit, so that the blocks that have been
+                # committed can be told from the commit results.
+                await writer.flush()
+                with self._lock:
+                    self._checkpoints.append((writer._batch_count, end_offset))
+                    self._advance_resume_offset()
+        except Exception as exc:
+            self._result.exceptions.append(exc)
+        finally:
+            await writer.close()
+
+    def _on_batch_complete(self, batch_result):
+        result = self._result
+        with self._lock:
+            if batch_result.succeeded:
+                result.rows_loaded += batch_result.rows
+                result.bytes_loaded += batch_result.bytes
+                self._succeeded_batches.add(batch_result.index)
+                self._advance_resume_offset()
+            else:
+                result.rows_failed += batch_result.rows
+                result.exceptions.append(batch_result.exception)
+            result.elapsed_time = time.perf_counter() - self._start_time
+        if self._on_progress is not None:
+            self._on_progress(result)
+
+    def _advance_resume_offset(self):
+        """Moves the resume offset past the blocks whose commits, and the
+        commits of all blocks before them, have succeeded."""
+        succeeded = self._succeeded_batches
+        while self._next_batch in succeeded:
+            succeeded.discard(self._next_batch)
+            self._next_batch += 1
+        checkpoints = self._checkpoints
+        while checkpoints and checkpoints[0][0] <= self._next_batch:
+            self._result.resume_offset = checkpoints.pop(0)[1]
+
+    @CrossSync.convert
+    async def _load_batch_write(self, blocks, columns, column_type_codes):
+        result = self._result
+        writer = MutationGroupWriter(
+            self._database,
+            max_bytes_per_request=self._max_bytes,
+            max_concurrent_requests=self._max_concurrent_requests,
+            **self._write_kw,
+        )
+        encoder = _RowEncoder(len(columns), column_type_codes)
+        end_offsets = []
+        block_sizes = []
+        try:
+            for rows, end_offset in blocks:
+                mutation_pb = Mutation.pb()()
+                write_pb = getattr(mutation_pb, self._operation)
+                write_pb.table = self._table
+                write_pb.columns.extend(columns)
+                add_row = write_pb.values.add
+                encode_into = encoder.encode_into
+                for row in rows:
+                    encode_into(add_row(), row)
+                await writer.write([[Mutation.wrap(mutation_pb)]])
+                end_offsets.append(end_offset)
+                block_sizes.append(len(rows))
+        except Exception as exc:
+            result.exceptions.append(exc)
+        finally:
+            failures = await writer.close()
+        failed_blocks = [failure.index for failure in failures]
+        for failure in failures:
+            exception = failure.exception
+            if exception is None:
+                exception = from_grpc_status(
+                    failure.status.code, failure.status.message
+                )
+            result.exceptions.append(exception)
+        result.rows_failed = sum(block_sizes[index] for index in failed_blocks)
+        result.rows_loaded = sum(block_sizes) - result.rows_failed
+        result.bytes_loaded = writer.stats.bytes_written
+        last_block = min(failed_blocks, default=len(end_offsets))
+        if last_block:
+            result.resume_offset = end_offsets[last_block - 1]
+        result.elapsed_time = time.perf_counter() - self._start_time
+        if self._on_progress is not None:
+            self._on_progress(result)
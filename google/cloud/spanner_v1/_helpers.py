@@ -28,7 +28,7 @@ from google.api_core import datetime_helpers
 from google.api_core.exceptions import Aborted
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 from google.protobuf.message import Message
-from google.protobuf.struct_pb2 import ListValue, Value
+from google.protobuf.struct_pb2 import NULL_VALUE, ListValue, Value
 from google.rpc.error_details_pb2 import RetryInfo
 
 from google.cloud._helpers import _date_from_iso8601_date
@@ -40,8 +40,11 @@ from google.cloud.spanner_v1.request_id_header import (
     with_request_id_metadata_only,
 )
 from google.cloud.spanner_v1.types import (
+    ExecuteBatchDmlRequest,
     ExecuteSqlRequest,
+    StructType,
     TransactionOptions,
+    Type,
     TypeCode,
 )
 
@@ -357,59 +360,421 @@ def _make_value_pb(value):
 
     :rtype: :class:`~google.protobuf.struct_pb2.Value`
     :returns: value protobufs
+    :raises ValueError: if value is not of a known scalar type.
+    """
+    value_pb = Value()
+    _encode_value(value_pb, value)
+    return value_pb
+
+
+def _encode_value(value_pb, value):
+    """Write a scalar value into an existing Value protobuf.
+
+    :type value_pb: :class:`~google.protobuf.struct_pb2.Value`
+    :param value_pb: protobuf to fill
+
+    :type value: scalar value
+    :param value: value to convert
+
     :raises ValueError: if value is not of a known scalar type.
     """
     if value is None:
-        return Value(null_value="NULL_VALUE")
-    if isinstance(value, (list, tuple)):
-        return Value(list_value=_make_list_value_pb(value))
-    if isinstance(value, bool):
-        return Value(bool_value=value)
-    if isinstance(value, int):
-        return Value(string_value=str(value))
-    if isinstance(value, float):
-        if math.isnan(value):
-            return Value(string_value="NaN")
-        if math.isinf(value):
-            if value > 0:
-                return Value(string_value="Infinity")
-            else:
-                return Value(string_value="-Infinity")
-        return Value(number_value=value)
-    if isinstance(value, datetime_helpers.DatetimeWithNanoseconds):
-        return Value(string_value=_datetime_to_rfc3339_nanoseconds(value))
-    if isinstance(value, datetime.datetime):
-        return Value(string_value=_datetime_to_rfc3339(value))
-    if isinstance(value, datetime.date):
-        return Value(string_value=value.isoformat())
-    if isinstance(value, bytes):
-        value = _try_to_coerce_bytes(value)
-        return Value(string_value=value)
-    if isinstance(value, str):
-        return Value(string_value=value)
-    if isinstance(value, ListValue):
-        return Value(list_value=value)
-    if isinstance(value, decimal.Decimal):
-        _assert_numeric_precision_and_scale(value)
-        return Value(string_value=str(value))
-    if isinstance(value, JsonObject):
-        value = value.serialize()
-        if value is None:
-            return Value(null_value="NULL_VALUE")
-        else:
-            return Value(string_value=value)
-    if isinstance(value, Message):
+        value_pb.null_value = NULL_VALUE
+    elif isinstance(value, (list, tuple)):
+        list_value_pb = value_pb.list_value
+        list_value_pb.SetInParent()
+        add = list_value_pb.values.add
+        for item in value:
+            _encode_value(add(), item)
+    elif isinstance(value, bool):
+        value_pb.bool_value = value
+    elif isinstance(value, int):
+        value_pb.string_value = str(value)
+    elif isinstance(value, float):
+        _encode_float(value_pb, value)
+    elif isinstance(value, datetime_helpers.DatetimeWithNanoseconds):
+        value_pb.string_value = _datetime_to_rfc3339_nanoseconds(value)
+    elif isinstance(value, datetime.datetime):
+        value_pb.string_value = _datetime_to_rfc3339(value)
+    elif isinstance(value, datetime.date):
+        value_pb.string_value = value.isoformat()
+    elif isinstance(value, bytes):
+        value_pb.string_value = _try_to_coerce_bytes(value)
+    elif isinstance(value, str):
+        value_pb.string_value = value
+    elif isinstance(value, ListValue):
+        value_pb.list_value.CopyFrom(value)
+    elif isinstance(value, decimal.Decimal):
+        _encode_decimal(value_pb, value)
+    elif isinstance(value, JsonObject):
+        _encode_json(value_pb, value)
+    elif isinstance(value, Message):
         value = value.SerializeToString()
         if value is None:
-            return Value(null_value="NULL_VALUE")
+            value_pb.null_value = NULL_VALUE
+        else:
+            value_pb.string_value = base64.b64encode(value)
+    elif isinstance(value, (Interval, uuid.UUID)):
+        value_pb.string_value = str(value)
+    else:
+        raise ValueError("Unknown type: %s" % (value,))
+
+
+def _encode_bool(value_pb, value):
+    value_pb.bool_value = value
+
+
+def _encode_str(value_pb, value):
+    value_pb.string_value = value
+
+
+def _encode_as_str(value_pb, value):
+    value_pb.string_value = str(value)
+
+
+def _encode_float(value_pb, value):
+    if math.isnan(value):
+        value_pb.string_value = "NaN"
+    elif math.isinf(value):
+        value_pb.string_value = "Infinity" if value > 0 else "-Infinity"
+    else:
+        value_pb.number_value = value
+
+
+def _encode_bytes(value_pb, value):
+    try:
+        value_pb.string_value = value
+    except ValueError:
+        # Raises a more helpful error.
+        _try_to_coerce_bytes(value)
+        raise
+
+
+def _encode_datetime_with_nanoseconds(value_pb, value):
+    value_pb.string_value = _datetime_to_rfc3339_nanoseconds(value)
+
+
+def _encode_datetime(value_pb, value):
+    value_pb.string_value = _datetime_to_rfc3339(value)
+
+
+def _encode_date(value_pb, value):
+    value_pb.string_value = value.isoformat()
+
+
+def _encode_decimal(value_pb, value):
+    _assert_numeric_precision_and_scale(value)
+    value_pb.string_value = str(value)
+
+
+def _encode_json(value_pb, value):
+    value = value.serialize()
+    if value is None:
+        value_pb.null_value = NULL_VALUE
+    else:
+        value_pb.string_value = value
+
+
+# Encoders for values of exactly these types. Values of other types,
+# including subclasses, are encoded by :func:`_encode_value`.
+_VALUE_ENCODERS = {
+    bool: _encode_bool,
+    int: _encode_as_str,
+    float: _encode_float,
+    str: _encode_str,
+    bytes: _encode_bytes,
+    datetime_helpers.DatetimeWithNanoseconds: _encode_datetime_with_nanoseconds,
+    datetime.datetime: _encode_datetime,
+    datetime.date: _encode_date,
+    decimal.Decimal: _encode_decimal,
+    JsonObject: _encode_json,
+    Interval: _encode_as_str,
+    uuid.UUID: _encode_as_str,
+}
+
+
+# Python types of the values of a column of a given type, for which the
+# encoder of the Python type can be bound before the first value is seen.
+_TYPE_CODE_PYTHON_TYPES = {
+    TypeCode.BOOL: (bool,),
+    TypeCode.INT64: (int,),
+    TypeCode.ENUM: (int,),
+    TypeCode.FLOAT64: (float,),
+    TypeCode.FLOAT32: (float,),
+    TypeCode.STRING: (str,),
+    TypeCode.BYTES: (bytes,),
+    TypeCode.DATE: (datetime.date,),
+    TypeCode.TIMESTAMP: (
+        datetime.datetime,
+        datetime_helpers.DatetimeWithNanoseconds,
+    ),
+    TypeCode.NUMERIC: (decimal.Decimal,),
+    TypeCode.JSON: (JsonObject, str),
+    TypeCode.UUID: (uuid.UUID,),
+    TypeCode.INTERVAL: (Interval,),
+}
+
+
+def _resolve_column_types(columns, column_types):
+    """Align column types with the columns of a write.
+
+    :type columns: list of str
+    :param columns: Name of the table columns to be modified.
+
+    :type column_types: list or dict
+    :param column_types: Either a list with one
+        :class:`~google.cloud.spanner_v1.types.Type` or
+        :class:`~google.cloud.spanner_v1.types.TypeCode` per column, a dict of
+        column name to type or type code, or the schema of the table as
+        returned by :attr:`~google.cloud.spanner_v1.table.Table.schema`.
+
+    :rtype: list
+    :returns: the type code of each column, or ``None`` if unknown
+    :raises ValueError: if a list of types does not match the columns.
+    """
+    if column_types is None:
+        return [None] * len(columns)
+    if isinstance(column_types, dict):
+        types = [column_types.get(column) for column in columns]
+    elif column_types and all(
+        isinstance(field, StructType.Field) for field in column_types
+    ):
+        schema = {field.name: field.type_ for field in column_types}
+        types = [schema.get(column) for column in columns]
+    else:
+        types = list(column_types)
+        if len(types) != len(columns):
+            raise ValueError(
+                "Expected {} column types, got {}".format(len(columns), len(types))
+            )
+    return [getattr(type_, "code", type_) for type_ in types]
+
+
+class _RowEncoder(object):
+    """Encodes rows of values into ListValue protobufs.
+
+    The encoder of each column is bound once, to the Python type of the
+    values of the column, instead of checking the type of every value
+    against all supported types. Without a column type, the encoder is bound
+    to the type of the first non-null value in the column. Values that do
+    not have the type of their column are encoded by :func:`_encode_value`.
+
+    :type column_count: int
+    :param column_count: number of values in each row
+
+    :type column_type_codes: list of :class:`~google.cloud.spanner_v1.types.TypeCode`
+    :param column_type_codes: (Optional) type code of each column, see
+        :func:`_resolve_column_types`.
+    """
+
+    def __init__(self, column_count, column_type_codes=None):
+        self._column_count = column_count
+        self._types = [None] * column_count
+        self._encoders = [None] * column_count
+        self._accepted_types = [()] * column_count
+        for column, type_code in enumerate(column_type_codes or ()):
+            accepted_types = _TYPE_CODE_PYTHON_TYPES.get(type_code)
+            if accepted_types:
+                self._accepted_types[column] = accepted_types
+                self._bind(column, accepted_types[0])
+
+    def _bind(self, column, value_type):
+        self._types[column] = value_type
+        self._encoders[column] = _VALUE_ENCODERS[value_type]
+
+    def encode(self, row):
+        """Encode a row into a new ListValue protobuf.
+
+        :type row: list of scalar
+        :param row: Row data
+
+        :rtype: :class:`~google.protobuf.struct_pb2.ListValue`
+        :returns: protobuf
+        """
+        row_pb = ListValue()
+        self.encode_into(row_pb, row)
+        return row_pb
+
+    def encode_into(self, row_pb, row):
+        """Encode a row into an existing, empty ListValue protobuf.
+
+        :type row_pb: :class:`~google.protobuf.struct_pb2.ListValue`
+        :param row_pb: protobuf to fill
+
+        :type row: list of scalar
+        :param row: Row data
+        """
+        add = row_pb.values.add
+        if len(row) != self._column_count:
+            for value in row:
+                _encode_value(add(), value)
+            return
+        column = 0
+        for value, value_type, encoder in zip(row, self._types, self._encoders):
+            if type(value) is value_type:
+                encoder(add(), value)
+            elif value is None:
+                add().null_value = NULL_VALUE
+            else:
+                self._encode_unexpected(column, add(), value)
+            column += 1
+
+    def encode_fields_into(self, fields, names, row):
+        """Encode a row into the fields of a Struct protobuf.
+
+        :type fields: map of str to :class:`~google.protobuf.struct_pb2.Value`
+        :param fields: the ``fields`` of the Struct protobuf to fill
+
+        :type names: list of str
+        :param names: field name of each value
+
+        :type row: list of scalar
+        :param row: Row data, with one value per column
+        """
+        column = 0
+        for name, value, value_type, encoder in zip(
+            names, row, self._types, self._encoders
+        ):
+            value_pb = fields[name]
+            if type(value) is value_type:
+                encoder(value_pb, value)
+            elif value is None:
+                value_pb.null_value = NULL_VALUE
+            else:
+                self._encode_unexpected(column, value_pb, value)
+            column += 1
+
+    def _encode_unexpected(self, column, value_pb, value):
+        value_type = type(value)
+        if value_type in self._accepted_types[column] or (
+            self._types[column] is None and value_type in _VALUE_ENCODERS
+        ):
+            # Columns of some types hold values of more than one Python type,
+            # such as datetime and DatetimeWithNanoseconds for TIMESTAMP.
+            self._bind(column, value_type)
+            self._encoders[column](value_pb, value)
         else:
-            return Value(string_value=base64.b64encode(value))
-    if isinstance(value, Interval):
-        return Value(string_value=str(value))
-    if isinstance(value, uuid.UUID):
-        return Value(string_value=str(value))
+            _encode_value(value_pb, value)
+
+
+def _type_pb(type_):
+    """Convert a param type, given as a Type, a raw Type protobuf or a dict,
+    to a raw Type protobuf."""
+    if isinstance(type_, Type):
+        return Type.pb(type_)
+    if isinstance(type_, Message):
+        return type_
+    return Type.pb(Type(type_))
 
-    raise ValueError("Unknown type: %s" % (value,))
+
+class _DmlStatementShape(object):
+    """The SQL text, param names and param types shared by DML statements.
+
+    The param types are converted to protobufs, and the encoder of each
+    param is bound, once for all statements of the shape.
+    """
+
+    def __init__(self, sql, names, param_types):
+        self._names = names
+        # Statements are matched to their shape by the ids of their param
+        # types, so keep the types alive for as long as the shape is used.
+        self._param_types = param_types
+        self._template = ExecuteBatchDmlRequest.Statement.pb()(sql=sql)
+        type_codes = []
+        for name in names:
+            type_ = param_types.get(name)
+            type_code = None
+            if type_ is not None:
+                type_pb = _type_pb(type_)
+                self._template.param_types[name].CopyFrom(type_pb)
+                type_code = type_pb.code
+            type_codes.append(type_code)
+        for name, type_ in param_types.items():
+            if name not in self._template.param_types:
+                self._template.param_types[name].CopyFrom(_type_pb(type_))
+        self._encoder = _RowEncoder(len(names), type_codes)
+
+    def encode(self, params):
+        statement_pb = ExecuteBatchDmlRequest.Statement.pb()()
+        statement_pb.CopyFrom(self._template)
+        if params:
+            self._encoder.encode_fields_into(
+                statement_pb.params.fields,
+                self._names,
+                [params[name] for name in self._names],
+            )
+        return statement_pb
+
+
+class _DmlStatementEncoder(object):
+    """Encodes DML statements into ``ExecuteBatchDmlRequest.Statement``
+    protobufs.
+
+    The params are encoded as by ``_make_params_pb``, but the work that only
+    depends on the shape of a statement, that is its SQL text and the names
+    and types of its params, is done once per shape. Batches of statements
+    created from a single template, such as those of ``executemany``, have
+    one shape.
+    """
+
+    def __init__(self):
+        self._shapes = {}
+
+    def encode(self, statement):
+        """Encode a DML statement.
+
+        :type statement: str or tuple
+        :param statement: the SQL text of the statement, or a tuple of the SQL
+            text, the params and the param types
+
+        :rtype: :class:`~google.cloud.spanner_v1.types.ExecuteBatchDmlRequest.Statement`
+        :returns: raw protobuf
+        """
+        if isinstance(statement, str):
+            return ExecuteBatchDmlRequest.Statement.pb()(sql=statement)
+        sql, params, param_types = statement
+        params = params or {}
+        param_types = param_types or {}
+        key = (
+            sql,
+            tuple(params),
+            tuple((name, id(type_)) for name, type_ in param_types.items()),
+        )
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = _DmlStatementShape(sql, tuple(params), param_types)
+            self._shapes[key] = shape
+        return shape.encode(params)
+
+
+def _split_dml_statements(statement_pbs, max_statements, max_bytes):
+    """Split encoded DML statements into size-bounded batches.
+
+    :type statement_pbs: iterable of raw ``ExecuteBatchDmlRequest.Statement``
+    :param statement_pbs: the statements to split
+
+    :type max_statements: int
+    :param max_statements: maximum number of statements per batch
+
+    :type max_bytes: int
+    :param max_bytes: maximum encoded size of the statements per batch. A
+        statement that is larger on its own gets a batch of its own.
+
+    :rtype: iterator of lists
+    :returns: the batches, in order
+    """
+    batch = []
+    batch_bytes = 0
+    for statement_pb in statement_pbs:
+        size = statement_pb.ByteSize()
+        if batch and (len(batch) >= max_statements or batch_bytes + size > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(statement_pb)
+        batch_bytes += size
+    if batch:
+        yield batch
 
 
 def _make_list_value_pb(values):
@@ -421,7 +786,11 @@ def _make_list_value_pb(values):
     :rtype: :class:`~google.protobuf.struct_pb2.ListValue`
     :returns: protobuf
     """
-    return ListValue(values=[_make_value_pb(value) for value in values])
+    list_value_pb = ListValue()
+    add = list_value_pb.values.add
+    for value in values:
+        _encode_value(add(), value)
+    return list_value_pb
 
 
 def _make_list_value_pbs(values):
@@ -433,7 +802,11 @@ def _make_list_value_pbs(values):
     :rtype: list of :class:`~google.protobuf.struct_pb2.ListValue`
     :returns: sequence of protobufs
     """
-    return [_make_list_value_pb(row) for row in values]
+    values = list(values)
+    if not values:
+        return []
+    encoder = _RowEncoder(len(values[0]))
+    return [encoder.encode(row) for row in values]
 
 
 def _parse_value_pb(value_pb, field_type, field_name, column_info=None):
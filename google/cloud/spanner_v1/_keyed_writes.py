@@ -0,0 +1,225 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Merges the writes to the same row of a batch before they are committed."""
+
+from google.cloud.spanner_v1.mutation_size import _varint_size
+from google.cloud.spanner_v1.types.mutation import Mutation
+
+# How a write merges into an earlier write of the same row: the operation of
+# the merged write, and whether it keeps the columns of the earlier write
+# that the new write does not set. Writes are only merged where the merged
+# write has the same outcome as applying both; an insert after another write
+# of the row, for example, fails the commit, so it is kept as it is.
+_MERGES = {
+    ("insert", "update"): ("insert", True),
+    ("insert", "insert_or_update"): ("insert", True),
+    ("insert", "replace"): ("insert", False),
+    ("update", "update"): ("update", True),
+    ("update", "insert_or_update"): ("update", True),
+    ("insert_or_update", "update"): ("insert_or_update", True),
+    ("insert_or_update", "insert_or_update"): ("insert_or_update", True),
+    ("insert_or_update", "replace"): ("replace", False),
+    ("replace", "update"): ("replace", True),
+    ("replace", "insert_or_update"): ("replace", True),
+    ("replace", "replace"): ("replace", False),
+}
+
+
+def _field_size(size):
+    """Encoded size of a length-delimited field with a one byte tag."""
+    return 1 + _varint_size(size) + size
+
+
+class _WriteGroup(object):
+    """A write mutation of the batch, with the key of each of its rows."""
+
+    __slots__ = ("mutation", "operation", "write_pb", "positions", "keys", "size")
+
+    def __init__(self, mutation, operation, write_pb):
+        self.mutation = mutation
+        self.operation = operation
+        self.write_pb = write_pb
+        self.positions = {column: i for i, column in enumerate(write_pb.columns)}
+        self.keys = []
+        # Encoded size of ``write_pb``, computed when it first changes.
+        self.size = None
+
+
+class _KeyedWriteBuffer(object):
+    """Merges the writes to the same row of a table within a batch.
+
+    A row is identified by the values of its key columns. A write of a row
+    that was already written in the batch is merged into the earlier write,
+    where the row keeps its position in the batch, so that each row is sent
+    once with the last value written to each column.
+
+    :type batch: :class:`~google.cloud.spanner_v1.batch._BatchBase`
+    :param batch: the batch that holds the writes
+
+    :type table: str
+    :param table: the table
+
+    :type key_columns: list of str
+    :param key_columns: the primary key columns of the table
+    """
+
+    def __init__(self, batch, table, key_columns):
+        self._batch = batch
+        self._table = table
+        self._key_columns = list(key_columns)
+        # The group and the position in the group of the row, by key.
+        self._rows = {}
+
+    def clear(self):
+        """Forget the rows written so far, e.g. after they are deleted."""
+        self._rows = {}
+
+    def add(self, operation, mutation):
+        """Merge the rows of a write into the earlier writes of the rows.
+
+        :type operation: str
+        :param operation: the operation of the write
+
+        :type mutation: :class:`~google.cloud.spanner_v1.types.Mutation`
+        :param mutation: the write
+
+        :rtype: :class:`~google.cloud.spanner_v1.types.Mutation`
+        :returns: the write with the rows that were not merged, to be added
+            to the batch, or None if all rows were merged.
+        """
+        write_pb = getattr(Mutation.pb(mutation), operation)
+        columns = list(write_pb.columns)
+        try:
+            key_positions = [columns.index(column) for column in self._key_columns]
+        except ValueError:
+            # Spanner rejects writes without the full key.
+            return mutation
+
+        rows = self._rows
+        group = _WriteGroup(mutation, operation, write_pb)
+        kept = []
+        for row_pb in write_pb.values:
+            values = row_pb.values
+            key = tuple(
+                values[position].SerializeToString() for position in key_positions
+            )
+            entry = rows.get(key)
+            if entry is not None:
+                earlier, index = entry
+                merge = _MERGES.get((earlier.operation, operation))
+                if merge is not None:
+                    if earlier is group:
+                        # The rows of a write have the same columns.
+                        kept[index].CopyFrom(row_pb)
+                    else:
+                        self._merge(key, earlier, index, merge, columns, row_pb)
+                    continue
+            rows[key] = (group, len(kept))
+            group.keys.append(key)
+            kept.append(row_pb)
+
+        if not kept:
+            return None
+        if len(kept) < len(write_pb.values):
+            del write_pb.values[:]
+            write_pb.values.extend(kept)
+        return mutation
+
+    def _merge(self, key, group, index, merge, columns, row_pb):
+        """Merge a row into its earlier write in another group."""
+        operation, keep_columns = merge
+        earlier_pb = group.write_pb.values[index]
+        positions = group.positions
+        if keep_columns:
+            if operation == group.operation and all(
+                column in positions for column in columns
+            ):
+                # The merged row fits the earlier write: update it in place.
+                old_rows, old_size = len(group.write_pb.values), self._size(group)
+                row_size = earlier_pb.ByteSize()
+                earlier_values = earlier_pb.values
+                for column, value_pb in zip(columns, row_pb.values):
+                    earlier_values[positions[column]].CopyFrom(value_pb)
+                group.size += _field_size(earlier_pb.ByteSize()) - _field_size(row_size)
+                self._account(group, old_rows, old_size)
+                return
+            merged_columns = list(group.write_pb.columns)
+            merged_values = list(earlier_pb.values)
+            for column, value_pb in zip(columns, row_pb.values):
+                position = positions.get(column)
+                if position is None:
+                    merged_columns.append(column)
+                    merged_values.append(value_pb)
+                else:
+                    merged_values[position] = value_pb
+        else:
+            merged_columns, merged_values = columns, row_pb.values
+
+        # Otherwise the row moves to a write of its own, next to the earlier
+        # write.
+        mutation = Mutation()
+        write_pb = getattr(Mutation.pb(mutation), operation)
+        write_pb.table = self._table
+        write_pb.columns.extend(merged_columns)
+        write_pb.values.add().values.extend(merged_values)
+
+        batch = self._batch
+        position = self._position(group)
+        old_rows, old_size = len(group.write_pb.values), self._size(group)
+        group.size -= _field_size(earlier_pb.ByteSize())
+        del group.write_pb.values[index]
+        del group.keys[index]
+        for row_index in range(index, len(group.keys)):
+            row_key = group.keys[row_index]
+            entry = self._rows.get(row_key)
+            if entry is not None and entry[0] is group:
+                self._rows[row_key] = (group, row_index)
+        self._account(group, old_rows, old_size)
+        if group.write_pb.values:
+            position += 1
+        else:
+            del batch._mutations[position]
+
+        new_group = _WriteGroup(mutation, operation, write_pb)
+        new_group.keys.append(key)
+        self._rows[key] = (new_group, 0)
+        batch._mutations.insert(position, mutation)
+        batch._account_write(self._table, operation, mutation)
+
+    def _position(self, group):
+        """Find the position of the write of a group in the batch."""
+        mutations = self._batch._mutations
+        for position in range(len(mutations) - 1, -1, -1):
+            if mutations[position] is group.mutation:
+                return position
+        raise ValueError("The write is no longer part of the batch")
+
+    def _size(self, group):
+        if group.size is None:
+            group.size = group.write_pb.ByteSize()
+        return group.size
+
+    def _account(self, group, old_rows, old_size):
+        """Replace the accounted size of a group after it changed."""
+        batch = self._batch
+        cells = batch._write_cells(self._table, group.write_pb.columns)
+        rows = len(group.write_pb.values)
+        batch._mutation_size.remove(
+            self._table, old_rows, old_rows * cells, _field_size(old_size)
+        )
+        if rows:
+            batch._mutation_size.add(
+                self._table, rows, rows * cells, _field_size(group.size)
+            )
@@ -0,0 +1,471 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Readers that stream blocks of rows from files for bulk loading."""
+
+import csv
+import json
+import mmap
+import os
+
+from google.cloud.spanner_v1.types import TypeCode
+from google.cloud.spanner_v1._helpers import _resolve_column_types
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    HAS_PYARROW_INSTALLED = True
+except ImportError:  # pragma: NO COVER
+    HAS_PYARROW_INSTALLED = False
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+FORMAT_ARROW = "arrow"
+FORMAT_PARQUET = "parquet"
+
+# Formats whose offsets are byte positions in the file. The offsets of the
+# other formats are row numbers, as their rows are stored in compressed
+# column chunks that cannot be addressed by byte position.
+BYTE_OFFSET_FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+_FORMAT_EXTENSIONS = {
+    ".csv": FORMAT_CSV,
+    ".jsonl": FORMAT_JSONL,
+    ".ndjson": FORMAT_JSONL,
+    ".arrow": FORMAT_ARROW,
+    ".arrows": FORMAT_ARROW,
+    ".feather": FORMAT_ARROW,
+    ".ipc": FORMAT_ARROW,
+    ".parquet": FORMAT_PARQUET,
+}
+
+_TRUE_STRINGS = frozenset(("true", "t", "1", "yes", "y"))
+_FALSE_STRINGS = frozenset(("false", "f", "0", "no", "n"))
+
+
+def _parse_bool(value):
+    lowered = value.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError("Invalid BOOL value: {!r}".format(value))
+
+
+# CSV fields are strings, which is also how Spanner encodes most types on the
+# wire, so only the types that are encoded as JSON booleans or numbers need to
+# be parsed.
+_CSV_CONVERTERS = {
+    TypeCode.BOOL: _parse_bool,
+    TypeCode.FLOAT64: float,
+    TypeCode.FLOAT32: float,
+}
+
+# JSON numbers without a fraction are decoded as ``int``, which would be
+# encoded as a string for FLOAT columns.
+_JSON_CONVERTERS = {
+    TypeCode.FLOAT64: float,
+    TypeCode.FLOAT32: float,
+}
+
+
+def _infer_format(source):
+    """Infer the format of a source from its file extension.
+
+    :raises ValueError: if the format cannot be inferred.
+    """
+    name = source if isinstance(source, (str, os.PathLike)) else None
+    name = name or getattr(source, "name", None)
+    if isinstance(name, (str, os.PathLike)):
+        extension = os.path.splitext(os.fspath(name))[1].lower()
+        if extension in _FORMAT_EXTENSIONS:
+            return _FORMAT_EXTENSIONS[extension]
+    raise ValueError("Cannot infer the format of {!r}, pass format=".format(source))
+
+
+def _convert_columns(rows, converters, null_value=None):
+    """Convert the values of a block of rows column by column.
+
+    :type rows: list of lists
+    :param rows: the rows of the block
+
+    :type converters: list of callable
+    :param converters: converter of each column, or ``None`` to keep the
+        values of the column as they are
+
+    :type null_value: str
+    :param null_value: (Optional) value that is loaded as NULL
+
+    :rtype: list of tuples
+    :returns: the converted rows
+    :raises ValueError: if a row does not have one value per column.
+    """
+    width = len(converters)
+    if any(len(row) != width for row in rows):
+        raise ValueError("Expected {} values in each row".format(width))
+    if not rows or (null_value is None and not any(converters)):
+        return rows
+    columns = []
+    for values, converter in zip(zip(*rows), converters):
+        if null_value is not None:
+            values = [None if value == null_value else value for value in values]
+        if converter is not None:
+            values = [None if value is None else converter(value) for value in values]
+        columns.append(values)
+    return list(zip(*columns))
+
+
+class _LineStream(object):
+    """Binary line reader over a file, memory-mapped when possible."""
+
+    def __init__(self, source):
+        self._file = None
+        self._mmap = None
+        if isinstance(source, (str, os.PathLike)):
+            self._file = source = open(source, "rb")
+        try:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # Empty files, pipes and in-memory buffers cannot be mapped.
+            pass
+        self._stream = self._mmap if self._mmap is not None else source
+
+    def readline(self):
+        return self._stream.readline()
+
+    def tell(self):
+        return self._stream.tell()
+
+    def seek(self, offset):
+        self._stream.seek(offset)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+
+
+class _FileSource(object):
+    """Base class of the readers of a single file.
+
+    :type source: str, path-like or binary file object
+    :param source: the file to read
+
+    :type columns: list of str
+    :param columns: (Optional) columns to load; defaults to all columns of
+        the file.
+
+    :type column_types: list or dict
+    :param column_types: (Optional) Spanner type of each column, see
+        :func:`~google.cloud.spanner_v1._helpers._resolve_column_types`.
+    """
+
+    def __init__(self, source, columns=None, column_types=None):
+        self._source = source
+        self.columns = list(columns) if columns is not None else None
+        self._column_types = column_types
+
+    def _column_converters(self, converters):
+        type_codes = _resolve_column_types(self.columns, self._column_types)
+        return [converters.get(type_code) for type_code in type_codes]
+
+    def open(self):
+        """Open the source and determine its columns."""
+        raise NotImplementedError
+
+    def blocks(self, start_offset, block_rows):
+        """Yield ``(rows, end_offset)`` for blocks of up to ``block_rows``
+        rows, starting at ``start_offset``."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release the file."""
+
+
+class _LineSource(_FileSource):
+    """Base class of the readers of line-oriented text files."""
+
+    def __init__(self, source, columns=None, column_types=None, encoding="utf-8"):
+        super(_LineSource, self).__init__(source, columns, column_types)
+        self._encoding = encoding
+        self._stream = None
+        self._data_offset = 0
+
+    def _lines(self):
+        readline = self._stream.readline
+        encoding = self._encoding
+        while True:
+            line = readline()
+            if not line:
+                return
+            yield line.decode(encoding)
+
+    def _rows(self):
+        """Yield the rows of the file from the current position."""
+        raise NotImplementedError
+
+    def open(self):
+        self._stream = _LineStream(self._source)
+
+    def blocks(self, start_offset, block_rows):
+        self._stream.seek(max(start_offset, self._data_offset))
+        tell = self._stream.tell
+        rows = []
+        for row in self._rows():
+            rows.append(row)
+            if len(rows) >= block_rows:
+                yield self._convert(rows), tell()
+                rows = []
+        if rows:
+            yield self._convert(rows), tell()
+
+    def _convert(self, rows):
+        return rows
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class _CsvSource(_LineSource):
+    """Reads CSV files.
+
+    The csv module reads one line at a time, also for quoted values that
+    span multiple lines, so the file position after each row is the offset at
+    which the next row starts.
+    """
+
+    def __init__(
+        self,
+        source,
+        columns=None,
+        column_types=None,
+        encoding="utf-8",
+        header=True,
+        null_value="",
+        **fmtparams,
+    ):
+        super(_CsvSource, self).__init__(
+            source, columns, column_types, encoding=encoding
+        )
+        self._header = header
+        self._null_value = null_value
+        self._fmtparams = fmtparams
+        self._selection = None
+        self._converters = None
+
+    def open(self):
+        super(_CsvSource, self).open()
+        if self._header:
+            reader = csv.reader(self._lines(), **self._fmtparams)
+            file_columns = next(reader, [])
+            self._data_offset = self._stream.tell()
+            if self.columns is None:
+                self.columns = file_columns
+            else:
+                missing = set(self.columns) - set(file_columns)
+                if missing:
+                    raise ValueError(
+                        "Columns not found in the header: {}".format(sorted(missing))
+                    )
+                positions = {column: i for i, column in enumerate(file_columns)}
+                selection = [positions[column] for column in self.columns]
+                if selection != list(range(len(file_columns))):
+                    self._selection = selection
+        elif self.columns is None:
+            raise ValueError("columns are required for CSV files without a header")
+        self._converters = self._column_converters(_CSV_CONVERTERS)
+
+    def _rows(self):
+        rows = csv.reader(self._lines(), **self._fmtparams)
+        selection = self._selection
+        if selection is None:
+            return (row for row in rows if row)
+        return ([row[i] for i in selection] for row in rows if row)
+
+    def _convert(self, rows):
+        return _convert_columns(rows, self._converters, self._null_value)
+
+
+class _JsonLinesSource(_LineSource):
+    """Reads JSON lines files of objects or arrays.
+
+    Without ``columns``, the keys of the first object are loaded.
+    """
+
+    def open(self):
+        super(_JsonLinesSource, self).open()
+        if self.columns is None:
+            for line in self._lines():
+                if line.strip():
+                    value = json.loads(line)
+                    if not isinstance(value, dict):
+                        raise ValueError("columns are required for JSON arrays")
+                    self.columns = list(value)
+                    break
+            else:
+                self.columns = []
+        self._converters = self._column_converters(_JSON_CONVERTERS)
+
+    def _rows(self):
+        columns = self.columns
+        loads = json.loads
+        for line in self._lines():
+            if not line.strip():
+                continue
+            value = loads(line)
+            if isinstance(value, dict):
+                yield [value.get(column) for column in columns]
+            else:
+                yield value
+
+    def _convert(self, rows):
+        return _convert_columns(rows, self._converters)
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW_INSTALLED:
+        raise ImportError("Loading Arrow and Parquet files requires pyarrow.")
+
+
+def _record_batch_rows(record_batch, columns):
+    """Convert a record batch to rows, one column at a time."""
+    return list(zip(*(record_batch.column(column).to_pylist() for column in columns)))
+
+
+class _ArrowSource(_FileSource):
+    """Reads Arrow IPC files, or streams, through a memory map."""
+
+    def open(self):
+        _require_pyarrow()
+        source = self._source
+        if isinstance(source, (str, os.PathLike)):
+            source = pyarrow.memory_map(os.fspath(source))
+        self._file = source
+        try:
+            self._reader = pyarrow.ipc.open_file(source)
+            self._batches = (
+                self._reader.get_batch(i)
+                for i in range(self._reader.num_record_batches)
+            )
+        except pyarrow.ArrowInvalid:
+            source.seek(0)
+            self._reader = pyarrow.ipc.open_stream(source)
+            self._batches = iter(self._reader)
+        if self.columns is None:
+            self.columns = list(self._reader.schema.names)
+
+    def blocks(self, start_offset, block_rows):
+        offset = 0
+        for record_batch in self._batches:
+            batch_offset = offset
+            offset += record_batch.num_rows
+            start = max(start_offset - batch_offset, 0)
+            for block_start in range(start, record_batch.num_rows, block_rows):
+                block = record_batch.slice(block_start, block_rows)
+                yield (
+                    _record_batch_rows(block, self.columns),
+                    batch_offset + block_start + block.num_rows,
+                )
+
+    def close(self):
+        if self._file is not self._source:
+            self._file.close()
+
+
+class _ParquetSource(_FileSource):
+    """Reads Parquet files, memory-mapped, skipping whole row groups when
+    resuming."""
+
+    def open(self):
+        _require_pyarrow()
+        source = self._source
+        if isinstance(source, os.PathLike):
+            source = os.fspath(source)
+        self._file = pyarrow.parquet.ParquetFile(source, memory_map=True)
+        if self.columns is None:
+            self.columns = list(self._file.schema_arrow.names)
+
+    def blocks(self, start_offset, block_rows):
+        metadata = self._file.metadata
+        offset = 0
+        row_groups = []
+        for i in range(metadata.num_row_groups):
+            num_rows = metadata.row_group(i).num_rows
+            if offset + num_rows > start_offset or row_groups:
+                row_groups.append(i)
+            else:
+                offset += num_rows
+        if not row_groups:
+            return
+        skip = start_offset - offset
+        for record_batch in self._file.iter_batches(
+            batch_size=block_rows, row_groups=row_groups, columns=self.columns
+        ):
+            if skip >= record_batch.num_rows:
+                skip -= record_batch.num_rows
+                offset += record_batch.num_rows
+                continue
+            if skip:
+                offset += skip
+                record_batch = record_batch.slice(skip)
+                skip = 0
+            offset += record_batch.num_rows
+            yield _record_batch_rows(record_batch, self.columns), offset
+
+    def close(self):
+        self._file.close()
+
+
+_SOURCE_CLASSES = {
+    FORMAT_CSV: _CsvSource,
+    FORMAT_JSONL: _JsonLinesSource,
+    FORMAT_ARROW: _ArrowSource,
+    FORMAT_PARQUET: _ParquetSource,
+}
+
+
+def _make_source(source, format=None, columns=None, column_types=None, **kw):
+    """Create the reader for a source file.
+
+    :type source: str, path-like or binary file object
+    :param source: the file to read
+
+    :type format: str
+    :param format: (Optional) one of ``csv``, ``jsonl``, ``arrow`` or
+        ``parquet``; inferred from the file extension if not set.
+
+    :type columns: list of str
+    :param columns: (Optional) columns to load
+
+    :type column_types: list or dict
+    :param column_types: (Optional) Spanner type of each column
+
+    :param kw: (Optional) options of the reader, such as ``header`` or
+        ``delimiter`` for CSV files.
+
+    :rtype: :class:`_FileSource`
+    :returns: an unopened reader
+    :raises ValueError: if the format is not supported.
+    """
+    if format is None:
+        format = _infer_format(source)
+    source_class = _SOURCE_CLASSES.get(format)
+    if source_class is None:
+        raise ValueError("Unsupported format: {}".format(format))
+    return source_class(source, columns, column_types, **kw)
@@ -0,0 +1,416 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is automatically generated by CrossSync. Do not edit manually.
+
+"""Bulk writer that splits a stream of rows into concurrent commits."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import time
+from typing import Any, Optional
+from google.cloud.aio._cross_sync import CrossSync
+from google.cloud.spanner_v1._helpers import _RowEncoder, _resolve_column_types
+from google.cloud.spanner_v1.mutation_size import (
+    MAX_BYTES_PER_COMMIT,
+    MAX_MUTATIONS_PER_COMMIT,
+)
+from google.cloud.spanner_v1.types.mutation import Mutation
+
+DEFAULT_MAX_MUTATIONS = 20000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_COMMITS = 4
+_OPERATIONS = ("insert", "update", "insert_or_update", "replace")
+
+
+@dataclass
+class BulkWriteBatchResult:
+    """Result of a single commit of a :class:`BulkWriter`."""
+
+    index: int
+    rows: int
+    mutations: int
+    bytes: int
+    commit_timestamp: Optional[Any] = None
+    exception: Optional[Exception] = None
+    elapsed_time: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exception is None
+
+
+class BulkWriter:
+    """Writes an unbounded stream of rows using multiple commits.
+
+    Rows are encoded as they are written, and their mutation count and size
+    are added up incrementally. A batch is committed as soon as adding the
+    next row would exceed ``max_mutations`` or ``max_bytes``, and up to
+    ``max_concurrent_commits`` batches are committed at the same time, each
+    using its own session from the session pool or the multiplexed session.
+    Writing blocks while that many commits are in flight.
+
+    Each batch is committed atomically, but the rows that are written by a
+    ``BulkWriter`` as a whole are not: some batches can fail while others
+    succeed. Inspect :attr:`results`, iterate over :meth:`stream_results` or
+    use ``on_batch_complete`` to find out which batches failed, or set
+    ``stop_on_error`` to stop committing at the first failed batch.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit.
+        The mutation count is estimated as the number of columns per row, so
+        leave room for the secondary indexes of the table.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum encoded size of the rows per commit.
+
+    :type max_concurrent_commits: int
+    :param max_concurrent_commits: (Optional) maximum number of commits in
+        flight.
+
+    :type on_batch_complete: callable
+    :param on_batch_complete: (Optional) called with the
+        :class:`BulkWriteBatchResult` of each commit when it finishes. If it
+        raises an exception, the other commits still run, and :meth:`close`
+        raises the first such exception.
+
+    :type stop_on_error: bool
+    :param stop_on_error: (Optional) stop committing batches after a commit
+        fails. Writing or flushing rows then raises the error of the failed
+        commit, and :meth:`close` discards the rows that were not submitted.
+        With ``max_concurrent_commits=1``, the batches that were committed
+        are exactly the ones before the failed batch.
+
+    :param commit_kw: (Optional) arguments for
+        :meth:`~google.cloud.spanner_v1.database.Database.batch`, such as
+        ``request_options`` or ``max_commit_delay``."""
+
+    def __init__(
+        self,
+        database,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_concurrent_commits=DEFAULT_MAX_CONCURRENT_COMMITS,
+        on_batch_complete=None,
+        stop_on_error=False,
+        **commit_kw,
+    ):
+        if not 0 < max_mutations <= MAX_MUTATIONS_PER_COMMIT:
+            raise ValueError(
+                f"max_mutations must be between 1 and {MAX_MUTATIONS_PER_COMMIT}"
+            )
+        if not 0 < max_bytes <= MAX_BYTES_PER_COMMIT:
+            raise ValueError(f"max_bytes must be between 1 and {MAX_BYTES_PER_COMMIT}")
+        if max_concurrent_commits < 1:
+            raise ValueError("max_concurrent_commits must be at least 1")
+        self._database = database
+        self._max_mutations = max_mutations
+        self._max_bytes = max_bytes
+        self._on_batch_complete = on_batch_complete
+        self._stop_on_error = stop_on_error
+        self._exception = None
+        self._callback_exception = None
+        self._commit_kw = commit_kw
+        self._semaphore = CrossSync._Sync_Impl.Semaphore(max_concurrent_commits)
+        self._results_changed = CrossSync._Sync_Impl.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_commits)
+        self._tasks = []
+        self._results = []
+        self._batch_count = 0
+        self._closed = False
+        self._reset_batch()
+
+    def _reset_batch(self):
+        self._writes = []
+        self._last_write_key = None
+        self._row_count = 0
+        self._mutation_count = 0
+        self._byte_count = 0
+
+    @property
+    def results(self):
+        """Results of the commits that have finished so far, ordered by batch.
+
+        :rtype: list of :class:`BulkWriteBatchResult`"""
+        return sorted(self._results, key=lambda result: result.index)
+
+    @property
+    def pending_rows(self):
+        """Number of written rows that have not been submitted for commit."""
+        return self._row_count
+
+    def write(
+        self, table, columns, rows, operation="insert_or_update", column_types=None
+    ):
+        """Adds rows to the writer, committing full batches on the way.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be written. May be a generator of any length,
+            or, with the asyncio API, an asynchronous iterable.
+
+        :type operation: str
+        :param operation: (Optional) one of ``insert``, ``update``,
+            ``insert_or_update`` or ``replace``.
+
+        :type column_types: list or dict
+        :param column_types: (Optional) Spanner type of each column, see
+            :meth:`~google.cloud.spanner_v1.batch.Batch.insert`."""
+        if self._closed:
+            raise ValueError("BulkWriter is closed")
+        self._raise_if_stopped()
+        if operation not in _OPERATIONS:
+            raise ValueError(f"Unsupported operation: {operation}")
+        columns = list(columns)
+        cells = len(columns)
+        if cells > self._max_mutations:
+            raise ValueError(
+                f"A row of {cells} columns exceeds max_mutations={self._max_mutations}"
+            )
+        key = (operation, table, tuple(columns))
+        encoder = _RowEncoder(cells, _resolve_column_types(columns, column_types))
+        for row in rows:
+            self._add_row(key, cells, encoder, row)
+
+    def _add_row(self, key, cells, encoder, row):
+        if len(row) != cells:
+            raise ValueError(f"Expected {cells} values, got {len(row)}")
+        value_pb = encoder.encode(row)
+        size = value_pb.ByteSize()
+        if self._row_count and (
+            self._mutation_count + cells > self._max_mutations
+            or self._byte_count + size > self._max_bytes
+        ):
+            self._submit()
+            self._raise_if_stopped()
+        if key != self._last_write_key:
+            operation, table, columns = key
+            self._writes.append((operation, table, list(columns), []))
+            self._last_write_key = key
+        self._writes[-1][3].append(value_pb)
+        self._row_count += 1
+        self._mutation_count += cells
+        self._byte_count += size
+
+    def insert(self, table, columns, rows, column_types=None):
+        """Inserts rows, see :meth:`write`."""
+        self.write(table, columns, rows, operation="insert", column_types=column_types)
+
+    def update(self, table, columns, rows, column_types=None):
+        """Updates rows, see :meth:`write`."""
+        self.write(table, columns, rows, operation="update", column_types=column_types)
+
+    def insert_or_update(self, table, columns, rows, column_types=None):
+        """Inserts or updates rows, see :meth:`write`."""
+        self.write(
+            table,
+            columns,
+            rows,
+            operation="insert_or_update",
+            column_types=column_types,
+        )
+
+    def replace(self, table, columns, rows, column_types=None):
+        """Replaces rows, see :meth:`write`."""
+        self.write(table, columns, rows, operation="replace", column_types=column_types)
+
+    def write_stream(
+        self, table, columns, rows, operation="insert_or_update", column_types=None
+    ):
+        """Writes rows in the background, closes the writer when all rows are
+        written, and yields the result of each commit as it finishes.
+
+        Reading the rows pauses while ``max_concurrent_commits`` commits are
+        in flight, so a fast producer does not buffer more than that many
+        batches.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be written, see :meth:`write`.
+
+        :type operation: str
+        :param operation: (Optional) one of ``insert``, ``update``,
+            ``insert_or_update`` or ``replace``.
+
+        :type column_types: list or dict
+        :param column_types: (Optional) Spanner type of each column, see
+            :meth:`~google.cloud.spanner_v1.batch.Batch.insert`.
+
+        :rtype: iterable of :class:`BulkWriteBatchResult`
+        :returns: the result of each commit, in the order they finish
+        :raises ValueError: if the rows are invalid, after the results of the
+            commits of the rows before them."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        producer = CrossSync._Sync_Impl.create_task(
+            self._write_and_close,
+            table,
+            columns,
+            rows,
+            operation,
+            column_types,
+            sync_executor=executor,
+        )
+        try:
+            for result in self.stream_results():
+                yield result
+        finally:
+            executor.shutdown(wait=False)
+            producer.result()
+
+    def _write_and_close(self, table, columns, rows, operation, column_types):
+        try:
+            self.write(table, columns, rows, operation, column_types)
+        except Exception:
+            self._reset_batch()
+            raise
+        finally:
+            self.close()
+
+    def stream_results(self):
+        """Yields the result of each commit as it finishes, until the writer
+        is closed and all of its commits have finished.
+
+        :rtype: iterable of :class:`BulkWriteBatchResult`
+        :returns: the result of each commit, in the order they finish"""
+        position = 0
+        while True:
+            with self._results_changed:
+                while position == len(self._results) and (not self._finished()):
+                    self._results_changed.wait()
+                results = self._results[position:]
+                finished = self._finished()
+            for result in results:
+                yield result
+            position += len(results)
+            if finished and position == len(self._results):
+                return
+
+    def _raise_if_stopped(self):
+        if self._stop_on_error and self._exception is not None:
+            raise self._exception
+
+    def _finished(self):
+        return self._closed and len(self._results) == self._batch_count
+
+    def flush(self):
+        """Submits the rows that have not been committed yet as a batch.
+
+        The commit runs in the background; use :meth:`close` to wait for it."""
+        if self._row_count:
+            self._submit()
+            self._raise_if_stopped()
+
+    def _submit(self):
+        self._semaphore.acquire()
+        if self._stop_on_error and self._exception is not None:
+            self._semaphore.release()
+            self._reset_batch()
+            return
+        mutations = []
+        for operation, table, columns, values in self._writes:
+            mutation_pb = Mutation.pb()()
+            write_pb = getattr(mutation_pb, operation)
+            write_pb.table = table
+            write_pb.columns.extend(columns)
+            write_pb.values.extend(values)
+            mutations.append((operation, table, Mutation.wrap(mutation_pb)))
+        result = BulkWriteBatchResult(
+            index=self._batch_count,
+            rows=self._row_count,
+            mutations=self._mutation_count,
+            bytes=self._byte_count,
+        )
+        self._batch_count += 1
+        self._reset_batch()
+        self._tasks = [task for task in self._tasks if not task.done()]
+        self._tasks.append(
+            CrossSync._Sync_Impl.create_task(
+                self._commit, mutations, result, sync_executor=self._executor
+            )
+        )
+
+    def _commit(self, mutations, result):
+        start_time = time.perf_counter()
+        try:
+            try:
+                with self._database.batch(**self._commit_kw) as batch:
+                    for operation, table, mutation in mutations:
+                        batch._add_write_mutation(operation, table, mutation)
+                result.commit_timestamp = batch.committed
+            except Exception as exc:
+                result.exception = exc
+                if self._exception is None:
+                    self._exception = exc
+            result.elapsed_time = time.perf_counter() - start_time
+            with self._results_changed:
+                self._results.append(result)
+                self._results_changed.notify_all()
+            if self._on_batch_complete is not None:
+                try:
+                    self._on_batch_complete(result)
+                except Exception as exc:
+                    if self._callback_exception is None:
+                        self._callback_exception = exc
+        finally:
+            self._semaphore.release()
+
+    def close(self):
+        """Commits the remaining rows and waits for all commits to finish.
+
+        :rtype: list of :class:`BulkWriteBatchResult`
+        :returns: the results of all commits, ordered by batch
+        :raises Exception: the first exception raised by ``on_batch_complete``,
+            once all commits have finished."""
+        if not self._closed:
+            if self._row_count:
+                self._submit()
+            with self._results_changed:
+                self._closed = True
+                self._results_changed.notify_all()
+        CrossSync._Sync_Impl.wait(self._tasks)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._callback_exception is not None:
+            exception, self._callback_exception = self._callback_exception, None
+            raise exception
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Closes the writer, and raises the error of the first failed
+        commit, if any."""
+        if exc_type is not None:
+            self._reset_batch()
+        results = self.close()
+        if exc_type is None:
+            for result in results:
+                if result.exception is not None:
+                    raise result.exception
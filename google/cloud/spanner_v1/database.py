@@ -16,7 +16,6 @@
 # This file is automatically generated by CrossSync. Do not edit manually.
 
 """User-friendly container for Cloud Spanner Database."""
-import copy
 import functools
 import logging
 import re
@@ -42,6 +41,15 @@ from google.cloud.spanner_admin_database_v1 import (
 )
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
 from google.cloud.spanner_v1.batch import Batch, MutationGroups
+from google.cloud.spanner_v1.commit_coalescer import CommitCoalescer
+from google.cloud.spanner_v1.bulk_writer import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_CONCURRENT_COMMITS,
+    DEFAULT_MAX_MUTATIONS,
+    BulkWriter,
+)
+from google.cloud.spanner_v1.mutation_group_writer import MutationGroupWriter
+from google.cloud.spanner_v1.table_loader import TableLoader
 from google.cloud.spanner_v1.database_sessions_manager import (
     DatabaseSessionsManager,
     TransactionType,
@@ -59,7 +67,7 @@ from google.cloud.spanner_v1._helpers import (
     _metadata_with_request_id_and_req_id,
 )
 from google.cloud.spanner_v1.keyset import KeySet
-from google.cloud.spanner_v1.merged_result_set import MergedResultSet
+from google.cloud.spanner_v1.partition_scheduler import shard_batches
 from google.cloud.spanner_v1.services.spanner.client import (
     SpannerClient as SpannerClient,
 )
@@ -73,6 +81,7 @@ from google.cloud.spanner_v1.types.transaction import (
     TransactionSelector,
 )
 from google.cloud.spanner_v1.types.type import Type, TypeCode
+from google.cloud.spanner_v1.merged_result_set import MergedResultSet
 from google.cloud.spanner_v1.services.spanner.transports.grpc import (
     SpannerGrpcTransport,
 )
@@ -970,6 +979,117 @@ class Database(object):
         :returns: new wrapper"""
         return MutationGroupsCheckout(self, client_context=client_context)
 
+    def bulk_writer(
+        self,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_concurrent_commits=DEFAULT_MAX_CONCURRENT_COMMITS,
+        on_batch_complete=None,
+        **kw,
+    ):
+        """Return a writer that commits a stream of rows in multiple batches.
+
+        The writer should be used as a context manager. Rows that are written
+        to it are split into commits of at most ``max_mutations`` mutations
+        and ``max_bytes`` bytes, of which up to ``max_concurrent_commits`` are
+        executed concurrently. Leaving the context manager waits for all
+        commits to finish.
+
+        :type max_mutations: int
+        :param max_mutations: (Optional) maximum number of mutations per commit.
+
+        :type max_bytes: int
+        :param max_bytes: (Optional) maximum encoded size of the rows per commit.
+
+        :type max_concurrent_commits: int
+        :param max_concurrent_commits: (Optional) maximum number of commits in flight.
+
+        :type on_batch_complete: callable
+        :param on_batch_complete: (Optional) called with the result of each commit.
+
+        :type kw: dict
+        :param kw: (Optional) arguments for :meth:`batch`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`
+        :returns: new writer"""
+        return BulkWriter(
+            self,
+            max_mutations=max_mutations,
+            max_bytes=max_bytes,
+            max_concurrent_commits=max_concurrent_commits,
+            on_batch_complete=on_batch_complete,
+            **kw,
+        )
+
+    def mutation_group_writer(self, **kw):
+        """Return a writer that applies mutation groups with pipelined
+        BatchWrite requests.
+
+        The writer should be used as a context manager. Mutation groups that
+        are written to it are packed into size-bounded BatchWrite requests,
+        of which several are executed concurrently, and groups that fail
+        with a retryable error are sent again. Leaving the context manager
+        waits for all requests to finish.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.mutation_group_writer.MutationGroupWriter`
+        :returns: new writer"""
+        return MutationGroupWriter(self, **kw)
+
+    def commit_coalescer(self, **kw):
+        """Return a coalescer that applies many small blind writes with
+        shared BatchWrite requests.
+
+        The coalescer is opt-in and should be shared by the callers whose
+        writes are to be combined. It must be closed, for example by using it
+        as a context manager, to send the last pending batches.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.commit_coalescer.CommitCoalescer`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.commit_coalescer.CommitCoalescer`
+        :returns: new coalescer"""
+        return CommitCoalescer(self, **kw)
+
+    def load_table(self, table, source, format=None, **kw):
+        """Load the rows of a CSV, JSON lines, Arrow IPC or Parquet file
+        into a table.
+
+        The file is streamed in blocks that are written with concurrent
+        commits, or with ``BatchWrite`` requests when ``use_batch_write`` is
+        set. A load that failed or was interrupted can be continued by
+        passing the ``resume_offset`` of its result, or of the last progress
+        report, as ``start_offset``.
+
+        .. code-block:: python
+
+           result = database.load_table("Singers", "singers.csv")
+           print(result.rows_loaded, result.rows_per_second)
+
+        :type table: str or :class:`~google.cloud.spanner_v1.table.Table`
+        :param table: the table to load
+
+        :type source: str, path-like or binary file object
+        :param source: the file to load
+
+        :type format: str
+        :param format: (Optional) one of ``csv``, ``jsonl``, ``arrow`` or
+            ``parquet``. Inferred from the file extension if not set.
+
+        :type kw: dict
+        :param kw: (Optional) options of
+            :class:`~google.cloud.spanner_v1.table_loader.TableLoader`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.table_loader.TableLoadResult`
+        :returns: the number of rows loaded, the throughput and the offset
+            from which to resume."""
+        loader = TableLoader(self, table, source, format=format, **kw)
+        return loader.load()
+
     def batch_snapshot(
         self,
         read_timestamp=None,
@@ -1597,6 +1717,16 @@ class BatchSnapshot(object):
             snapshot._read_timestamp,
         )
 
+    def shard_batches(self, batches, num_shards, weights=None):
+        """Split partitions into shards of roughly equal weight, one for each
+        worker that processes the partitions.
+
+        Use a :class:`~google.cloud.spanner_v1.partition_scheduler.PartitionLeaseCoordinator`
+        instead to let workers steal partitions from each other.
+
+        See :func:`~google.cloud.spanner_v1.partition_scheduler.shard_batches`."""
+        return shard_batches(batches, num_shards, weights)
+
     def read(self, *args, **kw):
         """Convenience method:  perform read operation via snapshot.
 
@@ -1667,9 +1797,8 @@ class BatchSnapshot(object):
             f"CloudSpanner.{type(self).__name__}.process_read_batch",
             observability_options=observability_options,
         ), MetricsCapture(self._resource_info):
-            kwargs = copy.deepcopy(batch["read"])
-            keyset_dict = kwargs.pop("keyset")
-            kwargs["keyset"] = KeySet._from_dict(keyset_dict)
+            kwargs = dict(batch["read"])
+            kwargs["keyset"] = KeySet._from_dict(kwargs["keyset"])
             snapshot = self._get_snapshot()
             return CrossSync._Sync_Impl.run_if_async(
                 snapshot.read,
@@ -1757,9 +1886,14 @@ class BatchSnapshot(object):
         query_options=None,
         data_boost_enabled=False,
         lazy_decode=False,
+        adaptive_parallelism=False,
     ):
         """Start a partitioned query operation to get list of partitions and
-        then executes each partition on a separate thread"""
+        then executes each partition on a separate thread
+
+        If ``adaptive_parallelism`` is set, the number of partitions that are
+        executed concurrently is scaled at runtime depending on how fast the
+        returned rows are consumed."""
         with trace_call(
             f"CloudSpanner.${type(self).__name__}.run_partitioned_query",
             extra_attributes=dict(sql=sql),
@@ -1776,7 +1910,13 @@ class BatchSnapshot(object):
                 data_boost_enabled,
             ):
                 partitions.append(partition)
-            return MergedResultSet(self, partitions, 0, lazy_decode=lazy_decode)
+            return MergedResultSet(
+                self,
+                partitions,
+                0,
+                lazy_decode=lazy_decode,
+                adaptive_parallelism=adaptive_parallelism,
+            )
 
     def process(self, batch):
         """Process a single, partitioned query or read."""
@@ -11,14 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from queue import Queue
-from threading import Event, Lock
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from threading import Condition, Event, Lock
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.types.result_set import PartialResultSet, ResultSetStats
 
 if TYPE_CHECKING:
     from google.cloud.spanner_v1.database import BatchSnapshot
@@ -26,6 +29,16 @@ if TYPE_CHECKING:
 QUEUE_SIZE_PER_WORKER = 32
 MAX_PARALLELISM = 16
 
+# Settings for adaptive parallelism. The controller re-evaluates the number
+# of partitions that may run concurrently at most once per interval, and
+# uses the queue occupancy watermarks to decide whether the consumer or the
+# producers are the bottleneck.
+ADAPTIVE_ADJUST_INTERVAL_SECONDS = 0.05
+ADAPTIVE_HIGH_WATERMARK = 0.75
+ADAPTIVE_LOW_WATERMARK = 0.25
+
+_END_OF_PARTITION = object()
+
 
 class PartitionExecutor:
     """
@@ -34,13 +47,21 @@ class PartitionExecutor:
     """
 
     def __init__(
-        self, batch_snapshot, partition_id, merged_result_set, lazy_decode=False
+        self,
+        batch_snapshot,
+        partition_id,
+        merged_result_set,
+        lazy_decode=False,
+        partition_stats=None,
     ):
         self._batch_snapshot: BatchSnapshot = batch_snapshot
         self._partition_id = partition_id
         self._merged_result_set: MergedResultSet = merged_result_set
         self._lazy_decode = lazy_decode
         self._queue: Queue[PartitionExecutorResult] = merged_result_set._queue
+        if partition_stats is None:
+            partition_stats = PartitionStats()
+        self._stats: PartitionStats = partition_stats
 
     def run(self):
         observability_options = getattr(
@@ -54,14 +75,36 @@ class PartitionExecutor:
 
     def __run(self):
         results = None
+        stats = self._stats
+        start_time = time.perf_counter()
         try:
             results = self._batch_snapshot.process_query_batch(
                 self._partition_id, lazy_decode=self._lazy_decode
             )
-            for row in results:
+            # Time spent waiting for the next PartialResultSet is accounted
+            # as network time, the remainder of each step as decode time.
+            results._response_iterator = _TimedResponseIterator(
+                results._response_iterator, stats
+            )
+            rows = iter(results)
+            while True:
+                step_start = time.perf_counter()
+                network_wait_time = stats.network_wait_time
+                row = next(rows, _END_OF_PARTITION)
+                stats.decode_time += (
+                    time.perf_counter()
+                    - step_start
+                    - (stats.network_wait_time - network_wait_time)
+                )
+                if row is _END_OF_PARTITION:
+                    break
+                stats.rows += 1
                 if self._merged_result_set._metadata is None:
                     self._set_metadata(results)
+                put_start = time.perf_counter()
                 self._queue.put(PartitionExecutorResult(data=row))
+                stats.queue_wait_time += time.perf_counter() - put_start
+            stats.result_set_stats = results.stats
             # Special case: The result set did not return any rows.
             # Push the metadata to the merged result set.
             if self._merged_result_set._metadata is None:
@@ -71,6 +114,8 @@ class PartitionExecutor:
                 self._set_metadata(results, True)
             self._queue.put(PartitionExecutorResult(exception=ex))
         finally:
+            stats.elapsed_time = time.perf_counter() - start_time
+            stats.done = True
             # Emit a special 'is_last' result to ensure that the MergedResultSet
             # is not blocked on a queue that never receives any more results.
             self._queue.put(PartitionExecutorResult(is_last=True))
@@ -86,6 +131,117 @@ class PartitionExecutor:
             self._merged_result_set.metadata_event.set()
 
 
+class _TimedResponseIterator:
+    """
+    Wraps the PartialResultSet stream of a single partition and records the
+    time spent waiting for responses and the number of bytes received.
+    """
+
+    def __init__(self, response_iterator, partition_stats):
+        self._response_iterator = response_iterator
+        self._stats = partition_stats
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            response = next(self._response_iterator)
+        finally:
+            self._stats.network_wait_time += time.perf_counter() - start
+        self._stats.bytes_received += PartialResultSet.pb(response).ByteSize()
+        return response
+
+
+class AdaptiveParallelismController:
+    """
+    Hands out partitions to the worker threads of a MergedResultSet and
+    scales the number of partitions that are executed concurrently.
+
+    The number of active partitions is decreased when the consumer does not
+    keep up with the producers (the queue is filling up, or the producers
+    spend more time blocked on the queue than waiting for Spanner), and is
+    increased when the queue is draining and the producers are network-bound.
+    Running partitions are never interrupted; scaling down only stops new
+    partitions from being started.
+    """
+
+    def __init__(
+        self,
+        merged_result_set,
+        partition_executors,
+        min_parallelism,
+        max_parallelism,
+        adjust_interval=ADAPTIVE_ADJUST_INTERVAL_SECONDS,
+    ):
+        self._merged_result_set: MergedResultSet = merged_result_set
+        self._pending = deque(partition_executors)
+        self.min_parallelism = min_parallelism
+        self.max_parallelism = max_parallelism
+        self.target_parallelism = min_parallelism
+        self._adjust_interval = adjust_interval
+        self._active = 0
+        self._condition = Condition()
+        self._last_adjust_time = time.monotonic()
+        self._last_queue_wait_time = 0.0
+        self._last_network_wait_time = 0.0
+        self._last_decode_time = 0.0
+
+    def next_partition(self):
+        """Blocks until a new partition may be started.
+
+        :rtype: :class:`PartitionExecutor`
+        :returns: the next partition to execute, or ``None`` if there are no
+            more partitions
+        """
+        with self._condition:
+            while True:
+                if not self._pending:
+                    return None
+                self._maybe_adjust()
+                if self._active < self.target_parallelism:
+                    self._active += 1
+                    return self._pending.popleft()
+                self._condition.wait(self._adjust_interval)
+
+    def partition_done(self):
+        """Marks a partition that was returned by next_partition as done."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def maybe_adjust(self):
+        """Re-evaluates the target parallelism if the adjust interval passed."""
+        with self._condition:
+            self._maybe_adjust()
+
+    def _maybe_adjust(self):
+        now = time.monotonic()
+        if now - self._last_adjust_time < self._adjust_interval:
+            return
+        self._last_adjust_time = now
+
+        stats = self._merged_result_set.stats
+        queue_wait_time = stats.queue_wait_time - self._last_queue_wait_time
+        network_wait_time = stats.network_wait_time - self._last_network_wait_time
+        decode_time = stats.decode_time - self._last_decode_time
+        self._last_queue_wait_time = stats.queue_wait_time
+        self._last_network_wait_time = stats.network_wait_time
+        self._last_decode_time = stats.decode_time
+
+        queue = self._merged_result_set._queue
+        occupancy = queue.qsize() / queue.maxsize if queue.maxsize else 0.0
+        target = self.target_parallelism
+        if occupancy >= ADAPTIVE_HIGH_WATERMARK or queue_wait_time > network_wait_time:
+            target = max(self.min_parallelism, target - 1)
+        elif occupancy <= ADAPTIVE_LOW_WATERMARK and network_wait_time > decode_time:
+            target = min(self.max_parallelism, target + 1)
+        if target != self.target_parallelism:
+            self.target_parallelism = target
+            self._condition.notify_all()
+
+
 @dataclass
 class PartitionExecutorResult:
     data: Any = None
@@ -93,15 +249,103 @@ class PartitionExecutorResult:
     is_last: bool = False
 
 
+@dataclass
+class PartitionStats:
+    """Client and server side statistics for a single partition.
+
+    All times are in seconds. ``decode_time`` is the time spent merging and
+    decoding rows, ``queue_wait_time`` the time the partition was blocked on
+    a full queue because the consumer did not keep up, and
+    ``network_wait_time`` the time spent waiting for the next response from
+    Spanner.
+    """
+
+    partition_index: int = 0
+    rows: int = 0
+    bytes_received: int = 0
+    decode_time: float = 0.0
+    queue_wait_time: float = 0.0
+    network_wait_time: float = 0.0
+    elapsed_time: float = 0.0
+    done: bool = False
+    result_set_stats: Optional[ResultSetStats] = None
+
+
+@dataclass
+class MergedResultSetStats:
+    """Statistics of a :class:`MergedResultSet`, combined over all partitions.
+
+    The per-partition breakdown is available in ``partitions``, ordered by
+    partition index.
+    """
+
+    partitions: List[PartitionStats] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(p.rows for p in self.partitions)
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(p.bytes_received for p in self.partitions)
+
+    @property
+    def decode_time(self) -> float:
+        return sum(p.decode_time for p in self.partitions)
+
+    @property
+    def queue_wait_time(self) -> float:
+        return sum(p.queue_wait_time for p in self.partitions)
+
+    @property
+    def network_wait_time(self) -> float:
+        return sum(p.network_wait_time for p in self.partitions)
+
+    @property
+    def max_elapsed_time(self) -> float:
+        """Elapsed time of the slowest partition."""
+        return max((p.elapsed_time for p in self.partitions), default=0.0)
+
+    @property
+    def row_count_exact(self) -> Optional[int]:
+        """Sum of the exact row counts reported by Spanner, or ``None`` if no
+        partition returned one."""
+        counts = [
+            p.result_set_stats.row_count_exact
+            for p in self.partitions
+            if p.result_set_stats is not None
+            and "row_count_exact" in p.result_set_stats
+        ]
+        if not counts:
+            return None
+        return sum(counts)
+
+    @property
+    def result_set_stats(self) -> List[Optional[ResultSetStats]]:
+        """The :class:`~google.cloud.spanner_v1.types.ResultSetStats` returned
+        by Spanner for each partition."""
+        return [p.result_set_stats for p in self.partitions]
+
+
 class MergedResultSet:
     """
     Executes multiple partitions on different threads and then combines the
     results from multiple queries using a synchronized queue. The order of the
     records in the MergedResultSet is not guaranteed.
+
+    If ``adaptive_parallelism`` is set, the number of partitions that are
+    executed concurrently starts at one and is scaled between one and the
+    maximum parallelism by an :class:`AdaptiveParallelismController`,
+    depending on how fast the rows are consumed.
     """
 
     def __init__(
-        self, batch_snapshot, partition_ids, max_parallelism, lazy_decode=False
+        self,
+        batch_snapshot,
+        partition_ids,
+        max_parallelism,
+        lazy_decode=False,
+        adaptive_parallelism=False,
     ):
         self._result_set = None
         self._exception = None
@@ -116,16 +360,54 @@ class MergedResultSet:
             parallelism = min(partition_ids_count, max_parallelism)
         self._queue = Queue(maxsize=QUEUE_SIZE_PER_WORKER * parallelism)
 
+        self._partition_stats = []
         partition_executors = []
-        for partition_id in partition_ids:
+        for index, partition_id in enumerate(partition_ids):
+            partition_stats = PartitionStats(partition_index=index)
+            self._partition_stats.append(partition_stats)
             partition_executors.append(
-                PartitionExecutor(batch_snapshot, partition_id, self, lazy_decode)
+                PartitionExecutor(
+                    batch_snapshot,
+                    partition_id,
+                    self,
+                    lazy_decode,
+                    partition_stats=partition_stats,
+                )
             )
+        self._controller = None
         executor = ThreadPoolExecutor(max_workers=parallelism)
-        for partition_executor in partition_executors:
-            executor.submit(partition_executor.run)
+        if adaptive_parallelism:
+            self._controller = AdaptiveParallelismController(
+                self, partition_executors, 1, parallelism
+            )
+            for _ in range(parallelism):
+                executor.submit(self._run_adaptive_worker)
+        else:
+            for partition_executor in partition_executors:
+                executor.submit(partition_executor.run)
         executor.shutdown(False)
 
+    def _run_adaptive_worker(self):
+        while True:
+            partition_executor = self._controller.next_partition()
+            if partition_executor is None:
+                return
+            try:
+                partition_executor.run()
+            finally:
+                self._controller.partition_done()
+
+    def _get_partition_result(self):
+        if self._controller is None:
+            return self._queue.get()
+        # Wake up regularly while waiting for rows, so the controller can add
+        # workers when the consumer is faster than the producers.
+        while True:
+            try:
+                return self._queue.get(timeout=ADAPTIVE_ADJUST_INTERVAL_SECONDS)
+            except Empty:
+                self._controller.maybe_adjust()
+
     def __iter__(self):
         return self
 
@@ -133,7 +415,7 @@ class MergedResultSet:
         if self._exception is not None:
             raise self._exception
         while True:
-            partition_result = self._queue.get()
+            partition_result = self._get_partition_result()
             if partition_result.is_last:
                 self._finished_count_down_latch -= 1
                 if self._finished_count_down_latch == 0:
@@ -144,15 +426,34 @@ class MergedResultSet:
             else:
                 return partition_result.data
 
+    @property
+    def parallelism(self):
+        """The number of partitions that may currently run concurrently.
+
+        :rtype: int
+        :returns: the target parallelism of the adaptive controller, or
+            ``None`` if adaptive parallelism is not enabled
+        """
+        if self._controller is None:
+            return None
+        return self._controller.target_parallelism
+
     @property
     def metadata(self):
         self.metadata_event.wait()
         return self._metadata
 
     @property
-    def stats(self):
-        # TODO: Implement
-        return None
+    def stats(self) -> MergedResultSetStats:
+        """Statistics of the partitions that have been executed so far.
+
+        The values of partitions that are still running are updated while the
+        result set is consumed.
+
+        :rtype: :class:`MergedResultSetStats`
+        :returns: combined and per-partition statistics
+        """
+        return MergedResultSetStats(partitions=list(self._partition_stats))
 
     def decode_row(self, row: []) -> []:
         """Decodes a row from protobuf values to Python objects. This function
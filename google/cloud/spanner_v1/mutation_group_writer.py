@@ -0,0 +1,361 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is automatically generated by CrossSync. Do not edit manually.
+
+"""Pipelined writer for large numbers of mutation groups using BatchWrite."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+import random
+import time
+from typing import Any, Optional
+from google.api_core.exceptions import (
+    Aborted,
+    DeadlineExceeded,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
+from google.rpc import code_pb2
+from google.cloud.aio._cross_sync import CrossSync
+from google.cloud.spanner_v1.batch import MutationGroup
+from google.cloud.spanner_v1.types.spanner import BatchWriteRequest
+
+DEFAULT_MAX_GROUPS_PER_REQUEST = 1000
+DEFAULT_MAX_BYTES_PER_REQUEST = 10 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_INITIAL_BACKOFF = 0.1
+DEFAULT_MAX_BACKOFF = 10.0
+_RETRYABLE_CODES = frozenset(
+    [
+        code_pb2.ABORTED,
+        code_pb2.DEADLINE_EXCEEDED,
+        code_pb2.RESOURCE_EXHAUSTED,
+        code_pb2.UNAVAILABLE,
+    ]
+)
+_RETRYABLE_EXCEPTIONS = (
+    Aborted,
+    DeadlineExceeded,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
+
+
+@dataclass
+class FailedMutationGroup:
+    """A mutation group that could not be applied by a
+    :class:`MutationGroupWriter`."""
+
+    index: int
+    mutation_group: Any
+    attempts: int
+    status: Optional[Any] = None
+    exception: Optional[Exception] = None
+
+
+@dataclass
+class MutationGroupWriterStats:
+    """Throughput and failure counters of a :class:`MutationGroupWriter`."""
+
+    requests: int = 0
+    groups_succeeded: int = 0
+    groups_failed: int = 0
+    groups_retried: int = 0
+    mutations_written: int = 0
+    bytes_written: int = 0
+    elapsed_time: float = 0.0
+
+    @property
+    def groups_per_second(self) -> float:
+        if not self.elapsed_time:
+            return 0.0
+        return self.groups_succeeded / self.elapsed_time
+
+    @property
+    def bytes_per_second(self) -> float:
+        if not self.elapsed_time:
+            return 0.0
+        return self.bytes_written / self.elapsed_time
+
+
+class _PendingGroup(object):
+    __slots__ = ("index", "mutation_group", "size", "attempts")
+
+    def __init__(self, index, mutation_group, size):
+        self.index = index
+        self.mutation_group = mutation_group
+        self.size = size
+        self.attempts = 0
+
+
+def _to_mutation_group_pb(mutation_group):
+    if isinstance(mutation_group, BatchWriteRequest.MutationGroup):
+        return mutation_group
+    if isinstance(mutation_group, MutationGroup):
+        mutation_group = mutation_group._mutations
+    return BatchWriteRequest.MutationGroup(mutations=list(mutation_group))
+
+
+class MutationGroupWriter:
+    """Applies a large number of mutation groups with pipelined BatchWrite requests.
+
+    Mutation groups are packed into ``BatchWrite`` requests of at most
+    ``max_groups_per_request`` groups and ``max_bytes_per_request`` bytes,
+    and up to ``max_concurrent_requests`` requests are executed at the same
+    time. Writing blocks while that many requests are in flight.
+
+    The status of each group is read from the response stream. Groups that
+    failed with a retryable error, or for which no status was received, are
+    sent again with exponential backoff, at most ``max_attempts`` times in
+    total. Other groups are not sent again. As with
+    :meth:`~google.cloud.spanner_v1.batch.MutationGroups.batch_write`, the
+    groups are applied independently and not in order, and a group may be
+    applied more than once, so the mutations should be idempotent.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to
+
+    :type max_groups_per_request: int
+    :param max_groups_per_request: (Optional) maximum number of mutation
+        groups per request.
+
+    :type max_bytes_per_request: int
+    :param max_bytes_per_request: (Optional) maximum encoded size of the
+        mutation groups per request.
+
+    :type max_concurrent_requests: int
+    :param max_concurrent_requests: (Optional) maximum number of requests in
+        flight.
+
+    :type max_attempts: int
+    :param max_attempts: (Optional) maximum number of times a group is sent.
+
+    :type initial_backoff: float
+    :param initial_backoff: (Optional) seconds to wait before the first
+        retry of the failed groups of a request.
+
+    :type max_backoff: float
+    :param max_backoff: (Optional) maximum seconds to wait between retries.
+
+    :type request_options:
+        :class:`google.cloud.spanner_v1.types.RequestOptions`
+    :param request_options: (Optional) Common options for the requests.
+
+    :type exclude_txn_from_change_streams: bool
+    :param exclude_txn_from_change_streams: (Optional) If true, the
+        transactions are excluded from change streams with the DDL option
+        ``allow_txn_exclusion=true``.
+
+    :type client_context: :class:`~google.cloud.spanner_v1.types.RequestOptions.ClientContext`
+    :param client_context: (Optional) Client context to use for the requests."""
+
+    def __init__(
+        self,
+        database,
+        max_groups_per_request=DEFAULT_MAX_GROUPS_PER_REQUEST,
+        max_bytes_per_request=DEFAULT_MAX_BYTES_PER_REQUEST,
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_attempts=DEFAULT_MAX_ATTEMPTS,
+        initial_backoff=DEFAULT_INITIAL_BACKOFF,
+        max_backoff=DEFAULT_MAX_BACKOFF,
+        request_options=None,
+        exclude_txn_from_change_streams=False,
+        client_context=None,
+    ):
+        if max_groups_per_request < 1:
+            raise ValueError("max_groups_per_request must be at least 1")
+        if max_bytes_per_request < 1:
+            raise ValueError("max_bytes_per_request must be at least 1")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self._database = database
+        self._max_groups_per_request = max_groups_per_request
+        self._max_bytes_per_request = max_bytes_per_request
+        self._max_attempts = max_attempts
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._batch_write_kw = {
+            "request_options": request_options,
+            "exclude_txn_from_change_streams": exclude_txn_from_change_streams,
+        }
+        self._client_context = client_context
+        self._semaphore = CrossSync._Sync_Impl.Semaphore(max_concurrent_requests)
+        self._lock = CrossSync._Sync_Impl.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests)
+        self._tasks = []
+        self._pending = []
+        self._pending_bytes = 0
+        self._group_count = 0
+        self._failed_groups = []
+        self._stats = MutationGroupWriterStats()
+        self._start_time = None
+        self._end_time = None
+        self._closed = False
+
+    @property
+    def stats(self):
+        """Counters of the requests and groups that have finished so far.
+
+        :rtype: :class:`MutationGroupWriterStats`"""
+        end_time = self._end_time
+        if end_time is None:
+            end_time = time.perf_counter()
+        elapsed_time = 0.0
+        if self._start_time is not None:
+            elapsed_time = end_time - self._start_time
+        return replace(self._stats, elapsed_time=elapsed_time)
+
+    @property
+    def failed_groups(self):
+        """Mutation groups that could not be applied, ordered by index.
+
+        :rtype: list of :class:`FailedMutationGroup`"""
+        return sorted(self._failed_groups, key=lambda failure: failure.index)
+
+    def write(self, mutation_groups):
+        """Adds mutation groups to the writer, sending full requests on the way.
+
+        :type mutation_groups: iterable
+        :param mutation_groups: the groups to apply. Each group is either a
+            :class:`~google.cloud.spanner_v1.types.BatchWriteRequest.MutationGroup`,
+            a :class:`~google.cloud.spanner_v1.batch.MutationGroup` or a list
+            of :class:`~google.cloud.spanner_v1.types.Mutation`. Groups are
+            numbered in the order in which they are written."""
+        if self._closed:
+            raise ValueError("MutationGroupWriter is closed")
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        for mutation_group in mutation_groups:
+            mutation_group = _to_mutation_group_pb(mutation_group)
+            size = BatchWriteRequest.MutationGroup.pb(mutation_group).ByteSize()
+            if self._pending and (
+                len(self._pending) >= self._max_groups_per_request
+                or self._pending_bytes + size > self._max_bytes_per_request
+            ):
+                self._submit()
+            self._pending.append(_PendingGroup(self._group_count, mutation_group, size))
+            self._group_count += 1
+            self._pending_bytes += size
+
+    def flush(self):
+        """Sends the groups that have not been sent yet.
+
+        The request runs in the background; use :meth:`close` to wait for it."""
+        if self._pending:
+            self._submit()
+
+    def _submit(self):
+        pending = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        self._semaphore.acquire()
+        self._tasks = [task for task in self._tasks if not task.done()]
+        self._tasks.append(
+            CrossSync._Sync_Impl.create_task(
+                self._send, pending, sync_executor=self._executor
+            )
+        )
+
+    def _send(self, pending):
+        try:
+            backoff = self._initial_backoff
+            while True:
+                pending = self._send_once(pending)
+                if not pending:
+                    break
+                with self._lock:
+                    self._stats.groups_retried += len(pending)
+                CrossSync._Sync_Impl.sleep(backoff * random.uniform(0.5, 1.0))
+                backoff = min(backoff * 2, self._max_backoff)
+        finally:
+            self._semaphore.release()
+
+    def _send_once(self, pending):
+        """Sends the groups in a single request, and returns the groups that
+        should be sent again."""
+        statuses = {}
+        exception = None
+        try:
+            with self._database.mutation_groups(
+                client_context=self._client_context
+            ) as groups:
+                groups._mutation_groups = [group.mutation_group for group in pending]
+                responses = groups.batch_write(**self._batch_write_kw)
+                for response in responses:
+                    for position in response.indexes:
+                        statuses[position] = response.status
+        except Exception as exc:
+            exception = exc
+        retry = []
+        with self._lock:
+            self._stats.requests += 1
+            for position, group in enumerate(pending):
+                group.attempts += 1
+                status = statuses.get(position)
+                if status is not None and status.code == code_pb2.OK:
+                    self._stats.groups_succeeded += 1
+                    self._stats.mutations_written += len(group.mutation_group.mutations)
+                    self._stats.bytes_written += group.size
+                    continue
+                if status is not None:
+                    retryable = status.code in _RETRYABLE_CODES
+                else:
+                    retryable = exception is None or isinstance(
+                        exception, _RETRYABLE_EXCEPTIONS
+                    )
+                if retryable and group.attempts < self._max_attempts:
+                    retry.append(group)
+                    continue
+                self._stats.groups_failed += 1
+                self._failed_groups.append(
+                    FailedMutationGroup(
+                        index=group.index,
+                        mutation_group=group.mutation_group,
+                        attempts=group.attempts,
+                        status=status,
+                        exception=exception if status is None else None,
+                    )
+                )
+        return retry
+
+    def close(self):
+        """Sends the remaining groups and waits for all requests to finish.
+
+        :rtype: list of :class:`FailedMutationGroup`
+        :returns: the mutation groups that could not be applied"""
+        if not self._closed:
+            self.flush()
+            self._closed = True
+        CrossSync._Sync_Impl.wait(self._tasks)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._end_time is None:
+            self._end_time = time.perf_counter()
+        return self.failed_groups
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Waits for all requests to finish. Inspect :attr:`failed_groups`
+        for the groups that could not be applied."""
+        if exc_type is not None:
+            self._pending = []
+        self.close()
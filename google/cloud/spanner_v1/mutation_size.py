@@ -0,0 +1,178 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Size accounting for the mutations of a batch or transaction."""
+
+from dataclasses import dataclass, field, replace
+from typing import Dict
+
+# Spanner rejects commits with more than 80,000 mutations, where each
+# inserted or updated column counts as one mutation (and each secondary index
+# that includes the column as another one), and requests larger than 100 MiB.
+MAX_MUTATIONS_PER_COMMIT = 80000
+MAX_BYTES_PER_COMMIT = 100 * 1024 * 1024
+
+
+@dataclass
+class TableMutationSize:
+    """Size of the mutations of a single table."""
+
+    rows: int = 0
+    mutations: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class MutationSize:
+    """Size of the mutations of a batch or transaction.
+
+    ``mutations`` estimates the mutation count that Spanner applies to the
+    commit limit: the number of written cells, plus, for tables whose
+    secondary indexes are known, the index entries that the writes touch.
+    Rows deleted by key ranges are not known up front and count once per
+    range. ``bytes`` is the encoded size of the mutations in the commit
+    request.
+    """
+
+    mutations: int = 0
+    bytes: int = 0
+    tables: Dict[str, TableMutationSize] = field(default_factory=dict)
+
+    def add(self, table, rows, mutations, size):
+        """Add the size of a mutation.
+
+        :type table: str
+        :param table: the table that the mutation modifies
+
+        :type rows: int
+        :param rows: number of rows, keys or key ranges of the mutation
+
+        :type mutations: int
+        :param mutations: mutation count of the mutation
+
+        :type size: int
+        :param size: encoded size of the mutation
+        """
+        # Each mutation is a length-delimited field of the commit request.
+        size += 1 + _varint_size(size)
+        self.mutations += mutations
+        self.bytes += size
+        table_size = self.tables.get(table)
+        if table_size is None:
+            table_size = self.tables[table] = TableMutationSize()
+        table_size.rows += rows
+        table_size.mutations += mutations
+        table_size.bytes += size
+
+    def remove(self, table, rows, mutations, size):
+        """Remove the size of a mutation that was added before.
+
+        :type table: str
+        :param table: the table that the mutation modifies
+
+        :type rows: int
+        :param rows: number of rows, keys or key ranges of the mutation
+
+        :type mutations: int
+        :param mutations: mutation count of the mutation
+
+        :type size: int
+        :param size: encoded size of the mutation when it was added
+        """
+        size += 1 + _varint_size(size)
+        self.mutations -= mutations
+        self.bytes -= size
+        table_size = self.tables[table]
+        table_size.rows -= rows
+        table_size.mutations -= mutations
+        table_size.bytes -= size
+
+    def validate_add(
+        self,
+        table,
+        rows,
+        mutations,
+        size,
+        max_mutations=MAX_MUTATIONS_PER_COMMIT,
+        max_bytes=MAX_BYTES_PER_COMMIT,
+    ):
+        """Check the size against the commit limits as if a mutation was
+        added, without adding it.
+
+        See :meth:`add` for the size of the mutation, and :meth:`validate`
+        for the limits.
+
+        :raises ValueError: if a limit would be exceeded, with the size of
+            each table including the mutation.
+        """
+        added = MutationSize(
+            self.mutations,
+            self.bytes,
+            {name: replace(table_size) for name, table_size in self.tables.items()},
+        )
+        added.add(table, rows, mutations, size)
+        added.validate(max_mutations, max_bytes)
+
+    def validate(
+        self, max_mutations=MAX_MUTATIONS_PER_COMMIT, max_bytes=MAX_BYTES_PER_COMMIT
+    ):
+        """Check the size against the commit limits.
+
+        :type max_mutations: int
+        :param max_mutations: (Optional) maximum mutation count
+
+        :type max_bytes: int
+        :param max_bytes: (Optional) maximum encoded size
+
+        :raises ValueError: if a limit is exceeded, with the size of each
+            table.
+        """
+        if self.mutations <= max_mutations and self.bytes <= max_bytes:
+            return
+        tables = ", ".join(
+            "{}: {} rows, {} mutations, {} bytes".format(
+                table, size.rows, size.mutations, size.bytes
+            )
+            for table, size in sorted(self.tables.items())
+        )
+        raise ValueError(
+            "Mutations exceed the commit limits ({} mutations of at most {}, "
+            "{} bytes of at most {}): {}".format(
+                self.mutations, max_mutations, self.bytes, max_bytes, tables
+            )
+        )
+
+
+def _varint_size(value):
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _index_mutations_per_row(columns, indexes):
+    """Count the index entries that writing a row touches.
+
+    :type columns: list of str
+    :param columns: the written columns
+
+    :type indexes: list of sets
+    :param indexes: the columns of each secondary index of the table,
+        including its stored columns
+
+    :rtype: int
+    :returns: one for each written column in each index that includes it
+    """
+    return sum(1 for index in indexes for column in columns if column in index)
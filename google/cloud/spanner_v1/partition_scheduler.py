@@ -0,0 +1,345 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for distributing the partitions of a batch read or query over
+multiple workers."""
+
+import heapq
+import pickle
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+DEFAULT_LEASE_SECONDS = 300.0
+
+_PENDING = "PENDING"
+_LEASED = "LEASED"
+_DONE = "DONE"
+
+_CREATE_TABLE = """CREATE TABLE IF NOT EXISTS partitions (
+    partition_index INTEGER PRIMARY KEY,
+    shard INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    batch BLOB NOT NULL,
+    state TEXT NOT NULL,
+    owner TEXT,
+    lease_expiry REAL,
+    duration REAL
+)"""
+
+# A partition is available if it has not been leased yet, or if the lease of
+# the worker that acquired it expired without the partition being completed.
+_AVAILABLE = "(state = 'PENDING' OR (state = 'LEASED' AND lease_expiry < ?))"
+
+
+def _resolve_weights(
+    count: int, weights: Optional[Union[Sequence[float], Mapping[int, float]]]
+) -> List[float]:
+    """Returns one weight per partition.
+
+    Partitions without a known weight get the mean of the known weights, or
+    1.0 if no weight is known at all.
+    """
+    if weights is None:
+        return [1.0] * count
+    if not isinstance(weights, Mapping):
+        if len(weights) != count:
+            raise ValueError(f"Expected {count} partition weights, got {len(weights)}")
+        weights = dict(enumerate(weights))
+    known = [float(w) for i, w in weights.items() if 0 <= i < count and w is not None]
+    default = sum(known) / len(known) if known else 1.0
+    resolved = []
+    for index in range(count):
+        weight = weights.get(index)
+        resolved.append(default if weight is None else float(weight))
+    return resolved
+
+
+def _assign_shards(weights: List[float], num_shards: int) -> List[Tuple[int, int]]:
+    """Returns ``(partition index, shard)`` pairs, heaviest partitions first.
+
+    Uses the longest processing time first heuristic: the heaviest remaining
+    partition is assigned to the least loaded shard.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1")
+    loads = [(0.0, shard) for shard in range(num_shards)]
+    assignments = []
+    for index in sorted(range(len(weights)), key=lambda i: (-weights[i], i)):
+        load, shard = heapq.heappop(loads)
+        heapq.heappush(loads, (load + weights[index], shard))
+        assignments.append((index, shard))
+    return assignments
+
+
+def shard_batches(
+    batches: Sequence[Dict[str, Any]],
+    num_shards: int,
+    weights: Optional[Union[Sequence[float], Mapping[int, float]]] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Splits partitions into ``num_shards`` shards of roughly equal weight.
+
+    :type batches: sequence of dict
+    :param batches: partitions returned by
+        :meth:`~google.cloud.spanner_v1.database.BatchSnapshot.generate_read_batches`
+        or
+        :meth:`~google.cloud.spanner_v1.database.BatchSnapshot.generate_query_batches`.
+
+    :type num_shards: int
+    :param num_shards: number of shards, typically the number of workers.
+
+    :type weights: sequence of float or mapping of int to float
+    :param weights: (Optional) expected cost of each partition, such as a
+        size hint or the duration observed in a previous run (see
+        :meth:`PartitionLeaseCoordinator.observed_durations`). A mapping is
+        keyed by partition index; missing partitions get the mean weight.
+        All partitions have the same weight if not set.
+
+    :rtype: list of list of dict
+    :returns: ``num_shards`` lists of partitions. Within each shard, the
+        partitions are ordered by decreasing weight.
+    """
+    resolved = _resolve_weights(len(batches), weights)
+    shards = [[] for _ in range(num_shards)]
+    for index, shard in _assign_shards(resolved, num_shards):
+        shards[shard].append(batches[index])
+    return shards
+
+
+@dataclass
+class PartitionLease:
+    """A partition that has been leased by a worker."""
+
+    partition_index: int
+    shard: int
+    batch: Dict[str, Any]
+    worker_id: str
+    lease_expiry: float
+    acquired_at: float
+
+
+class PartitionLeaseCoordinator:
+    """Work-stealing coordinator for distributing partitions over workers.
+
+    The state is kept in a SQLite database file that is shared by all
+    workers, for example on a shared volume. Partitions are pre-assigned to
+    shards with :func:`shard_batches`; each worker first processes the
+    partitions of its own shard and then steals work from the shard with the
+    most remaining weight, so the slowest worker does not determine the total
+    duration. A partition whose lease expires, for example because its
+    worker crashed, is handed out again.
+
+    Each worker should create its own coordinator instance, and restore the
+    :class:`~google.cloud.spanner_v1.database.BatchSnapshot` with
+    :meth:`~google.cloud.spanner_v1.database.BatchSnapshot.from_dict` before
+    processing the leased partitions.
+
+    :type path: str
+    :param path: path of the SQLite database file.
+
+    :type lease_seconds: float
+    :param lease_seconds: (Optional) duration of a lease.
+
+    :type timeout: float
+    :param timeout: (Optional) seconds to wait for the database lock.
+    """
+
+    def __init__(self, path, lease_seconds=DEFAULT_LEASE_SECONDS, timeout=30.0):
+        self._lease_seconds = lease_seconds
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute(_CREATE_TABLE)
+
+    def close(self):
+        """Closes the connection to the database file."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _transaction(self):
+        return _ImmediateTransaction(self._connection)
+
+    def add_batches(self, batches, num_shards, weights=None):
+        """Registers the partitions of a batch read or query.
+
+        This should be called once, by a single process, before the workers
+        start. Existing partitions are replaced.
+
+        :type batches: sequence of dict
+        :param batches: partitions to distribute.
+
+        :type num_shards: int
+        :param num_shards: number of workers.
+
+        :type weights: sequence of float or mapping of int to float
+        :param weights: (Optional) expected cost of each partition, see
+            :func:`shard_batches`.
+        """
+        resolved = _resolve_weights(len(batches), weights)
+        rows = [
+            (index, shard, resolved[index], pickle.dumps(batches[index]), _PENDING)
+            for index, shard in _assign_shards(resolved, num_shards)
+        ]
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM partitions")
+            cursor.executemany(
+                "INSERT INTO partitions (partition_index, shard, weight, batch, state)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def acquire(self, shard, worker_id):
+        """Leases the next partition for a worker.
+
+        :type shard: int
+        :param shard: the shard of the worker.
+
+        :type worker_id: str
+        :param worker_id: unique id of the worker.
+
+        :rtype: :class:`PartitionLease`
+        :returns: the leased partition, or ``None`` if all partitions are
+            either done or leased by other workers.
+        """
+        with self._transaction() as cursor:
+            now = time.time()
+            row = cursor.execute(
+                "SELECT partition_index, shard, batch FROM partitions"
+                f" WHERE shard = ? AND {_AVAILABLE}"
+                " ORDER BY weight DESC, partition_index LIMIT 1",
+                (shard, now),
+            ).fetchone()
+            if row is None:
+                row = cursor.execute(
+                    "SELECT partition_index, shard, batch FROM partitions"
+                    f" WHERE {_AVAILABLE} AND shard = ("
+                    "  SELECT shard FROM partitions"
+                    f"  WHERE {_AVAILABLE}"
+                    "  GROUP BY shard ORDER BY SUM(weight) DESC, shard LIMIT 1)"
+                    " ORDER BY weight DESC, partition_index LIMIT 1",
+                    (now, now),
+                ).fetchone()
+            if row is None:
+                return None
+            partition_index, partition_shard, batch = row
+            lease_expiry = now + self._lease_seconds
+            cursor.execute(
+                "UPDATE partitions SET state = ?, owner = ?, lease_expiry = ?"
+                " WHERE partition_index = ?",
+                (_LEASED, worker_id, lease_expiry, partition_index),
+            )
+        return PartitionLease(
+            partition_index=partition_index,
+            shard=partition_shard,
+            batch=pickle.loads(batch),
+            worker_id=worker_id,
+            lease_expiry=lease_expiry,
+            acquired_at=now,
+        )
+
+    def renew(self, lease):
+        """Extends a lease for a partition that takes long to process.
+
+        :type lease: :class:`PartitionLease`
+        :param lease: the lease to extend.
+
+        :rtype: bool
+        :returns: ``False`` if the lease was lost to another worker.
+        """
+        lease_expiry = time.time() + self._lease_seconds
+        with self._transaction() as cursor:
+            updated = cursor.execute(
+                "UPDATE partitions SET lease_expiry = ?"
+                " WHERE partition_index = ? AND state = ? AND owner = ?",
+                (lease_expiry, lease.partition_index, _LEASED, lease.worker_id),
+            ).rowcount
+        if updated:
+            lease.lease_expiry = lease_expiry
+        return bool(updated)
+
+    def complete(self, lease, duration=None):
+        """Marks a leased partition as done.
+
+        :type lease: :class:`PartitionLease`
+        :param lease: the lease of the processed partition.
+
+        :type duration: float
+        :param duration: (Optional) seconds it took to process the partition.
+            Defaults to the time since the partition was leased.
+
+        :rtype: bool
+        :returns: ``False`` if the lease was lost to another worker, in which
+            case the partition is left to that worker.
+        """
+        if duration is None:
+            duration = time.time() - lease.acquired_at
+        with self._transaction() as cursor:
+            updated = cursor.execute(
+                "UPDATE partitions SET state = ?, duration = ?"
+                " WHERE partition_index = ? AND state = ? AND owner = ?",
+                (_DONE, duration, lease.partition_index, _LEASED, lease.worker_id),
+            ).rowcount
+        return bool(updated)
+
+    def is_done(self):
+        """Returns whether all partitions have been processed.
+
+        :rtype: bool
+        """
+        (remaining,) = self._connection.execute(
+            "SELECT COUNT(*) FROM partitions WHERE state != ?", (_DONE,)
+        ).fetchone()
+        return remaining == 0
+
+    def observed_durations(self):
+        """Returns the processing time of each completed partition.
+
+        The result can be passed as ``weights`` to :func:`shard_batches` or
+        :meth:`add_batches` in a next run of the same read or query.
+
+        :rtype: dict
+        :returns: mapping of partition index to duration in seconds.
+        """
+        return dict(
+            self._connection.execute(
+                "SELECT partition_index, duration FROM partitions"
+                " WHERE state = ? AND duration IS NOT NULL",
+                (_DONE,),
+            ).fetchall()
+        )
+
+
+class _ImmediateTransaction:
+    """Runs a block in a SQLite transaction that takes the write lock
+    immediately, so concurrent workers cannot lease the same partition."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __enter__(self):
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        self._cursor = cursor
+        return cursor
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._cursor.execute("COMMIT")
+        else:
+            self._cursor.execute("ROLLBACK")
+        self._cursor.close()
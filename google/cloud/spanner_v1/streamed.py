@@ -45,6 +45,7 @@ class StreamedResultSet(object):
     ):
         self._response_iterator = response_iterator
         self._rows = []
+        self._row_offset = 0
         self._metadata = None
         self._stats = None
         self._current_row = []
@@ -146,10 +147,14 @@ class StreamedResultSet(object):
             self._done = True
 
     def __iter__(self):
+        rows = self._rows
         while True:
-            iter_rows, self._rows[:] = (self._rows[:], ())
-            while iter_rows:
-                yield iter_rows.pop(0)
+            while self._row_offset < len(rows):
+                row = rows[self._row_offset]
+                self._row_offset += 1
+                yield row
+            del rows[:]
+            self._row_offset = 0
             if self._done:
                 return
             try:
@@ -157,6 +162,45 @@ class StreamedResultSet(object):
             except StopIteration:
                 return
 
+    def _take_rows(self, max_rows=None):
+        """Remove up to ``max_rows`` processed rows from :attr:`_rows`."""
+        rows = self._rows
+        start = self._row_offset
+        end = len(rows) if max_rows is None else min(len(rows), start + max_rows)
+        taken = rows[start:end]
+        if end == len(rows):
+            del rows[:]
+            self._row_offset = 0
+        else:
+            self._row_offset = end
+        return taken
+
+    def fetch_rows(self, max_rows=None):
+        """Return the next rows of the result set as a list.
+
+        The rows are sliced from the partial result sets as they are
+        received, instead of being returned one at a time.
+
+        :type max_rows: int
+        :param max_rows: (Optional) maximum number of rows to return. All
+            remaining rows are returned if not set.
+
+        :rtype: list
+        :returns: the next rows, which are fewer than ``max_rows`` only at
+            the end of the result set."""
+        rows = self._take_rows(max_rows)
+        while max_rows is None or len(rows) < max_rows:
+            if self._done:
+                break
+            try:
+                self._consume_next()
+            except StopIteration:
+                break
+            rows.extend(
+                self._take_rows(None if max_rows is None else max_rows - len(rows))
+            )
+        return rows
+
     def decode_row(self, row: []) -> []:
         """Decodes a row from protobuf values to Python objects. This function
            should only be called for result sets that use ``lazy_decoding=True``.
@@ -26,6 +26,12 @@ SELECT EXISTS(
 )
 """
 _GET_SCHEMA_TEMPLATE = "SELECT * FROM {} LIMIT 0"
+_GET_INDEXES_TEMPLATE = """
+SELECT INDEX_NAME, INDEX_TYPE, COLUMN_NAME
+FROM INFORMATION_SCHEMA.INDEX_COLUMNS
+{}
+ORDER BY INDEX_NAME, ORDINAL_POSITION
+"""
 
 
 class Table(object):
@@ -48,6 +54,8 @@ class Table(object):
 
         # Calculated properties.
         self._schema = None
+        self._primary_key = None
+        self._indexes = None
 
     @property
     def schema_name(self):
@@ -163,6 +171,74 @@ class Table(object):
             pass
         return list(results.fields)
 
+    @property
+    def primary_key(self):
+        """The primary key of this table.
+
+        :rtype: list of str
+        :returns: The names of the key columns, in key order.
+        """
+        if self._primary_key is None:
+            with self._database.snapshot() as snapshot:
+                self._primary_key, self._indexes = self._get_indexes(snapshot)
+        return self._primary_key
+
+    @property
+    def indexes(self):
+        """The secondary indexes of this table.
+
+        :rtype: dict
+        :returns: The names of the columns of each index, including its
+            stored columns, by index name.
+        """
+        if self._indexes is None:
+            with self._database.snapshot() as snapshot:
+                self._primary_key, self._indexes = self._get_indexes(snapshot)
+        return self._indexes
+
+    def _get_indexes(self, snapshot):
+        """Get the primary key and the secondary indexes of this table.
+
+        :type snapshot: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
+        :param snapshot: snapshot to use for database queries
+
+        :rtype: tuple
+        :returns: The names of the key columns, and the names of the
+            columns of each secondary index by index name.
+        """
+        if self._database.database_dialect == DatabaseDialect.POSTGRESQL:
+            results = snapshot.execute_sql(
+                sql=_GET_INDEXES_TEMPLATE.format(
+                    "WHERE TABLE_SCHEMA = $1 AND TABLE_NAME = $2 "
+                    "AND INDEX_TYPE IN ('PRIMARY_KEY', 'INDEX')"
+                ),
+                params={"p1": self.schema_name, "p2": self.table_id},
+                param_types={
+                    "p1": Type(code=TypeCode.STRING),
+                    "p2": Type(code=TypeCode.STRING),
+                },
+            )
+        else:
+            results = snapshot.execute_sql(
+                sql=_GET_INDEXES_TEMPLATE.format(
+                    "WHERE TABLE_SCHEMA = @schema_name AND TABLE_NAME = @table_id "
+                    "AND INDEX_TYPE IN ('PRIMARY_KEY', 'INDEX')"
+                ),
+                params={"schema_name": self.schema_name, "table_id": self.table_id},
+                param_types={
+                    "schema_name": Type(code=TypeCode.STRING),
+                    "table_id": Type(code=TypeCode.STRING),
+                },
+            )
+        primary_key = []
+        indexes = {}
+        for index_name, index_type, column_name in results:
+            if index_type == "PRIMARY_KEY":
+                primary_key.append(column_name)
+            else:
+                indexes.setdefault(index_name, []).append(column_name)
+        return primary_key, indexes
+
     def reload(self):
         """Reload this table.
 
@@ -29,11 +29,14 @@ from google.cloud.spanner_v1._helpers import (
     _merge_Transaction_Options,
     _merge_client_context,
     _merge_request_options,
+    _DmlStatementEncoder,
+    _split_dml_statements,
 )
 from google.cloud.spanner_v1._helpers import _retry
 from google.api_core import gapic_v1
 from google.api_core.exceptions import InternalServerError
 from google.protobuf.struct_pb2 import Struct
+from google.rpc import code_pb2
 from google.cloud.spanner_v1.batch import _BatchBase
 from google.cloud.spanner_v1.snapshot import _SnapshotBase
 from google.cloud.spanner_v1._opentelemetry_tracing import add_span_event, trace_call
@@ -50,6 +53,9 @@ from google.cloud.spanner_v1.types.spanner import (
 )
 from google.cloud.spanner_v1.types.transaction import TransactionOptions
 
+DEFAULT_MAX_BATCH_DML_STATEMENTS = 1000
+DEFAULT_MAX_BATCH_DML_BYTES = 10 * 1024 * 1024
+
 
 class Transaction(_SnapshotBase, _BatchBase):
     """Implement read-write transaction semantics for a session.
@@ -536,21 +542,116 @@ class Transaction(_SnapshotBase, _BatchBase):
             statement.  Note that if the status code is not ``OK``, the
             statement triggering the error will not have an entry in the
             list, nor will any statements following that one."""
+        encoder = _DmlStatementEncoder()
+        parsed = [
+            ExecuteBatchDmlRequest.Statement.wrap(encoder.encode(statement))
+            for statement in statements
+        ]
+        return self._execute_batch_dml(
+            parsed, request_options, last_statement, retry=retry, timeout=timeout
+        )
+
+    def batch_update_many(
+        self,
+        statements,
+        max_statements_per_request=DEFAULT_MAX_BATCH_DML_STATEMENTS,
+        max_bytes_per_request=DEFAULT_MAX_BATCH_DML_BYTES,
+        request_options=None,
+        last_statement=False,
+        *,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    ):
+        """Perform any number of DML statements via one or more
+        ``ExecuteBatchDml`` requests in this transaction.
+
+        The statements are split into requests of at most
+        ``max_statements_per_request`` statements and
+        ``max_bytes_per_request`` bytes, which are executed in order. The
+        statements are encoded one request at a time, and the params of
+        statements that share their SQL text and param types are encoded
+        with the same bound encoders. When a statement fails, the remaining
+        requests are not sent.
+
+        :type statements:
+            Iterable[Union[ str, Tuple[str, Dict[str, Any], Dict[str, Union[dict, .types.Type]]]]]
+        :param statements: DML statements, see :meth:`batch_update`.
+
+        :type max_statements_per_request: int
+        :param max_statements_per_request:
+                (Optional) maximum number of statements per request.
+
+        :type max_bytes_per_request: int
+        :param max_bytes_per_request:
+                (Optional) maximum encoded size of the statements per
+                request. A statement that is larger on its own is sent in a
+                request of its own.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for the requests.
+
+        :type last_statement: bool
+        :param last_statement:
+                If set to true, the last request marks the end of the
+                transaction, see :meth:`batch_update`.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) The retry settings for each request.
+
+        :type timeout: float
+        :param timeout: (Optional) The timeout for each request.
+
+        :rtype:
+            Tuple(status, Sequence[int])
+        :returns:
+            Status code of the last request, plus counts of rows affected by
+            each completed DML statement of all requests. As with
+            :meth:`batch_update`, if the status code is not ``OK``, the
+            statement triggering the error will not have an entry in the
+            list, nor will any statements following that one."""
+        if max_statements_per_request < 1:
+            raise ValueError("max_statements_per_request must be at least 1")
+        if max_bytes_per_request < 1:
+            raise ValueError("max_bytes_per_request must be at least 1")
+        encoder = _DmlStatementEncoder()
+        batches = _split_dml_statements(
+            (encoder.encode(statement) for statement in statements),
+            max_statements_per_request,
+            max_bytes_per_request,
+        )
+        batch = next(batches, [])
+        row_counts = []
+        while True:
+            parsed = [
+                ExecuteBatchDmlRequest.Statement.wrap(statement_pb)
+                for statement_pb in batch
+            ]
+            next_batch = next(batches, None)
+            status, batch_row_counts = self._execute_batch_dml(
+                parsed,
+                request_options,
+                last_statement and next_batch is None,
+                retry=retry,
+                timeout=timeout,
+            )
+            row_counts.extend(batch_row_counts)
+            if next_batch is None or status.code != code_pb2.OK:
+                return status, row_counts
+            batch = next_batch
+
+    def _execute_batch_dml(
+        self, parsed, request_options, last_statement, retry, timeout
+    ):
+        """Send encoded DML statements in a single ``ExecuteBatchDml`` request.
+
+        :rtype:
+            Tuple(status, Sequence[int])
+        :returns: see :meth:`batch_update`."""
         session = self._session
         database = session._database
         api = database.spanner_api
-        parsed = []
-        for statement in statements:
-            if isinstance(statement, str):
-                parsed.append(ExecuteBatchDmlRequest.Statement(sql=statement))
-            else:
-                dml, params, param_types = statement
-                params_pb = self._make_params_pb(params, param_types)
-                parsed.append(
-                    ExecuteBatchDmlRequest.Statement(
-                        sql=dml, params=params_pb, param_types=param_types
-                    )
-                )
         metadata = _metadata_with_prefix(database.name)
         if database._route_to_leader_enabled:
             metadata.append(
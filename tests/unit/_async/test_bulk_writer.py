@@ -0,0 +1,189 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from google.api_core.exceptions import InvalidArgument
+
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "first_name", "last_name", "age"]
+
+
+def _rows(count):
+    for i in range(count):
+        yield [f"user{i}@example.com", "First", "Last", i]
+
+
+class _FakeBatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    async def __aenter__(self):
+        from google.cloud.spanner_v1._async.batch import _BatchBase
+
+        self._batch = _BatchBase(None)
+        return self._batch
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        database = self._database
+        database.in_flight += 1
+        database.max_in_flight = max(database.max_in_flight, database.in_flight)
+        commit_number = len(database.commits)
+        database.commits.append(list(self._batch._mutations))
+        database.mutation_counts.append(self._batch.mutation_size.mutations)
+        try:
+            await asyncio.sleep(0)
+            if commit_number in database.failing_commits:
+                raise InvalidArgument("invalid")
+            self._batch.committed = commit_number
+        finally:
+            database.in_flight -= 1
+
+
+class _FakeDatabase(object):
+    def __init__(self, failing_commits=()):
+        self.commits = []
+        self.mutation_counts = []
+        self.failing_commits = set(failing_commits)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def batch(self, **kw):
+        return _FakeBatchCheckout(self)
+
+
+class TestBulkWriter(unittest.IsolatedAsyncioTestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1._async.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    async def test_write_splits_on_max_mutations(self):
+        database = _FakeDatabase()
+        async with self._make_one(
+            database, max_mutations=40, max_concurrent_commits=2
+        ) as writer:
+            await writer.insert(TABLE_NAME, COLUMNS, _rows(45))
+
+        results = writer.results
+        self.assertEqual([result.rows for result in results], [10, 10, 10, 10, 5])
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(len(database.commits), 5)
+        self.assertEqual(database.mutation_counts, [40, 40, 40, 40, 20])
+        self.assertEqual(database.max_in_flight, 2)
+
+    async def test_failed_commit(self):
+        database = _FakeDatabase(failing_commits=[0])
+        writer = self._make_one(database, max_mutations=4)
+        await writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+        results = await writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [False, True])
+        self.assertIsInstance(results[0].exception, InvalidArgument)
+
+    async def test_stop_on_error(self):
+        database = _FakeDatabase(failing_commits=[1])
+        writer = self._make_one(
+            database, max_mutations=4, max_concurrent_commits=1, stop_on_error=True
+        )
+        with self.assertRaises(InvalidArgument):
+            await writer.insert(TABLE_NAME, COLUMNS, _rows(4))
+        results = await writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [True, False])
+        self.assertEqual(len(database.commits), 2)
+
+    async def test_stop_on_error_close_discards_pending_rows(self):
+        database = _FakeDatabase(failing_commits=[0])
+        writer = self._make_one(
+            database, max_mutations=4, max_concurrent_commits=1, stop_on_error=True
+        )
+        await writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+        results = await writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [False])
+        self.assertEqual(len(database.commits), 1)
+
+    async def test_callback_error(self):
+        completed = []
+
+        def on_batch_complete(result):
+            completed.append(result)
+            raise RuntimeError("callback failed")
+
+        with self.assertRaisesRegex(RuntimeError, "callback failed"):
+            async with self._make_one(
+                _FakeDatabase(),
+                max_mutations=4,
+                on_batch_complete=on_batch_complete,
+            ) as writer:
+                await writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+
+        self.assertEqual(len(completed), 2)
+
+    async def test_exit_raises_first_failure(self):
+        database = _FakeDatabase(failing_commits=[0])
+        with self.assertRaises(InvalidArgument):
+            async with self._make_one(database) as writer:
+                await writer.insert(TABLE_NAME, COLUMNS, _rows(1))
+
+    async def test_write_async_iterable(self):
+        async def rows():
+            for row in _rows(5):
+                await asyncio.sleep(0)
+                yield row
+
+        database = _FakeDatabase()
+        async with self._make_one(database, max_mutations=8) as writer:
+            await writer.insert(TABLE_NAME, COLUMNS, rows())
+
+        self.assertEqual([result.rows for result in writer.results], [2, 2, 1])
+
+    async def test_write_stream(self):
+        async def rows():
+            for row in _rows(9):
+                yield row
+
+        database = _FakeDatabase(failing_commits=[1])
+        writer = self._make_one(database, max_mutations=8, max_concurrent_commits=2)
+        results = [
+            result async for result in writer.write_stream(TABLE_NAME, COLUMNS, rows())
+        ]
+
+        self.assertEqual(sorted(result.index for result in results), [0, 1, 2, 3, 4])
+        self.assertEqual(sum(result.rows for result in results), 9)
+        self.assertEqual(
+            [result.succeeded for result in writer.results].count(False), 1
+        )
+        self.assertLessEqual(database.max_in_flight, 2)
+        with self.assertRaises(ValueError):
+            await writer.write(TABLE_NAME, COLUMNS, _rows(1))
+
+    async def test_write_stream_invalid_row(self):
+        async def rows():
+            for row in _rows(3):
+                yield row
+            yield ["too", "short"]
+
+        writer = self._make_one(_FakeDatabase(), max_mutations=8)
+        results = []
+        with self.assertRaises(ValueError):
+            async for result in writer.write_stream(TABLE_NAME, COLUMNS, rows()):
+                results.append(result)
+
+        self.assertEqual([result.rows for result in results], [2])
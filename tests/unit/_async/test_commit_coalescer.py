@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import datetime
+from datetime import timezone
+import unittest
+
+from google.api_core.exceptions import AlreadyExists
+from google.rpc import code_pb2
+from google.rpc.status_pb2 import Status
+
+from google.cloud.spanner_v1 import BatchWriteResponse, Mutation
+
+COMMIT_TIMESTAMP = datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _mutations(key):
+    return [
+        Mutation(
+            insert=Mutation.Write(table="citizens", columns=["id"], values=[[str(key)]])
+        )
+    ]
+
+
+class _AsyncResponses(object):
+    def __init__(self, responses):
+        self._responses = iter(responses)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._responses)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeMutationGroups(object):
+    def __init__(self, database):
+        self._database = database
+        self._mutation_groups = []
+
+    async def batch_write(self, **kw):
+        count = len(self._mutation_groups)
+        self._database.requests.append(count)
+        return _AsyncResponses(
+            [
+                BatchWriteResponse(
+                    indexes=range(count - 1),
+                    status=Status(code=code_pb2.OK),
+                    commit_timestamp=COMMIT_TIMESTAMP,
+                ),
+                BatchWriteResponse(
+                    indexes=[count - 1], status=Status(code=code_pb2.ALREADY_EXISTS)
+                ),
+            ]
+        )
+
+
+class _FakeMutationGroupsCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    async def __aenter__(self):
+        return _FakeMutationGroups(self._database)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _FakeDatabase(object):
+    def __init__(self):
+        self.requests = []
+
+    def mutation_groups(self, client_context=None):
+        return _FakeMutationGroupsCheckout(self)
+
+
+class TestCommitCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def test_write_coalesces_concurrent_batches(self):
+        from google.cloud.spanner_v1._async.commit_coalescer import CommitCoalescer
+
+        database = _FakeDatabase()
+
+        async def write(coalescer, key):
+            async with coalescer.batch() as batch:
+                batch.insert("citizens", ["id"], [[str(key)]])
+            return batch.committed
+
+        async with CommitCoalescer(database, max_delay=0.05) as coalescer:
+            results = await asyncio.gather(
+                *[write(coalescer, key) for key in range(3)],
+                coalescer.write(_mutations(3)),
+                return_exceptions=True,
+            )
+
+        self.assertEqual(database.requests, [4])
+        self.assertEqual(results[:3], [COMMIT_TIMESTAMP] * 3)
+        self.assertIsInstance(results[3], AlreadyExists)
@@ -2448,6 +2448,58 @@ class TestDatabase(_BaseTest):
         async for item in merged_result:
             self.assertEqual(item, "result")
 
+    @CrossSync.pytest
+    async def test_run_partitioned_query_w_adaptive_parallelism(self):
+        from google.cloud.spanner_v1._async.database import BatchSnapshot
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+        from google.cloud.spanner_v1.types import (
+            Partition,
+            PartitionResponse,
+            ResultSetMetadata,
+            StructType,
+            Transaction as TransactionPB,
+            Type,
+            TypeCode,
+        )
+
+        api = build_spanner_api()
+        instance = _Instance(self.INSTANCE_NAME)
+        database = await self._make_one(self.DATABASE_ID, instance)
+        database._spanner_api = api
+        api.begin_transaction = mock.AsyncMock(
+            return_value=TransactionPB(id=self.TRANSACTION_ID)
+        )
+        api.partition_query = mock.AsyncMock(
+            return_value=PartitionResponse(
+                partitions=[
+                    Partition(partition_token=b"token-1"),
+                    Partition(partition_token=b"token-2"),
+                ]
+            )
+        )
+        metadata = ResultSetMetadata(
+            row_type=StructType(
+                fields=[StructType.Field(name="id", type_=Type(code=TypeCode.INT64))]
+            )
+        )
+
+        def execute_streaming_sql(request, **kwargs):
+            result_set = PartialResultSet(metadata=metadata)
+            result_set.values.append(_make_value_pb(len(request.partition_token)))
+            return _MockIterator(result_set)
+
+        api.execute_streaming_sql = mock.Mock(side_effect=execute_streaming_sql)
+        batch_snapshot = BatchSnapshot(database)
+
+        merged_result = await batch_snapshot.run_partitioned_query(
+            "SELECT id FROM t", adaptive_parallelism=True
+        )
+        rows = [row async for row in merged_result]
+
+        self.assertEqual(rows, [[7], [7]])
+        self.assertEqual(api.execute_streaming_sql.call_count, 2)
+        self.assertIsNotNone(merged_result._controller)
+
     @CrossSync.pytest
     async def test_spanner_api_experimental_host(self):
         from google.cloud.spanner_v1.services.spanner.async_client import (
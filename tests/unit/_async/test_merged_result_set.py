@@ -0,0 +1,241 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from unittest import mock
+
+from google.cloud.spanner_v1 import (
+    PartialResultSet,
+    ResultSetMetadata,
+    ResultSetStats,
+    StructType,
+    Type,
+    TypeCode,
+)
+from google.cloud.spanner_v1._async.merged_result_set import MergedResultSet
+from google.cloud.spanner_v1._async.streamed import StreamedResultSet
+from google.cloud.spanner_v1._helpers import _make_value_pb
+
+
+class _AsyncIterator:
+    def __init__(self, items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items:
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        return self._items.pop(0)
+
+
+def _make_partial_result_set(values, metadata=None, stats=None, last=False):
+    result_set_pb = PartialResultSet.pb(PartialResultSet())
+    if metadata is not None:
+        result_set_pb.metadata.CopyFrom(metadata._pb)
+    if stats is not None:
+        result_set_pb.stats.CopyFrom(stats._pb)
+    result_set_pb.values.extend(_make_value_pb(value) for value in values)
+    result_set_pb.last = last
+    return PartialResultSet.wrap(result_set_pb)
+
+
+METADATA = ResultSetMetadata(
+    row_type=StructType(
+        fields=[StructType.Field(name="id", type_=Type(code=TypeCode.INT64))]
+    )
+)
+
+
+class TestMergedResultSet(unittest.IsolatedAsyncioTestCase):
+    def _make_batch_snapshot(self, responses_by_partition, errors=None):
+        batch_snapshot = mock.Mock(spec=["process_query_batch"])
+        errors = errors or {}
+
+        async def process_query_batch(partition, lazy_decode=False):
+            if partition in errors:
+                raise errors[partition]
+            return StreamedResultSet(
+                _AsyncIterator(responses_by_partition[partition]),
+                lazy_decode=lazy_decode,
+            )
+
+        batch_snapshot.process_query_batch.side_effect = process_query_batch
+        return batch_snapshot
+
+    async def test_iterate(self):
+        responses = {
+            0: [
+                _make_partial_result_set(
+                    [1, 2],
+                    metadata=METADATA,
+                    stats=ResultSetStats(row_count_exact=2),
+                    last=True,
+                )
+            ],
+            1: [
+                _make_partial_result_set([3], metadata=METADATA),
+                _make_partial_result_set([4], last=True),
+            ],
+            2: [_make_partial_result_set([], metadata=METADATA, last=True)],
+        }
+        merged = MergedResultSet(self._make_batch_snapshot(responses), [0, 1, 2], 2)
+
+        rows = [row async for row in merged]
+
+        self.assertEqual(sorted(rows), [[1], [2], [3], [4]])
+        self.assertEqual(merged.metadata.row_type.fields[0].name, "id")
+        stats = merged.stats
+        self.assertEqual([p.rows for p in stats.partitions], [2, 2, 0])
+        self.assertTrue(all(p.done for p in stats.partitions))
+        self.assertEqual(stats.row_count_exact, 2)
+        self.assertGreater(stats.bytes_received, 0)
+        self.assertEqual(len(merged._tasks), 2)
+
+    async def test_iterate_w_adaptive_parallelism(self):
+        responses = {
+            index: [_make_partial_result_set([index], metadata=METADATA, last=True)]
+            for index in range(4)
+        }
+        merged = MergedResultSet(
+            self._make_batch_snapshot(responses),
+            [0, 1, 2, 3],
+            2,
+            adaptive_parallelism=True,
+        )
+        controller = merged._controller
+
+        self.assertEqual(controller.target_parallelism, 1)
+        self.assertEqual(controller.max_parallelism, 2)
+        rows = [row async for row in merged]
+
+        self.assertEqual(sorted(rows), [[0], [1], [2], [3]])
+        self.assertEqual(controller._active, 0)
+        self.assertTrue(all(p.done for p in merged.stats.partitions))
+
+    async def test_adaptive_parallelism_scales_up(self):
+        responses = {
+            index: [_make_partial_result_set([index], metadata=METADATA, last=True)]
+            for index in range(3)
+        }
+        merged = MergedResultSet(
+            self._make_batch_snapshot(responses),
+            [0, 1, 2],
+            3,
+            adaptive_parallelism=True,
+        )
+        controller = merged._controller
+        controller._adjust_interval = 0
+        for partition_stats in merged._partition_stats:
+            partition_stats.network_wait_time = 1.0
+
+        await controller.maybe_adjust()
+
+        self.assertEqual(controller.target_parallelism, 2)
+        self.assertEqual(len([row async for row in merged]), 3)
+
+    async def test_iterate_no_partitions(self):
+        merged = MergedResultSet(self._make_batch_snapshot({}), [], 0)
+
+        self.assertEqual([row async for row in merged], [])
+
+    async def test_iterate_w_error(self):
+        responses = {
+            0: [_make_partial_result_set([1], metadata=METADATA, last=True)],
+        }
+        error = RuntimeError("partition failed")
+        merged = MergedResultSet(
+            self._make_batch_snapshot(responses, errors={1: error}), [0, 1], 1
+        )
+
+        with self.assertRaises(RuntimeError):
+            async for _ in merged:
+                pass
+        with self.assertRaises(RuntimeError):
+            await merged.__anext__()
+
+    async def test_backpressure(self):
+        responses = {
+            0: [
+                _make_partial_result_set(list(range(10)), metadata=METADATA, last=True)
+            ],
+        }
+        with mock.patch(
+            "google.cloud.spanner_v1._async.merged_result_set.QUEUE_SIZE_PER_WORKER",
+            2,
+        ):
+            merged = MergedResultSet(self._make_batch_snapshot(responses), [0], 0)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # The producer is suspended once the queue is full.
+        self.assertEqual(merged._queue.qsize(), 2)
+        self.assertFalse(merged.stats.partitions[0].done)
+
+        rows = [row async for row in merged]
+        self.assertEqual(len(rows), 10)
+
+    async def test_close(self):
+        responses = {
+            0: [_make_partial_result_set(list(range(100)), metadata=METADATA)],
+        }
+        async with MergedResultSet(
+            self._make_batch_snapshot(responses), [0], 1
+        ) as merged:
+            await merged.__anext__()
+
+        self.assertTrue(all(task.done() for task in merged._tasks))
+
+    async def test_close_w_full_queue(self):
+        responses = {
+            0: [_make_partial_result_set(list(range(50)), metadata=METADATA)],
+        }
+        with mock.patch(
+            "google.cloud.spanner_v1._async.merged_result_set.QUEUE_SIZE_PER_WORKER",
+            2,
+        ):
+            merged = MergedResultSet(self._make_batch_snapshot(responses), [0], 0)
+        await merged.__anext__()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # The producer is suspended on the full queue.
+        self.assertTrue(merged._queue.full())
+
+        await asyncio.wait_for(merged.close(), 1)
+
+        self.assertTrue(all(task.done() for task in merged._tasks))
+
+    async def test_decode_row_not_started(self):
+        merged = MergedResultSet(self._make_batch_snapshot({}), [], 0)
+
+        with self.assertRaisesRegex(ValueError, "iterator not started"):
+            merged.decode_row([])
+        with self.assertRaisesRegex(ValueError, "iterator not started"):
+            merged.decode_column([], 0)
+
+    async def test_decode_lazy(self):
+        responses = {
+            0: [_make_partial_result_set([7], metadata=METADATA, last=True)],
+        }
+        merged = MergedResultSet(
+            self._make_batch_snapshot(responses), [0], 0, lazy_decode=True
+        )
+
+        rows = [row async for row in merged]
+
+        self.assertEqual(merged.decode_row(rows[0]), [7])
+        self.assertEqual(merged.decode_column(rows[0], 0), 7)
@@ -0,0 +1,101 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from google.rpc import code_pb2
+from google.rpc.status_pb2 import Status
+
+from google.cloud.spanner_v1 import BatchWriteResponse, Mutation
+
+
+def _group(key):
+    return [
+        Mutation(
+            insert=Mutation.Write(table="citizens", columns=["id"], values=[[str(key)]])
+        )
+    ]
+
+
+class _AsyncResponses(object):
+    def __init__(self, responses):
+        self._responses = iter(responses)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._responses)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeMutationGroups(object):
+    def __init__(self, database):
+        self._database = database
+        self._mutation_groups = []
+
+    async def batch_write(self, **kw):
+        self._database.requests.append(len(self._mutation_groups))
+        code = code_pb2.OK
+        if len(self._database.requests) == 1:
+            code = code_pb2.UNAVAILABLE
+        return _AsyncResponses(
+            [
+                BatchWriteResponse(
+                    indexes=range(len(self._mutation_groups)),
+                    status=Status(code=code),
+                )
+            ]
+        )
+
+
+class _FakeMutationGroupsCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    async def __aenter__(self):
+        return _FakeMutationGroups(self._database)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _FakeDatabase(object):
+    def __init__(self):
+        self.requests = []
+
+    def mutation_groups(self, client_context=None):
+        return _FakeMutationGroupsCheckout(self)
+
+
+class TestMutationGroupWriter(unittest.IsolatedAsyncioTestCase):
+    async def test_write_retries_failed_groups(self):
+        from google.cloud.spanner_v1._async.mutation_group_writer import (
+            MutationGroupWriter,
+        )
+
+        database = _FakeDatabase()
+        async with MutationGroupWriter(
+            database, max_groups_per_request=2, initial_backoff=0.0
+        ) as writer:
+            await writer.write(_group(key) for key in range(3))
+
+        self.assertEqual(sorted(database.requests), [1, 2, 2])
+        stats = writer.stats
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.groups_succeeded, 3)
+        self.assertEqual(stats.groups_retried, 2)
+        self.assertEqual(writer.failed_groups, [])
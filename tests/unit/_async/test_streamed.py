@@ -1115,6 +1115,50 @@ class TestStreamedResultSet(IsolatedAsyncioTestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    @CrossSync.pytest
+    async def test_fetch_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred", 42, "Bharney", 39, "Wylma", 41, "Pebbylz", 4, "Dino", 4]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:5], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[5:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator)
+        rows = [BARE[i : i + 2] for i in range(0, len(BARE), 2)]
+
+        self.assertEqual(await streamed.fetch_rows(0), [])
+        self.assertEqual(await streamed.fetch_rows(1), rows[:1])
+        self.assertEqual(await streamed.fetch_rows(3), rows[1:4])
+        self.assertEqual(await streamed.fetch_rows(3), rows[4:])
+        self.assertEqual(await streamed.fetch_rows(3), [])
+        self.assertEqual(await streamed.fetch_rows(), [])
+
+    @CrossSync.pytest
+    async def test_fetch_rows_after_iteration(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [1, 2, 3, 4, 5, 6]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:4], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[4:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator)
+        rows = streamed.__aiter__()
+
+        self.assertEqual(await rows.__anext__(), [1])
+        self.assertEqual(await streamed.fetch_rows(2), [[2], [3]])
+        self.assertEqual(await rows.__anext__(), [4])
+        self.assertEqual(await streamed.fetch_rows(), [[5], [6]])
+        self.assertEqual([row async for row in rows], [])
+
 
 class _MockCancellableIterator(object):
     cancel_calls = 0
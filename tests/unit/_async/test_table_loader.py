@@ -0,0 +1,81 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+from google.cloud.spanner_v1 import Mutation, TypeCode
+
+CSV_DATA = b"id,score\n1,1.5\n2,\n3,2\n"
+
+
+class _FakeBatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    async def __aenter__(self):
+        from google.cloud.spanner_v1._async.batch import _BatchBase
+
+        self._batch = _BatchBase(None)
+        return self._batch
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._database.commits.append(list(self._batch._mutations))
+        self._batch.committed = len(self._database.commits)
+
+
+class _FakeDatabase(object):
+    def __init__(self):
+        self.commits = []
+
+    def batch(self, **kw):
+        return _FakeBatchCheckout(self)
+
+
+class TestTableLoader(unittest.IsolatedAsyncioTestCase):
+    async def test_load_csv(self):
+        from google.cloud.spanner_v1._async.table_loader import TableLoader
+
+        database = _FakeDatabase()
+        loader = TableLoader(
+            database,
+            "citizens",
+            io.BytesIO(CSV_DATA),
+            format="csv",
+            column_types={"id": TypeCode.INT64, "score": TypeCode.FLOAT64},
+            block_rows=2,
+        )
+        result = await loader.load()
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.rows_loaded, 3)
+        self.assertEqual(result.resume_offset, len(CSV_DATA))
+        self.assertEqual(len(database.commits), 2)
+        row_pbs = [
+            row_pb
+            for mutations in database.commits
+            for mutation in mutations
+            for row_pb in Mutation.pb(mutation).insert_or_update.values
+        ]
+        self.assertEqual(
+            [
+                [value.WhichOneof("kind") for value in row_pb.values]
+                for row_pb in row_pbs
+            ],
+            [
+                ["string_value", "number_value"],
+                ["string_value", "null_value"],
+                ["string_value", "number_value"],
+            ],
+        )
@@ -0,0 +1,191 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous Connection() class unit tests."""
+
+import unittest
+from unittest import mock
+
+from google.api_core.exceptions import Aborted
+
+from tests.unit.spanner_dbapi.aio.test_cursor import _make_result_set
+
+
+class TestConnection(unittest.IsolatedAsyncioTestCase):
+    INSTANCE = "test-instance"
+
+    def _make_connection(self, **kwargs):
+        from google.cloud.spanner_dbapi.aio import Connection
+
+        database = mock.MagicMock()
+        database._sessions_manager.get_session = mock.AsyncMock(
+            return_value=mock.Mock()
+        )
+        database._sessions_manager.put_session = mock.AsyncMock()
+        database._sessions_manager._pool.clear = mock.AsyncMock()
+        return Connection(self.INSTANCE, database, **kwargs)
+
+    def _make_transaction(self, connection, rows=()):
+        transaction = mock.Mock(_transaction_id=b"transaction")
+        transaction.execute_sql = mock.AsyncMock(
+            side_effect=lambda *args, **kwargs: _make_result_set(rows)
+        )
+        transaction.commit = mock.AsyncMock()
+        transaction.rollback = mock.AsyncMock()
+        session = connection.database._sessions_manager.get_session.return_value
+        session.transaction.return_value = transaction
+        return transaction
+
+    async def test_connect(self):
+        from google.cloud.spanner_dbapi.aio import Connection, connect
+
+        client = mock.Mock(project="test-project")
+        instance = client.instance.return_value
+        instance.database = mock.AsyncMock()
+        pool = mock.Mock()
+
+        connection = await connect(
+            self.INSTANCE, "test-database", client=client, pool=pool
+        )
+
+        self.assertIsInstance(connection, Connection)
+        client.instance.assert_called_once_with(self.INSTANCE)
+        instance.database.assert_awaited_once_with(
+            "test-database", pool=pool, database_role=None, logger=None
+        )
+        self.assertIs(connection.database, instance.database.return_value)
+        self.assertFalse(connection._own_pool)
+
+    async def test_commit(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection, [[1]])
+        cursor = connection.cursor()
+
+        await cursor.execute("SELECT id FROM t")
+        self.assertIs(connection._transaction, transaction)
+        await connection.commit()
+
+        transaction.commit.assert_awaited_once()
+        connection.database._sessions_manager.put_session.assert_awaited_once()
+        self.assertFalse(connection._spanner_transaction_started)
+
+    async def test_commit_aborted_is_retried(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection, [[1], [2]])
+        transaction.commit.side_effect = [Aborted("aborted"), None]
+        cursor = connection.cursor()
+
+        await cursor.execute("SELECT id FROM t")
+        self.assertEqual(await cursor.fetchall(), [(1,), (2,)])
+        await connection.commit()
+
+        self.assertEqual(transaction.execute_sql.await_count, 2)
+        self.assertEqual(transaction.commit.await_count, 2)
+
+    async def test_commit_aborted_w_changed_results(self):
+        from google.cloud.spanner_dbapi.exceptions import RetryAborted
+
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        transaction.execute_sql.side_effect = [
+            _make_result_set([[1]]),
+            _make_result_set([[2]]),
+        ]
+        transaction.commit.side_effect = Aborted("aborted")
+        cursor = connection.cursor()
+
+        await cursor.execute("SELECT id FROM t")
+        await cursor.fetchall()
+        with self.assertRaises(RetryAborted):
+            await connection.commit()
+
+    async def test_rollback(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+
+        await connection.cursor().execute("SELECT id FROM t")
+        await connection.rollback()
+
+        transaction.rollback.assert_awaited_once()
+        self.assertFalse(connection._spanner_transaction_started)
+
+    async def test_autocommit(self):
+        from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        await connection.cursor().execute("SELECT id FROM t")
+
+        with self.assertRaises(ProgrammingError):
+            connection.autocommit = True
+        await connection.set_autocommit(True)
+
+        self.assertTrue(connection.autocommit)
+        transaction.commit.assert_awaited_once()
+
+    async def test_context_manager(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+
+        async with connection:
+            await connection.cursor().execute("SELECT id FROM t")
+
+        transaction.commit.assert_awaited_once()
+        connection.database._sessions_manager._pool.clear.assert_awaited_once()
+        self.assertTrue(connection.is_closed)
+        with self.assertRaises(TypeError):
+            with connection:
+                pass
+
+    async def test_run_prior_DDL_statements(self):
+        connection = self._make_connection()
+        operation = mock.Mock(result=mock.AsyncMock())
+        connection.database.update_ddl = mock.AsyncMock(return_value=operation)
+        connection.autocommit = True
+
+        await connection.cursor().execute("CREATE TABLE t (id INT64) PRIMARY KEY (id)")
+
+        connection.database.update_ddl.assert_awaited_once_with(
+            ["CREATE TABLE t (id INT64) PRIMARY KEY (id)"]
+        )
+        operation.result.assert_awaited_once()
+
+    async def test_autocommit_dml_batch_flushed(self):
+        from google.rpc.code_pb2 import OK
+
+        from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
+
+        connection = self._make_connection()
+        connection.autocommit = True
+        connection.set_autocommit_dml_mode(AutocommitDmlMode.BATCHED)
+        transaction = mock.Mock()
+        transaction.batch_update_many = mock.AsyncMock(
+            return_value=(mock.Mock(code=OK), [1])
+        )
+
+        async def run_in_transaction(func, *args):
+            return await func(transaction, *args)
+
+        connection.database.run_in_transaction = run_in_transaction
+        cursor = connection.cursor()
+
+        await cursor.execute("UPDATE t SET a = 1 WHERE id = 1")
+        # The batch is sent by the next coroutine, not by the setter.
+        connection.set_autocommit_dml_mode(AutocommitDmlMode.TRANSACTIONAL)
+        transaction.batch_update_many.assert_not_awaited()
+        await connection.close()
+
+        transaction.batch_update_many.assert_awaited_once()
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertTrue(connection.is_closed)
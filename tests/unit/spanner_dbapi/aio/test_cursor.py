@@ -0,0 +1,343 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous Cursor() class unit tests."""
+
+import unittest
+from unittest import mock
+
+from google.api_core.exceptions import InvalidArgument
+from google.rpc.code_pb2 import OK
+
+
+class _AsyncIterator:
+    def __init__(self, *values):
+        self._values = iter(values)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._values)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _make_result_set(rows=(), row_count=None):
+    from google.cloud.spanner_v1 import (
+        PartialResultSet,
+        ResultSetMetadata,
+        ResultSetStats,
+        StructType,
+        Type,
+        TypeCode,
+    )
+    from google.cloud.spanner_v1._async.streamed import StreamedResultSet
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    metadata = ResultSetMetadata(
+        row_type=StructType(
+            fields=[StructType.Field(name="id", type_=Type(code=TypeCode.INT64))]
+        )
+    )
+    result_set = PartialResultSet(metadata=metadata)
+    for row in rows:
+        result_set.values.extend(_make_value_pb(value) for value in row)
+    if row_count is not None:
+        result_set.stats = ResultSetStats(row_count_exact=row_count)
+    return StreamedResultSet(_AsyncIterator(result_set))
+
+
+class _SnapshotCheckout:
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    async def __aenter__(self):
+        return self._snapshot
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class TestCursor(unittest.IsolatedAsyncioTestCase):
+    INSTANCE = "test-instance"
+
+    def _make_connection(self, database=None, **kwargs):
+        from google.cloud.spanner_dbapi.aio import Connection
+
+        if database is None:
+            database = mock.MagicMock()
+        return Connection(self.INSTANCE, database, **kwargs)
+
+    def _make_snapshot(self, database, rows):
+        snapshot = mock.Mock(_transaction_read_timestamp=None)
+        snapshot.execute_sql = mock.AsyncMock(return_value=_make_result_set(rows))
+        database.snapshot.return_value = _SnapshotCheckout(snapshot)
+        return snapshot
+
+    def _make_transaction(self, connection):
+        transaction = mock.Mock(_transaction_id=b"transaction")
+        transaction.batch_update_many = mock.AsyncMock()
+        connection._spanner_transaction_started = True
+        connection._transaction = transaction
+        return transaction
+
+    async def test_execute_query_and_fetch(self):
+        connection = self._make_connection()
+        connection.autocommit = True
+        snapshot = self._make_snapshot(connection.database, [[1], [2], [3], [4]])
+        cursor = connection.cursor()
+
+        await cursor.execute("SELECT id FROM t WHERE id > %s", (0,))
+
+        snapshot.execute_sql.assert_awaited_once()
+        self.assertEqual(
+            snapshot.execute_sql.call_args.args[:2],
+            ("SELECT id FROM t WHERE id > @a0", {"a0": 0}),
+        )
+        self.assertEqual(cursor.description[0].name, "id")
+        self.assertEqual(await cursor.fetchone(), (1,))
+        self.assertEqual(await cursor.fetchmany(2), [(2,), (3,)])
+        self.assertEqual([row async for row in cursor], [(4,)])
+        self.assertEqual(await cursor.fetchall(), [])
+        self.assertIsNone(await cursor.fetchone())
+
+    async def test_execute_dml_in_transaction(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        transaction.execute_sql = mock.AsyncMock(
+            return_value=_make_result_set(row_count=2)
+        )
+        cursor = connection.cursor()
+
+        await cursor.execute("UPDATE t SET a = %s WHERE id = %s", (1, 2))
+
+        self.assertEqual(
+            transaction.execute_sql.call_args.args[:2],
+            ("UPDATE t SET a = @a0 WHERE id = @a1", {"a0": 1, "a1": 2}),
+        )
+        self.assertEqual(cursor.rowcount, 2)
+        statements = connection._transaction_helper._statement_result_details_list
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(statements[0].sql, "UPDATE t SET a = %s WHERE id = %s")
+
+    async def test_execute_error(self):
+        from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        transaction.execute_sql = mock.AsyncMock(side_effect=InvalidArgument("bad"))
+        cursor = connection.cursor()
+
+        with self.assertRaises(ProgrammingError):
+            await cursor.execute("UPDATE t SET a = 1 WHERE id = 2")
+
+    async def test_executemany_dml_in_transaction(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        transaction.batch_update_many.return_value = (mock.Mock(code=OK), [1, 0])
+        cursor = connection.cursor()
+
+        await cursor.executemany("UPDATE t SET a = %s WHERE id = %s", [(1, 1), (2, 2)])
+
+        transaction.batch_update_many.assert_awaited_once_with(
+            [
+                ("UPDATE t SET a = @a0 WHERE id = @a1", {"a0": 1, "a1": 1}, mock.ANY),
+                ("UPDATE t SET a = @a0 WHERE id = @a1", {"a0": 2, "a1": 2}, mock.ANY),
+            ]
+        )
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertEqual(cursor._batch_dml_rows_count, [1, 0])
+        self.assertEqual(await cursor.fetchall(), [1, 0])
+
+    async def test_executemany_dml_autocommit(self):
+        connection = self._make_connection()
+        connection.autocommit = True
+        transaction = mock.Mock()
+        transaction.batch_update_many = mock.AsyncMock(
+            return_value=(mock.Mock(code=OK), [3])
+        )
+
+        async def run_in_transaction(func, *args):
+            return await func(transaction, *args)
+
+        connection.database.run_in_transaction = run_in_transaction
+        cursor = connection.cursor()
+
+        await cursor.executemany("DELETE FROM t WHERE a = %s", [(1,)])
+
+        transaction.batch_update_many.assert_awaited_once_with(
+            [("DELETE FROM t WHERE a = @a0", {"a0": 1}, mock.ANY)],
+            last_statement=True,
+        )
+        self.assertEqual(cursor.rowcount, 3)
+
+    async def test_executemany_query(self):
+        connection = self._make_connection(read_only=True)
+        connection.autocommit = True
+        snapshot = self._make_snapshot(connection.database, [[1], [2]])
+        snapshot.execute_sql.side_effect = [
+            _make_result_set([[1], [2]]),
+            _make_result_set([[3]]),
+        ]
+        cursor = connection.cursor()
+
+        await cursor.executemany("SELECT id FROM t WHERE a = %s", [(1,), (2,)])
+
+        self.assertEqual(await cursor.fetchmany(2), [(1,), (2,)])
+        self.assertEqual(await cursor.fetchall(), [(3,)])
+
+    async def test_executemany_query_concurrently(self):
+        import asyncio
+
+        connection = self._make_connection(max_concurrent_queries=2)
+        connection.autocommit = True
+        snapshot = self._make_snapshot(connection.database, [])
+        started = []
+        both_started = asyncio.Event()
+
+        async def execute_sql(sql, params, param_types, request_options=None):
+            started.append(params["a0"])
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+            return _make_result_set([[params["a0"]]] * params["a0"])
+
+        snapshot.execute_sql.side_effect = execute_sql
+        cursor = connection.cursor()
+
+        await asyncio.wait_for(
+            cursor.executemany("SELECT id FROM t WHERE a = %s", [(2,), (1,)]), 1
+        )
+
+        self.assertEqual(started, [2, 1])
+        self.assertIs(connection._snapshot, snapshot)
+        self.assertEqual(await cursor.fetchall(), [(2,), (2,), (1,)])
+
+    def _batched_dml_connection(self, row_counts):
+        from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
+
+        connection = self._make_connection()
+        connection.autocommit = True
+        connection.set_autocommit_dml_mode(AutocommitDmlMode.BATCHED)
+        transaction = mock.Mock()
+        transaction.batch_update_many = mock.AsyncMock(
+            return_value=(mock.Mock(code=OK), row_counts)
+        )
+
+        async def run_in_transaction(func, *args):
+            return await func(transaction, *args)
+
+        connection.database.run_in_transaction = mock.AsyncMock(
+            side_effect=run_in_transaction
+        )
+        return connection, transaction
+
+    async def test_execute_dml_autocommit_batched(self):
+        connection, transaction = self._batched_dml_connection([1, 2])
+        self._make_snapshot(connection.database, [[1]])
+        cursor1 = connection.cursor()
+        cursor2 = connection.cursor()
+
+        await cursor1.execute("UPDATE t SET a = %s WHERE id = %s", (1, 1))
+        await cursor2.execute("DELETE FROM t WHERE a = %s", (2,))
+
+        transaction.batch_update_many.assert_not_awaited()
+        self.assertEqual(cursor1.rowcount, -1)
+        self.assertEqual(cursor2.rowcount, -1)
+
+        await cursor2.execute("SELECT a FROM t")
+
+        transaction.batch_update_many.assert_awaited_once_with(
+            [
+                ("UPDATE t SET a = @a0 WHERE id = @a1", {"a0": 1, "a1": 1}, mock.ANY),
+                ("DELETE FROM t WHERE a = @a0", {"a0": 2}, mock.ANY),
+            ],
+            last_statement=True,
+        )
+        self.assertEqual(cursor1.rowcount, 1)
+        self.assertEqual(await cursor2.fetchall(), [(1,)])
+
+    async def test_execute_dml_autocommit_batched_flush(self):
+        connection, transaction = self._batched_dml_connection([1, 1])
+        connection.autocommit_dml_batch_size = 2
+        cursor = connection.cursor()
+
+        await cursor.execute("UPDATE t SET a = 1 WHERE id = 1")
+        await cursor.execute("UPDATE t SET a = 1 WHERE id = 2")
+        transaction.batch_update_many.assert_awaited_once()
+        self.assertEqual(cursor.rowcount, 1)
+
+        transaction.batch_update_many.return_value = (mock.Mock(code=OK), [3])
+        await cursor.execute("UPDATE t SET a = 1 WHERE id > 2")
+        self.assertEqual(await cursor.fetchall(), [])
+        self.assertEqual(transaction.batch_update_many.await_count, 2)
+        self.assertEqual(cursor.rowcount, 3)
+
+    async def test_execute_dml_autocommit_batched_cursor_close(self):
+        connection, transaction = self._batched_dml_connection([1])
+        idle_cursor = connection.cursor()
+        cursor = connection.cursor()
+
+        await cursor.execute("UPDATE t SET a = 1 WHERE id = 1")
+        await idle_cursor.close()
+        transaction.batch_update_many.assert_not_awaited()
+
+        async with cursor:
+            pass
+        transaction.batch_update_many.assert_awaited_once()
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertTrue(cursor.is_closed)
+
+    async def test_batch_dml(self):
+        connection = self._make_connection()
+        transaction = self._make_transaction(connection)
+        transaction.batch_update_many.return_value = (mock.Mock(code=OK), [1, 1])
+        cursor = connection.cursor()
+
+        await cursor.execute("START BATCH DML")
+        await cursor.execute("INSERT INTO t (a) VALUES (%s)", (1,))
+        await cursor.execute("INSERT INTO t (a) VALUES (%s)", (2,))
+        transaction.batch_update_many.assert_not_awaited()
+        await cursor.execute("RUN BATCH")
+
+        transaction.batch_update_many.assert_awaited_once()
+        self.assertEqual(cursor._batch_dml_rows_count, [1, 1])
+        self.assertEqual(await cursor.fetchall(), [1, 1])
+
+    async def test_partition_query_not_supported(self):
+        from google.cloud.spanner_dbapi.exceptions import NotSupportedError
+
+        connection = self._make_connection(read_only=True)
+        cursor = connection.cursor()
+
+        with self.assertRaises(NotSupportedError):
+            await cursor.execute("PARTITION SELECT id FROM t")
+
+    async def test_fetch_without_results(self):
+        from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+
+        cursor = self._make_connection().cursor()
+
+        self.assertEqual(await cursor.fetchall(), [])
+        with self.assertRaises(ProgrammingError):
+            cursor.__aiter__()
+
+    async def test_context_manager(self):
+        cursor = self._make_connection().cursor()
+
+        async with cursor as entered:
+            self.assertIs(entered, cursor)
+        self.assertTrue(cursor.is_closed)
@@ -77,3 +77,79 @@ class Test_compare_checksums(unittest.TestCase):
 
         with self.assertRaises(RetryAborted):
             _compare_checksums(original, retried)
+
+
+class TestResultsChecksum(unittest.TestCase):
+    def _make_one(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        return ResultsChecksum()
+
+    def test_consume_results_equals_consume_result(self):
+        import datetime
+        import decimal
+
+        rows = [
+            [1, "a", 1.5, b"x", None, True],
+            [2, decimal.Decimal("1.23"), datetime.date(2020, 1, 1)],
+            [[1, 2], ["nested", [3.0]]],
+        ]
+        batched = self._make_one()
+        batched.consume_results(rows[:2])
+        batched.consume_results(rows[2:])
+        batched.consume_results([])
+
+        one_by_one = self._make_one()
+        for row in rows:
+            one_by_one.consume_result(row)
+
+        self.assertEqual(len(batched), 3)
+        self.assertEqual(batched, one_by_one)
+
+    def test_does_not_depend_on_object_identity(self):
+        name = "".join(["na", "me"])
+        first = self._make_one()
+        first.consume_results([[name, name]])
+        second = self._make_one()
+        second.consume_results([["name", "".join(["na", "me"])]])
+
+        self.assertEqual(first, second)
+
+    def test_distinguishes_values(self):
+        import datetime
+
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+        from google.cloud.spanner_v1 import JsonObject
+
+        pairs = [
+            ([1], [True]),
+            ([1], [1.0]),
+            (["1"], [b"1"]),
+            ([[1, 2]], [[1], [2]]),
+            (
+                [
+                    DatetimeWithNanoseconds(
+                        2020, 1, 1, nanosecond=1, tzinfo=datetime.timezone.utc
+                    )
+                ],
+                [
+                    DatetimeWithNanoseconds(
+                        2020, 1, 1, nanosecond=2, tzinfo=datetime.timezone.utc
+                    )
+                ],
+            ),
+            ([JsonObject({"a": 1})], [JsonObject({"a": 2})]),
+            ([JsonObject([1])], [JsonObject([2])]),
+        ]
+        for original_row, retried_row in pairs:
+            with self.subTest(row=original_row):
+                original = self._make_one()
+                original.consume_result(original_row)
+                retried = self._make_one()
+                retried.consume_result(retried_row)
+                same = self._make_one()
+                same.consume_result(original_row)
+
+                self.assertNotEqual(original, retried)
+                self.assertEqual(original, same)
@@ -125,6 +125,29 @@ class TestConnection(unittest.TestCase):
         self.assertIsInstance(connection.database, Database)
         self.assertEqual(connection.current_schema, "public")
 
+    def test_retry_options(self):
+        connection = self._make_connection()
+        self.assertTrue(connection.retry_aborts_internally)
+        self.assertIsNone(connection.max_recorded_statements)
+        self.assertIsNone(connection.max_recorded_bytes)
+
+        connection.retry_aborts_internally = False
+        connection.max_recorded_statements = 10
+        connection.max_recorded_bytes = 1024
+
+        helper = connection._transaction_helper
+        self.assertFalse(helper.retry_aborts_internally)
+        self.assertEqual(helper.max_recorded_statements, 10)
+        self.assertEqual(helper.max_recorded_bytes, 1024)
+
+    def test_retry_aborts_internally_w_transaction_started(self):
+        connection = self._make_connection()
+        connection._spanner_transaction_started = True
+
+        with self.assertRaises(ProgrammingError):
+            connection.retry_aborts_internally = False
+        self.assertTrue(connection.retry_aborts_internally)
+
     def test_read_only_connection(self):
         connection = self._make_connection(read_only=True)
         self.assertTrue(connection.read_only)
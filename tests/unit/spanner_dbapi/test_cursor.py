@@ -13,6 +13,7 @@
 # limitations under the License.
 
 """Cursor() class unit tests."""
+
 import sys
 import unittest
 from unittest import mock
@@ -50,7 +51,7 @@ class TestCursor(unittest.TestCase):
         from google.rpc.code_pb2 import OK
 
         transaction = mock.Mock()
-        transaction.batch_update = mock.Mock(
+        transaction.batch_update_many = mock.Mock(
             return_value=[mock.Mock(code=OK), mock_response]
         )
         return transaction
@@ -151,7 +152,7 @@ class TestCursor(unittest.TestCase):
             ):
                 cursor.executemany(sql, [(1,), (2,), (3,)])
 
-        transaction.batch_update.assert_called_once_with(
+        transaction.batch_update_many.assert_called_once_with(
             [
                 ("DELETE FROM table WHERE col1 = @a0", {"a0": 1}, {"a0": INT64}),
                 ("DELETE FROM table WHERE col1 = @a0", {"a0": 2}, {"a0": INT64}),
@@ -563,7 +564,7 @@ class TestCursor(unittest.TestCase):
             ):
                 cursor.executemany(sql, [(1,), (2,), (3,)])
 
-        transaction.batch_update.assert_called_once_with(
+        transaction.batch_update_many.assert_called_once_with(
             [
                 ("DELETE FROM table WHERE col1 = @a0", {"a0": 1}, {"a0": INT64}),
                 ("DELETE FROM table WHERE col1 = @a0", {"a0": 2}, {"a0": INT64}),
@@ -601,7 +602,7 @@ class TestCursor(unittest.TestCase):
             ):
                 cursor.executemany(sql, [(1, "a"), (2, "b"), (3, "c")])
 
-        transaction.batch_update.assert_called_once_with(
+        transaction.batch_update_many.assert_called_once_with(
             [
                 (
                     "UPDATE table SET col1 = @a0 WHERE col2 = @a1",
@@ -650,7 +651,7 @@ class TestCursor(unittest.TestCase):
             ):
                 cursor.executemany(sql, [(1, 2, 3, 4), (5, 6, 7, 8)])
 
-        transaction.batch_update.assert_called_once_with(
+        transaction.batch_update_many.assert_called_once_with(
             [
                 (
                     """INSERT INTO table (col1, "col2", `col3`, `"col4"`) VALUES (@a0, @a1, @a2, @a3)""",
@@ -696,7 +697,7 @@ class TestCursor(unittest.TestCase):
             ):
                 cursor.executemany(sql, [(1, 2, 3, 4), (5, 6, 7, 8)])
 
-        transaction.batch_update.assert_called_once_with(
+        transaction.batch_update_many.assert_called_once_with(
             [
                 (
                     """INSERT INTO table (col1, "col2", `col3`, `"col4"`) VALUES (@a0, @a1, @a2, @a3)""",
@@ -713,6 +714,293 @@ class TestCursor(unittest.TestCase):
         )
         transaction.commit.assert_called_once()
 
+    def _insert_as_mutations_connection(self, autocommit):
+        from google.cloud.spanner_dbapi import connect
+
+        connection = connect(
+            "test-instance",
+            "test-database",
+            project="test-project",
+            credentials=AnonymousCredentials(),
+            client_options={"api_endpoint": "none"},
+        )
+        connection.autocommit = autocommit
+        connection.insert_as_mutations = True
+        return connection
+
+    def test_executemany_insert_as_mutations_non_autocommit(self):
+        from google.cloud.spanner_v1.types.spanner import Session
+
+        sql = """INSERT INTO table (col1, "col2", `col3`) VALUES (%s, %s, %s)"""
+        connection = self._insert_as_mutations_connection(autocommit=False)
+        transaction = self._transaction_mock()
+
+        cursor = connection.cursor()
+        with mock.patch(
+            "google.cloud.spanner_v1.services.spanner.client.SpannerClient.create_session",
+            return_value=Session(),
+        ):
+            with mock.patch(
+                "google.cloud.spanner_v1.session.Session.transaction",
+                return_value=transaction,
+            ):
+                cursor.executemany(sql, [(1, 2, 3), (4, 5, 6)])
+
+        transaction.insert.assert_called_once_with(
+            "table",
+            ("col1", "col2", "col3"),
+            [[1, 2, 3], [4, 5, 6]],
+            validate=True,
+        )
+        transaction.batch_update_many.assert_not_called()
+        self.assertEqual(cursor.rowcount, 2)
+        self.assertEqual(cursor._batch_dml_rows_count, [1, 1])
+
+    def test_executemany_insert_as_mutations_exceeds_commit_limits(self):
+        from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+        from google.cloud.spanner_v1.types.spanner import Session
+
+        from google.cloud.spanner_v1.transaction import Transaction
+
+        sql = "INSERT INTO table (col1) VALUES (%(col1)s)"
+        connection = self._insert_as_mutations_connection(autocommit=False)
+        transaction = Transaction(mock.MagicMock())
+        transaction.insert("table", ("col1",), [[0]])
+        mutations = list(transaction._mutations)
+        mutation_count = transaction.mutation_size.mutations
+
+        cursor = connection.cursor()
+        with mock.patch(
+            "google.cloud.spanner_v1.services.spanner.client.SpannerClient.create_session",
+            return_value=Session(),
+        ):
+            with mock.patch(
+                "google.cloud.spanner_v1.session.Session.transaction",
+                return_value=transaction,
+            ):
+                with mock.patch(
+                    "google.cloud.spanner_v1.mutation_size.MutationSize.validate",
+                    side_effect=ValueError("too large"),
+                ):
+                    with self.assertRaisesRegex(ProgrammingError, "too large"):
+                        cursor.executemany(sql, [{"col1": 1}])
+
+        # The rows were not added to the transaction.
+        self.assertEqual(transaction._mutations, mutations)
+        self.assertEqual(transaction.mutation_size.mutations, mutation_count)
+
+    def test_executemany_insert_as_mutations_autocommit(self):
+        from google.api_core.exceptions import AlreadyExists
+
+        from google.cloud.spanner_dbapi.exceptions import IntegrityError
+        from google.cloud.spanner_v1.bulk_writer import BulkWriteBatchResult
+
+        sql = "INSERT INTO table (col1, col2) VALUES (%s, %s)"
+        connection = self._insert_as_mutations_connection(autocommit=True)
+        cursor = connection.cursor()
+
+        with mock.patch("google.cloud.spanner_dbapi.cursor.BulkWriter") as writer_class:
+            writer = writer_class.return_value
+            writer.results = [
+                BulkWriteBatchResult(index=0, rows=2, mutations=4, bytes=10)
+            ]
+            cursor.executemany(sql, [(1, 2), (3, 4)])
+
+            writer_class.assert_called_once_with(
+                connection.database, max_concurrent_commits=1, stop_on_error=True
+            )
+            writer.insert.assert_called_once_with(
+                "table", ("col1", "col2"), [[1, 2], [3, 4]]
+            )
+            writer.__exit__.assert_called_once_with(None, None, None)
+            self.assertEqual(cursor.rowcount, 2)
+
+            writer.results = [
+                BulkWriteBatchResult(index=0, rows=1, mutations=2, bytes=5),
+                BulkWriteBatchResult(
+                    index=1,
+                    rows=1,
+                    mutations=2,
+                    bytes=5,
+                    exception=AlreadyExists("row exists"),
+                ),
+            ]
+            writer.insert.side_effect = AlreadyExists("row exists")
+            with self.assertRaises(IntegrityError):
+                cursor.executemany(sql, [(1, 2), (3, 4)])
+            self.assertEqual(cursor.rowcount, 1)
+
+    def _concurrent_queries_connection(self, **kwargs):
+        connection = self._make_connection(
+            self.INSTANCE, mock.MagicMock(), max_concurrent_queries=2, **kwargs
+        )
+
+        def execute_sql(sql, params, param_types, request_options=None):
+            result_set = mock.MagicMock()
+            result_set.metadata.transaction.read_timestamp = None
+            result_set.__iter__.return_value = iter(
+                [[params["a0"], i] for i in range(params["a0"])]
+            )
+            return result_set
+
+        snapshot = mock.Mock(execute_sql=mock.Mock(side_effect=execute_sql))
+        connection.database.snapshot.return_value.__enter__.return_value = snapshot
+        return connection, snapshot
+
+    def test_executemany_query_concurrently(self):
+        connection, snapshot = self._concurrent_queries_connection()
+        connection.autocommit = True
+        cursor = connection.cursor()
+
+        cursor.executemany("SELECT a, b FROM t WHERE a = %s", [(3,), (0,), (1,)])
+
+        self.assertEqual(snapshot.execute_sql.call_count, 3)
+        snapshot.execute_sql.assert_any_call(
+            "SELECT a, b FROM t WHERE a = @a0",
+            {"a0": 3},
+            {"a0": mock.ANY},
+            request_options=None,
+        )
+        self.assertEqual(connection.database.snapshot.call_count, 3)
+        self.assertIs(connection._snapshot, snapshot)
+        self.assertEqual(cursor.fetchone(), (3, 0))
+        self.assertEqual(cursor.fetchall(), [(3, 1), (3, 2), (1, 0)])
+
+    def test_executemany_query_concurrently_read_only_transaction(self):
+        connection, snapshot = self._concurrent_queries_connection(read_only=True)
+        cursor = connection.cursor()
+
+        with mock.patch.object(
+            connection, "snapshot_checkout", return_value=snapshot
+        ) as snapshot_checkout:
+            cursor.executemany("SELECT a, b FROM t WHERE a = %s", [(1,), (2,)])
+
+        snapshot_checkout.assert_called_once_with()
+        connection.database.snapshot.assert_not_called()
+        self.assertEqual(cursor.fetchall(), [(1, 0), (2, 0), (2, 1)])
+
+    def test_executemany_query_not_concurrently_in_transaction(self):
+        connection, _ = self._concurrent_queries_connection()
+        cursor = connection.cursor()
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.cursor.Cursor._execute"
+        ) as execute_mock:
+            cursor.executemany("SELECT a FROM t WHERE a = %s", [(1,), (2,)])
+
+        self.assertEqual(execute_mock.call_count, 2)
+
+    def test_max_concurrent_queries_invalid(self):
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+
+        with self.assertRaises(ValueError):
+            connection.max_concurrent_queries = 0
+
+    def _batched_dml_connection(self, row_counts):
+        from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        connection.autocommit = True
+        connection.set_autocommit_dml_mode(AutocommitDmlMode.BATCHED)
+        transaction = self._transaction_mock(row_counts)
+        connection.database.run_in_transaction = mock.Mock(
+            side_effect=lambda func, *args: func(transaction, *args)
+        )
+        return connection, transaction
+
+    def test_execute_dml_autocommit_batched(self):
+        connection, transaction = self._batched_dml_connection([1, 2])
+        cursor1 = connection.cursor()
+        cursor2 = connection.cursor()
+
+        cursor1.execute("UPDATE t SET a = %s WHERE id = %s", (1, 1))
+        cursor2.execute("DELETE FROM t WHERE a = %s", (2,))
+
+        connection.database.run_in_transaction.assert_not_called()
+        self.assertEqual(cursor1.rowcount, -1)
+        self.assertEqual(cursor2.rowcount, -1)
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.cursor.Cursor._handle_DQL"
+        ) as handle_dql:
+            cursor2.execute("SELECT a FROM t")
+            handle_dql.assert_called_once()
+
+        transaction.batch_update_many.assert_called_once_with(
+            [
+                ("UPDATE t SET a = @a0 WHERE id = @a1", {"a0": 1, "a1": 1}, mock.ANY),
+                ("DELETE FROM t WHERE a = @a0", {"a0": 2}, mock.ANY),
+            ],
+            last_statement=True,
+        )
+        self.assertEqual(cursor1.rowcount, 1)
+
+    def test_execute_dml_autocommit_batched_flush(self):
+        from google.rpc.code_pb2 import OK
+
+        connection, transaction = self._batched_dml_connection([1])
+        connection.autocommit_dml_batch_size = 2
+        cursor = connection.cursor()
+
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 1")
+        self.assertEqual(cursor.fetchall(), [])
+        self.assertEqual(cursor.rowcount, 1)
+
+        transaction.batch_update_many.return_value = [mock.Mock(code=OK), [1, 1]]
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 2")
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 3")
+        self.assertEqual(transaction.batch_update_many.call_count, 2)
+        self.assertEqual(cursor.rowcount, 1)
+
+        connection.autocommit_dml_batch_timeout = 0
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 4")
+        self.assertEqual(transaction.batch_update_many.call_count, 3)
+
+    def test_execute_dml_autocommit_batched_cursor_close(self):
+        connection, transaction = self._batched_dml_connection([1])
+        idle_cursor = connection.cursor()
+        cursor = connection.cursor()
+
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 1")
+        idle_cursor.close()
+        transaction.batch_update_many.assert_not_called()
+
+        cursor.close()
+        transaction.batch_update_many.assert_called_once()
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertTrue(cursor.is_closed)
+
+    def test_execute_dml_autocommit_batched_w_then_return(self):
+        connection, transaction = self._batched_dml_connection([])
+        transaction.execute_sql.return_value = iter([[1]])
+        cursor = connection.cursor()
+
+        cursor.execute("UPDATE t SET a = 1 WHERE id = 1 THEN RETURN a")
+
+        connection.database.run_in_transaction.assert_called_once_with(
+            cursor._do_execute_update_in_autocommit,
+            "UPDATE t SET a = 1 WHERE id = 1 THEN RETURN a",
+            None,
+        )
+        transaction.batch_update_many.assert_not_called()
+
+    def test_execute_dml_autocommit_batched_error(self):
+        from google.rpc.code_pb2 import INVALID_ARGUMENT
+
+        from google.cloud.spanner_dbapi.exceptions import OperationalError
+
+        connection, transaction = self._batched_dml_connection([])
+        transaction.batch_update_many.return_value = [
+            mock.Mock(code=INVALID_ARGUMENT, message="bad"),
+            [],
+        ]
+        cursor = connection.cursor()
+
+        cursor.execute("INSERT INTO t (a) VALUES (1)")
+        with self.assertRaises(OperationalError):
+            connection.close()
+        self.assertTrue(connection.is_closed)
+
     def test_executemany_insert_batch_failed(self):
         from google.rpc.code_pb2 import UNKNOWN
 
@@ -735,7 +1023,7 @@ class TestCursor(unittest.TestCase):
         cursor = connection.cursor()
 
         transaction = mock.Mock()
-        transaction.batch_update = mock.Mock(
+        transaction.batch_update_many = mock.Mock(
             return_value=(mock.Mock(code=UNKNOWN, message=err_details), [])
         )
 
@@ -767,7 +1055,7 @@ class TestCursor(unittest.TestCase):
         )
 
         transaction1 = mock.Mock()
-        transaction1.batch_update = mock.Mock(
+        transaction1.batch_update_many = mock.Mock(
             side_effect=[(mock.Mock(code=ABORTED, message=err_details), [])]
         )
 
@@ -780,7 +1068,7 @@ class TestCursor(unittest.TestCase):
         cursor = connection.cursor()
         cursor.executemany(sql, args)
 
-        transaction1.batch_update.assert_called_with(
+        transaction1.batch_update_many.assert_called_with(
             [
                 (
                     """INSERT INTO table (col1, "col2", `col3`, `"col4"`) VALUES (@a0, @a1, @a2, @a3)""",
@@ -794,7 +1082,7 @@ class TestCursor(unittest.TestCase):
                 ),
             ]
         )
-        transaction2.batch_update.assert_called_with(
+        transaction2.batch_update_many.assert_called_with(
             [
                 (
                     """INSERT INTO table (col1, "col2", `col3`, `"col4"`) VALUES (@a0, @a1, @a2, @a3)""",
@@ -890,6 +1178,28 @@ class TestCursor(unittest.TestCase):
         cursor._itr = iter(lst)
         self.assertEqual(cursor.fetchall(), lst)
 
+    def test_fetch_w_result_set(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        cursor = self._make_one(connection)
+        transaction_helper_mock = cursor.transaction_helper = mock.Mock()
+        result_set = mock.MagicMock()
+        result_set.__iter__.return_value = iter([[1]])
+        result_set.fetch_rows.side_effect = [[[2], [3]], [[4]]]
+        cursor._itr = PeekIterator(result_set)
+
+        self.assertEqual(cursor.fetchmany(3), [(1,), (2,), (3,)])
+        self.assertEqual(cursor.fetchall(), [(4,)])
+
+        result_set.fetch_rows.assert_has_calls([mock.call(2), mock.call(None)])
+        transaction_helper_mock.add_fetch_statement_for_retry.assert_has_calls(
+            [
+                mock.call(cursor, [(1,), (2,), (3,)], None, False),
+                mock.call(cursor, [(4,)], None, True),
+            ]
+        )
+
     def test_nextset(self):
         from google.cloud.spanner_dbapi import exceptions
 
@@ -250,6 +250,42 @@ class TestParseUtils(unittest.TestCase):
             ),
         )
 
+    def test_classify_statement_caches_template(self):
+        from unittest import mock
+
+        from google.cloud.spanner_dbapi import exceptions, parse_utils
+
+        sql = "UPDATE t SET f1 = %s WHERE f2 = %s -- cached"
+        with mock.patch(
+            "google.cloud.spanner_dbapi.parse_utils.scan_sql",
+            wraps=parse_utils.scan_sql,
+        ) as scan_sql:
+            first = classify_statement(sql, (1, "a"))
+            second = classify_statement(sql, [2, "b"])
+            self.assertRaisesRegex(
+                exceptions.Error,
+                "pyformat_args mismatch",
+                lambda: classify_statement(sql, (3,)),
+            )
+
+        self.assertEqual(scan_sql.call_count, 1)
+        self.assertEqual(first.statement_type, StatementType.UPDATE)
+        self.assertEqual(first.statement.sql, "UPDATE t SET f1 = @a0 WHERE f2 = @a1")
+        self.assertEqual(first.statement.params, {"a0": 1, "a1": "a"})
+        self.assertEqual(second.statement.sql, first.statement.sql)
+        self.assertEqual(second.statement.params, {"a0": 2, "a1": "b"})
+        self.assertIsNot(second.statement, first.statement)
+
+    def test_classify_statement_cache_is_bounded(self):
+        from google.cloud.spanner_dbapi import parse_utils
+
+        parse_utils._get_statement_template.cache_clear()
+        for i in range(parse_utils._STATEMENT_CACHE_SIZE + 10):
+            classify_statement("SELECT %d" % i)
+
+        cache_info = parse_utils._get_statement_template.cache_info()
+        self.assertEqual(cache_info.currsize, parse_utils._STATEMENT_CACHE_SIZE)
+
     @unittest.skipIf(skip_condition, skip_message)
     def test_sql_pyformat_args_to_spanner(self):
         from google.cloud.spanner_dbapi.parse_utils import sql_pyformat_args_to_spanner
@@ -307,6 +343,65 @@ class TestParseUtils(unittest.TestCase):
                 )
 
     @unittest.skipIf(skip_condition, skip_message)
+    def test_sql_pyformat_args_to_spanner_caches_template(self):
+        from unittest import mock
+
+        from google.cloud.spanner_dbapi import parse_utils
+
+        sql = "INSERT INTO t (a, b) VALUES " + ", ".join(["(%s, %s)"] * 1000)
+        with mock.patch(
+            "google.cloud.spanner_dbapi.parse_utils.scan_sql",
+            wraps=parse_utils.scan_sql,
+        ) as scan_sql:
+            for row in range(3):
+                params = [row] * 2000
+                new_sql, new_params = parse_utils.sql_pyformat_args_to_spanner(
+                    sql, params
+                )
+
+        self.assertEqual(scan_sql.call_count, 1)
+        self.assertTrue(new_sql.startswith("INSERT INTO t (a, b) VALUES (@a0, @a1), "))
+        self.assertTrue(new_sql.endswith("(@a1998, @a1999)"))
+        self.assertEqual(new_params, {"a%d" % i: 2 for i in range(2000)})
+
+    def test_get_insert_template(self):
+        from google.cloud.spanner_dbapi.parse_utils import get_insert_template
+
+        template = get_insert_template(
+            "/* c */ INSERT INTO `my-table` (a, `b`) VALUES (%s, %s) -- c"
+        )
+        self.assertEqual(template.table, "my-table")
+        self.assertEqual(template.columns, ("a", "b"))
+        self.assertEqual(template.bind((1, "x")), [1, "x"])
+
+        template = get_insert_template("insert t (a, b) values (%(b)s, %(a)s);")
+        self.assertEqual(template.table, "t")
+        self.assertEqual(template.bind({"a": 1, "b": 2, "c": 3}), [2, 1])
+
+        for sql in (
+            "INSERT INTO t (a, b) VALUES (%s, 'x')",
+            "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)",
+            "INSERT INTO t (a) VALUES (%s) THEN RETURN a",
+            "INSERT INTO t (a, b) VALUES (%s, %(b)s)",
+            "INSERT INTO t (a, b) VALUES (%s)",
+            "INSERT INTO t (a) SELECT %s",
+            "INSERT OR UPDATE INTO t (a) VALUES (%s)",
+            "@{LOCK_SCANNED_RANGES=exclusive} INSERT INTO t (a) VALUES (%s)",
+        ):
+            with self.subTest(sql=sql):
+                self.assertIsNone(get_insert_template(sql))
+
+    def test_insert_template_bind_mismatch(self):
+        from google.cloud.spanner_dbapi import exceptions
+        from google.cloud.spanner_dbapi.parse_utils import get_insert_template
+
+        template = get_insert_template("INSERT INTO t (a, b) VALUES (%s, %s)")
+        with self.assertRaises(exceptions.Error):
+            template.bind((1,))
+        template = get_insert_template("INSERT INTO t (a) VALUES (%(a)s)")
+        with self.assertRaises(exceptions.Error):
+            template.bind({"b": 1})
+
     def test_sql_pyformat_args_to_spanner_invalid(self):
         from google.cloud.spanner_dbapi import exceptions
         from google.cloud.spanner_dbapi.parse_utils import sql_pyformat_args_to_spanner
@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import datetime
+import gzip
+import pickle
+import unittest
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+from google.cloud.spanner_dbapi import partition_helper
+from google.cloud.spanner_dbapi.partition_helper import PartitionId
+from google.cloud.spanner_v1 import BatchTransactionId
+
+
+class TestPartitionHelper(unittest.TestCase):
+    QUERY_INFO = {
+        "sql": "SELECT * FROM Singers WHERE SingerId > @a0",
+        "params": {"a0": 10},
+        "data_boost_enabled": False,
+        "directed_read_options": None,
+    }
+
+    @staticmethod
+    def _make_transaction_id(read_timestamp=None):
+        return BatchTransactionId(b"transaction-id", "session-id", read_timestamp)
+
+    def test_round_trip(self):
+        transaction_id = self._make_transaction_id()
+        partition_result = {"partition": b"token", "query": self.QUERY_INFO}
+
+        encoded = partition_helper.encode_to_string(transaction_id, partition_result)
+        decoded = partition_helper.decode_from_string(encoded)
+
+        self.assertEqual(decoded, PartitionId(transaction_id, partition_result))
+
+    def test_round_trip_w_read_timestamp(self):
+        read_timestamp = DatetimeWithNanoseconds(
+            2025, 1, 2, 3, 4, 5, nanosecond=123456789, tzinfo=datetime.timezone.utc
+        )
+        transaction_id = self._make_transaction_id(read_timestamp)
+        partition_result = {"partition": b"token", "query": self.QUERY_INFO}
+
+        encoded = partition_helper.encode_to_string(transaction_id, partition_result)
+        decoded = partition_helper.decode_from_string(encoded)
+
+        self.assertEqual(
+            decoded.batch_transaction_id.read_timestamp.nanosecond, 123456789
+        )
+        self.assertEqual(decoded.batch_transaction_id.read_timestamp, read_timestamp)
+
+    def test_round_trip_w_datetime_read_timestamp(self):
+        read_timestamp = datetime.datetime(
+            2025, 1, 2, 3, 4, 5, 678, tzinfo=datetime.timezone.utc
+        )
+        transaction_id = self._make_transaction_id(read_timestamp)
+        partition_result = {"partition": b"token", "query": self.QUERY_INFO}
+
+        encoded = partition_helper.encode_to_string(transaction_id, partition_result)
+        decoded = partition_helper.decode_from_string(encoded)
+
+        self.assertEqual(decoded.batch_transaction_id.read_timestamp, read_timestamp)
+
+    def test_encode_partitions_to_strings(self):
+        transaction_id = self._make_transaction_id()
+        partition_results = [
+            {"partition": b"token-%d" % index, "query": self.QUERY_INFO}
+            for index in range(3)
+        ]
+
+        encoded = partition_helper.encode_partitions_to_strings(
+            transaction_id, partition_results
+        )
+
+        self.assertEqual(
+            encoded,
+            [
+                partition_helper.encode_to_string(transaction_id, partition_result)
+                for partition_result in partition_results
+            ],
+        )
+        decoded = [partition_helper.decode_from_string(value) for value in encoded]
+        self.assertEqual(
+            [d.partition_result for d in decoded],
+            partition_results,
+        )
+        # The request template is decoded once and shared by all partitions.
+        self.assertIs(
+            decoded[0].partition_result["query"], decoded[2].partition_result["query"]
+        )
+
+    def test_encode_partitions_to_strings_different_templates(self):
+        transaction_id = self._make_transaction_id()
+        keyset = {"all": True}
+        partition_results = [
+            {
+                "partition": b"token-0",
+                "read": {"table": "Singers", "columns": ["Id"], "keyset": keyset},
+            },
+            {
+                "partition": b"token-1",
+                "read": {"table": "Albums", "columns": ["Id"], "keyset": keyset},
+            },
+        ]
+
+        encoded = partition_helper.encode_partitions_to_strings(
+            transaction_id, partition_results
+        )
+
+        decoded = [partition_helper.decode_from_string(value) for value in encoded]
+        self.assertEqual(
+            [d.partition_result for d in decoded],
+            partition_results,
+        )
+
+    def test_decode_legacy_format(self):
+        transaction_id = self._make_transaction_id()
+        partition_result = {"partition": b"token", "query": self.QUERY_INFO}
+        partition_id = PartitionId(transaction_id, partition_result)
+        encoded = str(
+            base64.b64encode(gzip.compress(pickle.dumps(partition_id))), "utf-8"
+        )
+
+        self.assertEqual(partition_helper.decode_from_string(encoded), partition_id)
+
+    def test_decode_unsupported_version(self):
+        encoded = str(base64.b64encode(b"\x02"), "utf-8")
+
+        with self.assertRaisesRegex(ValueError, "Unsupported partition id version"):
+            partition_helper.decode_from_string(encoded)
+
+    def test_decode_invalid(self):
+        transaction_id = self._make_transaction_id()
+        encoded = partition_helper.encode_to_string(
+            transaction_id, {"partition": b"token", "query": self.QUERY_INFO}
+        )
+        padded = base64.b64decode(encoded) + b"trailing"
+
+        with self.assertRaisesRegex(ValueError, "Invalid partition id"):
+            partition_helper.decode_from_string(str(base64.b64encode(padded), "utf-8"))
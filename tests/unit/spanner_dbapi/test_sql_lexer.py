@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import unittest
+
+import sqlparse
+
+# Statements that the lexer handles like the sqlparse based parsing that it
+# replaces: the same statement without comments, the same placeholders and
+# the same WHERE clause detection.
+CONFORMANCE_CORPUS = [
+    "SELECT 1",
+    "  select * from t  ",
+    "SELECT * FROM t WHERE a = %s AND b = %(name)s",
+    "SELECT 1 -- comment",
+    "SELECT 1 -- comment\nFROM t",
+    "SELECT 1 # comment\nFROM t",
+    "-- leading comment\nSELECT 1",
+    "/* leading */ SELECT 1",
+    "SELECT 1 /* inline */ FROM t",
+    "SELECT /* multi\nline */ 1",
+    "SELECT 1 /* a */ /* b */",
+    "/*+ hint */ SELECT 1",
+    "@{FORCE_INDEX=idx} SELECT * FROM t",
+    "SELECT '-- not a comment' FROM t",
+    'SELECT "/* not a comment */" FROM t',
+    "SELECT 'it''s' FROM t -- c",
+    "SELECT 'a\\'b' FROM t -- c",
+    "SELECT `col -- name` FROM t",
+    "SELECT '''multi -- line\n''' FROM t",
+    'SELECT """x /* y */ z""" FROM t',
+    "SELECT $$ -- dollar $$ FROM t",
+    "SELECT $tag$ /* x */ $tag$ FROM t",
+    "INSERT INTO t (a, b) VALUES (%s, %s)",
+    "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s) -- c",
+    "UPDATE t SET a = 1",
+    "UPDATE t SET a = 1 WHERE b = 2",
+    "update t set a = 1 where b = 2",
+    "UPDATE t SET a = (SELECT x FROM u WHERE y = 1)",
+    "DELETE FROM t",
+    "DELETE FROM t WHERE id IN (SELECT id FROM u)",
+    "DELETE FROM t\nWHERE\tid = %s",
+    "UPDATE t SET nowhere = 1",
+    "UPDATE t SET a = 'WHERE'",
+    "UPDATE `where` SET a = 1",
+    "WITH x AS (SELECT 1) SELECT * FROM x",
+    "CREATE TABLE t (id INT64) PRIMARY KEY (id)",
+    "GRAPH FinGraph MATCH (n) RETURN n",
+    "SHOW VARIABLE COMMIT_TIMESTAMP",
+    "SELECT 100 %% 7, %s",
+    "",
+    "  -- only a comment",
+]
+
+# Statements where the lexer intentionally differs from sqlparse, with the
+# lexer result: the statement, the placeholders and whether it has a WHERE
+# clause.
+DEVIATIONS = [
+    # Placeholders are only recognized outside of literals.
+    ("SELECT '%s', %s FROM t", "SELECT '%s', %s FROM t", ["%s"], False),
+    ("SELECT `%(a)s` FROM t", "SELECT `%(a)s` FROM t", [], False),
+    # An escaped percent sign is not the start of a placeholder.
+    ("SELECT 'a' LIKE 'b%%s'", "SELECT 'a' LIKE 'b%%s'", [], False),
+    ("SELECT 1 %%s", "SELECT 1 %%s", [], False),
+    # Adjacent placeholders are separate placeholders.
+    ("SELECT CONCAT(%s%s)", "SELECT CONCAT(%s%s)", ["%s", "%s"], False),
+    # A WHERE clause directly followed by a parenthesis is a WHERE clause.
+    ("UPDATE t SET a=1 WHERE(a>1)", "UPDATE t SET a=1 WHERE(a>1)", [], True),
+]
+
+
+def _normalize(sql):
+    return " ".join(sql.split())
+
+
+def _sqlparse_has_where(sql):
+    return any(
+        isinstance(token, sqlparse.sql.Where) for token in sqlparse.parse(sql)[0]
+    )
+
+
+class TestScanSql(unittest.TestCase):
+    def _call_fut(self, sql):
+        from google.cloud.spanner_dbapi._sql_lexer import scan_sql
+
+        return scan_sql(sql)
+
+    def test_conformance_corpus(self):
+        for sql in CONFORMANCE_CORPUS:
+            with self.subTest(sql=sql):
+                scanned = self._call_fut(sql)
+                expected = sqlparse.format(sql, strip_comments=True).strip()
+
+                self.assertEqual(_normalize(scanned.sql), _normalize(expected))
+                self.assertEqual(
+                    scanned.placeholders,
+                    re.findall(r"%s|%\([^()]+\)s", expected.replace("%%", "")),
+                )
+                if expected:
+                    self.assertEqual(scanned.has_where, _sqlparse_has_where(expected))
+
+    def test_deviations(self):
+        for sql, expected, placeholders, has_where in DEVIATIONS:
+            with self.subTest(sql=sql):
+                scanned = self._call_fut(sql)
+
+                self.assertEqual(scanned.sql, expected)
+                self.assertEqual(scanned.placeholders, placeholders)
+                self.assertEqual(scanned.has_where, has_where)
+
+    def test_keeps_line_breaks_of_line_comments(self):
+        scanned = self._call_fut("SELECT 1 -- c\nFROM t # d\nWHERE x")
+
+        self.assertEqual(scanned.sql, "SELECT 1\nFROM t\nWHERE x")
+
+    def test_unterminated(self):
+        for sql in ("SELECT 'abc", "SELECT 1 /* abc", "SELECT `abc", "SELECT $$ a"):
+            with self.subTest(sql=sql):
+                scanned = self._call_fut(sql + " %s")
+
+                self.assertEqual(scanned.placeholders, [])
+
+    def test_rewrite(self):
+        scanned = self._call_fut(
+            "/* c */ UPDATE t SET a = %s, b = '%s' WHERE c = %(c)s -- c"
+        )
+
+        self.assertEqual(scanned.placeholders, ["%s", "%(c)s"])
+        self.assertEqual(
+            scanned.rewrite(["@a0", "@a1"]),
+            "UPDATE t SET a = @a0, b = '%s' WHERE c = @a1",
+        )
+        self.assertTrue(scanned.has_where)
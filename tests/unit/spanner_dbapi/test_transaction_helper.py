@@ -363,6 +363,67 @@ class TestTransactionHelper(unittest.TestCase):
             [expected_statement_result_details],
         )
 
+    def test_retry_aborts_internally_disabled(self):
+        self._under_test.retry_aborts_internally = False
+        self._mock_cursor._batch_dml_rows_count = None
+        self._under_test.add_execute_statement_for_retry(
+            self._mock_cursor, SQL, ARGS, None, False
+        )
+        self._under_test.add_fetch_statement_for_retry(
+            self._mock_cursor, [("field1",)], None, False
+        )
+
+        self.assertEqual(self._under_test._statement_result_details_list, [])
+        self.assertEqual(self._under_test._last_statement_details_per_cursor, {})
+        with self.assertRaisesRegex(RetryAborted, "retries are disabled"):
+            self._under_test.retry_transaction()
+        self._under_test._connection.cursor.assert_not_called()
+
+    def test_max_recorded_statements(self):
+        self._under_test.max_recorded_statements = 1
+        self._mock_cursor._batch_dml_rows_count = None
+        self._under_test.add_execute_statement_for_retry(
+            self._mock_cursor, SQL, ARGS, None, False
+        )
+        self.assertEqual(len(self._under_test._statement_result_details_list), 1)
+
+        self._under_test.add_fetch_statement_for_retry(
+            self._mock_cursor, [("field1",)], None, False
+        )
+        self._under_test.add_execute_statement_for_retry(
+            self._mock_cursor, SQL, ARGS, None, False
+        )
+
+        self.assertEqual(self._under_test._statement_result_details_list, [])
+        self.assertEqual(self._under_test._last_statement_details_per_cursor, {})
+        with self.assertRaisesRegex(RetryAborted, "exceeded the limits"):
+            self._under_test.retry_transaction()
+
+        self._under_test.reset()
+        self._under_test.add_execute_statement_for_retry(
+            self._mock_cursor, SQL, ARGS, None, False
+        )
+        self.assertEqual(len(self._under_test._statement_result_details_list), 1)
+
+    def test_max_recorded_bytes(self):
+        self._under_test.max_recorded_bytes = 100
+        self._under_test.add_fetch_statement_for_retry(
+            self._mock_cursor, [("x" * 40,)], None, False
+        )
+        self._under_test.add_fetch_statement_for_retry(
+            self._mock_cursor, [("y" * 40,)], None, False
+        )
+        self.assertEqual(len(self._under_test._statement_result_details_list), 1)
+        self.assertLessEqual(self._under_test._recorded_bytes, 100)
+
+        self._under_test.add_fetch_statement_for_retry(
+            self._mock_cursor, [("z" * 40,)], None, False
+        )
+
+        self.assertEqual(self._under_test._statement_result_details_list, [])
+        with self.assertRaisesRegex(RetryAborted, "exceeded the limits"):
+            self._under_test.retry_transaction()
+
     def test_add_execute_statement_for_retry_with_exception(self):
         """
         Test add_execute_statement_for_retry method with exception
@@ -495,6 +556,24 @@ class TestTransactionHelper(unittest.TestCase):
             original_checksum_digest,
         )
 
+    def test_add_fetch_statement_for_retry_w_checksum_class(self):
+        checksum_class = mock.Mock(return_value=mock.Mock(size=12))
+        helper = TransactionRetryHelper(
+            self._under_test._connection, checksum_class=checksum_class
+        )
+        rows = [("field1", "field2"), ("field3", "field4")]
+
+        helper.add_fetch_statement_for_retry(self._mock_cursor, rows, None, False)
+
+        checksum_class.assert_called_once_with()
+        checksum = checksum_class.return_value
+        checksum.consume_results.assert_called_once_with(rows)
+        self.assertIs(
+            helper._last_statement_details_per_cursor[self._mock_cursor].result_details,
+            checksum,
+        )
+        self.assertEqual(helper._recorded_bytes, 12)
+
     def test_add_fetch_statement_for_retry_with_exception(self):
         """
         Test add_fetch_statement_for_retry method with exception
@@ -60,6 +60,38 @@ class TestUtils(unittest.TestCase):
         pit = PeekIterator([("Clark", "Kent")])
         self.assertEqual(next(pit), ("Clark", "Kent"))
 
+    def test_PeekIterator_fetch(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        pit = PeekIterator([["a"], ["b"], ["c"], ["d"], ("e",)])
+        self.assertEqual(pit.fetch(0), [])
+        self.assertEqual(pit.fetch(2), [("a",), ("b",)])
+        self.assertEqual(next(pit), ("c",))
+        self.assertEqual(pit.fetch(), [("d",), ("e",)])
+        self.assertEqual(pit.fetch(2), [])
+        self.assertEqual(PeekIterator([]).fetch(), [])
+
+    def test_PeekIterator_fetch_w_fetch_rows(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        class _ResultSet:
+            def __init__(self, rows):
+                self._rows = rows
+
+            def __iter__(self):
+                while self._rows:
+                    yield self._rows.pop(0)
+
+            def fetch_rows(self, max_rows=None):
+                rows = self._rows[:max_rows]
+                del self._rows[:max_rows]
+                return rows
+
+        pit = PeekIterator(_ResultSet([["a"], ["b"], ["c"], ["d"]]))
+        self.assertEqual(pit.fetch(3), [("a",), ("b",), ("c",)])
+        self.assertEqual(pit.fetch(3), [("d",)])
+        self.assertEqual(pit.fetch(), [])
+
     @unittest.skipIf(skip_condition, "Python 2 has an outdated iterator definition")
     def test_peekIterator_nonlist_rows_unconverted(self):
         from google.cloud.spanner_dbapi.utils import PeekIterator
@@ -488,6 +488,225 @@ class Test_make_list_value_pbs(unittest.TestCase):
             self.assertEqual(found.values[1].string_value, expected[1])
 
 
+class Test_RowEncoder(unittest.TestCase):
+    def _make_one(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _RowEncoder
+
+        return _RowEncoder(*args, **kw)
+
+    def _make_list_value_pb(self, values):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        return _make_list_value_pb(values)
+
+    def test_matches_make_list_value_pb(self):
+        import datetime
+        import decimal
+        import uuid
+
+        from google.api_core import datetime_helpers
+
+        rows = [
+            [
+                1,
+                1.5,
+                "A",
+                b"QUJD",
+                True,
+                datetime.date(2025, 1, 2),
+                datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+                datetime_helpers.DatetimeWithNanoseconds(
+                    2025, 1, 2, nanosecond=7, tzinfo=datetime.timezone.utc
+                ),
+                decimal.Decimal("1.25"),
+                uuid.UUID("12345678123456781234567812345678"),
+                [1, None],
+            ],
+            [None, float("nan"), None, None, False, None, None, None, None, None, []],
+        ]
+        encoder = self._make_one(len(rows[0]))
+        for row in rows:
+            self.assertEqual(encoder.encode(row), self._make_list_value_pb(row))
+
+    def test_binds_encoder_on_first_non_null_value(self):
+        encoder = self._make_one(2)
+        encoder.encode([None, "A"])
+        self.assertEqual(encoder._types, [None, str])
+
+        encoder.encode([1, "B"])
+        self.assertEqual(encoder._types, [int, str])
+
+    def test_value_of_other_type(self):
+        encoder = self._make_one(1)
+        encoder.encode([1])
+
+        row_pb = encoder.encode([True])
+        self.assertTrue(row_pb.values[0].bool_value)
+        self.assertEqual(encoder._types, [int])
+
+    def test_row_of_other_length(self):
+        encoder = self._make_one(1)
+
+        row_pb = encoder.encode([1, "A"])
+        self.assertEqual(row_pb, self._make_list_value_pb([1, "A"]))
+
+    def test_w_column_type_codes(self):
+        import datetime
+
+        from google.api_core import datetime_helpers
+        from google.cloud.spanner_v1 import TypeCode
+
+        encoder = self._make_one(2, [TypeCode.TIMESTAMP, None])
+        self.assertEqual(encoder._types, [datetime.datetime, None])
+
+        value = datetime_helpers.DatetimeWithNanoseconds(
+            2025, 1, 2, nanosecond=7, tzinfo=datetime.timezone.utc
+        )
+        row_pb = encoder.encode([value, 1])
+        self.assertEqual(row_pb, self._make_list_value_pb([value, 1]))
+        self.assertEqual(
+            encoder._types, [datetime_helpers.DatetimeWithNanoseconds, int]
+        )
+
+    def test_w_column_type_code_of_other_value(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        encoder = self._make_one(1, [TypeCode.INT64])
+        encoder.encode(["1"])
+
+        self.assertEqual(encoder._types, [int])
+
+    def test_invalid_bytes(self):
+        encoder = self._make_one(1)
+        encoder.encode([b"QUJD"])
+
+        with self.assertRaisesRegex(ValueError, "base64"):
+            encoder.encode([b"\xff"])
+
+
+class Test_DmlStatementEncoder(unittest.TestCase):
+    def _make_one(self):
+        from google.cloud.spanner_v1._helpers import _DmlStatementEncoder
+
+        return _DmlStatementEncoder()
+
+    def test_encode_sql_only(self):
+        statement_pb = self._make_one().encode("DELETE FROM t WHERE true")
+
+        self.assertEqual(statement_pb.sql, "DELETE FROM t WHERE true")
+        self.assertFalse(statement_pb.HasField("params"))
+
+    def test_encode_matches_make_value_pb(self):
+        import datetime
+        import decimal
+
+        from google.cloud.spanner_v1 import ExecuteBatchDmlRequest, param_types
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        sql = "UPDATE t SET a = @a, b = @b, c = @c, d = @d WHERE k = @k"
+        types = {
+            "a": param_types.TIMESTAMP,
+            "b": param_types.NUMERIC,
+            "c": {"code": "STRING"},
+            "k": param_types.INT64,
+        }
+        encoder = self._make_one()
+        for i in range(3):
+            params = {
+                "a": datetime.datetime(2024, 1, i + 1, tzinfo=datetime.timezone.utc),
+                "b": decimal.Decimal(i),
+                "c": None if i else "x",
+                "d": [True, False],
+                "k": i,
+            }
+            statement_pb = encoder.encode((sql, params, types))
+            expected = ExecuteBatchDmlRequest.Statement.pb(
+                ExecuteBatchDmlRequest.Statement(
+                    sql=sql,
+                    params={
+                        key: _make_value_pb(value) for key, value in params.items()
+                    },
+                    param_types=types,
+                )
+            )
+            self.assertEqual(statement_pb, expected)
+        self.assertEqual(len(encoder._shapes), 1)
+
+    def test_encode_new_shape_per_param_types(self):
+        from google.cloud.spanner_v1 import param_types
+
+        sql = "DELETE FROM t WHERE k = @k"
+        encoder = self._make_one()
+        encoder.encode((sql, {"k": 1}, {"k": param_types.INT64}))
+        statement_pb = encoder.encode((sql, {"k": "1"}, {"k": param_types.STRING}))
+
+        self.assertEqual(len(encoder._shapes), 2)
+        self.assertEqual(statement_pb.param_types["k"].code, param_types.STRING.code)
+
+
+class Test_split_dml_statements(unittest.TestCase):
+    def _call_fut(self, *args):
+        from google.cloud.spanner_v1._helpers import _split_dml_statements
+
+        return list(_split_dml_statements(*args))
+
+    def test_split(self):
+        from google.cloud.spanner_v1 import ExecuteBatchDmlRequest
+
+        statement_pbs = [
+            ExecuteBatchDmlRequest.Statement.pb()(sql="x" * size)
+            for size in (10, 10, 10, 50, 10)
+        ]
+        batches = self._call_fut(statement_pbs, 2, 30)
+
+        self.assertEqual(
+            [[len(pb.sql) for pb in batch] for batch in batches],
+            [[10, 10], [10], [50], [10]],
+        )
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([], 2, 30), [])
+
+
+class Test_resolve_column_types(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _resolve_column_types
+
+        return _resolve_column_types(*args, **kw)
+
+    def test_none(self):
+        self.assertEqual(self._callFUT(["a", "b"], None), [None, None])
+
+    def test_list(self):
+        from google.cloud.spanner_v1 import Type, TypeCode
+
+        result = self._callFUT(["a", "b"], [Type(code=TypeCode.INT64), TypeCode.BOOL])
+        self.assertEqual(result, [TypeCode.INT64, TypeCode.BOOL])
+
+    def test_list_wrong_length(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        with self.assertRaises(ValueError):
+            self._callFUT(["a", "b"], [TypeCode.INT64])
+
+    def test_dict(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        result = self._callFUT(["a", "b"], {"b": TypeCode.STRING})
+        self.assertEqual(result, [None, TypeCode.STRING])
+
+    def test_schema(self):
+        from google.cloud.spanner_v1 import StructType, Type, TypeCode
+
+        schema = [
+            StructType.Field(name="b", type_=Type(code=TypeCode.DATE)),
+            StructType.Field(name="a", type_=Type(code=TypeCode.INT64)),
+            StructType.Field(name="c", type_=Type(code=TypeCode.STRING)),
+        ]
+        result = self._callFUT(["a", "b"], schema)
+        self.assertEqual(result, [TypeCode.INT64, TypeCode.DATE])
+
+
 class Test_parse_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_value_pb
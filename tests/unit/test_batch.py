@@ -117,6 +117,22 @@ class Test_BatchBase(_BaseTest):
         self.assertEqual(write.columns, COLUMNS)
         self._compare_values(write.values, VALUES)
 
+    def test_insert_w_column_types(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        session = _Session()
+        base = self._make_one(session)
+        column_types = {"email": TypeCode.STRING, "age": TypeCode.INT64}
+
+        base.insert(
+            TABLE_NAME, columns=COLUMNS, values=VALUES, column_types=column_types
+        )
+
+        write = base._mutations[0].insert
+        self.assertEqual(write.table, TABLE_NAME)
+        self.assertEqual(write.columns, COLUMNS)
+        self._compare_values(write.values, VALUES)
+
     def test_update(self):
         session = _Session()
         base = self._make_one(session)
@@ -182,6 +198,213 @@ class Test_BatchBase(_BaseTest):
         for found, expected in zip(key_set_pb.keys, keys):
             self.assertEqual([int(value) for value in found], expected)
 
+    def test_mutation_size(self):
+        from google.cloud.spanner_v1 import CommitRequest
+
+        session = _Session()
+        base = self._make_one(session)
+
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES)
+        base.update("other", columns=["id"], values=[[1]])
+        base.delete(TABLE_NAME, keyset=KeySet(keys=[[0], [1]]))
+        base.delete("other", keyset=KeySet(all_=True))
+
+        size = base.mutation_size
+        self.assertEqual(size.mutations, len(VALUES) * len(COLUMNS) + 1 + 2 + 1)
+        request = CommitRequest(mutations=base._mutations)
+        self.assertEqual(size.bytes, CommitRequest.pb(request).ByteSize())
+        self.assertEqual(size.tables[TABLE_NAME].rows, len(VALUES) + 2)
+        self.assertEqual(size.tables["other"].rows, 2)
+        self.assertEqual(size.tables["other"].mutations, 2)
+        size.validate()
+        with self.assertRaises(ValueError):
+            size.validate(max_mutations=size.mutations - 1)
+
+    def test_mutation_size_computed_when_read(self):
+        session = _Session()
+        base = self._make_one(session)
+
+        with mock.patch(
+            "google.cloud.spanner_v1.mutation_size.MutationSize.add"
+        ) as add:
+            base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES)
+            base.delete(TABLE_NAME, keyset=KeySet(all_=True))
+            add.assert_not_called()
+            base.mutation_size
+            self.assertEqual(add.call_count, 2)
+
+    def test_set_secondary_indexes_after_writes(self):
+        session = _Session()
+        base = self._make_one(session)
+
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES)
+        base.set_secondary_indexes(TABLE_NAME, [["age"]])
+        base.update(TABLE_NAME, columns=["email", "age"], values=[VALUES[0][::3]])
+
+        self.assertEqual(
+            base.mutation_size.mutations, len(VALUES) * len(COLUMNS) + (2 + 1)
+        )
+
+    def test_insert_w_validate(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES, validate=True)
+        mutations = list(base._mutations)
+        size = base.mutation_size.mutations
+
+        with mock.patch(
+            "google.cloud.spanner_v1.mutation_size.MutationSize.validate",
+            side_effect=ValueError("too large"),
+        ):
+            with self.assertRaisesRegex(ValueError, "too large"):
+                base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES, validate=True)
+
+        self.assertEqual(base._mutations, mutations)
+        self.assertEqual(base.mutation_size.mutations, size)
+        self.assertEqual(base.mutation_size.tables[TABLE_NAME].rows, len(VALUES))
+
+    def test_mutation_size_w_secondary_indexes(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.set_secondary_indexes(
+            TABLE_NAME,
+            {"by_name": ["last_name", "first_name"], "by_age": ["age", "email"]},
+        )
+
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES)
+        base.update(TABLE_NAME, columns=["email", "age"], values=[VALUES[0][::3]])
+        base.delete(TABLE_NAME, keyset=KeySet(keys=[[0]]))
+
+        self.assertEqual(
+            base.mutation_size.mutations,
+            len(VALUES) * (len(COLUMNS) + 4) + (2 + 2) + (1 + 2),
+        )
+
+    def test_set_secondary_indexes_w_table(self):
+        session = _Session()
+        base = self._make_one(session)
+        table = mock.Mock(table_id=TABLE_NAME, indexes={"by_age": ["age"]})
+
+        base.set_secondary_indexes(table)
+        base.insert(TABLE_NAME, columns=COLUMNS, values=VALUES)
+
+        self.assertEqual(base.mutation_size.mutations, len(VALUES) * (len(COLUMNS) + 1))
+
+    def _written(self, base):
+        written = []
+        for mutation in base._mutations:
+            mutation_pb = Mutation.pb(mutation)
+            operation = mutation_pb.WhichOneof("operation")
+            write_pb = getattr(mutation_pb, operation)
+            rows = [
+                [getattr(value, value.WhichOneof("kind")) for value in row.values]
+                for row in write_pb.values
+            ]
+            written.append((operation, write_pb.table, list(write_pb.columns), rows))
+        return written
+
+    def _assert_size(self, base):
+        from google.cloud.spanner_v1 import CommitRequest
+
+        request = CommitRequest(mutations=base._mutations)
+        self.assertEqual(base.mutation_size.bytes, CommitRequest.pb(request).ByteSize())
+
+    def test_deduplicate_writes(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.deduplicate_writes(TABLE_NAME, ["email"])
+
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["a", 1], ["b", 2]])
+        base.update("other", ["id"], [[1]])
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["b", 3], ["c", 4]])
+        base.update(TABLE_NAME, ["age", "email"], [[5, "a"], [6, "a"]])
+
+        self.assertEqual(
+            self._written(base),
+            [
+                (
+                    "insert_or_update",
+                    TABLE_NAME,
+                    ["email", "age"],
+                    [["a", "6"], ["b", "3"]],
+                ),
+                ("update", "other", ["id"], [["1"]]),
+                ("insert_or_update", TABLE_NAME, ["email", "age"], [["c", "4"]]),
+            ],
+        )
+        self.assertEqual(base.mutation_size.mutations, 7)
+        self.assertEqual(base.mutation_size.tables[TABLE_NAME].rows, 3)
+        self._assert_size(base)
+
+    def test_deduplicate_writes_moves_merged_row(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.deduplicate_writes(TABLE_NAME, ["email"])
+
+        base.insert(TABLE_NAME, ["email", "age"], [["a", 1], ["b", 2]])
+        base.update("other", ["id"], [[1]])
+        base.update(TABLE_NAME, ["email", "last_name"], [["a", "x"]])
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["a", 3]])
+        base.replace(TABLE_NAME, ["email"], [["b"]])
+
+        self.assertEqual(
+            self._written(base),
+            [
+                ("insert", TABLE_NAME, ["email"], [["b"]]),
+                (
+                    "insert",
+                    TABLE_NAME,
+                    ["email", "age", "last_name"],
+                    [["a", "3", "x"]],
+                ),
+                ("update", "other", ["id"], [["1"]]),
+            ],
+        )
+        self.assertEqual(base.mutation_size.mutations, 5)
+        self._assert_size(base)
+
+    def test_deduplicate_writes_keeps_writes_that_do_not_merge(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.deduplicate_writes(TABLE_NAME, ["email"])
+
+        base.update(TABLE_NAME, ["email", "age"], [["a", 1], ["a", 2]])
+        base.insert(TABLE_NAME, ["email", "age"], [["a", 3], ["a", 4]])
+        base.update(TABLE_NAME, ["email", "age"], [["a", 5]])
+
+        self.assertEqual(
+            self._written(base),
+            [
+                ("update", TABLE_NAME, ["email", "age"], [["a", "2"]]),
+                ("insert", TABLE_NAME, ["email", "age"], [["a", "3"], ["a", "5"]]),
+            ],
+        )
+        self._assert_size(base)
+
+    def test_deduplicate_writes_w_delete(self):
+        session = _Session()
+        base = self._make_one(session)
+        base.deduplicate_writes(TABLE_NAME, ["email"])
+
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["a", 1]])
+        base.delete(TABLE_NAME, KeySet(keys=[["a"]]))
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["a", 2]])
+
+        self.assertEqual(len(base._mutations), 3)
+        self.assertEqual(base._mutations[2].insert_or_update.columns, ["email", "age"])
+
+    def test_deduplicate_writes_w_table(self):
+        session = _Session()
+        base = self._make_one(session)
+        table = mock.Mock(table_id=TABLE_NAME, primary_key=["email"])
+        base.deduplicate_writes(table)
+
+        base.insert_or_update(TABLE_NAME, ["email", "age"], [["a", 1], ["a", 2]])
+
+        self.assertEqual(self._written(base)[0][3], [["a", "2"]])
+        with self.assertRaises(ValueError):
+            base.deduplicate_writes(TABLE_NAME, [])
+
 
 class TestBatch(_BaseTest, OpenTelemetryBase):
     def _getTargetClass(self):
@@ -0,0 +1,274 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from google.api_core.exceptions import InvalidArgument
+
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "first_name", "last_name", "age"]
+
+
+def _rows(count):
+    for i in range(count):
+        yield [f"user{i}@example.com", "First", "Last", i]
+
+
+class _FakeBatchCheckout(object):
+    def __init__(self, database, kw):
+        self._database = database
+        self._kw = kw
+
+    def __enter__(self):
+        from google.cloud.spanner_v1.batch import _BatchBase
+
+        self._batch = _BatchBase(None)
+        return self._batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        database = self._database
+        with database.lock:
+            database.in_flight += 1
+            database.max_in_flight = max(database.max_in_flight, database.in_flight)
+            commit_number = len(database.commits)
+            database.commits.append((list(self._batch._mutations), self._kw))
+            database.mutation_counts.append(self._batch.mutation_size.mutations)
+        try:
+            if commit_number in database.failing_commits:
+                raise InvalidArgument("invalid")
+            self._batch.committed = commit_number
+        finally:
+            with database.lock:
+                database.in_flight -= 1
+
+
+class _FakeDatabase(object):
+    def __init__(self, failing_commits=()):
+        self.lock = threading.Lock()
+        self.commits = []
+        self.mutation_counts = []
+        self.failing_commits = set(failing_commits)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def batch(self, **kw):
+        return _FakeBatchCheckout(self, kw)
+
+
+class TestBulkWriter(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_invalid_limits(self):
+        from google.cloud.spanner_v1.bulk_writer import MAX_MUTATIONS_PER_COMMIT
+
+        database = _FakeDatabase()
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_mutations=MAX_MUTATIONS_PER_COMMIT + 1)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_bytes=0)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_concurrent_commits=0)
+
+    def test_write_splits_on_max_mutations(self):
+        database = _FakeDatabase()
+        with self._make_one(database, max_mutations=40) as writer:
+            writer.insert(TABLE_NAME, COLUMNS, _rows(25))
+
+        results = writer.results
+        self.assertEqual([result.rows for result in results], [10, 10, 5])
+        self.assertEqual([result.mutations for result in results], [40, 40, 20])
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(len(database.commits), 3)
+        self.assertEqual(database.mutation_counts, [40, 40, 20])
+        rows = 0
+        for mutations, _ in database.commits:
+            self.assertEqual(len(mutations), 1)
+            write = mutations[0].insert
+            self.assertEqual(write.table, TABLE_NAME)
+            self.assertEqual(list(write.columns), COLUMNS)
+            rows += len(write.values)
+        self.assertEqual(rows, 25)
+
+    def test_write_splits_on_max_bytes(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        row_size = _make_list_value_pb(next(_rows(1))).ByteSize()
+        database = _FakeDatabase()
+        with self._make_one(database, max_bytes=row_size * 3) as writer:
+            writer.write(TABLE_NAME, COLUMNS, [next(_rows(1))] * 7)
+
+        self.assertEqual([result.rows for result in writer.results], [3, 3, 1])
+        self.assertEqual(writer.results[0].bytes, row_size * 3)
+
+    def test_write_coalesces_consecutive_rows(self):
+        database = _FakeDatabase()
+        with self._make_one(database) as writer:
+            writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+            writer.insert(TABLE_NAME, COLUMNS, _rows(3))
+            writer.update(TABLE_NAME, ["email", "age"], [["a@example.com", 1]])
+            writer.replace("other", ["id"], [[1]])
+
+        ((mutations, _),) = database.commits
+        self.assertEqual(len(mutations), 3)
+        self.assertEqual(len(mutations[0].insert.values), 5)
+        self.assertEqual(list(mutations[1].update.columns), ["email", "age"])
+        self.assertEqual(mutations[2].replace.table, "other")
+
+    def test_write_invalid_arguments(self):
+        writer = self._make_one(_FakeDatabase(), max_mutations=2)
+        with self.assertRaises(ValueError):
+            writer.write(TABLE_NAME, COLUMNS[:2], [], operation="delete")
+        with self.assertRaises(ValueError):
+            writer.write(TABLE_NAME, COLUMNS, [])
+        with self.assertRaises(ValueError):
+            writer.write(TABLE_NAME, COLUMNS[:2], [["a"]])
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS[:2], [])
+
+    def test_commit_kw_and_callback(self):
+        database = _FakeDatabase()
+        completed = []
+        with self._make_one(
+            database,
+            max_mutations=4,
+            on_batch_complete=completed.append,
+            request_options={"transaction_tag": "bulk"},
+        ) as writer:
+            writer.insert_or_update(TABLE_NAME, COLUMNS, _rows(2))
+
+        self.assertEqual(
+            [kw for _, kw in database.commits],
+            [{"request_options": {"transaction_tag": "bulk"}}] * 2,
+        )
+        self.assertEqual(sorted(result.index for result in completed), [0, 1])
+        self.assertEqual(
+            sorted(result.commit_timestamp for result in completed), [0, 1]
+        )
+
+    def test_callback_error(self):
+        database = _FakeDatabase()
+        completed = []
+
+        def on_batch_complete(result):
+            completed.append(result)
+            raise RuntimeError(f"callback failed for batch {result.index}")
+
+        writer = self._make_one(
+            database,
+            max_mutations=4,
+            max_concurrent_commits=1,
+            on_batch_complete=on_batch_complete,
+        )
+        writer.insert(TABLE_NAME, COLUMNS, _rows(3))
+        with self.assertRaisesRegex(RuntimeError, "batch 0"):
+            writer.close()
+
+        self.assertEqual(len(completed), 3)
+        self.assertEqual(len(writer.close()), 3)
+
+    def test_max_concurrent_commits(self):
+        database = _FakeDatabase()
+        with self._make_one(
+            database, max_mutations=4, max_concurrent_commits=2
+        ) as writer:
+            writer.insert(TABLE_NAME, COLUMNS, _rows(20))
+
+        self.assertEqual(len(writer.results), 20)
+        self.assertLessEqual(database.max_in_flight, 2)
+
+    def test_failed_commit(self):
+        database = _FakeDatabase(failing_commits=[1])
+        writer = self._make_one(database, max_mutations=4, max_concurrent_commits=1)
+        writer.insert(TABLE_NAME, COLUMNS, _rows(3))
+        results = writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [True, False, True])
+        self.assertIsInstance(results[1].exception, InvalidArgument)
+
+    def test_stop_on_error(self):
+        database = _FakeDatabase(failing_commits=[1])
+        writer = self._make_one(
+            database, max_mutations=4, max_concurrent_commits=1, stop_on_error=True
+        )
+        with self.assertRaises(InvalidArgument):
+            writer.insert(TABLE_NAME, COLUMNS, _rows(4))
+        with self.assertRaises(InvalidArgument):
+            writer.insert(TABLE_NAME, COLUMNS, _rows(1))
+        results = writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [True, False])
+        self.assertEqual(len(database.commits), 2)
+        self.assertEqual(writer.pending_rows, 0)
+
+    def test_stop_on_error_close_discards_pending_rows(self):
+        database = _FakeDatabase(failing_commits=[0])
+        writer = self._make_one(
+            database, max_mutations=4, max_concurrent_commits=1, stop_on_error=True
+        )
+        with database.lock:
+            # The first commit waits for the lock, so it fails after the
+            # second row is written.
+            writer.insert(TABLE_NAME, COLUMNS, _rows(2))
+        results = writer.close()
+
+        self.assertEqual([result.succeeded for result in results], [False])
+        self.assertEqual(len(database.commits), 1)
+
+    def test_exit_raises_first_failure(self):
+        database = _FakeDatabase(failing_commits=[0])
+        with self.assertRaises(InvalidArgument):
+            with self._make_one(database) as writer:
+                writer.insert(TABLE_NAME, COLUMNS, _rows(1))
+
+    def test_exit_with_exception_discards_pending_rows(self):
+        database = _FakeDatabase()
+        with self.assertRaises(RuntimeError):
+            with self._make_one(database, max_mutations=8) as writer:
+                writer.insert(TABLE_NAME, COLUMNS, _rows(3))
+                raise RuntimeError("failed")
+
+        self.assertEqual(len(database.commits), 1)
+        self.assertEqual(writer.pending_rows, 0)
+
+    def test_write_stream(self):
+        database = _FakeDatabase(failing_commits=[1])
+        writer = self._make_one(database, max_mutations=8, max_concurrent_commits=2)
+        results = list(writer.write_stream(TABLE_NAME, COLUMNS, _rows(9)))
+
+        self.assertEqual(sorted(result.index for result in results), [0, 1, 2, 3, 4])
+        self.assertEqual(sum(result.rows for result in results), 9)
+        self.assertEqual([result.succeeded for result in results].count(False), 1)
+        self.assertLessEqual(database.max_in_flight, 2)
+
+    def test_stream_results(self):
+        database = _FakeDatabase()
+        writer = self._make_one(database, max_mutations=8)
+        writer.insert(TABLE_NAME, COLUMNS, _rows(3))
+        streamed = []
+        consumer = threading.Thread(
+            target=lambda: streamed.extend(writer.stream_results())
+        )
+        consumer.start()
+        writer.close()
+        consumer.join()
+
+        self.assertEqual(sorted(result.rows for result in streamed), [1, 2])
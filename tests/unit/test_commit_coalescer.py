@@ -0,0 +1,191 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+from datetime import timezone
+import threading
+import unittest
+
+from google.api_core.exceptions import AlreadyExists, ServiceUnavailable, Unknown
+from google.rpc import code_pb2
+from google.rpc.status_pb2 import Status
+
+from google.cloud.spanner_v1 import BatchWriteResponse, Mutation
+
+COMMIT_TIMESTAMP = datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _mutations(key):
+    return [
+        Mutation(
+            insert=Mutation.Write(table="citizens", columns=["id"], values=[[str(key)]])
+        )
+    ]
+
+
+def _key(mutation_group):
+    return int(mutation_group.mutations[0].insert.values[0][0])
+
+
+def _ok(indexes):
+    return BatchWriteResponse(
+        indexes=indexes,
+        status=Status(code=code_pb2.OK),
+        commit_timestamp=COMMIT_TIMESTAMP,
+    )
+
+
+class _FakeMutationGroups(object):
+    def __init__(self, database):
+        self._database = database
+        self._mutation_groups = []
+
+    def batch_write(self, **kw):
+        database = self._database
+        with database.lock:
+            database.requests.append([_key(group) for group in self._mutation_groups])
+        return database.respond(self._mutation_groups)
+
+
+class _FakeMutationGroupsCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        return _FakeMutationGroups(self._database)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _FakeDatabase(object):
+    def __init__(self, respond=None):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.respond = respond or (lambda groups: [_ok(range(len(groups)))])
+
+    def mutation_groups(self, client_context=None):
+        return _FakeMutationGroupsCheckout(self)
+
+
+class TestCommitCoalescer(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.commit_coalescer import CommitCoalescer
+
+        return CommitCoalescer
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_invalid_limits(self):
+        database = _FakeDatabase()
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_delay=-1)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_mutations=0)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_groups=0)
+
+    def test_submit_coalesces_until_max_groups(self):
+        database = _FakeDatabase()
+        with self._make_one(database, max_delay=60, max_groups=3) as coalescer:
+            futures = [coalescer.submit(_mutations(key)) for key in range(3)]
+            results = [future.result(timeout=10) for future in futures]
+
+        self.assertEqual(results, [COMMIT_TIMESTAMP] * 3)
+        self.assertEqual(database.requests, [[0, 1, 2]])
+
+    def test_submit_coalesces_until_max_mutations(self):
+        database = _FakeDatabase()
+        with self._make_one(database, max_delay=60, max_mutations=2) as coalescer:
+            futures = [coalescer.submit(_mutations(key)) for key in range(4)]
+            for future in futures:
+                future.result(timeout=10)
+
+        self.assertEqual(sorted(database.requests), [[0, 1], [2, 3]])
+
+    def test_submit_sends_after_max_delay(self):
+        database = _FakeDatabase()
+        with self._make_one(database, max_delay=0.01) as coalescer:
+            future = coalescer.submit(_mutations(1))
+            self.assertEqual(future.result(timeout=10), COMMIT_TIMESTAMP)
+
+        self.assertEqual(database.requests, [[1]])
+
+    def test_close_sends_pending_batches(self):
+        database = _FakeDatabase()
+        coalescer = self._make_one(database, max_delay=60)
+        future = coalescer.submit(_mutations(1))
+        coalescer.close()
+
+        self.assertEqual(future.result(timeout=0), COMMIT_TIMESTAMP)
+        with self.assertRaises(ValueError):
+            coalescer.submit(_mutations(2))
+
+    def test_status_per_caller(self):
+        def respond(groups):
+            return [
+                _ok([0, 2]),
+                BatchWriteResponse(
+                    indexes=[1],
+                    status=Status(code=code_pb2.ALREADY_EXISTS, message="exists"),
+                ),
+            ]
+
+        with self._make_one(_FakeDatabase(respond), max_groups=4) as coalescer:
+            futures = [coalescer.submit(_mutations(key)) for key in range(4)]
+
+        self.assertEqual(futures[0].result(), COMMIT_TIMESTAMP)
+        with self.assertRaises(AlreadyExists):
+            futures[1].result()
+        self.assertEqual(futures[2].result(), COMMIT_TIMESTAMP)
+        with self.assertRaises(Unknown):
+            futures[3].result()
+
+    def test_request_failure(self):
+        def respond(groups):
+            raise ServiceUnavailable("unavailable")
+
+        with self._make_one(_FakeDatabase(respond), max_groups=2) as coalescer:
+            futures = [coalescer.submit(_mutations(key)) for key in range(2)]
+
+        for future in futures:
+            with self.assertRaises(ServiceUnavailable):
+                future.result()
+
+    def test_write_and_batch(self):
+        database = _FakeDatabase()
+        results = []
+
+        with self._make_one(database, max_delay=0.05) as coalescer:
+
+            def write(key):
+                with coalescer.batch() as batch:
+                    batch.insert("citizens", ["id"], [[str(key)]])
+                results.append(batch.committed)
+
+            threads = [threading.Thread(target=write, args=(key,)) for key in range(5)]
+            threads.append(
+                threading.Thread(
+                    target=lambda: results.append(coalescer.write(_mutations(5)))
+                )
+            )
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(results, [COMMIT_TIMESTAMP] * 6)
+        self.assertEqual(sorted(sum(database.requests, [])), list(range(6)))
+        self.assertLess(len(database.requests), 6)
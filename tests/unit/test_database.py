@@ -1663,6 +1663,69 @@ class TestDatabase(_BaseTest):
         self.assertIsInstance(checkout, MutationGroupsCheckout)
         self.assertIs(checkout._database, database)
 
+    def test_bulk_writer(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        writer = database.bulk_writer(
+            max_mutations=100, max_concurrent_commits=2, max_commit_delay=None
+        )
+        self.assertIsInstance(writer, BulkWriter)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer._max_mutations, 100)
+        self.assertEqual(writer._commit_kw, {"max_commit_delay": None})
+        writer.close()
+
+    def test_mutation_group_writer(self):
+        from google.cloud.spanner_v1.mutation_group_writer import (
+            MutationGroupWriter,
+        )
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        writer = database.mutation_group_writer(max_attempts=2)
+        self.assertIsInstance(writer, MutationGroupWriter)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer._max_attempts, 2)
+        writer.close()
+
+    def test_commit_coalescer(self):
+        from google.cloud.spanner_v1.commit_coalescer import CommitCoalescer
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        coalescer = database.commit_coalescer(max_delay=0.01)
+        self.assertIsInstance(coalescer, CommitCoalescer)
+        self.assertIs(coalescer._database, database)
+        self.assertEqual(coalescer._max_delay, 0.01)
+        coalescer.close()
+
+    def test_load_table(self):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        with mock.patch("google.cloud.spanner_v1.database.TableLoader") as loader_cls:
+            result = database.load_table(
+                "citizens", "citizens.csv", format="csv", block_rows=10
+            )
+
+        loader_cls.assert_called_once_with(
+            database, "citizens", "citizens.csv", format="csv", block_rows=10
+        )
+        self.assertIs(result, loader_cls.return_value.load.return_value)
+
     def test_batch_snapshot(self):
         from google.cloud.spanner_v1.database import BatchSnapshot
 
@@ -2663,6 +2726,17 @@ class TestBatchSnapshot(_BaseTest):
         )
         snapshot.begin.assert_called_once_with()
 
+    def test_shard_batches(self):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batches = [
+            {"partition": token, "query": {"sql": "SELECT 1"}} for token in self.TOKENS
+        ]
+
+        shards = batch_txn.shard_batches(batches, 2, weights=[1.0, 2.0])
+
+        self.assertEqual(shards, [[batches[1]], [batches[0]]])
+
     def test_read(self):
         keyset = self._make_keyset()
         database = self._make_database()
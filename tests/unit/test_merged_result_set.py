@@ -34,6 +34,8 @@ class TestMergedResultSet(unittest.TestCase):
         obj.metadata_lock = Lock()
         obj._metadata = None
         obj._result_set = None
+        obj._partition_stats = []
+        obj._controller = None
         return obj
 
     @staticmethod
@@ -57,10 +59,93 @@ class TestMergedResultSet(unittest.TestCase):
             metadata.row_type.fields.append(field)
         return metadata
 
-    def test_stats_property(self):
+    @staticmethod
+    def _make_partial_result_set(values, metadata=None, stats=None, last=False):
+        from google.cloud.spanner_v1 import PartialResultSet
+
+        result_set_pb = PartialResultSet.pb(PartialResultSet())
+        if metadata is not None:
+            result_set_pb.metadata.CopyFrom(metadata._pb)
+        if stats is not None:
+            result_set_pb.stats.CopyFrom(stats._pb)
+        result_set_pb.values.extend(values)
+        result_set_pb.last = last
+        return PartialResultSet.wrap(result_set_pb)
+
+    def _make_batch_snapshot(self, responses_by_partition):
+        batch_snapshot = mock.Mock(spec=["process_query_batch"])
+
+        def process_query_batch(partition, lazy_decode=False):
+            return StreamedResultSet(
+                iter(responses_by_partition[partition]), lazy_decode=lazy_decode
+            )
+
+        batch_snapshot.process_query_batch.side_effect = process_query_batch
+        return batch_snapshot
+
+    def test_stats_property_empty(self):
         merged = self._make_one()
-        # The property is currently not implemented, so it should just return None.
-        self.assertIsNone(merged.stats)
+        stats = merged.stats
+        self.assertEqual(stats.partitions, [])
+        self.assertEqual(stats.rows, 0)
+        self.assertEqual(stats.bytes_received, 0)
+        self.assertEqual(stats.max_elapsed_time, 0.0)
+        self.assertIsNone(stats.row_count_exact)
+
+    def test_stats_aggregates_partitions(self):
+        from google.cloud.spanner_v1 import ResultSetStats, TypeCode
+
+        metadata = self._make_result_set_metadata(
+            [self._make_scalar_field("id", TypeCode.INT64)]
+        )
+        responses = {
+            0: [
+                self._make_partial_result_set(
+                    [self._make_value(1), self._make_value(2)],
+                    metadata=metadata,
+                    stats=ResultSetStats(row_count_exact=2),
+                    last=True,
+                )
+            ],
+            1: [
+                self._make_partial_result_set([self._make_value(3)], metadata=metadata),
+                self._make_partial_result_set(
+                    [self._make_value(4), self._make_value(5)],
+                    stats=ResultSetStats(row_count_exact=3),
+                    last=True,
+                ),
+            ],
+        }
+        expected_bytes = [
+            sum(r._pb.ByteSize() for r in responses[0]),
+            sum(r._pb.ByteSize() for r in responses[1]),
+        ]
+        merged = self._get_target_class()(
+            self._make_batch_snapshot(responses), [0, 1], 0
+        )
+
+        self.assertEqual(sorted(merged), [[1], [2], [3], [4], [5]])
+
+        stats = merged.stats
+        self.assertEqual([p.partition_index for p in stats.partitions], [0, 1])
+        self.assertEqual([p.rows for p in stats.partitions], [2, 3])
+        self.assertEqual([p.bytes_received for p in stats.partitions], expected_bytes)
+        self.assertTrue(all(p.done for p in stats.partitions))
+        self.assertEqual(stats.rows, 5)
+        self.assertEqual(stats.bytes_received, sum(expected_bytes))
+        self.assertEqual(stats.row_count_exact, 5)
+        self.assertEqual([s.row_count_exact for s in stats.result_set_stats], [2, 3])
+        for partition in stats.partitions:
+            self.assertGreaterEqual(partition.decode_time, 0.0)
+            self.assertGreaterEqual(partition.network_wait_time, 0.0)
+            self.assertGreaterEqual(partition.queue_wait_time, 0.0)
+            self.assertGreaterEqual(
+                partition.elapsed_time,
+                partition.decode_time + partition.network_wait_time,
+            )
+        self.assertEqual(
+            stats.max_elapsed_time, max(p.elapsed_time for p in stats.partitions)
+        )
 
     def test_decode_row(self):
         merged = self._make_one()
@@ -116,3 +201,99 @@ class TestMergedResultSet(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             merged.decode_column("not a list", 0)
+
+    def test_adaptive_parallelism_returns_all_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = self._make_result_set_metadata(
+            [self._make_scalar_field("id", TypeCode.INT64)]
+        )
+        responses = {
+            index: [
+                self._make_partial_result_set(
+                    [self._make_value(index)], metadata=metadata, last=True
+                )
+            ]
+            for index in range(4)
+        }
+        merged = self._get_target_class()(
+            self._make_batch_snapshot(responses),
+            list(range(4)),
+            2,
+            adaptive_parallelism=True,
+        )
+
+        self.assertEqual(sorted(merged), [[0], [1], [2], [3]])
+        self.assertEqual(merged.stats.rows, 4)
+        self.assertGreaterEqual(merged.parallelism, 1)
+        self.assertLessEqual(merged.parallelism, 2)
+
+    def test_parallelism_not_adaptive(self):
+        merged = self._make_one()
+        self.assertIsNone(merged.parallelism)
+
+
+class TestAdaptiveParallelismController(unittest.TestCase):
+    def _make_one(self, queue_size=0, max_queue_size=10, **stats):
+        from queue import Queue
+
+        from google.cloud.spanner_v1.merged_result_set import (
+            AdaptiveParallelismController,
+            MergedResultSetStats,
+            PartitionStats,
+        )
+
+        merged_result_set = mock.Mock()
+        merged_result_set._queue = Queue(maxsize=max_queue_size)
+        for _ in range(queue_size):
+            merged_result_set._queue.put(None)
+        merged_result_set.stats = MergedResultSetStats(
+            partitions=[PartitionStats(**stats)]
+        )
+        return AdaptiveParallelismController(
+            merged_result_set, ["p0", "p1", "p2"], 1, 3, adjust_interval=0
+        )
+
+    def test_next_partition_respects_target(self):
+        controller = self._make_one()
+        controller._adjust_interval = 60
+        self.assertEqual(controller.next_partition(), "p0")
+        self.assertEqual(controller._active, 1)
+        controller.partition_done()
+        self.assertEqual(controller.next_partition(), "p1")
+        self.assertEqual(controller._active, 1)
+
+    def test_next_partition_exhausted(self):
+        controller = self._make_one()
+        controller._pending.clear()
+        self.assertIsNone(controller.next_partition())
+
+    def test_scale_up_when_network_bound(self):
+        controller = self._make_one(network_wait_time=1.0, decode_time=0.1)
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 2)
+
+    def test_scale_up_capped_at_max(self):
+        controller = self._make_one(network_wait_time=1.0, decode_time=0.1)
+        controller.target_parallelism = 3
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 3)
+
+    def test_scale_down_when_queue_full(self):
+        controller = self._make_one(queue_size=9, network_wait_time=1.0)
+        controller.target_parallelism = 3
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 2)
+
+    def test_scale_down_when_blocked_on_queue(self):
+        controller = self._make_one(queue_wait_time=1.0, network_wait_time=0.5)
+        controller.target_parallelism = 2
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 1)
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 1)
+
+    def test_no_change_when_decode_bound(self):
+        controller = self._make_one(network_wait_time=0.1, decode_time=1.0)
+        controller.maybe_adjust()
+        self.assertEqual(controller.target_parallelism, 1)
@@ -0,0 +1,235 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+from google.rpc import code_pb2
+from google.rpc.status_pb2 import Status
+
+from google.cloud.spanner_v1 import BatchWriteResponse, Mutation
+
+TABLE_NAME = "citizens"
+
+
+def _group(key):
+    return [
+        Mutation(
+            insert=Mutation.Write(
+                table=TABLE_NAME,
+                columns=["id"],
+                values=[[str(key)]],
+            )
+        )
+    ]
+
+
+def _key(mutation_group):
+    return int(mutation_group.mutations[0].insert.values[0][0])
+
+
+def _ok(indexes):
+    return BatchWriteResponse(indexes=indexes, status=Status(code=code_pb2.OK))
+
+
+class _FakeMutationGroups(object):
+    def __init__(self, database):
+        self._database = database
+        self._mutation_groups = []
+
+    def batch_write(self, **kw):
+        database = self._database
+        with database.lock:
+            database.requests.append(
+                ([_key(group) for group in self._mutation_groups], kw)
+            )
+        return database.respond(self._mutation_groups)
+
+
+class _FakeMutationGroupsCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        return _FakeMutationGroups(self._database)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _FakeDatabase(object):
+    def __init__(self, respond=None):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.respond = respond or (lambda groups: [_ok(range(len(groups)))])
+
+    def mutation_groups(self, client_context=None):
+        return _FakeMutationGroupsCheckout(self)
+
+
+class TestMutationGroupWriter(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.mutation_group_writer import (
+            MutationGroupWriter,
+        )
+
+        return MutationGroupWriter
+
+    def _make_one(self, *args, **kwargs):
+        kwargs.setdefault("initial_backoff", 0.0)
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_invalid_limits(self):
+        database = _FakeDatabase()
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_groups_per_request=0)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_concurrent_requests=0)
+        with self.assertRaises(ValueError):
+            self._make_one(database, max_attempts=0)
+
+    def test_write_splits_on_max_groups_per_request(self):
+        database = _FakeDatabase()
+        with self._make_one(
+            database,
+            max_groups_per_request=4,
+            request_options={"request_tag": "tag"},
+        ) as writer:
+            writer.write(_group(key) for key in range(10))
+
+        keys = sorted(keys for keys, _ in database.requests)
+        self.assertEqual(keys, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual(
+            database.requests[0][1],
+            {
+                "request_options": {"request_tag": "tag"},
+                "exclude_txn_from_change_streams": False,
+            },
+        )
+        stats = writer.stats
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.groups_succeeded, 10)
+        self.assertEqual(stats.mutations_written, 10)
+        self.assertEqual(stats.groups_failed, 0)
+        self.assertGreater(stats.bytes_written, 0)
+        self.assertEqual(writer.failed_groups, [])
+
+    def test_write_splits_on_max_bytes_per_request(self):
+        from google.cloud.spanner_v1 import BatchWriteRequest
+
+        size = BatchWriteRequest.MutationGroup.pb(
+            BatchWriteRequest.MutationGroup(mutations=_group(1))
+        ).ByteSize()
+        database = _FakeDatabase()
+        with self._make_one(database, max_bytes_per_request=size * 2) as writer:
+            writer.write(_group(key) for key in range(1, 6))
+
+        self.assertEqual(sorted(len(keys) for keys, _ in database.requests), [1, 2, 2])
+
+    def test_retries_only_failed_groups(self):
+        attempts = []
+
+        def respond(groups):
+            attempts.append([_key(group) for group in groups])
+            if len(attempts) == 1:
+                return [
+                    _ok([0, 2]),
+                    BatchWriteResponse(
+                        indexes=[1], status=Status(code=code_pb2.ABORTED)
+                    ),
+                    BatchWriteResponse(
+                        indexes=[3], status=Status(code=code_pb2.ALREADY_EXISTS)
+                    ),
+                ]
+            return [_ok(range(len(groups)))]
+
+        with self._make_one(_FakeDatabase(respond)) as writer:
+            writer.write(_group(key) for key in range(5))
+
+        self.assertEqual(attempts, [[0, 1, 2, 3, 4], [1, 4]])
+        stats = writer.stats
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.groups_succeeded, 4)
+        self.assertEqual(stats.groups_retried, 2)
+        self.assertEqual(stats.groups_failed, 1)
+        (failure,) = writer.failed_groups
+        self.assertEqual(failure.index, 3)
+        self.assertEqual(_key(failure.mutation_group), 3)
+        self.assertEqual(failure.status.code, code_pb2.ALREADY_EXISTS)
+        self.assertEqual(failure.attempts, 1)
+
+    def test_retries_after_retryable_exception(self):
+        attempts = []
+
+        def respond(groups):
+            attempts.append(len(groups))
+            if len(attempts) == 1:
+                raise ServiceUnavailable("unavailable")
+            return [_ok(range(len(groups)))]
+
+        with self._make_one(_FakeDatabase(respond)) as writer:
+            writer.write(_group(key) for key in range(3))
+
+        self.assertEqual(attempts, [3, 3])
+        self.assertEqual(writer.stats.groups_succeeded, 3)
+
+    def test_gives_up_after_max_attempts(self):
+        def respond(groups):
+            raise ServiceUnavailable("unavailable")
+
+        database = _FakeDatabase(respond)
+        with self._make_one(database, max_attempts=3) as writer:
+            writer.write([_group(1)])
+
+        self.assertEqual(len(database.requests), 3)
+        (failure,) = writer.failed_groups
+        self.assertEqual(failure.attempts, 3)
+        self.assertIsInstance(failure.exception, ServiceUnavailable)
+        self.assertIsNone(failure.status)
+
+    def test_non_retryable_exception(self):
+        def respond(groups):
+            raise InvalidArgument("invalid")
+
+        database = _FakeDatabase(respond)
+        writer = self._make_one(database)
+        writer.write([_group(1), _group(2)])
+        failures = writer.close()
+
+        self.assertEqual(len(database.requests), 1)
+        self.assertEqual([failure.index for failure in failures], [0, 1])
+        self.assertEqual(writer.stats.groups_failed, 2)
+
+    def test_write_accepts_mutation_group_types(self):
+        from google.cloud.spanner_v1 import BatchWriteRequest
+        from google.cloud.spanner_v1.batch import MutationGroup
+
+        database = _FakeDatabase()
+        with self._make_one(database) as writer:
+            writer.write(
+                [
+                    BatchWriteRequest.MutationGroup(mutations=_group(1)),
+                    MutationGroup(None, _group(2)),
+                    _group(3),
+                ]
+            )
+
+        self.assertEqual(database.requests[0][0], [1, 2, 3])
+
+    def test_write_after_close(self):
+        writer = self._make_one(_FakeDatabase())
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write([_group(1)])
@@ -0,0 +1,77 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestMutationSize(unittest.TestCase):
+    def _make_one(self):
+        from google.cloud.spanner_v1.mutation_size import MutationSize
+
+        return MutationSize()
+
+    def test_add(self):
+        size = self._make_one()
+
+        size.add("citizens", 2, 8, 100)
+        size.add("citizens", 1, 4, 200)
+        size.add("cities", 1, 1, 10)
+
+        # Each mutation adds its tag and length prefix.
+        self.assertEqual(size.mutations, 13)
+        self.assertEqual(size.bytes, 102 + 203 + 12)
+        self.assertEqual(size.tables["citizens"].rows, 3)
+        self.assertEqual(size.tables["citizens"].mutations, 12)
+        self.assertEqual(size.tables["citizens"].bytes, 305)
+        self.assertEqual(size.tables["cities"].bytes, 12)
+
+    def test_validate(self):
+        size = self._make_one()
+        size.add("citizens", 10, 40, 1000)
+        size.add("cities", 1, 1, 10)
+
+        size.validate()
+        size.validate(max_mutations=41, max_bytes=size.bytes)
+        with self.assertRaisesRegex(ValueError, "citizens: 10 rows, 40 mutations"):
+            size.validate(max_mutations=40)
+        with self.assertRaisesRegex(ValueError, "cities: 1 rows"):
+            size.validate(max_bytes=size.bytes - 1)
+
+    def test_validate_add(self):
+        size = self._make_one()
+        size.add("citizens", 10, 40, 1000)
+
+        size.validate_add("citizens", 1, 4, 100, max_mutations=44)
+        with self.assertRaisesRegex(ValueError, "citizens: 11 rows, 44 mutations"):
+            size.validate_add("citizens", 1, 4, 100, max_mutations=43)
+        with self.assertRaisesRegex(ValueError, "cities: 1 rows"):
+            size.validate_add("cities", 1, 1, 10, max_mutations=40)
+
+        # The size is unchanged.
+        self.assertEqual(size.mutations, 40)
+        self.assertEqual(size.tables["citizens"].rows, 10)
+        self.assertNotIn("cities", size.tables)
+
+
+class Test_index_mutations_per_row(unittest.TestCase):
+    def _call_fut(self, columns, indexes):
+        from google.cloud.spanner_v1.mutation_size import _index_mutations_per_row
+
+        return _index_mutations_per_row(columns, indexes)
+
+    def test_w_indexes(self):
+        indexes = [{"name", "age"}, {"age"}, {"city"}]
+        self.assertEqual(self._call_fut(["id", "name", "age"], indexes), 3)
+        self.assertEqual(self._call_fut(["id"], indexes), 0)
+        self.assertEqual(self._call_fut(["id"], []), 0)
@@ -0,0 +1,192 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_batches(count):
+    query = {"sql": "SELECT * FROM Singers", "data_boost_enabled": False}
+    return [{"partition": b"token-%d" % i, "query": query} for i in range(count)]
+
+
+class Test_shard_batches(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.spanner_v1.partition_scheduler import shard_batches
+
+        return shard_batches(*args, **kwargs)
+
+    def test_uniform(self):
+        batches = _make_batches(5)
+
+        shards = self._call_fut(batches, 2)
+
+        self.assertEqual(shards, [batches[0:5:2], batches[1:5:2]])
+
+    def test_weights(self):
+        batches = _make_batches(4)
+
+        shards = self._call_fut(batches, 2, weights=[10.0, 1.0, 4.0, 5.0])
+
+        self.assertEqual(shards, [[batches[0]], [batches[3], batches[2], batches[1]]])
+
+    def test_weights_mapping_w_missing(self):
+        batches = _make_batches(3)
+
+        # Partition 2 gets the mean weight of the known partitions.
+        shards = self._call_fut(batches, 2, weights={0: 2.0, 1: 4.0})
+
+        self.assertEqual(shards, [[batches[1]], [batches[2], batches[0]]])
+
+    def test_more_shards_than_batches(self):
+        batches = _make_batches(1)
+
+        self.assertEqual(self._call_fut(batches, 3), [batches, [], []])
+
+    def test_invalid_num_shards(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(_make_batches(1), 0)
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(_make_batches(2), 2, weights=[1.0])
+
+
+class TestPartitionLeaseCoordinator(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "partitions.db")
+
+    def _make_one(self, **kwargs):
+        from google.cloud.spanner_v1.partition_scheduler import (
+            PartitionLeaseCoordinator,
+        )
+
+        coordinator = PartitionLeaseCoordinator(self.path, **kwargs)
+        self.addCleanup(coordinator.close)
+        return coordinator
+
+    def test_acquire_own_shard_first(self):
+        batches = _make_batches(4)
+        coordinator = self._make_one()
+        coordinator.add_batches(batches, 2, weights=[4.0, 3.0, 2.0, 1.0])
+
+        lease = coordinator.acquire(1, "worker-1")
+
+        self.assertEqual(lease.shard, 1)
+        self.assertEqual(lease.partition_index, 1)
+        self.assertEqual(lease.batch, batches[1])
+        self.assertEqual(lease.worker_id, "worker-1")
+
+    def test_steal_from_most_loaded_shard(self):
+        batches = _make_batches(3)
+        coordinator = self._make_one()
+        # Shard 0: partition 0 (5.0). Shard 1: partitions 1 and 2 (3.0, 2.0).
+        coordinator.add_batches(batches, 2, weights=[5.0, 3.0, 2.0])
+        other = self._make_one()
+
+        first = coordinator.acquire(0, "worker-0")
+        coordinator.complete(first, duration=1.0)
+        stolen = coordinator.acquire(0, "worker-0")
+        own = other.acquire(1, "worker-1")
+
+        self.assertEqual(first.partition_index, 0)
+        self.assertEqual((stolen.shard, stolen.partition_index), (1, 1))
+        self.assertEqual((own.shard, own.partition_index), (1, 2))
+        self.assertIsNone(other.acquire(1, "worker-1"))
+        self.assertFalse(coordinator.is_done())
+
+        coordinator.complete(stolen, duration=2.0)
+        other.complete(own)
+
+        self.assertTrue(coordinator.is_done())
+        durations = coordinator.observed_durations()
+        self.assertEqual(durations[0], 1.0)
+        self.assertEqual(durations[1], 2.0)
+        self.assertGreaterEqual(durations[2], 0.0)
+
+    def test_expired_lease_is_handed_out_again(self):
+        coordinator = self._make_one(lease_seconds=10)
+        coordinator.add_batches(_make_batches(1), 1)
+
+        with mock.patch("time.time", return_value=1000.0):
+            lease = coordinator.acquire(0, "worker-0")
+            self.assertIsNone(coordinator.acquire(0, "worker-1"))
+        with mock.patch("time.time", return_value=1011.0):
+            retaken = coordinator.acquire(0, "worker-1")
+
+        self.assertEqual(retaken.partition_index, lease.partition_index)
+        self.assertEqual(retaken.worker_id, "worker-1")
+
+    def test_complete_expired_lease(self):
+        coordinator = self._make_one(lease_seconds=10)
+        coordinator.add_batches(_make_batches(1), 1)
+
+        with mock.patch("time.time", return_value=1000.0):
+            lease = coordinator.acquire(0, "worker-0")
+        with mock.patch("time.time", return_value=1011.0):
+            retaken = coordinator.acquire(0, "worker-1")
+
+        self.assertFalse(coordinator.complete(lease, duration=1.0))
+        self.assertFalse(coordinator.is_done())
+        self.assertFalse(coordinator.complete(lease, duration=1.0))
+        self.assertTrue(coordinator.complete(retaken, duration=2.0))
+        self.assertFalse(coordinator.complete(retaken, duration=3.0))
+        self.assertTrue(coordinator.is_done())
+        self.assertEqual(coordinator.observed_durations(), {0: 2.0})
+
+    def test_renew(self):
+        coordinator = self._make_one(lease_seconds=10)
+        coordinator.add_batches(_make_batches(1), 1)
+
+        with mock.patch("time.time", return_value=1000.0):
+            lease = coordinator.acquire(0, "worker-0")
+        with mock.patch("time.time", return_value=1005.0):
+            self.assertTrue(coordinator.renew(lease))
+        self.assertEqual(lease.lease_expiry, 1015.0)
+        with mock.patch("time.time", return_value=1012.0):
+            self.assertIsNone(coordinator.acquire(0, "worker-1"))
+
+    def test_renew_lost_lease(self):
+        coordinator = self._make_one(lease_seconds=10)
+        coordinator.add_batches(_make_batches(1), 1)
+
+        with mock.patch("time.time", return_value=1000.0):
+            lease = coordinator.acquire(0, "worker-0")
+        with mock.patch("time.time", return_value=1011.0):
+            coordinator.acquire(0, "worker-1")
+            self.assertFalse(coordinator.renew(lease))
+
+    def test_add_batches_replaces_existing(self):
+        coordinator = self._make_one()
+        coordinator.add_batches(_make_batches(3), 1)
+        coordinator.add_batches(_make_batches(1), 1)
+
+        coordinator.acquire(0, "worker-0")
+
+        self.assertIsNone(coordinator.acquire(0, "worker-0"))
+
+    def test_context_manager(self):
+        from google.cloud.spanner_v1.partition_scheduler import (
+            PartitionLeaseCoordinator,
+        )
+
+        with PartitionLeaseCoordinator(self.path) as coordinator:
+            coordinator.add_batches(_make_batches(1), 1)
+        with PartitionLeaseCoordinator(self.path) as coordinator:
+            self.assertIsNotNone(coordinator.acquire(0, "worker-0"))
@@ -92,6 +92,36 @@ class TestTable(_BaseTest):
         schema = table.schema
         self.assertEqual(schema, [StructType.Field(name="col1")])
 
+    def test_indexes_executes_query(self):
+        from google.cloud.spanner_v1.database import Database, SnapshotCheckout
+        from google.cloud.spanner_v1.snapshot import Snapshot
+
+        db = mock.create_autospec(Database, instance=True)
+        checkout = mock.create_autospec(SnapshotCheckout, instance=True)
+        snapshot = mock.create_autospec(Snapshot, instance=True)
+        db.snapshot.return_value = checkout
+        checkout.__enter__.return_value = snapshot
+        snapshot.execute_sql.return_value = [
+            ["by_age", "INDEX", "age"],
+            ["by_name", "INDEX", "last_name"],
+            ["by_name", "INDEX", "first_name"],
+            ["PRIMARY_KEY", "PRIMARY_KEY", "country"],
+            ["PRIMARY_KEY", "PRIMARY_KEY", "id"],
+        ]
+        table = self._make_one(self.TABLE_ID, db, schema_name=self.TABLE_SCHEMA)
+
+        self.assertEqual(
+            table.indexes,
+            {"by_age": ["age"], "by_name": ["last_name", "first_name"]},
+        )
+        self.assertEqual(table.primary_key, ["country", "id"])
+        self.assertEqual(
+            snapshot.execute_sql.call_args.kwargs["params"],
+            {"schema_name": self.TABLE_SCHEMA, "table_id": self.TABLE_ID},
+        )
+        table.indexes
+        snapshot.execute_sql.assert_called_once()
+
     def test_reload_raises_notfound(self):
         from google.cloud.spanner_v1.database import Database, SnapshotCheckout
         from google.cloud.spanner_v1.snapshot import Snapshot
@@ -0,0 +1,358 @@
+# Copyright 2025 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from google.api_core.exceptions import InvalidArgument
+from google.rpc import code_pb2
+from google.rpc.status_pb2 import Status
+
+from google.cloud.spanner_v1 import BatchWriteResponse, Mutation, TypeCode
+from google.cloud.spanner_v1._load_sources import HAS_PYARROW_INSTALLED
+
+TABLE_NAME = "citizens"
+CSV_DATA = (
+    b"id,name,active,score\n"
+    b"1,Alice,true,1.5\n"
+    b'2,"Bob\nBuilder",false,\n'
+    b"3,Carol,,2\n"
+    b"4,Dave,true,3.25\n"
+    b"5,Eve,false,4\n"
+)
+COLUMN_TYPES = {
+    "id": TypeCode.INT64,
+    "name": TypeCode.STRING,
+    "active": TypeCode.BOOL,
+    "score": TypeCode.FLOAT64,
+}
+
+
+def _values(row_pb):
+    return [
+        (
+            None
+            if value.HasField("null_value")
+            else getattr(value, value.WhichOneof("kind"))
+        )
+        for value in row_pb.values
+    ]
+
+
+class _FakeBatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        from google.cloud.spanner_v1.batch import _BatchBase
+
+        self._batch = _BatchBase(None)
+        return self._batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        database = self._database
+        with database.lock:
+            commit_number = len(database.commits)
+            database.commits.append(list(self._batch._mutations))
+        if commit_number in database.failing_commits:
+            raise InvalidArgument("invalid")
+        self._batch.committed = commit_number
+
+
+class _FakeMutationGroups(object):
+    def __init__(self, database):
+        self._database = database
+        self._mutation_groups = []
+
+    def batch_write(self, **kw):
+        database = self._database
+        with database.lock:
+            first = sum(len(groups) for groups in database.requests)
+            database.requests.append(list(self._mutation_groups))
+        return [
+            BatchWriteResponse(
+                indexes=[i],
+                status=Status(
+                    code=(
+                        code_pb2.INVALID_ARGUMENT
+                        if first + i in database.failing_commits
+                        else code_pb2.OK
+                    )
+                ),
+            )
+            for i in range(len(self._mutation_groups))
+        ]
+
+
+class _FakeMutationGroupsCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        return _FakeMutationGroups(self._database)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _FakeDatabase(object):
+    def __init__(self, failing_commits=()):
+        self.lock = threading.Lock()
+        self.commits = []
+        self.requests = []
+        self.failing_commits = set(failing_commits)
+
+    def batch(self, **kw):
+        return _FakeBatchCheckout(self)
+
+    def mutation_groups(self, client_context=None):
+        return _FakeMutationGroupsCheckout(self)
+
+    def written_rows(self):
+        mutations = sum(self.commits, [])
+        mutations += [
+            mutation
+            for groups in self.requests
+            for group in groups
+            for mutation in group.mutations
+        ]
+        rows = [
+            _values(row_pb)
+            for mutation in mutations
+            for row_pb in Mutation.pb(mutation).insert_or_update.values
+        ]
+        return sorted(rows, key=lambda row: int(row[0]))
+
+
+class TestTableLoader(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _write_file(self, name, data):
+        path = os.path.join(self._dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.table_loader import TableLoader
+
+        return TableLoader
+
+    def _make_one(self, *args, **kwargs):
+        kwargs.setdefault("max_concurrent_requests", 1)
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_invalid_arguments(self):
+        database = _FakeDatabase()
+        with self.assertRaises(ValueError):
+            self._make_one(database, TABLE_NAME, "rows.csv", operation="delete")
+        with self.assertRaises(ValueError):
+            self._make_one(database, TABLE_NAME, "rows.csv", start_offset=-1)
+        with self.assertRaises(ValueError):
+            self._make_one(database, TABLE_NAME, "rows.csv", block_rows=0)
+
+    def test_load_unknown_format(self):
+        loader = self._make_one(_FakeDatabase(), TABLE_NAME, "rows.txt")
+        with self.assertRaises(ValueError):
+            loader.load()
+
+    def test_load_csv(self):
+        path = self._write_file("rows.csv", CSV_DATA)
+        database = _FakeDatabase()
+        progress = []
+        loader = self._make_one(
+            database,
+            TABLE_NAME,
+            path,
+            column_types=COLUMN_TYPES,
+            block_rows=2,
+            on_progress=lambda result: progress.append(result.resume_offset),
+        )
+        result = loader.load()
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.rows_loaded, 5)
+        self.assertEqual(result.resume_offset, len(CSV_DATA))
+        self.assertGreater(result.rows_per_second, 0)
+        self.assertEqual(len(database.commits), 3)
+        self.assertEqual(
+            database.written_rows(),
+            [
+                ["1", "Alice", True, 1.5],
+                ["2", "Bob\nBuilder", False, None],
+                ["3", "Carol", None, 2.0],
+                ["4", "Dave", True, 3.25],
+                ["5", "Eve", False, 4.0],
+            ],
+        )
+        self.assertEqual(progress[-1], len(CSV_DATA))
+        self.assertEqual(progress, sorted(progress))
+
+    def test_load_csv_resume(self):
+        path = self._write_file("rows.csv", CSV_DATA)
+        offset = CSV_DATA.index(b"4,Dave")
+        database = _FakeDatabase()
+        result = self._make_one(
+            database, TABLE_NAME, path, columns=["id", "name"], start_offset=offset
+        ).load()
+
+        self.assertEqual(result.start_offset, offset)
+        self.assertEqual(result.rows_loaded, 2)
+        self.assertEqual(database.written_rows(), [["4", "Dave"], ["5", "Eve"]])
+
+    def test_load_csv_without_header_from_file_object(self):
+        data = b"1;Alice\n2;Bob\n"
+        database = _FakeDatabase()
+        result = self._make_one(
+            database,
+            TABLE_NAME,
+            io.BytesIO(data),
+            format="csv",
+            columns=["id", "name"],
+            reader_options={"header": False, "delimiter": ";"},
+        ).load()
+
+        self.assertEqual(result.rows_loaded, 2)
+        self.assertEqual(result.resume_offset, len(data))
+        self.assertEqual(database.written_rows(), [["1", "Alice"], ["2", "Bob"]])
+
+    def test_load_failed_commit(self):
+        path = self._write_file("rows.csv", CSV_DATA)
+        database = _FakeDatabase(failing_commits=[1])
+        result = self._make_one(
+            database, TABLE_NAME, path, column_types=COLUMN_TYPES, block_rows=2
+        ).load()
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.rows_loaded, 3)
+        self.assertEqual(result.rows_failed, 2)
+        self.assertIsInstance(result.exceptions[0], InvalidArgument)
+        self.assertEqual(result.resume_offset, CSV_DATA.index(b"3,Carol"))
+
+    def test_load_invalid_row(self):
+        path = self._write_file("rows.csv", b"id,name\n1,Alice\n2\n")
+        result = self._make_one(_FakeDatabase(), TABLE_NAME, path, block_rows=1).load()
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.rows_loaded, 1)
+        self.assertIsInstance(result.exceptions[0], ValueError)
+        self.assertEqual(result.resume_offset, len(b"id,name\n1,Alice\n"))
+
+    def test_load_json_lines(self):
+        data = b'{"id": 1, "score": 1}\n\n{"id": 2, "score": null}\n[3, 2.5]\n'
+        path = self._write_file("rows.jsonl", data)
+        database = _FakeDatabase()
+        result = self._make_one(
+            database,
+            TABLE_NAME,
+            path,
+            column_types={"id": TypeCode.INT64, "score": TypeCode.FLOAT64},
+        ).load()
+
+        self.assertEqual(result.rows_loaded, 3)
+        self.assertEqual(result.resume_offset, len(data))
+        self.assertEqual(database.written_rows(), [["1", 1.0], ["2", None], ["3", 2.5]])
+
+    def test_load_table_schema(self):
+        from google.cloud.spanner_v1 import StructType, Type
+
+        class _Table(object):
+            table_id = TABLE_NAME
+            schema = [
+                StructType.Field(name=name, type_=Type(code=code))
+                for name, code in COLUMN_TYPES.items()
+            ]
+
+        path = self._write_file("rows.csv", CSV_DATA)
+        database = _FakeDatabase()
+        result = self._make_one(database, _Table(), path).load()
+
+        self.assertEqual(result.table, TABLE_NAME)
+        self.assertEqual(database.written_rows()[0], ["1", "Alice", True, 1.5])
+
+    def test_load_batch_write(self):
+        path = self._write_file("rows.csv", CSV_DATA)
+        database = _FakeDatabase(failing_commits=[2])
+        result = self._make_one(
+            database,
+            TABLE_NAME,
+            path,
+            column_types=COLUMN_TYPES,
+            block_rows=2,
+            use_batch_write=True,
+            max_attempts=1,
+        ).load()
+
+        self.assertEqual(database.commits, [])
+        self.assertEqual([len(groups) for groups in database.requests], [3])
+        self.assertEqual(result.rows_loaded, 4)
+        self.assertEqual(result.rows_failed, 1)
+        self.assertIsInstance(result.exceptions[0], InvalidArgument)
+        self.assertEqual(result.resume_offset, CSV_DATA.index(b"5,Eve"))
+
+    @unittest.skipUnless(HAS_PYARROW_INSTALLED, "pyarrow is not installed")
+    def test_load_arrow_and_parquet(self):
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        table = pyarrow.table({"id": [1, 2, 3, 4, 5], "name": list("abcde")})
+        arrow_path = os.path.join(self._dir, "rows.arrow")
+        with pyarrow.ipc.new_file(arrow_path, table.schema) as writer:
+            writer.write_table(table, max_chunksize=2)
+        parquet_path = os.path.join(self._dir, "rows.parquet")
+        pyarrow.parquet.write_table(table, parquet_path, row_group_size=2)
+
+        for path in (arrow_path, parquet_path):
+            database = _FakeDatabase()
+            result = self._make_one(
+                database, TABLE_NAME, path, block_rows=2, start_offset=1
+            ).load()
+
+            self.assertEqual(result.rows_loaded, 4)
+            self.assertEqual(result.resume_offset, 5)
+            self.assertEqual(
+                database.written_rows(),
+                [["2", "b"], ["3", "c"], ["4", "d"], ["5", "e"]],
+            )
+
+
+class Test_convert_columns(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.spanner_v1._load_sources import _convert_columns
+
+        return _convert_columns(*args, **kwargs)
+
+    def test_without_conversion(self):
+        rows = [["a", "b"]]
+        self.assertIs(self._call_fut(rows, [None, None]), rows)
+
+    def test_with_conversion(self):
+        rows = [["1", "x"], ["", "y"]]
+        self.assertEqual(
+            self._call_fut(rows, [float, None], null_value=""),
+            [(1.0, "x"), (None, "y")],
+        )
+
+    def test_invalid_row(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([["1"]], [None, None])
@@ -1282,6 +1282,106 @@ class TestTransaction(OpenTelemetryBase):
     def test_batch_update_w_precommit_token(self, mock_region):
         self._batch_update_helper(use_multiplexed=True)
 
+    def _batch_update_many_helper(self, statuses, **kw):
+        from google.rpc.status_pb2 import Status
+
+        from google.cloud.spanner_v1 import ExecuteBatchDmlResponse, ResultSet
+        from google.cloud.spanner_v1.param_types import INT64
+
+        statements = [
+            (
+                "UPDATE table SET desc = @desc WHERE pkey = @pkey",
+                {"pkey": i, "desc": None},
+                {"pkey": INT64},
+            )
+            for i in range(5)
+        ]
+
+        def execute_batch_dml(request, **kwargs):
+            count = len(request.statements)
+            if statuses[0] != 0:
+                count -= 1
+            return ExecuteBatchDmlResponse(
+                status=Status(code=statuses.pop(0)),
+                result_sets=[
+                    ResultSet(stats={"row_count_exact": 1}) for _ in range(count)
+                ],
+            )
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_batch_dml.side_effect = execute_batch_dml
+        transaction = self._make_one(_Session(database))
+        transaction._transaction_id = TRANSACTION_ID
+
+        status, row_counts = transaction.batch_update_many(statements, **kw)
+        requests = [
+            call.kwargs["request"] for call in api.execute_batch_dml.call_args_list
+        ]
+        return status, row_counts, requests
+
+    @mock.patch(
+        "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
+        return_value="global",
+    )
+    def test_batch_update_many_splits_requests(self, mock_region):
+        from google.protobuf.struct_pb2 import NULL_VALUE
+
+        from google.cloud.spanner_v1 import ExecuteBatchDmlRequest, param_types
+
+        status, row_counts, requests = self._batch_update_many_helper(
+            [0, 0, 0], max_statements_per_request=2, last_statement=True
+        )
+
+        self.assertEqual(status.code, 0)
+        self.assertEqual(row_counts, [1] * 5)
+        self.assertEqual([len(request.statements) for request in requests], [2, 2, 1])
+        self.assertEqual([request.seqno for request in requests], [0, 1, 2])
+        self.assertEqual(
+            [request.last_statements for request in requests], [False, False, True]
+        )
+        statement = requests[2].statements[0]
+        self.assertEqual(statement.params["pkey"], "4")
+        self.assertEqual(statement.params["desc"], None)
+        self.assertEqual(
+            ExecuteBatchDmlRequest.Statement.pb(statement)
+            .params.fields["desc"]
+            .null_value,
+            NULL_VALUE,
+        )
+        self.assertEqual(dict(statement.param_types), {"pkey": param_types.INT64})
+
+    @mock.patch(
+        "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
+        return_value="global",
+    )
+    def test_batch_update_many_splits_on_bytes(self, mock_region):
+        _, _, requests = self._batch_update_many_helper(
+            [0, 0, 0, 0, 0], max_bytes_per_request=1
+        )
+
+        self.assertEqual([len(request.statements) for request in requests], [1] * 5)
+
+    @mock.patch(
+        "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
+        return_value="global",
+    )
+    def test_batch_update_many_stops_after_error(self, mock_region):
+        status, row_counts, requests = self._batch_update_many_helper(
+            [0, 3], max_statements_per_request=2
+        )
+
+        self.assertEqual(status.code, 3)
+        self.assertEqual(row_counts, [1, 1, 1])
+        self.assertEqual(len(requests), 2)
+
+    def test_batch_update_many_invalid_limits(self):
+        transaction = self._make_one(_Session(_Database()))
+        with self.assertRaises(ValueError):
+            transaction.batch_update_many([], max_statements_per_request=0)
+        with self.assertRaises(ValueError):
+            transaction.batch_update_many([], max_bytes_per_request=0)
+
     @mock.patch(
         "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
         return_value="global",